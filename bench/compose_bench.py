@@ -0,0 +1,131 @@
+"""
+Per-frame compose benchmark for reaction shorts
+- Builds deterministic synthetic source and overlay frames (no video files)
+- legacy: the previous MoviePy path - resize the whole source to 1920 high,
+  crop to 9:16, resize the overlay and blit both with CompositeVideoClip
+- compositor: compositor.Compositor - crop, then remap-table scale into a
+  reused buffer, overlay scaled straight into its slice
+- Reports ms per frame and how far the two outputs differ
+
+MoviePy 1.0.x resizes through PIL's Image.ANTIALIAS, which Pillow 10 removed;
+the legacy run aliases it to LANCZOS (the same filter) so it can run at all.
+
+Usage: python bench/compose_bench.py [--source 1280x720] [--overlay 480x854] [--frames 30] [--opacity 255]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import compositor
+
+
+def size_arg(value):
+    width, height = value.lower().split('x')
+    return int(width), int(height)
+
+
+def make_frames(size, count, seed):
+    """Gradients, rings and a moving block - deterministic, with hard edges"""
+    width, height = size
+    base = np.empty((height, width, 3), dtype=np.uint8)
+    base[..., 0] = (np.arange(width) * 255 // max(1, width - 1))[None, :]
+    base[..., 1] = (np.arange(height) * 255 // max(1, height - 1))[:, None]
+    rows, cols = np.ogrid[:height, :width]
+    base[..., 2] = ((rows - height // 2) ** 2 + (cols - width // 2) ** 2) * seed // 97 % 256
+    frames = []
+    for index in range(count):
+        frame = base.copy()
+        x = index * 17 % max(1, width - 32)
+        frame[height // 3:height // 3 + 32, x:x + 32] = 255
+        frames.append(frame)
+    return frames
+
+
+def legacy_compose(source_frames, overlay_frames, fps, opacity):
+    """The old _create_background_for_shorts + _create_elly_overlay + CompositeVideoClip"""
+    from PIL import Image
+    if not hasattr(Image, 'ANTIALIAS'):
+        Image.ANTIALIAS = Image.LANCZOS
+    from moviepy.editor import VideoClip, CompositeVideoClip
+
+    target_w, target_h = compositor.TARGET_SIZE
+    source = VideoClip(lambda t: source_frames[int(round(t * fps)) % len(source_frames)],
+                       duration=len(source_frames) / fps)
+    overlay = VideoClip(lambda t: overlay_frames[int(round(t * fps)) % len(overlay_frames)],
+                        duration=len(source_frames) / fps)
+
+    video_w, video_h = source.size
+    video_aspect = video_w / video_h
+    if video_aspect > target_w / target_h:
+        new_width = int(target_h * video_aspect)
+        x1 = new_width / 2 - target_w / 2
+        background = source.resize((new_width, target_h)).crop(x1=x1, x2=x1 + target_w)
+    else:
+        new_height = int(target_w / video_aspect)
+        y1 = new_height / 2 - target_h / 2
+        background = source.resize((target_w, new_height)).crop(y1=y1, y2=y1 + target_h)
+
+    x, y, width, height = compositor.overlay_box(compositor.TARGET_SIZE, overlay.size, 0.25, 'top-right')
+    overlay = overlay.resize((width, height)).set_position((x, y))
+    if opacity < 255:
+        overlay = overlay.set_opacity(opacity / 255)
+    final = CompositeVideoClip([background, overlay], size=compositor.TARGET_SIZE)
+    return [final.get_frame(index / fps) for index in range(len(source_frames))]
+
+
+def compositor_compose(source_frames, overlay_frames, fps, opacity):
+    frames = compositor.Compositor(opacity=opacity)
+    # compose() reuses its buffer - copy so the outputs can be compared
+    return [frames.compose(source, overlay).copy() for source, overlay in zip(source_frames, overlay_frames)]
+
+
+def measure(name, func, source_frames, overlay_frames, fps, opacity):
+    func(source_frames[:2], overlay_frames[:2], fps, opacity)  # warm up
+    started = time.perf_counter()
+    output = func(source_frames, overlay_frames, fps, opacity)
+    elapsed = time.perf_counter() - started
+    return output, {
+        'name': name,
+        'ms_per_frame': round(elapsed * 1000 / len(source_frames), 2),
+        'fps': round(len(source_frames) / elapsed, 1)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--source', type=size_arg, default=(1280, 720))
+    parser.add_argument('--overlay', type=size_arg, default=(480, 854))
+    parser.add_argument('--frames', type=int, default=30)
+    parser.add_argument('--opacity', type=int, default=255)
+    args = parser.parse_args()
+
+    fps = 30
+    source_frames = make_frames(args.source, args.frames, seed=1)
+    overlay_frames = make_frames(args.overlay, args.frames, seed=2)
+
+    legacy_output, legacy = measure('legacy_moviepy', legacy_compose, source_frames, overlay_frames,
+                                    fps, args.opacity)
+    new_output, new = measure('compositor', compositor_compose, source_frames, overlay_frames,
+                              fps, args.opacity)
+
+    difference = np.mean([np.abs(old.astype(np.int16) - frame).mean()
+                          for old, frame in zip(legacy_output, new_output)])
+    print(json.dumps({
+        'source': 'x'.join(map(str, args.source)),
+        'overlay': 'x'.join(map(str, args.overlay)),
+        'frames': args.frames,
+        'opacity': args.opacity,
+        'results': [legacy, new],
+        'speedup': round(legacy['ms_per_frame'] / new['ms_per_frame'], 2),
+        'mean_abs_difference': round(float(difference), 2)
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+"""
+Download writer benchmark
+- Serves a synthetic MP4 from a local HTTP server (separate process, so its
+  syscalls are not counted)
+- Downloads it with the old 8 KB iter_content loop + reopen check and with
+  download_writer.write_response
+- Reports MB/s and read/write syscalls (from /proc/self/io, Linux only;
+  socket recv() calls are not included there)
+
+Usage: python bench/download_bench.py [--size-mb 64] [--runs 3]
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import argparse
+import tempfile
+import subprocess
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import download_writer
+
+
+def make_payload(path, size):
+    """ftyp box followed by deterministic filler"""
+    header = b'\x00\x00\x00\x18ftypmp42\x00\x00\x00\x00mp42isom'
+    block = bytes(range(256)) * 4096
+    with open(path, 'wb') as f:
+        f.write(header)
+        remaining = size - len(header)
+        while remaining > 0:
+            f.write(block[:remaining])
+            remaining -= len(block)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def io_counters():
+    """(read syscalls, write syscalls) of this process"""
+    counters = {}
+    with open('/proc/self/io') as f:
+        for line in f:
+            key, value = line.split(':')
+            counters[key] = int(value)
+    return counters['syscr'], counters['syscw']
+
+
+def legacy_download(url, path):
+    """The previous download_video loop"""
+    response = requests.get(url, stream=True, timeout=30, headers={'Accept-Encoding': 'identity'})
+    with open(path, 'wb') as f:
+        for chunk in response.iter_content(chunk_size=8192):
+            if chunk:
+                f.write(chunk)
+    with open(path, 'rb') as f:
+        header = f.read(8)
+    if b'ftyp' not in header:
+        raise ValueError("invalid header")
+    return os.path.getsize(path)
+
+
+def writer_download(url, path):
+    response = requests.get(url, stream=True, timeout=30, headers={'Accept-Encoding': 'identity'})
+    try:
+        return download_writer.write_response(response, path)
+    finally:
+        response.close()
+
+
+def measure(name, func, url, path, runs):
+    results = []
+    for _ in range(runs):
+        reads, writes = io_counters()
+        started = time.perf_counter()
+        size = func(url, path)
+        elapsed = time.perf_counter() - started
+        after_reads, after_writes = io_counters()
+        os.remove(path)
+        results.append({
+            'mb_per_s': size / (1024 * 1024) / elapsed,
+            'read_syscalls': after_reads - reads,
+            'write_syscalls': after_writes - writes
+        })
+
+    best = max(results, key=lambda result: result['mb_per_s'])
+    return {
+        'name': name,
+        'mb_per_s': round(best['mb_per_s'], 1),
+        'read_syscalls': best['read_syscalls'],
+        'write_syscalls': best['write_syscalls']
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size-mb', type=int, default=64)
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        served = os.path.join(workdir, 'serve')
+        os.mkdir(served)
+        make_payload(os.path.join(served, 'source.mp4'), args.size_mb * 1024 * 1024)
+
+        port = free_port()
+        server = subprocess.Popen([sys.executable, '-m', 'http.server', str(port), '--bind', '127.0.0.1'],
+                                  cwd=served, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            url = f'http://127.0.0.1:{port}/source.mp4'
+            for _ in range(50):
+                try:
+                    requests.head(url, timeout=1)
+                    break
+                except requests.ConnectionError:
+                    time.sleep(0.1)
+
+            target = os.path.join(workdir, 'download.mp4')
+            results = [
+                measure('legacy_8k', legacy_download, url, target, args.runs),
+                measure('download_writer', writer_download, url, target, args.runs)
+            ]
+        finally:
+            server.terminate()
+            server.wait()
+
+    print(json.dumps({'size_mb': args.size_mb, 'results': results}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
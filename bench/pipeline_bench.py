@@ -0,0 +1,361 @@
+"""
+Offline benchmark of the whole shorts pipeline
+- Synthetic sources per render profile (size, duration, with or without
+  audio) and a silent overlay, from ffmpeg's test sources
+  (render_memory.make_clip) - deterministic, no video files needed
+- YouTube and Groq are local stubs (bench/stubs.py) and downloads copy the
+  synthetic source, so nothing leaves the machine
+- Stages, each timed into a metrics.Registry: discovery, filter (copyright
+  checks), dedup (check_duplicate against --history seeded rows), metadata
+  (cold and cached), render per backend and profile, upload, and whole
+  process_scheduled_upload slots (end_to_end); the bot's own /metrics
+  timings and counters (render fallbacks, memory aborts, ...) are
+  included as bot_stages and bot_counters
+- --extras also runs compose_bench, download_bench and render_memory and
+  keeps their JSON
+- --baseline compares with an earlier --output file: a figure (stage p50s,
+  extras results) more than --threshold worse - and, for stage times, at
+  least --min-delta-ms slower - is a regression and the exit code is 1
+
+Stage times include the stub latencies (--api-latency-ms, --groq-latency-ms),
+so only compare runs made with the same options on the same machine.
+
+Usage: python bench/pipeline_bench.py [--runs 3] [--backends moviepy,stream] [--profiles landscape,portrait]
+                                      [--extras compose,download,render_memory]
+                                      [--output results.json] [--baseline baseline.json]
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import platform
+import tempfile
+import contextlib
+import subprocess
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+import metrics
+import metadata_service
+import bot_logging
+
+import stubs
+import render_memory
+
+# Synthetic sources - 'long' is cut to the middle SHORT_MAX_SECONDS like a long upload
+PROFILES = {
+    'landscape': {'size': (1280, 720), 'duration': 6, 'audio': True},
+    'portrait': {'size': (720, 1280), 'duration': 6, 'audio': False},
+    'square': {'size': (720, 720), 'duration': 6, 'audio': True},
+    'long': {'size': (1280, 720), 'duration': 75, 'audio': True},
+}
+BACKENDS = ('moviepy', 'stream')
+OVERLAY = {'size': (480, 854), 'duration': 4}
+
+# Existing benchmarks run by --extras: arguments and the figures kept from
+# their JSON - (value, unit, higher is better)
+EXTRAS = {
+    'compose': (['compose_bench.py', '--frames', '10'], lambda result: {
+        'compositor_ms_per_frame': (result['results'][1]['ms_per_frame'], 'ms', False)
+    }),
+    'download': (['download_bench.py', '--size-mb', '32', '--runs', '2'], lambda result: {
+        'writer_mb_per_s': (result['results'][1]['mb_per_s'], 'MB/s', True)
+    }),
+    'render_memory': (['render_memory.py', '--duration', '10', '--preset', 'veryfast'], lambda result: {
+        'peak_rss_mb': (result['peak_rss_mb'], 'MB', False),
+        'render_seconds': (result['render_seconds'], 's', False)
+    }),
+}
+
+
+def list_arg(choices):
+    def parse(value):
+        names = [name.strip() for name in value.split(',') if name.strip()]
+        unknown = [name for name in names if name not in choices]
+        if unknown:
+            raise argparse.ArgumentTypeError(f"unknown: {', '.join(unknown)} (choose from {', '.join(choices)})")
+        return names
+    return parse
+
+
+def make_bot(youtube, workdir):
+    """A real AutoYouTubeBot wired to the stubs (in-memory DB, no network)"""
+    # Before the import: youtube_bot reads its settings at import time
+    os.environ.update({'RENDER': '1', 'YOUTUBE_API_KEY': '', 'YOUTUBE_REFRESH_TOKEN': '',
+                       'GROQ_API_KEY': 'bench', 'TELEGRAM_BOT_TOKEN': '', 'TELEGRAM_CHAT_ID': ''})
+    import youtube_bot
+
+    class BenchBot(youtube_bot.AutoYouTubeBot):
+        def update_ytdlp(self):
+            pass  # pip install - not offline
+
+    bot = BenchBot()
+    bot.youtube = youtube
+    bot.upload_youtube = youtube
+    bot.credentials = stubs.FakeCredentials(youtube)
+    bot.download_dir = os.path.join(workdir, 'downloads')
+    os.makedirs(bot.download_dir, exist_ok=True)
+    return youtube_bot, bot
+
+
+def local_downloads(bot, source):
+    """download_video_enhanced stand-in - copies the synthetic source"""
+    @metrics.timer('download')
+    def download(video_id, duration_seconds=None):
+        path = os.path.join(bot.download_dir, f"{video_id}.mp4")
+        shutil.copyfile(source, path)
+        return bot.track_artifact(path, video_id)
+    return download
+
+
+def seed_history(bot, count, catalogue, already_processed=4):
+    """count past uploads, plus every already_processed-th catalogue video marked processed"""
+    history = stubs.make_catalogue(count, seed=2, prefix='hist')
+    processed = history + catalogue[::already_processed]
+    with bot.db_lock:
+        cursor = bot.db.cursor()
+        cursor.executemany('''
+            INSERT OR IGNORE INTO uploaded_videos (video_id, title, description, upload_date, youtube_url,
+                                                   channel, category, views, likes, comments)
+            VALUES (?, ?, ?, ?, ?, ?, 'reaction', ?, ?, ?)
+        ''', [(video['id'], f"Elly Reacts to {video['title'][:30]}", video['description'], video['published'],
+               f"https://www.youtube.com/watch?v={video['id']}", video['channel'], video['views'],
+               video['likes'], video['comments']) for video in history])
+        cursor.executemany('''
+            INSERT OR IGNORE INTO processed_videos (video_id, original_title, channel, processed_date, video_hash)
+            VALUES (?, ?, ?, ?, ?)
+        ''', [(video['id'], video['title'], video['channel'], video['published'], None) for video in processed])
+        bot.db.commit()
+    bot.mark_videos_changed()
+
+
+def run_stages(args, workdir, registry):
+    """Every stage with the stubs; returns the details that are not timings"""
+    def timer(stage, **labels):
+        return metrics.timer(stage, registry, **labels)
+
+    details = {}
+    catalogue = stubs.make_catalogue(args.catalogue, seed=args.seed)
+    youtube = stubs.FakeYouTube(catalogue, latency=args.api_latency_ms / 1000, upload_mbps=args.upload_mbps)
+
+    # Synthetic media - the overlay goes where the bot looks for Elly
+    clips = {}
+    for name in args.profiles:
+        profile = PROFILES[name]
+        clips[name] = render_memory.make_clip(os.path.join(workdir, f"source_{name}.mp4"),
+                                              profile['size'], profile['duration'], profile['audio'])
+    os.makedirs('video', exist_ok=True)
+    render_memory.make_clip(os.path.abspath('video/elly.mp4'), OVERLAY['size'], OVERLAY['duration'], audio=False)
+
+    with stubs.GroqStub(latency=args.groq_latency_ms / 1000) as groq:
+        metadata_service.GROQ_URL = groq.url
+        youtube_bot, bot = make_bot(youtube, workdir)
+        seed_history(bot, args.history, catalogue)
+        metrics.REGISTRY.reset()  # bot_stages - only what the bench itself ran
+
+        # Discovery, filter and dedup see the same candidate list every run
+        for _ in range(args.runs):
+            calls = sum(youtube.calls.values())
+            with timer('discovery'):
+                candidates = bot.get_real_youtube_data()
+            details['discovery'] = {'candidates': len(candidates), 'api_calls': sum(youtube.calls.values()) - calls}
+
+            with timer('filter'):
+                safe = [video for video in candidates if bot.is_copyright_safe(video)]
+            details['filter'] = {'kept': len(safe), 'dropped': len(candidates) - len(safe)}
+
+            with timer('dedup'):
+                fresh = [video for video in safe if not bot.check_duplicate(video)]
+            details['dedup'] = {'history_rows': args.history, 'kept': len(fresh), 'dropped': len(safe) - len(fresh)}
+
+        # A new video ID per run, so the first call always goes to Groq
+        subject = (fresh or candidates or catalogue)[0]
+        generated = groq.requests
+        for run in range(args.runs):
+            video = dict(subject, id=f"{subject['id']}-m{run}")
+            with timer('metadata', cache='cold'):
+                bot.reaction_metadata(video)
+            with timer('metadata', cache='warm'):
+                bot.reaction_metadata(video)
+        details['metadata'] = {'groq_requests': groq.requests - generated, 'service': bot.metadata.status()}
+
+        renders = []
+        for backend in args.backends:
+            youtube_bot.RENDER_MODE = backend
+            for name in args.profiles:
+                for run in range(args.render_runs):
+                    video_id = f"render-{backend}-{name}-{run}"
+                    fallbacks = metrics.REGISTRY.counters.get(('render_fallbacks', ()), 0)
+                    with timer('render', backend=backend, profile=name):
+                        output = bot.create_elly_reaction_short(clips[name], video_id)
+                    expected = f"shorts/elly_short_{video_id}.mp4"
+                    renders.append({
+                        'backend': backend,
+                        'profile': name,
+                        # A fallback (other backend, plain short) is timed but is not a pass
+                        'ok': output == expected and os.path.exists(output) and
+                              metrics.REGISTRY.counters.get(('render_fallbacks', ()), 0) == fallbacks,
+                        'output_mb': round(os.path.getsize(output) / (1024 * 1024), 2)
+                                     if output and os.path.exists(output) else None
+                    })
+                    if output:
+                        bot.cleanup(output)
+        details['render'] = renders
+
+        upload_source = clips[args.profiles[0]]
+        uploaded = 0
+        for run in range(args.runs):
+            with timer('upload'):
+                url = bot.upload_to_youtube(upload_source, f"Bench upload {run}", "Bench", client=youtube)
+            uploaded += bool(url) and url != "UPLOAD_LIMIT_EXCEEDED"
+        details['upload'] = {'uploads': uploaded, 'runs': args.runs,
+                             'mb': round(os.path.getsize(upload_source) / (1024 * 1024), 2)}
+
+        # Whole slots - buffer miss, discovery, dedup, download, render, metadata, upload, DB writes
+        youtube_bot.RENDER_MODE = args.backends[0]
+        bot.download_video_enhanced = local_downloads(bot, upload_source)
+        slots = []
+        for _ in range(args.e2e_runs):
+            with timer('end_to_end', backend=args.backends[0], profile=args.profiles[0]):
+                slots.append(bool(bot.process_scheduled_upload('shorts')))
+        details['end_to_end'] = {'uploaded': sum(slots), 'runs': len(slots)}
+        details['api_calls'] = dict(youtube.calls)
+
+    return details
+
+
+def run_extras(names):
+    """Run the standalone benchmarks; returns {name: JSON output}"""
+    results = {}
+    for name in names:
+        command, _ = EXTRAS[name]
+        process = subprocess.run([sys.executable, os.path.join(BENCH_DIR, command[0]), *command[1:]],
+                                 capture_output=True, text=True)
+        try:
+            results[name] = json.loads(process.stdout)
+        except ValueError:
+            results[name] = {'error': (process.stderr or process.stdout).strip()[-500:]}
+    return results
+
+
+def figures(stages, extras):
+    """Comparable numbers: {key: {value, unit, higher_is_better}}"""
+    result = {}
+    for stage, summary in stages.items():
+        result[f"{stage}.p50"] = {'value': summary['p50'], 'unit': 's', 'higher_is_better': False}
+    for name, output in extras.items():
+        if 'error' in output:
+            continue
+        for key, (value, unit, higher) in EXTRAS[name][1](output).items():
+            result[f"{name}.{key}"] = {'value': value, 'unit': unit, 'higher_is_better': higher}
+    return result
+
+
+def compare(current, baseline, threshold, min_delta):
+    """Regressions and improvements of the current figures against a baseline's"""
+    regressions, improvements = [], []
+    for key, figure in current.items():
+        before = baseline.get(key)
+        if not before or not before['value']:
+            continue
+        value, previous = figure['value'], before['value']
+        worse = previous - value if figure['higher_is_better'] else value - previous
+        change = worse / previous
+        # Stage times also need an absolute change - sub-millisecond stages are noisy
+        large_enough = figure['unit'] != 's' or abs(value - previous) >= min_delta
+        entry = {'figure': key, 'baseline': previous, 'current': value, 'unit': figure['unit'],
+                 'change': f"{'+' if value >= previous else ''}{(value - previous) / previous:.1%}"}
+        if change > threshold and large_enough:
+            regressions.append(entry)
+        elif change < -threshold and large_enough:
+            improvements.append(entry)
+    return {
+        'threshold': threshold,
+        'min_delta_ms': round(min_delta * 1000, 1),
+        'regressions': regressions,
+        'improvements': improvements,
+        'missing': sorted(set(baseline) - set(current))
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=3, help='runs of the cheap stages')
+    parser.add_argument('--render-runs', type=int, default=1)
+    parser.add_argument('--e2e-runs', type=int, default=1)
+    parser.add_argument('--backends', type=list_arg(BACKENDS), default=list(BACKENDS))
+    parser.add_argument('--profiles', type=list_arg(PROFILES), default=['landscape', 'portrait'])
+    parser.add_argument('--extras', type=list_arg(EXTRAS), default=[])
+    parser.add_argument('--catalogue', type=int, default=200, help='videos the fake YouTube knows')
+    parser.add_argument('--history', type=int, default=2000, help='past uploads in the dedup tables')
+    parser.add_argument('--api-latency-ms', type=float, default=10)
+    parser.add_argument('--groq-latency-ms', type=float, default=300)
+    parser.add_argument('--upload-mbps', type=float, default=None, help='throttle the fake upload')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', help='also write the results here (use as a later --baseline)')
+    parser.add_argument('--baseline', help='results file to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2, help='relative change that counts (0.2 = 20%%)')
+    parser.add_argument('--min-delta-ms', type=float, default=5)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    registry = metrics.Registry()
+    started = time.perf_counter()
+
+    workdir = tempfile.mkdtemp(prefix='pipeline_bench_')
+    previous_dir = os.getcwd()
+    try:
+        # The bot writes shorts/, logs/ and its overlay path relative to the working directory
+        os.chdir(workdir)
+        bot_logging.setup_logging(path=os.path.join(workdir, 'bot_activity.log'), console=False)
+        # Bot start-up banners go to stderr - stdout is the JSON
+        with contextlib.redirect_stdout(sys.stderr):
+            details = run_stages(args, workdir, registry)
+            bot_stages = metrics.snapshot()
+            with metrics.REGISTRY.lock:
+                bot_counters = {name + ''.join(f',{key}={value}' for key, value in labels): count
+                                for (name, labels), count in sorted(metrics.REGISTRY.counters.items())}
+            extras = run_extras(args.extras)
+    finally:
+        os.chdir(previous_dir)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    stages = registry.snapshot()
+    results = {
+        'machine': {'python': platform.python_version(), 'platform': platform.platform(), 'cpus': os.cpu_count()},
+        'options': {key: value for key, value in vars(args).items() if key not in ('output', 'baseline')},
+        'total_seconds': round(time.perf_counter() - started, 1),
+        'stages': stages,
+        'details': details,
+        'bot_stages': bot_stages,
+        'bot_counters': bot_counters,
+        'extras': extras,
+        'figures': figures(stages, extras)
+    }
+
+    failed = [f"render {item['backend']}/{item['profile']}" for item in details['render'] if not item['ok']]
+    if details['end_to_end']['uploaded'] < details['end_to_end']['runs']:
+        failed.append('end_to_end')
+    results['failed'] = failed
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        results['comparison'] = dict(compare(results['figures'], baseline.get('figures', {}),
+                                             args.threshold, args.min_delta_ms / 1000), baseline=args.baseline)
+
+    print(json.dumps(results, indent=2))
+    regressed = bool(results.get('comparison', {}).get('regressions'))
+    sys.exit(1 if failed or regressed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+Peak-memory check for the streamed renderer (RENDER_MODE=stream)
+- Generates a synthetic source (with audio) and overlay with ffmpeg's test
+  sources, so it runs offline and is deterministic
+- Renders a reaction short with stream_render.StreamRenderer and reports
+  frames, render time and peak RSS (this process + ffmpeg children); the
+  bot module is loaded first, as the limit counts the bot process too
+- Exits 1 if the peak goes over --limit-mb (default RENDER_MEMORY_LIMIT_MB)
+
+Usage: python bench/render_memory.py [--duration 60] [--preset medium] [--limit-mb 496]
+"""
+
+import os
+import sys
+import json
+import argparse
+import tempfile
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import stream_render
+
+
+def make_clip(path, size, duration, audio=True):
+    """lavfi test pattern (plus a sine tone) encoded to mp4"""
+    ffmpeg = stream_render.get_setting('FFMPEG_BINARY')
+    command = [ffmpeg, '-v', 'error', '-y',
+               '-f', 'lavfi', '-i', f'testsrc2=size={size[0]}x{size[1]}:rate=30:duration={duration}']
+    if audio:
+        command += ['-f', 'lavfi', '-i', f'sine=frequency=440:duration={duration}', '-c:a', 'aac']
+    command += ['-c:v', 'libx264', '-preset', 'ultrafast', '-pix_fmt', 'yuv420p', path]
+    subprocess.run(command, check=True)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--duration', type=float, default=60)
+    parser.add_argument('--preset', default=stream_render.STREAM_RENDER_PRESET)
+    parser.add_argument('--limit-mb', type=int, default=stream_render.RENDER_MEMORY_LIMIT_MB)
+    args = parser.parse_args()
+
+    # In-memory DB, and the bot's footprint in the measured process
+    os.environ.setdefault('RENDER', '1')
+    import youtube_bot  # noqa: F401
+    bot_rss_mb = stream_render._rss_mb(os.getpid())
+
+    with tempfile.TemporaryDirectory() as workdir:
+        # Longer than the short, so the middle window is cut like in production
+        source = make_clip(os.path.join(workdir, 'source.mp4'), (1280, 720), args.duration + 20)
+        overlay = make_clip(os.path.join(workdir, 'overlay.mp4'), (480, 854), 10, audio=False)
+        output = os.path.join(workdir, 'short.mp4')
+
+        # No limit while measuring - the peak is compared below
+        renderer = stream_render.StreamRenderer(memory_limit_mb=10 ** 6, preset=args.preset)
+        renderer.render(source, overlay, output, max_duration=args.duration)
+        output_mb = os.path.getsize(output) / (1024 * 1024)
+
+    result = {
+        'duration': args.duration,
+        'preset': args.preset,
+        'frames': renderer.frames,
+        'render_seconds': renderer.seconds,
+        'render_fps': round(renderer.frames / renderer.seconds, 1) if renderer.seconds else None,
+        'output_mb': round(output_mb, 1),
+        'bot_rss_mb': round(bot_rss_mb, 1),
+        'peak_rss_mb': round(renderer.peak_rss_mb, 1),
+        'limit_mb': args.limit_mb,
+        'within_limit': renderer.peak_rss_mb <= args.limit_mb
+    }
+    print(json.dumps(result, indent=2))
+    sys.exit(0 if result['within_limit'] else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,254 @@
+"""
+Local stand-ins for the YouTube Data API and Groq, for offline benchmarks
+- FakeYouTube answers search().list / videos().list / videos().insert like
+  the googleapiclient resource the bot uses, from a deterministic catalogue
+  (seeded titles, channels, views and durations - some are filtered out by
+  the bot, some are over 60s), with a fixed latency per call
+- insert() reads the whole MediaFileUpload, so upload time scales with the
+  file (optionally throttled to --upload-mbps)
+- GroqStub is a local HTTP server speaking the chat completions API; the
+  bench points metadata_service.GROQ_URL at it
+- FakeCredentials replaces youtube_auth.CredentialManager
+"""
+
+import json
+import time
+import zlib
+import random
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SUBJECTS = ['cat', 'drone', 'street food', 'magic trick', 'skateboard', 'science demo', 'puppy',
+            'life hack', 'robot', 'dance', 'prank', 'cooking fail', 'parkour', 'origami', 'rubik cube']
+HOOKS = ['You won\'t believe this', 'Wait for the end', 'Most satisfying', 'Insane', 'This changed everything',
+         'Unexpected', 'Crazy fast', 'Best ever', 'Tiny', 'Giant']
+CHANNELS = ['Daily Laughs', 'Maker Minute', 'Quick Bites', 'Street Clips', 'Tiny Wonders',
+            'Loop Lab', 'Fun Factory', 'Clip Culture', 'Viral Vault', 'Shorty Club']
+
+# Titles/channels the bot's copyright filter rejects
+BLOCKED_WORDS = ['official', 'trailer', 'nba', 'minecraft', 'music video', 'news']
+BLOCKED_CHANNELS = ['Mega Studios', 'Sound Records', 'TV Network', 'Clips123456']
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def make_catalogue(size=200, seed=1, prefix='bench'):
+    """Deterministic list of video dicts (raw fields, not the API shape)"""
+    rng = random.Random(seed)
+    videos = []
+    for index in range(size):
+        title = f"{rng.choice(HOOKS)} {rng.choice(SUBJECTS)} #{index}"
+        channel = f"{rng.choice(CHANNELS)} {rng.randint(1, 9)}"
+        if rng.random() < 0.15:
+            title = f"{title} {rng.choice(BLOCKED_WORDS)}"
+        if rng.random() < 0.1:
+            channel = rng.choice(BLOCKED_CHANNELS)
+        videos.append({
+            'id': f"{prefix}{index:06d}",
+            'title': title,
+            'channel': channel,
+            'description': f"{title} - filmed by {channel}. " * rng.randint(1, 6),
+            'published': f"2024-01-{index % 28 + 1:02d}T12:00:00Z",
+            # Log-uniform from 5K to 80M - both ends fail the view filter
+            'views': int(10 ** rng.uniform(3.7, 7.9)),
+            'likes': rng.randint(100, 100000),
+            'comments': rng.randint(0, 5000),
+            'duration_seconds': rng.randint(61, 240) if rng.random() < 0.1 else rng.randint(8, 59),
+            'tags': rng.sample(SUBJECTS, 4)
+        })
+    return videos
+
+
+def _iso_duration(seconds):
+    minutes, seconds = divmod(seconds, 60)
+    return f"PT{minutes}M{seconds}S" if minutes else f"PT{seconds}S"
+
+
+class _Request:
+    """What googleapiclient's list()/insert() return - run on execute()"""
+
+    def __init__(self, api, method, func):
+        self.api = api
+        self.method = method
+        self.func = func
+
+    def execute(self):
+        self.api.calls[self.method] += 1
+        if self.api.latency:
+            time.sleep(self.api.latency)
+        return self.func()
+
+
+class _Search:
+    def __init__(self, api):
+        self.api = api
+
+    def list(self, q='', maxResults=5, **params):
+        return _Request(self.api, 'search.list', lambda: self.api.search_items(q, maxResults))
+
+
+class _Videos:
+    def __init__(self, api):
+        self.api = api
+
+    def list(self, id='', **params):
+        return _Request(self.api, 'videos.list', lambda: self.api.video_items(id.split(',')))
+
+    def insert(self, part=None, body=None, media_body=None, **params):
+        return _Request(self.api, 'videos.insert', lambda: self.api.receive_upload(body, media_body))
+
+
+class FakeYouTube:
+    """Offline YouTube Data API v3 client (search, videos.list, videos.insert)"""
+
+    def __init__(self, catalogue, latency=0.0, upload_mbps=None):
+        self.catalogue = catalogue
+        self.by_id = {video['id']: video for video in catalogue}
+        self.latency = latency
+        self.upload_mbps = upload_mbps
+        self.calls = Counter()
+        self.uploads = []
+        self.lock = threading.Lock()
+
+    def search(self):
+        return _Search(self)
+
+    def videos(self):
+        return _Videos(self)
+
+    def search_items(self, q, max_results):
+        # The same query always finds the same videos; different queries overlap
+        rng = random.Random(zlib.crc32(q.encode()))
+        picked = rng.sample(self.catalogue, min(max_results, len(self.catalogue)))
+        return {'items': [{
+            'id': {'kind': 'youtube#video', 'videoId': video['id']},
+            'snippet': {'title': video['title'], 'channelTitle': video['channel'],
+                        'description': video['description'], 'publishedAt': video['published']}
+        } for video in picked]}
+
+    def video_items(self, ids):
+        items = []
+        for video_id in ids:
+            video = self.by_id.get(video_id)
+            if video is None:
+                continue
+            items.append({
+                'id': video_id,
+                'snippet': {
+                    'title': video['title'],
+                    'description': video['description'],
+                    'publishedAt': video['published'],
+                    'channelTitle': video['channel'],
+                    'tags': video['tags'],
+                    'thumbnails': {'medium': {'url': f"https://i.ytimg.invalid/vi/{video_id}/mqdefault.jpg"}}
+                },
+                'statistics': {'viewCount': str(video['views']), 'likeCount': str(video['likes']),
+                               'commentCount': str(video['comments'])},
+                'contentDetails': {'duration': _iso_duration(video['duration_seconds']), 'definition': 'hd'},
+                'status': {'embeddable': True, 'privacyStatus': 'public'}
+            })
+        return {'items': items}
+
+    def receive_upload(self, body, media_body):
+        """Reads the upload like the resumable uploader would"""
+        size = media_body.size()
+        started = time.perf_counter()
+        offset = 0
+        while offset < size:
+            chunk = media_body.getbytes(offset, CHUNK_SIZE)
+            offset += len(chunk)
+            if self.upload_mbps:
+                ahead = offset / (self.upload_mbps * 125000) - (time.perf_counter() - started)
+                if ahead > 0:
+                    time.sleep(ahead)
+        with self.lock:
+            video_id = f"up{len(self.uploads):09d}"
+            self.uploads.append({'id': video_id, 'title': body['snippet']['title'], 'bytes': size})
+        return {'id': video_id, 'snippet': body['snippet'], 'status': body['status']}
+
+
+class FakeCredentials:
+    """CredentialManager stand-in that always hands out the fake client"""
+
+    def __init__(self, client):
+        self._client = client
+
+    def start(self):
+        return True
+
+    def stop(self):
+        pass
+
+    def client(self):
+        return self._client
+
+    def status(self):
+        return {'authenticated': True, 'stub': True}
+
+
+class GroqStub:
+    """Local chat-completions endpoint with a fixed response latency"""
+
+    def __init__(self, latency=0.0, status=200):
+        self.latency = latency
+        self.status = status
+        self.requests = 0
+        self.server = None
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/openai/v1/chat/completions"
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_POST(self):
+                payload = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+                stub.requests += 1
+                if stub.latency:
+                    time.sleep(stub.latency)
+                prompt = payload.get('messages', [{}])[-1].get('content', '')
+                digest = zlib.crc32(prompt.encode())
+                content = (f"🤯 Elly can't believe this one!\n\n• Watch till the end\n• Reaction #{digest % 1000}\n"
+                           f"• Share with a friend\n\n#shorts #reaction #viral #elly #fyp")
+                body = json.dumps({
+                    'id': f"chatcmpl-{digest:08x}",
+                    'model': payload.get('model'),
+                    'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': content},
+                                 'finish_reason': 'stop'}]
+                }).encode()
+                self.send_response(stub.status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, name='groq-stub', daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
@@ -0,0 +1,304 @@
+"""
+Structured activity logging
+- log calls only build a LogRecord and put it on a queue (a few microseconds)
+- One background writer formats JSON lines, writes them in batches and
+  rotates the file by size and by age
+- Console output comes from the same writer, so lines never interleave
+"""
+
+import os
+import sys
+import json
+import time
+import queue
+import atexit
+import logging
+import threading
+import logging.handlers
+from datetime import datetime
+
+LOG_FILE = 'logs/bot_activity.log'
+LOGGER_NAME = 'youtube_bot'
+
+# Rotation - whichever limit is hit first
+LOG_MAX_BYTES = int(os.getenv('LOG_MAX_BYTES', 5 * 1024 * 1024))
+LOG_ROTATE_HOURS = float(os.getenv('LOG_ROTATE_HOURS', 24))
+LOG_BACKUP_COUNT = int(os.getenv('LOG_BACKUP_COUNT', 5))
+
+# Batching - collect up to this many records / seconds before one write + flush
+BATCH_SIZE = 256
+FLUSH_INTERVAL = 0.5
+
+LEVEL_NAMES = {
+    'debug': logging.DEBUG,
+    'info': logging.INFO,
+    'warning': logging.WARNING,
+    'error': logging.ERROR
+}
+
+# LogRecord attributes copied into the JSON line when set
+EXTRA_FIELDS = ('stage', 'video_id', 'duration')
+
+_logger = None
+_writer = None
+_setup_lock = threading.Lock()
+
+
+class FastQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that skips formatting on the caller's thread"""
+
+    def prepare(self, record):
+        return record
+
+
+def format_json(record):
+    """One JSON log line for a record"""
+    entry = {
+        'ts': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+        'level': record.levelname.lower(),
+        'msg': record.getMessage()
+    }
+    for field in EXTRA_FIELDS:
+        value = getattr(record, field, None)
+        if value is not None:
+            entry[field] = value
+    if record.threadName and record.threadName != 'MainThread':
+        entry['thread'] = record.threadName
+    return json.dumps(entry, ensure_ascii=False)
+
+
+def format_console(record):
+    """Human readable line, same shape as the old log format"""
+    timestamp = datetime.fromtimestamp(record.created).strftime('%Y-%m-%d %H:%M:%S')
+    return f"[{timestamp}] {record.getMessage()}"
+
+
+class BatchedLogWriter:
+    """Drains the log queue from one thread, writing and rotating in batches"""
+
+    def __init__(self, log_queue, path=LOG_FILE, max_bytes=LOG_MAX_BYTES,
+                 rotate_hours=LOG_ROTATE_HOURS, backup_count=LOG_BACKUP_COUNT, console=True):
+        self.queue = log_queue
+        self.path = path
+        self.max_bytes = max_bytes
+        self.rotate_seconds = rotate_hours * 3600
+        self.backup_count = backup_count
+        self.console = console
+
+        self.file = None
+        self.opened_at = 0
+        self.running = False
+        self.thread = None
+
+    def start(self):
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name='log-writer', daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Write everything still queued and close the file"""
+        if not self.running:
+            return
+        self.running = False
+        self.queue.put(None)
+        self.thread.join(timeout=5)
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self.file = open(self.path, 'a', encoding='utf-8')
+        self.opened_at = time.time()
+
+    def _rotate_if_needed(self):
+        """Roll the file over when it is too big or too old"""
+        too_big = self.max_bytes and self.file.tell() >= self.max_bytes
+        too_old = self.rotate_seconds and time.time() - self.opened_at >= self.rotate_seconds
+        if not (too_big or too_old):
+            return
+
+        self.file.close()
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        if self.backup_count > 0 and os.path.exists(self.path):
+            os.replace(self.path, f"{self.path}.1")
+        self._open()
+
+    def _next_batch(self):
+        """Block for one record, then collect more for up to FLUSH_INTERVAL"""
+        batch = [self.queue.get()]
+        deadline = time.monotonic() + FLUSH_INTERVAL
+        while len(batch) < BATCH_SIZE and batch[-1] is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self.queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        self._open()
+        while True:
+            batch = self._next_batch()
+            records = [record for record in batch if record is not None]
+
+            if records:
+                try:
+                    self._rotate_if_needed()
+                    self.file.write(''.join(format_json(record) + '\n' for record in records))
+                    self.file.flush()
+                    if self.console:
+                        sys.stdout.write(''.join(format_console(record) + '\n' for record in records))
+                        sys.stdout.flush()
+                except Exception as e:
+                    sys.stderr.write(f"❌ Log writer error: {e}\n")
+
+            if len(records) < len(batch):  # Stop sentinel
+                self.file.close()
+                return
+
+
+def setup_logging(path=LOG_FILE, console=True):
+    """Return the shared activity logger, starting the writer on first call"""
+    global _logger, _writer
+
+    with _setup_lock:
+        if _logger:
+            return _logger
+
+        log_queue = queue.SimpleQueue()
+        logger = logging.getLogger(LOGGER_NAME)
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+        logger.addHandler(FastQueueHandler(log_queue))
+
+        _writer = BatchedLogWriter(log_queue, path=path, console=console)
+        _writer.start()
+        atexit.register(_writer.stop)
+
+        _logger = logger
+        return _logger
+
+
+def shutdown_logging():
+    """Flush and stop the writer (also registered with atexit)"""
+    if _writer:
+        _writer.stop()
+
+
+# Log reading - cost depends on the lines returned, not on the file size
+READ_BLOCK_SIZE = 8192
+MAX_SCAN_BYTES = 1024 * 1024  # Upper bound on bytes examined per request
+
+
+def parse_log_line(raw):
+    """Decode one log line - JSON entries, or plain text from the old format"""
+    line = raw.decode('utf-8', errors='replace').strip()
+    if line.startswith('{'):
+        try:
+            return json.loads(line)
+        except ValueError:
+            pass
+    return {'level': 'info', 'msg': line}
+
+
+def _matches(entry, min_level, stage):
+    if min_level and LEVEL_NAMES.get(entry.get('level'), logging.INFO) < min_level:
+        return False
+    if stage and entry.get('stage') != stage:
+        return False
+    return True
+
+
+def tail_log(path=LOG_FILE, count=100, level=None, stage=None, max_scan=MAX_SCAN_BYTES):
+    """Last count matching entries, read backwards from EOF in blocks
+
+    Returns (entries oldest first, offset just past the last complete line).
+    The offset is the cursor for read_log_since().
+    """
+    min_level = LEVEL_NAMES.get(level) if level else None
+    entries = []
+
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        end_offset = None
+        buffer = b''
+        scanned = 0
+
+        while position > 0 and len(entries) < count and scanned < max_scan:
+            read_size = min(READ_BLOCK_SIZE, position)
+            position -= read_size
+            f.seek(position)
+            buffer = f.read(read_size) + buffer
+            scanned += read_size
+
+            if end_offset is None:
+                # Skip a half-written last line; the cursor stops before it
+                last_newline = buffer.rfind(b'\n')
+                if last_newline == -1:
+                    if position > 0:
+                        continue
+                    break
+                end_offset = position + last_newline + 1
+                buffer = buffer[:last_newline + 1]
+
+            lines = buffer.split(b'\n')
+            # lines[0] may be cut off by the block boundary - keep it for the next block
+            buffer = lines[0] if position > 0 else b''
+            complete = lines[1:] if position > 0 else lines
+            for raw in reversed(complete):
+                if not raw.strip():
+                    continue
+                entry = parse_log_line(raw)
+                if _matches(entry, min_level, stage):
+                    entries.append(entry)
+                    if len(entries) >= count:
+                        break
+
+    entries.reverse()
+    return entries, end_offset or 0
+
+
+def read_log_since(path=LOG_FILE, offset=0, count=100, level=None, stage=None, max_scan=MAX_SCAN_BYTES):
+    """Up to count matching entries written after byte offset
+
+    Returns (entries, next offset, reset). reset is True when the offset no
+    longer fits the file - past its end, or not at the start of a line (the
+    file was rotated or cleared since) - and reading restarted at 0.
+    """
+    min_level = LEVEL_NAMES.get(level) if level else None
+    entries = []
+    reset = False
+
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        if offset > f.tell():
+            offset = 0
+            reset = True
+        elif offset > 0:
+            # A cursor always points just past a newline
+            f.seek(offset - 1)
+            if f.read(1) != b'\n':
+                offset = 0
+                reset = True
+        f.seek(offset)
+        data = f.read(max_scan)
+
+    # Only whole lines; the next read resumes at the first unfinished one
+    data = data[:data.rfind(b'\n') + 1]
+
+    next_offset = offset
+    for raw in data.split(b'\n')[:-1]:
+        next_offset += len(raw) + 1
+        if not raw.strip():
+            continue
+        entry = parse_log_line(raw)
+        if _matches(entry, min_level, stage):
+            entries.append(entry)
+            if len(entries) >= count:
+                break
+
+    return entries, next_offset, reset
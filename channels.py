@@ -0,0 +1,499 @@
+"""
+Multi-channel operation from one process
+- Channel profiles (credentials, category mix, schedule, overlay, quota)
+  live in the channels table; each gets its own upload client and its own
+  scheduler job
+- All channels share one discovery cache, one download cache and one render
+  pool; the pool serves channels round-robin so a busy channel cannot
+  starve the others
+- Per-channel uploads and stage timings go to channel_stats, so throughput
+  can be compared with one-process-per-channel deployments; uploads are
+  tagged with uploaded_videos.channel_id and never count against the
+  default channel's daily total in bot_stats
+"""
+
+import os
+import json
+import time
+import random
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+
+import workspace
+import metrics
+
+# Discovery results are reused by every channel for this long
+DISCOVERY_TTL = int(os.getenv('DISCOVERY_TTL_SECONDS', 30 * 60))
+
+# Downloaded sources kept for reuse (a failed upload can be retried by any channel)
+DOWNLOAD_CACHE_SIZE = 20
+
+RENDER_WORKERS = int(os.getenv('RENDER_WORKERS', 2))
+
+DEFAULT_OVERLAY = 'video/elly.mp4'
+
+# Never returned by the API
+SECRET_FIELDS = ('client_secret', 'refresh_token')
+
+# Every profile needs its own - a missing one would fall back to the
+# YOUTUBE_* environment, i.e. upload to the default channel
+CREDENTIAL_FIELDS = ('client_id', 'client_secret', 'refresh_token')
+
+PROFILE_FIELDS = ('name', 'client_id', 'client_secret', 'refresh_token', 'token_path',
+                  'category_mix', 'schedule', 'overlay_path', 'daily_quota', 'active')
+
+STAGES = ('discover', 'download', 'render', 'upload')
+
+
+def create_tables(cursor):
+    """Create the channel profile and per-channel stats tables"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS channels (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT UNIQUE NOT NULL,
+            client_id TEXT,
+            client_secret TEXT,
+            refresh_token TEXT,
+            token_path TEXT,
+            category_mix TEXT DEFAULT '{"shorts": 1}',
+            schedule TEXT,
+            overlay_path TEXT,
+            daily_quota INTEGER DEFAULT 10,
+            active INTEGER DEFAULT 1
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS channel_stats (
+            channel_id INTEGER NOT NULL,
+            date DATE NOT NULL,
+            runs INTEGER DEFAULT 0,
+            uploads INTEGER DEFAULT 0,
+            discover_seconds REAL DEFAULT 0,
+            download_seconds REAL DEFAULT 0,
+            render_seconds REAL DEFAULT 0,
+            upload_seconds REAL DEFAULT 0,
+            PRIMARY KEY (channel_id, date)
+        )
+    ''')
+
+
+def _row_to_profile(columns, row):
+    profile = dict(zip(columns, row))
+    try:
+        profile['category_mix'] = json.loads(profile.get('category_mix') or '{}') or {'shorts': 1}
+    except ValueError:
+        profile['category_mix'] = {'shorts': 1}
+    profile['active'] = bool(profile.get('active'))
+    return profile
+
+
+def load_channels(cursor, active_only=True):
+    """All channel profiles as dicts"""
+    sql = 'SELECT * FROM channels'
+    if active_only:
+        sql += ' WHERE active = 1'
+    cursor.execute(sql + ' ORDER BY id')
+    columns = [column[0] for column in cursor.description]
+    return [_row_to_profile(columns, row) for row in cursor.fetchall()]
+
+
+def missing_credentials(profile):
+    """Credential fields the profile does not have itself"""
+    return [field for field in CREDENTIAL_FIELDS if not profile.get(field)]
+
+
+def save_channel(cursor, profile):
+    """Insert or update a profile by name (caller commits); returns the channel id"""
+    if not profile.get('name'):
+        raise ValueError("channel name is required")
+
+    # Updates may leave out the stored secrets (the API never returns them)
+    cursor.execute(f"SELECT {', '.join(CREDENTIAL_FIELDS)} FROM channels WHERE name = ?", (profile['name'],))
+    stored = dict(zip(CREDENTIAL_FIELDS, cursor.fetchone() or ()))
+    missing = missing_credentials({**stored, **{field: profile[field] for field in CREDENTIAL_FIELDS
+                                                if field in profile}})
+    if missing:
+        raise ValueError(f"channel needs its own {', '.join(missing)}")
+
+    values = {field: profile[field] for field in PROFILE_FIELDS if field in profile}
+    if isinstance(values.get('category_mix'), dict):
+        values['category_mix'] = json.dumps(values['category_mix'])
+    if 'active' in values:
+        values['active'] = 1 if values['active'] else 0
+
+    columns = ', '.join(values)
+    placeholders = ', '.join('?' for _ in values)
+    updates = ', '.join(f"{field} = excluded.{field}" for field in values if field != 'name')
+    cursor.execute(f'''
+        INSERT INTO channels ({columns}) VALUES ({placeholders})
+        ON CONFLICT(name) DO {'UPDATE SET ' + updates if updates else 'NOTHING'}
+    ''', list(values.values()))
+
+    cursor.execute('SELECT id FROM channels WHERE name = ?', (values['name'],))
+    return cursor.fetchone()[0]
+
+
+def public_profile(profile):
+    """Profile without credentials"""
+    return {key: value for key, value in profile.items() if key not in SECRET_FIELDS}
+
+
+def record_run(cursor, channel_id, uploaded, timings):
+    """Add one pipeline run to today's channel_stats row (caller commits)"""
+    cursor.execute('''
+        INSERT INTO channel_stats
+        (channel_id, date, runs, uploads, discover_seconds, download_seconds, render_seconds, upload_seconds)
+        VALUES (?, ?, 1, ?, ?, ?, ?, ?)
+        ON CONFLICT(channel_id, date) DO UPDATE SET
+            runs = runs + 1,
+            uploads = uploads + excluded.uploads,
+            discover_seconds = discover_seconds + excluded.discover_seconds,
+            download_seconds = download_seconds + excluded.download_seconds,
+            render_seconds = render_seconds + excluded.render_seconds,
+            upload_seconds = upload_seconds + excluded.upload_seconds
+    ''', (channel_id, datetime.now().date(), 1 if uploaded else 0,
+          *(round(timings.get(stage, 0), 3) for stage in STAGES)))
+
+
+def load_stats(cursor, channel_id, date=None):
+    """One day's counters and average stage timings for a channel"""
+    cursor.execute('''
+        SELECT runs, uploads, discover_seconds, download_seconds, render_seconds, upload_seconds
+        FROM channel_stats WHERE channel_id = ? AND date = ?
+    ''', (channel_id, date or datetime.now().date()))
+    row = cursor.fetchone() or (0, 0, 0, 0, 0, 0)
+    runs, uploads = row[0], row[1]
+
+    stats = {'runs': runs, 'uploads': uploads}
+    for stage, total in zip(STAGES, row[2:]):
+        stats[f'avg_{stage}_seconds'] = round(total / runs, 1) if runs else None
+    # Wall time per successful upload - the number to compare across deployments
+    stats['seconds_per_upload'] = round(sum(row[2:]) / uploads, 1) if uploads else None
+    return stats
+
+
+class DiscoveryCache:
+    """Shared candidate list - one search run serves every channel for DISCOVERY_TTL"""
+
+    def __init__(self, ttl=DISCOVERY_TTL):
+        self.ttl = ttl
+        self.videos = []
+        self.fetched_at = 0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, fetch):
+        """Copies of the cached video dicts - callers update them with their own upload"""
+        # Holding the lock while fetching makes concurrent callers wait and reuse the result
+        with self.lock:
+            if self.videos and time.monotonic() - self.fetched_at < self.ttl:
+                self.hits += 1
+            else:
+                self.misses += 1
+                self.videos = fetch() or []
+                self.fetched_at = time.monotonic()
+            return [dict(video) for video in self.videos]
+
+    def invalidate(self):
+        with self.lock:
+            self.videos = []
+
+
+class DownloadCache:
+    """Shared source downloads - each video is fetched once, even if requested concurrently
+
+    Only local files are kept. A stream URL (DOWNLOAD_MODE=stream) is signed
+    and expires, so concurrent requests share one but the next one resolves
+    a fresh URL.
+    """
+
+    def __init__(self, size=DOWNLOAD_CACHE_SIZE):
+        self.size = size
+        self.paths = OrderedDict()     # video_id -> path, least recently used first
+        self.in_flight = {}            # video_id -> Event
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, video_id, fetch):
+        """Path of the downloaded video (None if the download failed)"""
+        while True:
+            with self.lock:
+                path = self.paths.get(video_id)
+                if path and os.path.exists(path):
+                    self.paths.move_to_end(video_id)
+                    self.hits += 1
+                    return path
+                waiter = self.in_flight.get(video_id)
+                if not waiter:
+                    self.in_flight[video_id] = threading.Event()
+                    self.misses += 1
+                    break
+            waiter.wait()  # Someone else is downloading it - reuse their result
+
+        path = None
+        try:
+            path = fetch(video_id)
+        finally:
+            with self.lock:
+                if path and not path.startswith(('http://', 'https://')):
+                    self.paths[video_id] = path
+                    self._evict()
+                self.in_flight.pop(video_id).set()
+        return path
+
+    def discard(self, video_id):
+        """Drop and delete a source that is no longer needed"""
+        with self.lock:
+            path = self.paths.pop(video_id, None)
+        self._delete(path)
+
+    def _evict(self):
+        while len(self.paths) > self.size:
+            _, path = self.paths.popitem(last=False)
+            self._delete(path)
+
+    @staticmethod
+    def _delete(path):
+        try:
+            if path and os.path.exists(path):
+                os.remove(path)
+        except OSError:
+            pass
+
+
+class FairRenderPool:
+    """Fixed render workers fed round-robin from one queue per channel"""
+
+    def __init__(self, workers=RENDER_WORKERS):
+        self.workers = workers
+        self.queues = OrderedDict()    # channel_id -> deque of jobs, next channel first
+        self.cond = threading.Condition()
+        self.threads = []
+        self.rendered = 0
+
+    def submit(self, channel_id, fn, *args, **kwargs):
+        future = Future()
+        with self.cond:
+            self.queues.setdefault(channel_id, deque()).append((future, fn, args, kwargs))
+            self.cond.notify()
+        self._ensure_started()
+        return future
+
+    def pending(self):
+        with self.cond:
+            return {channel_id: len(jobs) for channel_id, jobs in self.queues.items()}
+
+    def _ensure_started(self):
+        if self.threads:
+            return
+        with self.cond:
+            if not self.threads:
+                for index in range(self.workers):
+                    thread = threading.Thread(target=self._run, name=f'render-{index}', daemon=True)
+                    thread.start()
+                    self.threads.append(thread)
+
+    def _next_job(self):
+        with self.cond:
+            while not self.queues:
+                self.cond.wait()
+            channel_id, jobs = next(iter(self.queues.items()))
+            job = jobs.popleft()
+            # Served channel goes to the back of the line
+            del self.queues[channel_id]
+            if jobs:
+                self.queues[channel_id] = jobs
+            return job
+
+    def _run(self):
+        while True:
+            future, fn, args, kwargs = self._next_job()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except Exception as e:
+                future.set_exception(e)
+            self.rendered += 1
+
+
+class ChannelManager:
+    """Runs every active channel profile through the shared caches and render pool"""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.discovery = DiscoveryCache()
+        self.downloads = DownloadCache()
+        self.render_pool = FairRenderPool()
+
+        self.claimed = set()       # Source video_ids being processed by some channel
+        self.in_flight = {}        # channel_id -> runs in progress (count against the quota)
+        self.lock = threading.Lock()
+        self.job_names = set()
+        self.executor = None
+
+    def profiles(self, active_only=True):
+        if not self.bot.db:
+            return []
+        with self.bot.db_lock:
+            return load_channels(self.bot.db.cursor(), active_only)
+
+    def start(self, default_schedule, catch_up, jitter=0):
+        """(Re)register one scheduler job per active channel"""
+        profiles = self.profiles()
+
+        for name in self.job_names - {f"channel:{profile['name']}" for profile in profiles}:
+            self.bot.scheduler.remove(name)
+        self.job_names = set()
+
+        if not profiles:
+            return 0
+
+        if not self.executor:
+            self.executor = ThreadPoolExecutor(max_workers=max(2, len(profiles)),
+                                               thread_name_prefix='channel')
+        for profile in profiles:
+            job_name = f"channel:{profile['name']}"
+            self.bot.scheduler.add_cron(
+                job_name, profile.get('schedule') or default_schedule,
+                lambda channel_id=profile['id']: self.executor.submit(self.run_channel, channel_id),
+                catch_up=catch_up, jitter=jitter)
+            self.job_names.add(job_name)
+
+        self.bot.log_activity(f"📺 Multi-channel mode: {len(profiles)} channel(s) scheduled")
+        return len(profiles)
+
+    def _client(self, profile):
+        # Per-thread client from the profile's credential manager (kept fresh in the background)
+        return self.bot.get_channel_upload_client(profile)
+
+    def claim(self, video_id):
+        with self.lock:
+            if video_id in self.claimed:
+                return False
+            self.claimed.add(video_id)
+            return True
+
+    def release(self, video_id):
+        with self.lock:
+            self.claimed.discard(video_id)
+
+    def run_channel(self, channel_id):
+        """One upload slot for one channel: discover, download, render, upload"""
+        bot = self.bot
+        profile = next((p for p in self.profiles() if p['id'] == channel_id), None)
+        if not profile or not bot.bot_active:
+            return False
+
+        with self.lock:
+            with bot.db_lock:
+                today = load_stats(bot.db.cursor(), channel_id)
+            if today['uploads'] + self.in_flight.get(channel_id, 0) >= (profile.get('daily_quota') or 0):
+                bot.log_activity(f"📺 {profile['name']}: daily quota reached", stage='channel')
+                return False
+            self.in_flight[channel_id] = self.in_flight.get(channel_id, 0) + 1
+
+        timings = {}
+        uploaded = False
+        try:
+            client = self._client(profile)
+            if not client:
+                bot.log_activity(f"❌ {profile['name']}: upload authentication failed", level='error', stage='channel')
+                return False
+
+            started = time.monotonic()
+            candidates = self.discovery.get(bot.get_real_youtube_data)
+            timings['discover'] = time.monotonic() - started
+
+            mix = profile['category_mix']
+            category = random.choices(list(mix), weights=list(mix.values()))[0]
+            overlay = profile.get('overlay_path') or DEFAULT_OVERLAY
+
+            for video in candidates:
+                if not self.claim(video['id']):
+                    continue
+                try:
+                    if bot.check_duplicate(video):
+                        metrics.count('candidates_skipped', reason='duplicate')
+                        continue
+                    uploaded = self._process(profile, client, video, category, overlay, timings)
+                    if uploaded is not None:
+                        break
+                finally:
+                    self.release(video['id'])
+                    bot.finish_job(video['id'])
+        finally:
+            with bot.db_lock:
+                record_run(bot.db.cursor(), channel_id, uploaded, timings)
+                bot.db.commit()
+            with self.lock:
+                self.in_flight[channel_id] -= 1
+
+        return bool(uploaded)
+
+    def _process(self, profile, client, video, category, overlay, timings):
+        """True uploaded, False stop trying (quota), None try the next candidate"""
+        bot = self.bot
+
+        bot.prefetch_metadata([video])
+        started = time.monotonic()
+        source_path = self.downloads.get(
+            video['id'], lambda video_id: bot.download_video_enhanced(video_id, video.get('duration_seconds')))
+        timings['download'] = timings.get('download', 0) + time.monotonic() - started
+        if not source_path:
+            return None
+
+        started = time.monotonic()
+        reaction_path = self.render_pool.submit(
+            profile['id'], bot.create_elly_reaction_short, source_path, video['id'],
+            overlay_path=overlay).result()
+        timings['render'] = timings.get('render', 0) + time.monotonic() - started
+        if not reaction_path or not os.path.exists(reaction_path):
+            return None
+        bot.track_artifact(source_path, video['id'], workspace.CACHED)  # Other channels may reuse it
+
+        title, description = bot.reaction_metadata(video)
+        started = time.monotonic()
+        upload_url = bot.upload_to_youtube(reaction_path, title, description, client=client)
+        timings['upload'] = timings.get('upload', 0) + time.monotonic() - started
+
+        if upload_url == "UPLOAD_LIMIT_EXCEEDED":
+            return False
+        if not upload_url:
+            return None
+
+        video.update(youtube_url=upload_url, title=title, description=description, reaction_created=True,
+                     category=category, channel_id=profile['id'])
+        bot.save_video_with_stats(video)
+        bot.save_processed_video(video)
+        # Counted in channel_stats by run_channel, not in bot_stats - that daily
+        # total is the default channel's upload limit
+        bot.log_activity(f"✅ {profile['name']}: uploaded {title[:40]}...", stage='channel', video_id=video['id'])
+
+        self.downloads.discard(video['id'])
+        bot.cleanup(reaction_path)
+        return True
+
+    def status(self):
+        """Profiles (without secrets) with today's throughput, plus shared cache stats"""
+        profiles = self.profiles(active_only=False)
+        with self.bot.db_lock:
+            cursor = self.bot.db.cursor()
+            channels = [dict(public_profile(profile), today=load_stats(cursor, profile['id']))
+                        for profile in profiles]
+        return {
+            'channels': channels,
+            'shared': {
+                'discovery_hits': self.discovery.hits,
+                'discovery_misses': self.discovery.misses,
+                'download_hits': self.downloads.hits,
+                'download_misses': self.downloads.misses,
+                'render_workers': self.render_pool.workers,
+                'render_pending': self.render_pool.pending(),
+                'rendered': self.render_pool.rendered
+            }
+        }
@@ -0,0 +1,213 @@
+"""
+Frame compositor for reaction shorts
+- The background is center-cropped to 9:16 first and only the crop is
+  scaled (resizing the whole frame and cropping afterwards scaled pixels
+  that were thrown away)
+- Scaling is bilinear through remap tables - source rows/columns and 7-bit
+  weights - built once per input size; the math is 16-bit integer only
+- Every frame is written into the same output buffer; the overlay is scaled
+  straight into its slice of it with slice assignment
+- OVERLAY_OPACITY below 255 alpha-blends the overlay (uint16 math) instead
+  of pasting it
+"""
+
+import os
+
+import numpy as np
+
+TARGET_SIZE = (1080, 1920)
+
+OVERLAY_MARGIN = 20
+OVERLAY_OPACITY = min(255, max(0, int(os.getenv('OVERLAY_OPACITY', 255))))
+
+# Interpolation weights are fractions of 128, so (next - this) * weight of
+# 8-bit pixels stays within int16
+WEIGHT_BITS = 7
+WEIGHT_ONE = 1 << WEIGHT_BITS
+
+
+def _even(value):
+    return int(value) // 2 * 2
+
+
+def crop_box(source_size, target_size):
+    """(x, y, width, height) of the centered crop with the target's aspect ratio"""
+    source_w, source_h = source_size
+    target_w, target_h = target_size
+    if source_w * target_h > source_h * target_w:
+        width, height = _even(source_h * target_w / target_h), _even(source_h)
+    else:
+        width, height = _even(source_w), _even(source_w * target_h / target_w)
+    # Even sizes, so the crop can also be cut from yuv420p frames
+    width, height = max(2, min(width, source_w)), max(2, min(height, source_h))
+    return (source_w - width) // 2, (source_h - height) // 2, width, height
+
+
+def overlay_box(target_size, overlay_size, scale, position):
+    """(x, y, width, height) of the overlay in the frame - even values, so
+    the box also lines up with yuv420p chroma planes"""
+    target_w, target_h = target_size
+    width = _even(target_w * scale)
+    height = _even(width * overlay_size[1] / overlay_size[0])
+
+    right = target_w - width - OVERLAY_MARGIN
+    bottom = target_h - height - OVERLAY_MARGIN
+    x, y = {
+        'top-left': (OVERLAY_MARGIN, OVERLAY_MARGIN),
+        'bottom-right': (right, bottom),
+        'bottom-left': (OVERLAY_MARGIN, bottom),
+    }.get(position, (right, OVERLAY_MARGIN))
+    return x, y, width, height
+
+
+def _axis_table(length, output_length):
+    """Bilinear taps along one axis: (first index, second index, weight of the second)"""
+    # Pixel centers line up, as in ffmpeg/OpenCV bilinear scaling
+    position = (np.arange(output_length) + 0.5) * (length / output_length) - 0.5
+    position = np.clip(position, 0, length - 1)
+    first = np.floor(position).astype(np.intp)
+    second = np.minimum(first + 1, length - 1)
+    weight = np.round((position - first) * WEIGHT_ONE).astype(np.int16)
+    return first, second, weight
+
+
+class Remap:
+    """Scales a box of an (H, W, C) uint8 frame to a fixed size, into a caller's buffer
+
+    Rows are handled as flat (W * C) lines, so the column tables hold one
+    entry per channel and every gather and multiply runs on contiguous memory.
+    """
+
+    def __init__(self, box, output_size, channels=3):
+        x, y, width, height = box
+        output_w, output_h = output_size
+        self.rows_slice = slice(y, y + height)
+        self.output_shape = (output_h, output_w, channels)
+
+        cols, cols_next, col_weight = _axis_table(width, output_w)
+        channel = np.arange(channels)
+        self.cols = ((cols[:, None] + x) * channels + channel).ravel()
+        self.cols_next = ((cols_next[:, None] + x) * channels + channel).ravel()
+        self.col_weight = np.repeat(col_weight, channels)[None, :]
+
+        self.rows, self.rows_next, row_weight = _axis_table(height, output_h)
+        self.row_weight = row_weight[:, None]
+
+        # Scratch buffers, reused for every frame
+        line = output_w * channels
+        self.taps = np.empty((2, height, line), dtype=np.uint8)
+        self.horizontal = np.empty((2, height, line), dtype=np.int16)
+        self.vertical = np.empty((2, output_h, line), dtype=np.int16)
+
+    @staticmethod
+    def _lerp(this, following, weight):
+        """this += (following - this) * weight >> WEIGHT_BITS, in place"""
+        following -= this
+        following *= weight
+        following >>= WEIGHT_BITS
+        this += following
+
+    def __call__(self, frame, out):
+        """Write the scaled box of frame into out (any (h, w, C) view)"""
+        left, right = self.taps
+        horizontal, horizontal_next = self.horizontal
+        vertical, vertical_next = self.vertical
+
+        # Columns first, on the box's rows only (fewer lines than the output)
+        lines = frame[self.rows_slice].reshape(left.shape[0], -1)
+        np.take(lines, self.cols, axis=1, out=left)
+        np.take(lines, self.cols_next, axis=1, out=right)
+        np.copyto(horizontal, left)
+        np.copyto(horizontal_next, right)
+        self._lerp(horizontal, horizontal_next, self.col_weight)
+
+        np.take(horizontal, self.rows, axis=0, out=vertical)
+        np.take(horizontal, self.rows_next, axis=0, out=vertical_next)
+        self._lerp(vertical, vertical_next, self.row_weight)
+
+        np.copyto(out, vertical.reshape(self.output_shape), casting='unsafe')
+        return out
+
+
+def blend(background, overlay, alpha, work=None):
+    """background = overlay * a + background * (1 - a), in place, for alpha 0-255
+
+    alpha is a number or an array broadcastable to the frames; work is an
+    optional (2, *background.shape) uint16 scratch buffer.
+    """
+    if work is None:
+        work = np.empty((2,) + background.shape, dtype=np.uint16)
+    alpha = np.asarray(alpha, dtype=np.uint16)
+    total, part = work
+
+    # At most 255 * 255 - the sum fits uint16
+    np.multiply(overlay, alpha, out=total)
+    np.multiply(background, np.uint16(255) - alpha, out=part)
+    total += part
+
+    # Rounded division by 255: (x + 128 + ((x + 128) >> 8)) >> 8
+    total += 128
+    np.right_shift(total, 8, out=part)
+    total += part
+    total >>= 8
+    np.copyto(background, total, casting='unsafe')
+    return background
+
+
+class Compositor:
+    """Background + overlay into one reused (height, width, 3) frame"""
+
+    def __init__(self, target_size=TARGET_SIZE, overlay_scale=0.25, position='top-right',
+                 opacity=OVERLAY_OPACITY):
+        self.target_size = target_size
+        self.overlay_scale = overlay_scale
+        self.position = position
+        self.opacity = opacity
+
+        target_w, target_h = target_size
+        self.output = np.empty((target_h, target_w, 3), dtype=np.uint8)
+
+        # Built from the first frame of each input
+        self.background = None
+        self.background_shape = None
+        self.overlay = None
+        self.overlay_shape = None
+        self.overlay_target = None
+        self.overlay_scratch = None
+        self.blend_work = None
+
+    def _prepare_background(self, frame):
+        height, width = frame.shape[:2]
+        box = crop_box((width, height), self.target_size)
+        self.background = Remap(box, self.target_size, frame.shape[2])
+        self.background_shape = frame.shape
+
+    def _prepare_overlay(self, frame):
+        height, width = frame.shape[:2]
+        x, y, box_w, box_h = overlay_box(self.target_size, (width, height), self.overlay_scale, self.position)
+        self.overlay = Remap((0, 0, width, height), (box_w, box_h), frame.shape[2])
+        self.overlay_shape = frame.shape
+        self.overlay_target = self.output[y:y + box_h, x:x + box_w]
+        if self.opacity < 255:
+            self.overlay_scratch = np.empty((box_h, box_w, 3), dtype=np.uint8)
+            self.blend_work = np.empty((2, box_h, box_w, 3), dtype=np.uint16)
+
+    def compose(self, frame, overlay_frame=None):
+        """The composited frame - the same array every call, overwritten next time"""
+        if frame.dtype != np.uint8:
+            frame = frame.astype(np.uint8)
+        if frame.shape != self.background_shape:
+            self._prepare_background(frame)
+        self.background(frame, self.output)
+
+        if overlay_frame is not None:
+            if overlay_frame.dtype != np.uint8:
+                overlay_frame = overlay_frame.astype(np.uint8)
+            if overlay_frame.shape != self.overlay_shape:
+                self._prepare_overlay(overlay_frame)
+            if self.opacity >= 255:
+                self.overlay(overlay_frame, self.overlay_target)
+            else:
+                self.overlay(overlay_frame, self.overlay_scratch)
+                blend(self.overlay_target, self.overlay_scratch, self.opacity, self.blend_work)
+        return self.output
@@ -0,0 +1,110 @@
+"""
+Fast writer for HTTP video downloads
+- Reads straight from the socket into one reused buffer (readinto), no
+  per-chunk bytes objects
+- Chunk size adapts: it doubles while reads keep filling the buffer, from
+  MIN_CHUNK up to MAX_CHUNK, so fast links need few syscalls per MB
+- The file is opened unbuffered and preallocated from Content-Length;
+  with a Content-Encoding (gzip, deflate ...) that is the compressed size,
+  so the body is not preallocated or checked against it
+- The MP4 ftyp box is checked on the first chunk while it is still in
+  memory; bad responses are dropped before anything else is downloaded
+"""
+
+import os
+
+MIN_CHUNK = 64 * 1024
+MAX_CHUNK = 4 * 1024 * 1024
+
+# Anything smaller is an error page, not a video
+MIN_VIDEO_BYTES = 10000
+
+
+class InvalidDownload(Exception):
+    """The response is not a (complete) MP4 file"""
+
+
+def is_mp4_header(header):
+    """ISO base media files start with a size word followed by 'ftyp'"""
+    return len(header) >= 8 and header[4:8] == b'ftyp'
+
+
+def has_mp4_header(path):
+    """Header check for a file already on disk (curl fallback)"""
+    with open(path, 'rb') as f:
+        return is_mp4_header(f.read(8))
+
+
+def _preallocate(fd, length):
+    try:
+        os.posix_fallocate(fd, 0, length)
+    except (AttributeError, OSError):
+        # Filesystems without fallocate (tmpfs on some kernels, Termux storage)
+        pass
+
+
+def write_response(response, path, min_chunk=MIN_CHUNK, max_chunk=MAX_CHUNK):
+    """Stream a requests response (stream=True) to path; returns bytes written
+
+    Raises InvalidDownload, after removing the partial file, when the body
+    is not an MP4, is too small, or ends before Content-Length.
+    """
+    raw = response.raw
+    raw.decode_content = True
+
+    expected = response.headers.get('Content-Length')
+    expected = int(expected) if expected and expected.isdigit() else None
+    if response.headers.get('Content-Encoding', 'identity').lower() != 'identity':
+        expected = None  # Length of the encoded body, not of what we write
+
+    buffer = bytearray(max_chunk)
+    view = memoryview(buffer)
+    chunk = min_chunk
+    written = 0
+
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if expected:
+            _preallocate(fd, expected)
+
+        # First chunk: validate before touching the disk
+        filled = 0
+        while filled < 8:
+            count = raw.readinto(view[filled:chunk])
+            if not count:
+                break
+            filled += count
+        if not is_mp4_header(view[:filled]):
+            raise InvalidDownload("missing MP4 ftyp header")
+        os.write(fd, view[:filled])
+        written = filled
+
+        while True:
+            count = raw.readinto(view[:chunk])
+            if not count:
+                break
+            offset = 0
+            while offset < count:
+                offset += os.write(fd, view[offset:count])
+            written += count
+            # Full reads mean data is waiting - ask for more per syscall
+            if count == chunk and chunk < max_chunk:
+                chunk *= 2
+
+        if expected is not None and written != expected:
+            raise InvalidDownload(f"truncated download ({written} of {expected} bytes)")
+        if written < MIN_VIDEO_BYTES:
+            raise InvalidDownload(f"file too small ({written} bytes)")
+    except BaseException:
+        os.close(fd)
+        fd = None
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        raise
+    finally:
+        if fd is not None:
+            os.close(fd)
+
+    return written
@@ -0,0 +1,9 @@
+"""
+Shared bot engine
+- One in-process BotService per process, used by every front-end
+  (youtube_bot.py dashboard, render_bot.py, telegram_bot.py, main.py)
+"""
+
+from .service import BotService, get_service, DAILY_UPLOAD_LIMIT
+
+__all__ = ['BotService', 'get_service', 'DAILY_UPLOAD_LIMIT']
@@ -0,0 +1,138 @@
+"""
+In-process bot service
+- Owns the single AutoYouTubeBot of the process, created on first use
+- Serializes uploads process-wide (bot.upload_lock), whichever front-end asks
+- Counters come from the bot_stats / dashboard_summary tables, so the
+  dashboard, Telegram and the webhook all report the same numbers
+"""
+
+import threading
+from datetime import datetime
+
+# process_scheduled_upload stops at this many uploads per day
+DAILY_UPLOAD_LIMIT = 10
+
+_service = None
+_service_lock = threading.Lock()
+
+
+class BotService:
+    """Front-end facing API over one AutoYouTubeBot"""
+
+    def __init__(self, bot_factory=None):
+        self._factory = bot_factory
+        self._bot = None
+        self._bot_lock = threading.Lock()
+
+        self.current_upload = None  # Category being uploaded, if any
+        self.automation_thread = None
+
+    @property
+    def bot(self):
+        """The shared AutoYouTubeBot - built on first access"""
+        if self._bot is None:
+            with self._bot_lock:
+                if self._bot is None:
+                    factory = self._factory
+                    if factory is None:
+                        # Heavy import (Google APIs, moviepy) - only when a bot is needed
+                        from youtube_bot import AutoYouTubeBot
+                        factory = AutoYouTubeBot
+                    self._bot = factory()
+        return self._bot
+
+    @property
+    def started(self):
+        return self._bot is not None
+
+    @property
+    def is_running(self):
+        """True while the 24/7 loop is alive and uploads are enabled"""
+        return bool(self._bot and self._bot.bot_active and
+                    self.automation_thread and self.automation_thread.is_alive())
+
+    def start(self):
+        """Enable uploads and start the 24/7 loop once; False if it was already running"""
+        if self.is_running:
+            return False
+
+        bot = self.bot
+        bot.bot_active = True
+        if bot.youtube:
+            bot.stats_refresher.start()
+        # The producer idles while the bot is stopped
+        bot.render_buffer.wake()
+
+        if not (self.automation_thread and self.automation_thread.is_alive()):
+            self.automation_thread = threading.Thread(target=self._run_automation,
+                                                      name='automation', daemon=True)
+            self.automation_thread.start()
+        return True
+
+    def stop(self):
+        """Disable uploads - the loop keeps ticking but skips every slot"""
+        if self._bot:
+            self._bot.bot_active = False
+
+    def _run_automation(self):
+        try:
+            self.bot.run_24x7()
+        except Exception as e:
+            print(f"Bot background error: {e}")
+
+    def upload(self, category):
+        """Upload one video now - True/False, or None if another upload is running"""
+        bot = self.bot
+        # Same lock the 24/7 loop takes, so manual and scheduled uploads never overlap
+        if not bot.upload_lock.acquire(blocking=False):
+            return None
+        try:
+            self.current_upload = category
+            return bot.process_scheduled_upload(category)
+        finally:
+            self.current_upload = None
+            bot.upload_lock.release()
+
+    def process_tech_video(self):
+        return self.upload('tech')
+
+    def process_entertainment_video(self):
+        return self.upload('entertainment')
+
+    def stats(self):
+        """Today's upload counters and library totals, read from the database"""
+        bot = self.bot
+        today = datetime.now().date()
+
+        with bot.db_lock:
+            cursor = bot.db.cursor()
+            cursor.execute('''
+                SELECT tech_uploads, entertainment_uploads, total_uploads
+                FROM bot_stats WHERE date = ?
+            ''', (today,))
+            row = cursor.fetchone() or (0, 0, 0)
+            summary = bot.get_dashboard_summary()
+
+        return {
+            'tech_uploads': row[0],
+            'entertainment_uploads': row[1],
+            'uploads_today': row[2],
+            'daily_limit': DAILY_UPLOAD_LIMIT,
+            'total_videos': summary['total_videos'],
+            'running': self.is_running,
+            'uploading': self.current_upload
+        }
+
+
+def get_service(bot_factory=None):
+    """The process-wide BotService
+
+    bot_factory is only used by the first call - youtube_bot.py passes its own
+    AutoYouTubeBot when run as __main__ so the module is not imported twice.
+    """
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = BotService(bot_factory)
+    return _service
@@ -0,0 +1,202 @@
+"""
+Metadata A/B experiments (Thompson sampling)
+- Every reaction upload records the title pattern, adjective set and
+  description template it used (metadata_experiments table), keyed by
+  the uploaded video's YouTube id - not the source short's
+- Reward is the views an upload gained in its first REWARD_WINDOW_HOURS,
+  summed from video_stats_history once that window has closed and stored
+  with the upload (history is rolled up and later deleted); uploads with
+  no history yet are not scored
+- Each choice keeps a Beta posterior; a reward counts as
+  views / (views + median views), so one viral hit cannot swamp the rest
+- New uploads sample every dimension from its posteriors, so the bot
+  converges on the metadata that earns the most views per upload slot
+"""
+
+import os
+import time
+import random
+import threading
+from datetime import datetime
+
+REWARD_WINDOW_HOURS = int(os.getenv('EXPERIMENT_REWARD_HOURS', 24))
+
+# Posteriors are rebuilt from the database at most this often
+REFRESH_INTERVAL = 10 * 60
+
+DIMENSIONS = ('title_pattern', 'adjective_set', 'description_template')
+
+# Description written by Groq - recorded, but never chosen by the sampler
+AI_DESCRIPTION = 'ai'
+
+
+def create_tables(cursor):
+    """Create the per-upload experiment table"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS metadata_experiments (
+            video_id TEXT PRIMARY KEY,
+            category TEXT,
+            title_pattern TEXT,
+            adjective_set TEXT,
+            description_template TEXT,
+            uploaded_at REAL NOT NULL,
+            reward_views INTEGER
+        )
+    ''')
+    cursor.execute('PRAGMA table_info(metadata_experiments)')
+    if 'reward_views' not in [column[1] for column in cursor.fetchall()]:
+        cursor.execute('ALTER TABLE metadata_experiments ADD COLUMN reward_views INTEGER')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_experiments_uploaded ON metadata_experiments (uploaded_at)')
+
+
+def drop_source_keyed(cursor):
+    """Delete experiments recorded under a source short's id instead of the upload's
+
+    Before uploaded_videos had youtube_id, uploads were recorded under the
+    source id and rewarded with the source channel's views - data the
+    chosen metadata never influenced.
+    """
+    cursor.execute('''
+        DELETE FROM metadata_experiments
+        WHERE video_id IN (SELECT video_id FROM uploaded_videos)
+          AND video_id NOT IN (SELECT youtube_id FROM uploaded_videos WHERE youtube_id IS NOT NULL)
+    ''')
+
+
+class ExperimentEngine:
+    """Chooses metadata variants and learns from their view counts"""
+
+    def __init__(self, bot, arms, rng=None):
+        self.bot = bot
+        self.arms = {dimension: [str(choice) for choice in choices] for dimension, choices in arms.items()}
+        self.rng = rng or random.Random()
+        self.lock = threading.Lock()
+
+        self.posteriors = {}      # (dimension, choice) -> [alpha, beta, uploads, views]
+        self.median_views = 0
+        self.scored = 0
+        self.refreshed_at = 0.0
+
+    # --- Learning ---
+
+    def _rewards(self, cursor, now):
+        """(choices, views in the reward window) for every scored upload (caller commits)"""
+        window = REWARD_WINDOW_HOURS * 3600
+        # Settle uploads whose window has closed while their history is still
+        # there; no history (yet) leaves reward_views NULL and the upload unscored
+        cursor.execute('''
+            UPDATE metadata_experiments SET reward_views = (
+                SELECT MAX(0, SUM(h.views_delta)) FROM video_stats_history h
+                WHERE h.video_id = metadata_experiments.video_id
+                  AND h.bucket_start <= metadata_experiments.uploaded_at + ?
+            )
+            WHERE reward_views IS NULL AND uploaded_at <= ?
+        ''', (window, now - window))
+        cursor.execute('''
+            SELECT title_pattern, adjective_set, description_template, reward_views
+            FROM metadata_experiments WHERE reward_views IS NOT NULL
+        ''')
+        return [(dict(zip(DIMENSIONS, row[:3])), row[3]) for row in cursor.fetchall()]
+
+    def refresh(self, force=False):
+        """Rebuild the Beta posteriors from the database"""
+        now = time.time()
+        if not force and now - self.refreshed_at < REFRESH_INTERVAL:
+            return
+        if not self.bot.db:
+            return
+
+        with self.bot.db_lock:
+            rewards = self._rewards(self.bot.db.cursor(), now)
+            self.bot.db.commit()
+
+        views = sorted(value for _, value in rewards)
+        median = views[len(views) // 2] if views else 0
+
+        posteriors = {}
+        for choices, value in rewards:
+            # Fractional success against the median upload (0.5 = typical)
+            success = value / (value + median) if value + median > 0 else 0.5
+            for dimension, choice in choices.items():
+                if choice is None:
+                    continue
+                posterior = posteriors.setdefault((dimension, choice), [1.0, 1.0, 0, 0])
+                posterior[0] += success
+                posterior[1] += 1 - success
+                posterior[2] += 1
+                posterior[3] += value
+
+        with self.lock:
+            self.posteriors = posteriors
+            self.median_views = median
+            self.scored = len(rewards)
+            self.refreshed_at = now
+
+    # --- Assignment ---
+
+    def choose(self):
+        """One Thompson sample per dimension -> {dimension: choice}"""
+        self.refresh()
+        choices = {}
+        with self.lock:
+            for dimension, options in self.arms.items():
+                best, best_draw = None, -1.0
+                for option in options:
+                    alpha, beta = self.posteriors.get((dimension, option), (1.0, 1.0))[:2]
+                    draw = self.rng.betavariate(alpha, beta)
+                    if draw > best_draw:
+                        best, best_draw = option, draw
+                choices[dimension] = best
+        return choices
+
+    def record(self, video_id, choices, category=None):
+        """Remember which variants an upload used"""
+        if not (self.bot.db and video_id and choices):
+            return
+        try:
+            with self.bot.db_lock:
+                self.bot.db.execute('''
+                    INSERT OR REPLACE INTO metadata_experiments
+                    (video_id, category, title_pattern, adjective_set, description_template, uploaded_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', (video_id, category, *(choices.get(dimension) for dimension in DIMENSIONS), time.time()))
+                self.bot.db.commit()
+        except Exception as e:
+            print(f"⚠️ Could not record experiment for {video_id}: {e}")
+
+    # --- Report ---
+
+    def report(self):
+        """Per-dimension arm statistics for /api/experiments"""
+        self.refresh(force=True)
+        with self.bot.db_lock:
+            cursor = self.bot.db.cursor()
+            cursor.execute('SELECT COUNT(*) FROM metadata_experiments')
+            recorded = cursor.fetchone()[0]
+
+        dimensions = {}
+        with self.lock:
+            for dimension, options in self.arms.items():
+                rows = []
+                known = options + ([AI_DESCRIPTION] if dimension == 'description_template' else [])
+                for option in known:
+                    alpha, beta, uploads, views = self.posteriors.get((dimension, option), (1.0, 1.0, 0, 0))
+                    rows.append({
+                        'choice': option,
+                        'uploads': uploads,
+                        'avg_views': round(views / uploads, 1) if uploads else None,
+                        'expected_score': round(alpha / (alpha + beta), 3),
+                        'sampled': option in options
+                    })
+                rows.sort(key=lambda row: row['expected_score'], reverse=True)
+                dimensions[dimension] = rows
+
+        return {
+            'reward_window_hours': REWARD_WINDOW_HOURS,
+            'recorded_uploads': recorded,
+            'scored_uploads': self.scored,
+            'median_views': self.median_views,
+            'refreshed_at': datetime.fromtimestamp(self.refreshed_at).isoformat(timespec='seconds')
+                            if self.refreshed_at else None,
+            'dimensions': dimensions
+        }
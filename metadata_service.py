@@ -0,0 +1,269 @@
+"""
+Groq description service
+- One pooled requests.Session, prompts run concurrently on a small worker pool
+- Results are cached by (prompt template, source video ID, title) in memory
+  (LRU, METADATA_CACHE_SIZE entries) and in the metadata_cache table, so a
+  description is generated once per video and title variant - the prompt
+  includes the title, which depends on the experiment arm
+- prefetch() starts generation as soon as candidates are known (buffer
+  fill, on-demand slot) so it overlaps download and render
+- describe() waits at most a latency budget; None means "use the template"
+- 429 / 5xx are retried with backoff (Retry-After when Groq sends one)
+"""
+
+import os
+import time
+import random
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+
+GROQ_URL = "https://api.groq.com/openai/v1/chat/completions"
+GROQ_MODEL = os.getenv('GROQ_MODEL', 'llama-3.1-8b-instant')
+
+METADATA_WORKERS = int(os.getenv('METADATA_WORKERS', 4))
+
+# Descriptions kept in memory (the database keeps them all)
+METADATA_CACHE_SIZE = int(os.getenv('METADATA_CACHE_SIZE', 500))
+
+# Longest an on-demand slot waits for the LLM before using the template
+METADATA_LATENCY_BUDGET = float(os.getenv('METADATA_LATENCY_BUDGET', 3))
+
+REQUEST_TIMEOUT = 10
+MAX_RETRIES = 3
+BACKOFF_BASE = 1.0
+MAX_BACKOFF = 20
+
+DESCRIPTION_PROMPT = """Create a viral YouTube Shorts description for:
+Title: {title}
+Category: {category}
+Original: {original}
+Channel: {channel}
+
+Requirements:
+- Start with eye-catching emoji
+- Include 3 bullet points about the content
+- Add relevant hashtags (15-20)
+- Make it engaging and shareable
+- Include call-to-action
+- SEO optimized
+- Max 500 characters
+
+Format with emojis and line breaks for readability."""
+
+# Cache key part - changes whenever the prompt or model changes
+PROMPT_KEY = hashlib.md5(f"{GROQ_MODEL}\n{DESCRIPTION_PROMPT}".encode()).hexdigest()[:12]
+
+
+def title_key(title):
+    """Cache key part for the title the description was written for"""
+    return hashlib.md5((title or '').encode()).hexdigest()[:12]
+
+
+def create_tables(cursor):
+    """Create the generated description cache"""
+    # Rows from before title_key may belong to another title variant - it is only a cache
+    cursor.execute("PRAGMA table_info(metadata_cache)")
+    columns = [column[1] for column in cursor.fetchall()]
+    if columns and 'title_key' not in columns:
+        cursor.execute('DROP TABLE metadata_cache')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS metadata_cache (
+            prompt_key TEXT NOT NULL,
+            video_id TEXT NOT NULL,
+            title_key TEXT NOT NULL,
+            description TEXT NOT NULL,
+            created_at TIMESTAMP,
+            PRIMARY KEY (prompt_key, video_id, title_key)
+        )
+    ''')
+
+
+class MetadataService:
+    """Cached, concurrent Groq descriptions with a bounded wait"""
+
+    def __init__(self, bot, api_key=None, workers=METADATA_WORKERS, cache_size=METADATA_CACHE_SIZE):
+        self.bot = bot
+        self.api_key = api_key
+        self.cache = OrderedDict()   # (video_id, title_key) -> description, least recently used first
+        self.cache_size = cache_size
+        self.in_flight = {}          # (video_id, title_key) -> Future
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='metadata')
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        })
+
+        # Counters for /api/metadata
+        self.hits = 0
+        self.generated = 0
+        self.rate_limited = 0
+        self.failures = 0
+        self.fallbacks = 0
+        self.last_latency = None
+
+    @property
+    def enabled(self):
+        return bool(self.api_key)
+
+    # --- Cache ---
+
+    def _remember(self, key, description):
+        # Caller holds self.lock
+        self.cache[key] = description
+        self.cache.move_to_end(key)
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+    def cached(self, video_id, title):
+        """Cached description for video_id written for title (memory, then database)"""
+        key = (video_id, title_key(title))
+        with self.lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                return self.cache[key]
+
+        if not self.bot.db:
+            return None
+        with self.bot.db_lock:
+            cursor = self.bot.db.cursor()
+            cursor.execute('''
+                SELECT description FROM metadata_cache WHERE prompt_key = ? AND video_id = ? AND title_key = ?
+            ''', (PROMPT_KEY, *key))
+            row = cursor.fetchone()
+        if row:
+            with self.lock:
+                self._remember(key, row[0])
+            return row[0]
+        return None
+
+    def _store(self, video_id, title, description):
+        key = (video_id, title_key(title))
+        with self.lock:
+            self._remember(key, description)
+        if not self.bot.db:
+            return
+        try:
+            with self.bot.db_lock:
+                self.bot.db.execute('''
+                    INSERT OR REPLACE INTO metadata_cache (prompt_key, video_id, title_key, description, created_at)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', (PROMPT_KEY, *key, description, datetime.now()))
+                self.bot.db.commit()
+        except Exception as e:
+            print(f"⚠️ Could not cache description for {video_id}: {e}")
+
+    # --- Generation ---
+
+    def prefetch(self, items):
+        """Start generating descriptions for (video_data, title, category) items
+
+        Returns {video_id: Future}; cached and already running items are not
+        requested again.
+        """
+        futures = {}
+        if not self.enabled:
+            return futures
+        for video_data, title, category in items:
+            video_id = video_data['id']
+            if self.cached(video_id, title) is not None:
+                continue
+            key = (video_id, title_key(title))
+            with self.lock:
+                future = self.in_flight.get(key)
+                if future is None:
+                    future = self.executor.submit(self._generate, video_data, title, category)
+                    self.in_flight[key] = future
+                    future.add_done_callback(lambda _, key=key: self._done(key))
+            futures[video_id] = future
+        return futures
+
+    def _done(self, key):
+        with self.lock:
+            self.in_flight.pop(key, None)
+
+    def describe(self, video_data, title, category, budget=METADATA_LATENCY_BUDGET):
+        """AI description, or None if it is not ready within budget seconds"""
+        description = self.cached(video_data['id'], title)
+        if description is not None:
+            self.hits += 1
+            return description
+        if not self.enabled:
+            return None
+
+        future = self.prefetch([(video_data, title, category)]).get(video_data['id'])
+        try:
+            description = future.result(timeout=budget) if future else None
+        except Exception:
+            description = None  # Timed out - keeps running and lands in the cache
+        if description is None:
+            self.fallbacks += 1
+        return description
+
+    def _generate(self, video_data, title, category):
+        prompt = DESCRIPTION_PROMPT.format(
+            title=title,
+            category=category,
+            original=video_data['title'][:50],
+            channel=video_data['channel']
+        )
+        data = {
+            "model": GROQ_MODEL,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": 400,
+            "temperature": 0.9
+        }
+
+        started = time.monotonic()
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                response = self.session.post(GROQ_URL, json=data, timeout=REQUEST_TIMEOUT)
+            except requests.RequestException as e:
+                response = None
+                error = str(e)
+            else:
+                if response.status_code == 200:
+                    description = response.json()['choices'][0]['message']['content']
+                    self.generated += 1
+                    self.last_latency = round(time.monotonic() - started, 2)
+                    self._store(video_data['id'], title, description)
+                    return description
+                error = f"HTTP {response.status_code}"
+                if response.status_code == 429:
+                    self.rate_limited += 1
+                elif response.status_code < 500:
+                    break  # Bad request / auth - retrying won't help
+
+            if attempt < MAX_RETRIES:
+                retry_after = response.headers.get('Retry-After') if response is not None else None
+                delay = float(retry_after) if retry_after and retry_after.isdigit() else \
+                    min(MAX_BACKOFF, BACKOFF_BASE * 2 ** attempt) * random.uniform(0.5, 1.5)
+                time.sleep(delay)
+
+        self.failures += 1
+        print(f"⚠️ Groq description failed for {video_data['id']}: {error}")
+        return None
+
+    def status(self):
+        return {
+            'enabled': self.enabled,
+            'model': GROQ_MODEL,
+            'cached': len(self.cache),
+            'in_flight': len(self.in_flight),
+            'hits': self.hits,
+            'generated': self.generated,
+            'rate_limited': self.rate_limited,
+            'failures': self.failures,
+            'fallbacks': self.fallbacks,
+            'last_latency': self.last_latency
+        }
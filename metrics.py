@@ -0,0 +1,243 @@
+"""
+In-process metrics for the upload pipeline, served at /metrics
+- timer(stage) is a context manager and a decorator; durations go into
+  log-linear (HDR-style) histograms - SUB_BUCKETS per power of two, so
+  quantiles are within ~6% from 0.1 ms to over an hour
+- A timed block that raises also counts bot_stage_errors_total
+- count(name) for plain counters (candidates skipped, uploads, ...)
+- Recording is a frexp and a list increment under a lock; all the
+  formatting happens when /metrics is scraped (Prometheus text format)
+"""
+
+import math
+import time
+import threading
+import functools
+
+NAMESPACE = 'bot'
+
+# Histogram range and resolution: values are bucketed by power of two and
+# then linearly within it
+SUB_BUCKETS = 16
+MIN_EXPONENT = -13            # 2 ** -14 s (~61 us) and below share bucket 0
+MAX_EXPONENT = 13             # 2 ** 13 s (~2.3 h) and above share the last one
+BUCKETS = (MAX_EXPONENT - MIN_EXPONENT + 1) * SUB_BUCKETS
+
+# Prometheus `le` buckets - every other power of two, 1 ms to ~68 min;
+# they fall on histogram bucket edges, so the counts are exact
+EXPORT_BOUNDS = tuple(2.0 ** exponent for exponent in range(-10, 13, 2))
+EXPORT_QUANTILES = (0.5, 0.9, 0.99)
+
+STAGE_HELP = 'Time spent in each pipeline stage'
+
+COUNTER_HELP = {
+    'stage_errors': 'Timed stages that raised',
+    'videos_discovered': 'Shorts returned by discovery',
+    'candidates_skipped': 'Discovered videos not processed',
+    'uploads': 'YouTube upload attempts by result',
+    'render_fallbacks': 'Stream renders that fell back to MoviePy',
+    'render_memory_exceeded': 'Stream renders stopped at the memory limit',
+    'render_buffer_slots': 'Upload slots by whether the render buffer had a short',
+}
+
+
+def _bucket(value):
+    """Histogram bucket index of a (positive) value"""
+    if value <= 0:
+        return 0
+    mantissa, exponent = math.frexp(value)       # value = mantissa * 2 ** exponent, 0.5 <= mantissa < 1
+    if exponent < MIN_EXPONENT:
+        return 0
+    if exponent > MAX_EXPONENT:
+        return BUCKETS - 1
+    return (exponent - MIN_EXPONENT) * SUB_BUCKETS + int((mantissa - 0.5) * 2 * SUB_BUCKETS)
+
+
+def _bucket_upper(index):
+    """Upper edge of a histogram bucket"""
+    octave, sub = divmod(index, SUB_BUCKETS)
+    return 2.0 ** (octave + MIN_EXPONENT - 1) * (1 + (sub + 1) / SUB_BUCKETS)
+
+
+class Histogram:
+    """Fixed-size log-linear histogram"""
+
+    def __init__(self):
+        self.counts = [0] * BUCKETS
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def record(self, value):
+        self.counts[_bucket(value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q):
+        """Upper edge of the bucket holding the q-quantile (capped at the max seen)"""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(_bucket_upper(index), self.max)
+        return self.max
+
+    def cumulative(self, bounds):
+        """Count of values below each bound (bounds must be powers of two, ascending)"""
+        result = []
+        seen = 0
+        index = 0
+        for bound in bounds:
+            stop = min(BUCKETS, max(0, _bucket(bound)))
+            seen += sum(self.counts[index:stop])
+            index = max(index, stop)
+            result.append(seen)
+        return result
+
+
+class Registry:
+    """All timers and counters of the process"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.histograms = {}      # (stage, labels) -> Histogram
+        self.counters = {}        # (name, labels) -> value
+        self.started = time.time()
+
+    def observe(self, stage, seconds, labels=()):
+        key = (stage, labels)
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.record(seconds)
+
+    def count(self, name, value=1, labels=()):
+        key = (name, labels)
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def reset(self):
+        with self.lock:
+            self.histograms.clear()
+            self.counters.clear()
+
+    # --- Exposition ---
+
+    def snapshot(self):
+        """Per-stage summary (count, mean, quantiles, max) for JSON APIs"""
+        with self.lock:
+            histograms = list(self.histograms.items())
+            stages = {}
+            for (stage, labels), histogram in histograms:
+                name = stage + ''.join(f',{key}={value}' for key, value in labels)
+                stages[name] = {
+                    'count': histogram.count,
+                    'mean': round(histogram.sum / histogram.count, 4) if histogram.count else 0,
+                    **{f'p{int(q * 100)}': round(histogram.quantile(q), 4) for q in EXPORT_QUANTILES},
+                    'max': round(histogram.max, 4)
+                }
+        return stages
+
+    def render(self):
+        """Prometheus text exposition format (0.0.4)"""
+        lines = []
+        histogram_name = f'{NAMESPACE}_stage_duration_seconds'
+        quantile_name = f'{NAMESPACE}_stage_duration_quantile_seconds'
+
+        with self.lock:
+            histograms = sorted(self.histograms.items())
+            counters = sorted(self.counters.items())
+
+            lines += [f'# HELP {histogram_name} {STAGE_HELP}', f'# TYPE {histogram_name} histogram']
+            quantiles = []
+            for (stage, labels), histogram in histograms:
+                base = (('stage', stage),) + labels
+                for bound, cumulative in zip(EXPORT_BOUNDS, histogram.cumulative(EXPORT_BOUNDS)):
+                    lines.append(f'{histogram_name}_bucket{_labels(base + (("le", repr(bound)),))} {cumulative}')
+                lines.append(f'{histogram_name}_bucket{_labels(base + (("le", "+Inf"),))} {histogram.count}')
+                lines.append(f'{histogram_name}_sum{_labels(base)} {histogram.sum!r}')
+                lines.append(f'{histogram_name}_count{_labels(base)} {histogram.count}')
+                for q in EXPORT_QUANTILES:
+                    quantiles.append(f'{quantile_name}{_labels(base + (("quantile", repr(q)),))} '
+                                     f'{histogram.quantile(q)!r}')
+
+            lines += [f'# HELP {quantile_name} {STAGE_HELP} - quantiles from the full-resolution histogram',
+                      f'# TYPE {quantile_name} gauge', *quantiles]
+
+            previous = None
+            for (name, labels), value in counters:
+                metric = f'{NAMESPACE}_{name}_total'
+                if name != previous:
+                    lines += [f'# HELP {metric} {COUNTER_HELP.get(name, name)}', f'# TYPE {metric} counter']
+                    previous = name
+                lines.append(f'{metric}{_labels(labels)} {value}')
+
+        uptime_name = f'{NAMESPACE}_uptime_seconds'
+        lines += [f'# HELP {uptime_name} Seconds since the metrics registry was created',
+                  f'# TYPE {uptime_name} gauge', f'{uptime_name} {time.time() - self.started:.0f}']
+        return '\n'.join(lines) + '\n'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in labels) + '}'
+
+
+REGISTRY = Registry()
+
+
+class timer:
+    """Times a stage - `with metrics.timer('download'):` or `@metrics.timer('download')`"""
+
+    def __init__(self, stage, registry=None, **labels):
+        self.stage = stage
+        self.labels = tuple(sorted(labels.items()))
+        self.registry = registry or REGISTRY
+        self.started = None
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.registry.observe(self.stage, time.perf_counter() - self.started, self.labels)
+        if exc_type is not None:
+            self.registry.count('stage_errors', labels=(('stage', self.stage),) + self.labels)
+        return False
+
+    def __call__(self, func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # A fresh timer per call - the decorator instance is shared between threads
+            with timer(self.stage, self.registry, **dict(self.labels)):
+                return func(*args, **kwargs)
+        return wrapper
+
+
+def count(name, value=1, **labels):
+    """Add to the counter bot_<name>_total (describe new names in COUNTER_HELP)"""
+    REGISTRY.count(name, value, tuple(sorted(labels.items())))
+
+
+def observe(stage, seconds, **labels):
+    """Record a duration measured elsewhere"""
+    REGISTRY.observe(stage, seconds, tuple(sorted(labels.items())))
+
+
+def render():
+    return REGISTRY.render()
+
+
+def snapshot():
+    return REGISTRY.snapshot()
@@ -0,0 +1,144 @@
+"""
+Sampling profiler and thread dump for the running bot (/debug/*)
+- Disabled unless DEBUG_TOKEN is set; requests must send the token
+  (X-Debug-Token header, Bearer token or ?token=)
+- The requesting thread reads sys._current_frames() every
+  PROFILE_INTERVAL_MS and counts each thread's stack - nothing is hooked
+  into the profiled code, so it only costs while a profile runs
+- Output is collapsed stacks ("thread;outer;...;inner count" per line),
+  the input format of flamegraph.pl, speedscope and inferno
+- One profile at a time, at most MAX_PROFILE_SECONDS long
+"""
+
+import os
+import sys
+import hmac
+import math
+import time
+import threading
+import traceback
+from collections import Counter
+
+DEBUG_TOKEN = os.getenv('DEBUG_TOKEN', '')
+
+PROFILE_INTERVAL_MS = int(os.getenv('PROFILE_INTERVAL_MS', 10))
+DEFAULT_PROFILE_SECONDS = 30
+MAX_PROFILE_SECONDS = 120
+
+# Deepest stack kept per sample (the outermost frames are dropped)
+MAX_DEPTH = 100
+
+
+class ProfilerBusy(Exception):
+    """Another profile is already running"""
+
+
+def authorized(request):
+    """True if the request carries DEBUG_TOKEN (always False when it is unset)"""
+    if not DEBUG_TOKEN:
+        return False
+    provided = request.headers.get('X-Debug-Token') or request.args.get('token') or ''
+    authorization = request.headers.get('Authorization', '')
+    if not provided and authorization.startswith('Bearer '):
+        provided = authorization[len('Bearer '):]
+    return hmac.compare_digest(provided.encode(), DEBUG_TOKEN.encode())
+
+
+def _frame_label(code):
+    # First line of the function, not the current one, so a function is one box
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _thread_names():
+    return {thread.ident: thread.name for thread in threading.enumerate()}
+
+
+class SamplingProfiler:
+    """Wall-clock stack sampler over all threads"""
+
+    def __init__(self, interval=PROFILE_INTERVAL_MS / 1000):
+        self.interval = max(0.001, interval)
+        self.lock = threading.Lock()
+        self.running = False
+
+        # Stats of the last profile
+        self.samples = 0
+        self.seconds = 0.0
+
+    def _labels(self, frame, cache):
+        labels = []
+        while frame is not None and len(labels) < MAX_DEPTH:
+            code = frame.f_code
+            label = cache.get(code)
+            if label is None:
+                label = cache[code] = _frame_label(code)
+            labels.append(label)
+            frame = frame.f_back
+        labels.reverse()
+        return labels
+
+    def profile(self, seconds=DEFAULT_PROFILE_SECONDS, exclude=()):
+        """Sample every thread for seconds; returns collapsed stacks as text
+
+        Runs on the calling thread, which is left out of the samples (it
+        would only show up as a long sleep), as are the idents in exclude.
+        """
+        seconds = float(seconds)
+        if math.isnan(seconds):
+            seconds = DEFAULT_PROFILE_SECONDS
+        seconds = min(max(seconds, 0.1), MAX_PROFILE_SECONDS)
+        if not self.lock.acquire(blocking=False):
+            raise ProfilerBusy("a profile is already running")
+        try:
+            self.running = True
+            stacks = Counter()
+            cache = {}
+            skip = set(exclude) | {threading.get_ident()}
+            names = _thread_names()
+            samples = 0
+
+            started = time.monotonic()
+            deadline = started + seconds
+            next_sample = started
+            while True:
+                now = time.monotonic()
+                if now >= deadline:
+                    break
+                if now < next_sample:
+                    time.sleep(next_sample - now)
+                next_sample += self.interval
+
+                frames = sys._current_frames()
+                for ident, frame in frames.items():
+                    if ident in skip:
+                        continue
+                    name = names.get(ident)
+                    if name is None:
+                        names = _thread_names()  # Thread started since
+                        name = names.get(ident, f'thread-{ident}')
+                    stacks[(name.replace(';', ':'), *self._labels(frame, cache))] += 1
+                del frames
+                samples += 1
+
+            self.samples = samples
+            self.seconds = round(time.monotonic() - started, 2)
+            return ''.join(f"{';'.join(stack)} {count}\n" for stack, count in stacks.most_common())
+        finally:
+            self.running = False
+            self.lock.release()
+
+
+def thread_dump():
+    """Current stack of every thread as text, like a JVM thread dump"""
+    threads = {thread.ident: thread for thread in threading.enumerate()}
+    lines = [f"# {len(threads)} threads at {time.strftime('%Y-%m-%d %H:%M:%S')}\n"]
+    for ident, frame in sorted(sys._current_frames().items(), key=lambda item: str(threads.get(item[0]))):
+        thread = threads.get(ident)
+        name = thread.name if thread else f'thread-{ident}'
+        daemon = ' daemon' if thread and thread.daemon else ''
+        lines.append(f'\n"{name}" ident={ident}{daemon}\n')
+        lines.extend(traceback.format_stack(frame))
+    return ''.join(lines)
+
+
+PROFILER = SamplingProfiler()
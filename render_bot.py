@@ -5,23 +5,22 @@ Simple Telegram Bot for Render.com - Fixed Version
 
 import os
 import time
-import threading
 from flask import Flask, jsonify, request
 from dotenv import load_dotenv
 import requests
-from youtube_bot import YouTubeBot
+from engine import get_service
+from webhook_queue import WebhookDispatcher
 
 load_dotenv()
 
 # Flask app for Render.com
 app = Flask(__name__)
 
-# Global bot state
-bot_state = {
-    'is_running': False,
-    'uploads_today': 0,
-    'youtube_bot': None
-}
+# Shared engine - counters come from the bot database, not from this process
+service = get_service()
+
+# Reused connection for replies sent from the webhook workers
+telegram_session = requests.Session()
 
 def send_telegram_message(message):
     """Send message to Telegram"""
@@ -35,49 +34,46 @@ def send_telegram_message(message):
             'text': message,
             'parse_mode': 'HTML'
         }
-        response = requests.post(url, data=data, timeout=10)
+        response = telegram_session.post(url, data=data, timeout=10)
         return response.status_code == 200
     except Exception as e:
         print(f"❌ Telegram error: {e}")
         return False
 
-@app.route('/')
-def health_check():
-    """Health check for Render.com"""
-    return jsonify({
-        "status": "alive",
-        "message": "Simple YouTube Bot is running!",
-        "bot_running": bot_state['is_running'],
-        "uploads_today": bot_state['uploads_today']
-    })
-
-@app.route('/webhook/telegram', methods=['POST'])
-def telegram_webhook():
-    """Handle Telegram messages"""
+def run_upload(label, category):
+    """Upload one video on the current worker unless another upload is running"""
+    if not service.is_running:
+        send_telegram_message("⚠️ Bot is stopped. Send 'start' first.")
+        return
+    
     try:
-        data = request.get_json()
+        send_telegram_message(f"🎬 <b>Processing {label.lower()} video...</b>")
+        success = service.upload(category)
+        if success is None:
+            send_telegram_message("⏳ <b>An upload is already running</b>\n\nSend 'status' to check progress.")
+        elif success:
+            stats = service.stats()
+            send_telegram_message(f"✅ <b>{label} Video Uploaded!</b>\n\n📊 Today: {stats['uploads_today']}/{stats['daily_limit']}")
+        else:
+            send_telegram_message(f"❌ <b>{label} video upload failed!</b>")
+    except Exception as e:
+        send_telegram_message(f"❌ <b>Upload Error:</b>\n\n{str(e)}")
+
+def handle_update(update):
+    """Process one Telegram update (runs on a webhook worker)"""
+    message = update['message']
+    text = message.get('text', '').lower().strip()
+    
+    # Handle commands
+    if text in ['start', '/start']:
+        # Builds the shared bot on first use and starts the 24/7 loop
+        service.start()
+        stats = service.stats()
         
-        if 'message' in data:
-            message = data['message']
-            text = message.get('text', '').lower().strip()
-            chat_id = str(message['chat']['id'])
-            
-            # Check if message is from authorized chat
-            if chat_id != os.getenv('TELEGRAM_CHAT_ID'):
-                return jsonify({"status": "unauthorized"}), 403
-            
-            # Handle commands
-            if text in ['start', '/start']:
-                bot_state['is_running'] = True
-                
-                # Initialize YouTube bot
-                if not bot_state['youtube_bot']:
-                    bot_state['youtube_bot'] = YouTubeBot()
-                
-                response = """🚀 <b>YouTube Automation Started!</b>
+        response = f"""🚀 <b>YouTube Automation Started!</b>
 
 ✅ Status: Running 24/7
-📊 Today: 0/10 videos
+📊 Today: {stats['uploads_today']}/{stats['daily_limit']} videos
 ⏰ Schedule: Every 2 hours
 
 <b>Commands:</b>
@@ -86,71 +82,32 @@ def telegram_webhook():
 • <code>upload tech</code> - Manual tech upload
 • <code>upload entertainment</code> - Manual entertainment upload
 • <code>help</code> - Show commands"""
-                
-                send_telegram_message(response)
-                
-            elif text in ['stop', '/stop']:
-                bot_state['is_running'] = False
-                send_telegram_message("⏹️ <b>Automation Stopped</b>\n\nSend 'start' to resume")
-                
-            elif text in ['status', '/status']:
-                status = f"""📊 <b>Bot Status</b>
-
-🤖 Status: {'🟢 Running' if bot_state['is_running'] else '🔴 Stopped'}
-📈 Today: {bot_state['uploads_today']}/10
+        
+        send_telegram_message(response)
+        
+    elif text in ['stop', '/stop']:
+        service.stop()
+        send_telegram_message("⏹️ <b>Automation Stopped</b>\n\nSend 'start' to resume")
+        
+    elif text in ['status', '/status']:
+        stats = service.stats()
+        status = f"""📊 <b>Bot Status</b>
+
+🤖 Status: {'🟢 Running' if stats['running'] else '🔴 Stopped'}
+📈 Today: {stats['uploads_today']}/{stats['daily_limit']}
 ⏰ Time: {time.strftime('%H:%M:%S')}
 
 Send 'start' to begin automation"""
-                send_telegram_message(status)
-                
-            elif text in ['upload', '/upload', 'upload tech']:
-                if bot_state['is_running']:
-                    if not bot_state['youtube_bot']:
-                        bot_state['youtube_bot'] = YouTubeBot()
-                    
-                    send_telegram_message("🎬 <b>Processing tech video...</b>")
-                    
-                    # Process in background thread
-                    def process_video():
-                        try:
-                            success = bot_state['youtube_bot'].process_tech_video()
-                            if success:
-                                bot_state['uploads_today'] += 1
-                                send_telegram_message(f"✅ <b>Tech Video Uploaded!</b>\n\n📊 Today: {bot_state['uploads_today']}/10")
-                            else:
-                                send_telegram_message("❌ <b>Tech video upload failed!</b>")
-                        except Exception as e:
-                            send_telegram_message(f"❌ <b>Upload Error:</b>\n\n{str(e)}")
-                    
-                    threading.Thread(target=process_video, daemon=True).start()
-                else:
-                    send_telegram_message("⚠️ Bot is stopped. Send 'start' first.")
-                    
-            elif text in ['upload entertainment']:
-                if bot_state['is_running']:
-                    if not bot_state['youtube_bot']:
-                        bot_state['youtube_bot'] = YouTubeBot()
-                    
-                    send_telegram_message("🎬 <b>Processing entertainment video...</b>")
-                    
-                    # Process in background thread
-                    def process_video():
-                        try:
-                            success = bot_state['youtube_bot'].process_entertainment_video()
-                            if success:
-                                bot_state['uploads_today'] += 1
-                                send_telegram_message(f"✅ <b>Entertainment Video Uploaded!</b>\n\n📊 Today: {bot_state['uploads_today']}/10")
-                            else:
-                                send_telegram_message("❌ <b>Entertainment video upload failed!</b>")
-                        except Exception as e:
-                            send_telegram_message(f"❌ <b>Upload Error:</b>\n\n{str(e)}")
-                    
-                    threading.Thread(target=process_video, daemon=True).start()
-                else:
-                    send_telegram_message("⚠️ Bot is stopped. Send 'start' first.")
-                    
-            elif text in ['help', '/help']:
-                help_text = """🤖 <b>YouTube Automation Bot</b>
+        send_telegram_message(status)
+        
+    elif text in ['upload', '/upload', 'upload tech']:
+        run_upload('Tech', 'tech')
+            
+    elif text in ['upload entertainment']:
+        run_upload('Entertainment', 'entertainment')
+            
+    elif text in ['help', '/help']:
+        help_text = """🤖 <b>YouTube Automation Bot</b>
 
 <b>Commands:</b>
 • <code>start</code> - Start 24/7 automation
@@ -164,12 +121,45 @@ Send 'start' to begin automation"""
 • 24/7 automation
 • Free hosting
 • Real-time notifications"""
-                send_telegram_message(help_text)
-                
-            else:
-                send_telegram_message("❓ Unknown command. Send 'help' for available commands.")
+        send_telegram_message(help_text)
+        
+    else:
+        send_telegram_message("❓ Unknown command. Send 'help' for available commands.")
+
+# Webhook only claims + enqueues; handle_update runs on the worker pool
+dispatcher = WebhookDispatcher(handle_update)
+
+@app.route('/')
+def health_check():
+    """Health check for Render.com"""
+    return jsonify({
+        "status": "alive",
+        "message": "Simple YouTube Bot is running!",
+        "bot_running": service.is_running,
+        "uploads_today": service.stats()['uploads_today'] if service.started else 0,
+        "webhook": dispatcher.stats()
+    })
+
+@app.route('/webhook/telegram', methods=['POST'])
+def telegram_webhook():
+    """Accept a Telegram update and ack immediately - work happens on the worker pool"""
+    try:
+        data = request.get_json(silent=True) or {}
+        
+        message = data.get('message')
+        if 'update_id' not in data or not message:
+            return jsonify({"status": "ignored"})
+        
+        # Any non-2xx makes Telegram redeliver, so unauthorized chats get a 200 too
+        if str(message.get('chat', {}).get('id')) != os.getenv('TELEGRAM_CHAT_ID'):
+            return jsonify({"status": "unauthorized"})
+        
+        result = dispatcher.submit(data)
+        if result == 'busy':
+            # Not claimed - Telegram will redeliver once the queue drains
+            return jsonify({"status": "busy"}), 503
         
-        return jsonify({"status": "ok"})
+        return jsonify({"status": "ok" if result == 'accepted' else result})
         
     except Exception as e:
         print(f"❌ Webhook error: {e}")
@@ -0,0 +1,364 @@
+"""
+Pre-render buffer of ready-to-upload shorts
+- A producer thread keeps RENDER_BUFFER_SIZE rendered shorts, with title
+  and description already generated, in the render_jobs table
+- It renders only while idle: no upload running and no upload slot due
+  within RENDER_SLOT_GUARD seconds, one item per RENDER_SPACING_SECONDS,
+  so encoding is spread across the day instead of bunched at slot time
+- A slot pops the best ready item and only pays for the upload
+"""
+
+import os
+import json
+import time
+import threading
+from datetime import datetime
+
+import metadata_service
+import workspace
+import metrics
+
+RENDER_BUFFER_SIZE = int(os.getenv('RENDER_BUFFER_SIZE', 3))
+RENDER_SPACING_SECONDS = int(os.getenv('RENDER_SPACING_SECONDS', 3600))
+
+# Don't start a render this close to an upload slot
+RENDER_SLOT_GUARD = 5 * 60
+
+# Trending sources go stale - unused renders are dropped after this long
+MAX_ITEM_AGE_HOURS = 48
+
+# Back-off after a failed fill attempt (no candidates, download failed ...)
+RETRY_DELAY = 10 * 60
+
+# How often a stopped bot is re-checked (BotService.start() also wakes it)
+INACTIVE_POLL_SECONDS = 60
+
+# Render-pool queue the producer uses (channel profiles use their ids)
+RENDER_QUEUE = 'buffer'
+
+# Scheduler jobs that upload (channel profile jobs are matched by prefix)
+UPLOAD_JOBS = ('shorts_upload', 'first_upload', 'random_upload')
+
+
+def create_tables(cursor):
+    """Create the render job table"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS render_jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            video_id TEXT UNIQUE,
+            status TEXT NOT NULL,
+            score REAL DEFAULT 0,
+            title TEXT,
+            description TEXT,
+            category TEXT,
+            path TEXT,
+            video_json TEXT,
+            render_seconds REAL,
+            created_at TIMESTAMP,
+            finished_at TIMESTAMP,
+            youtube_url TEXT,
+            error TEXT
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_render_jobs_ready ON render_jobs (status, score)')
+
+
+class RenderBuffer:
+    """Producer thread plus pop/upload for the scheduled slots"""
+
+    def __init__(self, bot, size=RENDER_BUFFER_SIZE, spacing=RENDER_SPACING_SECONDS):
+        self.bot = bot
+        self.size = size
+        self.spacing = spacing
+
+        self.wakeup = threading.Event()
+        self.running = False
+        self.thread = None
+        self.last_render = 0.0        # Monotonic time the last render finished
+
+        # Counters for /api/render-buffer
+        self.rendered = 0
+        self.served = 0
+        self.misses = 0               # Slots that found the buffer empty
+        self.last_publish_seconds = None
+
+    def start(self):
+        if self.running or self.size <= 0:
+            return
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name='render-buffer', daemon=True)
+        self.thread.start()
+        print(f"🎞️ Render buffer started ({self.size} shorts)")
+
+    def stop(self):
+        self.running = False
+        self.wakeup.set()
+
+    def wake(self):
+        self.wakeup.set()
+
+    # --- Job table ---
+
+    def _execute(self, sql, params=()):
+        with self.bot.db_lock:
+            cursor = self.bot.db.cursor()
+            cursor.execute(sql, params)
+            self.bot.db.commit()
+            return cursor
+
+    def ready_count(self):
+        with self.bot.db_lock:
+            cursor = self.bot.db.cursor()
+            cursor.execute("SELECT COUNT(*) FROM render_jobs WHERE status = 'ready'")
+            return cursor.fetchone()[0]
+
+    def ready_paths(self):
+        """Files of ready items - kept by the workspace's startup sweep"""
+        with self.bot.db_lock:
+            cursor = self.bot.db.cursor()
+            cursor.execute("SELECT path FROM render_jobs WHERE status = 'ready' AND path IS NOT NULL")
+            return [row[0] for row in cursor.fetchall()]
+
+    def expire(self):
+        """Drop ready items that are too old or whose file disappeared"""
+        cutoff = datetime.now().timestamp() - MAX_ITEM_AGE_HOURS * 3600
+        with self.bot.db_lock:
+            cursor = self.bot.db.cursor()
+            cursor.execute("SELECT id, path, created_at FROM render_jobs WHERE status = 'ready'")
+            stale = [(job_id, path) for job_id, path, created_at in cursor.fetchall()
+                     if not path or not os.path.exists(path) or
+                     datetime.fromisoformat(created_at).timestamp() < cutoff]
+            for job_id, path in stale:
+                cursor.execute("UPDATE render_jobs SET status = 'expired', finished_at = ? WHERE id = ?",
+                               (datetime.now().isoformat(), job_id))
+            self.bot.db.commit()
+        for _, path in stale:
+            self.bot.cleanup(path)
+        return len(stale)
+
+    def recover(self):
+        """Settle items left 'uploading' by a crash - call before the workspace sweep
+
+        Already uploaded (saved to uploaded_videos) -> 'uploaded', file still
+        there -> 'ready' again, otherwise 'failed'.
+        """
+        now = datetime.now().isoformat()
+        with self.bot.db_lock:
+            cursor = self.bot.db.cursor()
+            cursor.execute('''
+                SELECT id, path, EXISTS (SELECT 1 FROM uploaded_videos u WHERE u.video_id = render_jobs.video_id)
+                FROM render_jobs WHERE status = 'uploading'
+            ''')
+            stuck = cursor.fetchall()
+            for job_id, path, uploaded in stuck:
+                if uploaded:
+                    cursor.execute("UPDATE render_jobs SET status = 'uploaded', finished_at = ? WHERE id = ?",
+                                   (now, job_id))
+                elif path and os.path.exists(path):
+                    cursor.execute("UPDATE render_jobs SET status = 'ready' WHERE id = ?", (job_id,))
+                else:
+                    cursor.execute('''
+                        UPDATE render_jobs SET status = 'failed', error = ?, finished_at = ? WHERE id = ?
+                    ''', ('interrupted upload', now, job_id))
+            self.bot.db.commit()
+        if stuck:
+            print(f"🎞️ Render buffer: {len(stuck)} interrupted upload(s) recovered")
+        return len(stuck)
+
+    def pop_best(self):
+        """Claim the highest scoring ready item (None if the buffer is empty)"""
+        self.expire()
+        with self.bot.db_lock:
+            cursor = self.bot.db.cursor()
+            cursor.execute('''
+                SELECT id, title, description, category, path, video_json
+                FROM render_jobs WHERE status = 'ready'
+                ORDER BY score DESC, id LIMIT 1
+            ''')
+            row = cursor.fetchone()
+            if not row:
+                return None
+            cursor.execute("UPDATE render_jobs SET status = 'uploading' WHERE id = ?", (row[0],))
+            self.bot.db.commit()
+
+        job_id, title, description, category, path, video_json = row
+        return {'id': job_id, 'title': title, 'description': description, 'category': category,
+                'path': path, 'video': json.loads(video_json)}
+
+    def _finish(self, job_id, status, youtube_url=None, error=None):
+        self._execute('''
+            UPDATE render_jobs SET status = ?, youtube_url = ?, error = ?, finished_at = ?
+            WHERE id = ?
+        ''', (status, youtube_url, error, datetime.now().isoformat(), job_id))
+
+    # --- Consumer (scheduled slot) ---
+
+    def upload_next(self, category):
+        """Upload the best buffered short
+
+        True uploaded, False upload limit hit (item kept), None nothing usable
+        buffered - the caller falls back to rendering on demand.
+        """
+        bot = self.bot
+        started = time.monotonic()
+        item = self.pop_best()
+        if not item:
+            self.misses += 1
+            metrics.count('render_buffer_slots', result='miss')
+            self.wake()
+            return None
+        metrics.count('render_buffer_slots', result='hit')
+
+        bot.track_artifact(item['path'], item['video'].get('id'), workspace.ACTIVE)  # Not evictable mid-upload
+        upload_url = bot.upload_to_youtube(item['path'], item['title'], item['description'])
+
+        if upload_url == "UPLOAD_LIMIT_EXCEEDED":
+            self._execute("UPDATE render_jobs SET status = 'ready' WHERE id = ?", (item['id'],))
+            bot.track_artifact(item['path'], item['video'].get('id'), workspace.READY)
+            bot.log_activity("⚠️ Upload limit exceeded - buffered short kept for later", level='warning')
+            return False
+
+        if not upload_url:
+            self._finish(item['id'], 'failed', error='upload failed')
+            bot.cleanup(item['path'])
+            self.wake()
+            return None
+
+        video = item['video']
+        video.update(youtube_url=upload_url, title=item['title'], description=item['description'],
+                     reaction_created=True)
+        bot.save_video_with_stats(video)
+        bot.save_processed_video(video)
+        bot.update_stats(category)
+        self._finish(item['id'], 'uploaded', youtube_url=upload_url)
+
+        self.served += 1
+        self.last_publish_seconds = round(time.monotonic() - started, 1)
+        bot.log_activity(f"✅ ELLY REACTION UPLOADED (pre-rendered): {item['title'][:40]}...",
+                         stage='upload', video_id=video.get('id'), duration=self.last_publish_seconds)
+        bot.log_activity(f"📺 URL: {upload_url}")
+
+        bot.cleanup(item['path'])
+        self.wake()  # Refill
+        return True
+
+    # --- Producer ---
+
+    def _idle_wait(self):
+        """Seconds until the producer may render again (0 = now)"""
+        bot = self.bot
+
+        # An upload is running - let it have the CPU and bandwidth
+        if not bot.upload_lock.acquire(blocking=False):
+            return 60
+        bot.upload_lock.release()
+
+        # An upload slot is about to fire
+        for run in bot.scheduler.upcoming(limit=10):
+            is_upload_slot = run['name'] in UPLOAD_JOBS or run['name'].startswith('channel:')
+            if is_upload_slot and run['in_seconds'] < RENDER_SLOT_GUARD:
+                return run['in_seconds'] + 60
+
+        # Spread renders out, unless the buffer is empty
+        if self.ready_count() > 0:
+            return max(0, self.last_render + self.spacing - time.monotonic())
+        return 0
+
+    def _run(self):
+        while self.running:
+            self.wakeup.clear()
+            wait = None
+            try:
+                self.expire()
+                if not self.bot.bot_active:
+                    wait = INACTIVE_POLL_SECONDS
+                elif self.ready_count() < self.size:
+                    wait = self._idle_wait()
+                    if wait <= 0:
+                        wait = 0 if self.fill_one() else RETRY_DELAY
+            except Exception as e:
+                print(f"❌ Render buffer error: {e}")
+                wait = RETRY_DELAY
+            if wait != 0:
+                # Full buffer: sleep until a slot pops an item; a stopped bot is re-checked
+                self.wakeup.wait(wait)
+
+    def fill_one(self):
+        """Discover, download, render and queue one short; True on success"""
+        bot = self.bot
+        manager = bot.channels
+
+        with bot.db_lock:
+            cursor = bot.db.cursor()
+            cursor.execute("SELECT video_id FROM render_jobs WHERE status IN ('ready', 'uploading')")
+            buffered = {row[0] for row in cursor.fetchall()}
+
+        candidates = manager.discovery.get(bot.get_real_youtube_data)
+        candidates.sort(key=bot.calculate_trending_score, reverse=True)
+
+        # Descriptions for the next buffer's worth of shorts, generated concurrently
+        bot.prefetch_metadata([video for video in candidates if video['id'] not in buffered][:self.size])
+
+        for video in candidates:
+            if video['id'] in buffered or not manager.claim(video['id']):
+                continue
+            try:
+                if bot.check_duplicate(video):
+                    metrics.count('candidates_skipped', reason='duplicate')
+                    continue
+
+                started = time.monotonic()
+                source_path = manager.downloads.get(
+                    video['id'], lambda video_id: bot.download_video_enhanced(video_id, video.get('duration_seconds')))
+                if not source_path:
+                    continue
+
+                reaction_path = manager.render_pool.submit(
+                    RENDER_QUEUE, bot.create_elly_reaction_short, source_path, video['id']).result()
+                manager.downloads.discard(video['id'])
+                if not reaction_path or not os.path.exists(reaction_path):
+                    continue
+
+                bot.track_artifact(reaction_path, video['id'], workspace.READY)
+                render_seconds = round(time.monotonic() - started, 1)
+                # Off the slot path, so the LLM may take its time
+                title, description = bot.reaction_metadata(video, budget=metadata_service.REQUEST_TIMEOUT)
+                self._execute('''
+                    INSERT OR REPLACE INTO render_jobs
+                    (video_id, status, score, title, description, category, path,
+                     video_json, render_seconds, created_at)
+                    VALUES (?, 'ready', ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (video['id'], bot.calculate_trending_score(video), title, description,
+                      video.get('category', 'shorts'), reaction_path, json.dumps(video),
+                      render_seconds, datetime.now().isoformat()))
+
+                self.rendered += 1
+                self.last_render = time.monotonic()
+                bot.log_activity(f"🎞️ Pre-rendered short buffered: {title[:40]}...",
+                                 stage='render', video_id=video['id'], duration=render_seconds)
+                return True
+            finally:
+                manager.release(video['id'])
+                bot.finish_job(video['id'])
+
+        return False
+
+    def status(self):
+        with self.bot.db_lock:
+            cursor = self.bot.db.cursor()
+            cursor.execute('''
+                SELECT video_id, title, score, render_seconds, created_at
+                FROM render_jobs WHERE status = 'ready' ORDER BY score DESC
+            ''')
+            items = [dict(zip(('video_id', 'title', 'score', 'render_seconds', 'created_at'), row))
+                     for row in cursor.fetchall()]
+        return {
+            'size': self.size,
+            'ready': len(items),
+            'items': items,
+            'running': self.running,
+            'rendered': self.rendered,
+            'served': self.served,
+            'misses': self.misses,
+            'last_publish_seconds': self.last_publish_seconds
+        }
@@ -0,0 +1,336 @@
+"""
+Event-driven job scheduler for the 24/7 loop
+- Jobs sit in a heap keyed by monotonic deadline; the thread sleeps exactly
+  until the earliest one (or until a job is added/removed), no polling
+- Cron-like slots ("08:00,12:00" or "0 8-22/2 * * *"), optional jitter
+- Missed slots (long upload, restart, downtime) follow a catch-up policy
+- Next-run times are persisted in the scheduled_jobs table
+- Long jobs (uploads, which can wait minutes for the upload lock) run on
+  their own pool, so they never hold up short housekeeping jobs
+"""
+
+import re
+import time
+import heapq
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+# Catch-up policies for slots whose time passed without running
+CATCH_UP_SKIP = 'skip'    # Drop missed slots, wait for the next one
+CATCH_UP_ONCE = 'once'    # Run once now, however many were missed
+CATCH_UP_ALL = 'all'      # Run every missed slot (up to MAX_CATCH_UP)
+CATCH_UP_POLICIES = (CATCH_UP_SKIP, CATCH_UP_ONCE, CATCH_UP_ALL)
+
+MAX_CATCH_UP = 10
+
+# A slot is only "missed" if we are this late for it; smaller delays just run
+MISFIRE_GRACE = 60
+
+# Jobs run here, so a long upload never delays the next deadline
+JOB_WORKERS = 4
+
+# Separate pool for long_running jobs (uploads serialize on the upload lock anyway)
+LONG_JOB_WORKERS = 2
+
+# Fields: minute hour day-of-month month day-of-week (0/7 = Sunday)
+CRON_FIELDS = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+DAY_TIME = re.compile(r'^\d{1,2}:\d{2}$')
+
+
+def create_tables(cursor):
+    """Create the persisted schedule table"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS scheduled_jobs (
+            name TEXT PRIMARY KEY,
+            schedule TEXT,
+            next_run REAL,
+            last_run REAL
+        )
+    ''')
+
+
+def _parse_field(text, low, high):
+    """One cron field -> sorted list of allowed values"""
+    values = set()
+    for part in text.split(','):
+        step = 1
+        if '/' in part:
+            part, step = part.split('/', 1)
+            step = int(step)
+        if part == '*':
+            start, end = low, high
+        elif '-' in part:
+            start, end = (int(value) for value in part.split('-', 1))
+        else:
+            start = int(part)
+            end = high if step > 1 else start
+        if start < low or end > high or start > end or step < 1:
+            raise ValueError(f"cron field out of range: {text}")
+        values.update(range(start, end + 1, step))
+    return sorted(values)
+
+
+class CronSchedule:
+    """One five-field cron expression, evaluated in local time"""
+
+    def __init__(self, expression):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"cron expression needs 5 fields: {expression}")
+
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, weekdays = (
+            _parse_field(field, low, high) for field, (low, high) in zip(fields, CRON_FIELDS))
+        self.weekdays = {day % 7 for day in weekdays}
+        # Standard cron: if both day fields are restricted, either may match
+        self.any_day = fields[2] == '*'
+        self.any_weekday = fields[4] == '*'
+
+    def _day_matches(self, day):
+        in_month = day.day in self.days
+        in_week = (day.weekday() + 1) % 7 in self.weekdays
+        if self.any_day or self.any_weekday:
+            return in_month and in_week
+        return in_month or in_week
+
+    def next_after(self, timestamp):
+        """Epoch seconds of the first slot strictly after timestamp"""
+        moment = datetime.fromtimestamp(timestamp).replace(second=0, microsecond=0) + timedelta(minutes=1)
+        for _ in range(366 * 5):
+            if moment.month in self.months and self._day_matches(moment):
+                for hour in self.hours:
+                    if hour < moment.hour:
+                        continue
+                    for minute in self.minutes:
+                        if hour > moment.hour or minute >= moment.minute:
+                            return moment.replace(hour=hour, minute=minute).timestamp()
+            moment = (moment + timedelta(days=1)).replace(hour=0, minute=0)
+        raise ValueError(f"cron expression never fires: {self.expression}")
+
+
+class Schedule:
+    """Union of slot definitions, e.g. "08:00,12:00" or "0 9 * * 1-5; 30 18 * * *" """
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.entries = []
+        for entry in filter(None, (part.strip() for part in spec.split(';'))):
+            times = [value.strip() for value in entry.split(',')]
+            if all(DAY_TIME.match(value) for value in times):
+                for value in times:
+                    hour, minute = value.split(':')
+                    self.entries.append(CronSchedule(f"{int(minute)} {int(hour)} * * *"))
+            else:
+                self.entries.append(CronSchedule(entry))
+        if not self.entries:
+            raise ValueError(f"empty schedule: {spec!r}")
+
+    def next_after(self, timestamp):
+        return min(entry.next_after(timestamp) for entry in self.entries)
+
+
+class Job:
+    def __init__(self, name, func, schedule=None, catch_up=CATCH_UP_ONCE, jitter=0, long_running=False):
+        if catch_up not in CATCH_UP_POLICIES:
+            raise ValueError(f"unknown catch-up policy: {catch_up}")
+        self.name = name
+        self.func = func
+        self.schedule = schedule      # None for one-shot jobs
+        self.catch_up = catch_up
+        self.jitter = jitter
+        self.long_running = long_running  # Runs on the long-job pool
+        self.next_run = None          # Wall-clock slot time (persisted, without jitter)
+        self.deadline = None          # Monotonic time the job actually fires
+        self.pending = 0              # Extra catch-up runs still owed
+        self.last_run = None
+        self.last_duration = None
+        self.runs = 0
+        self.version = 0              # Invalidates stale heap entries
+
+
+class Scheduler:
+    """Runs jobs at their deadlines from one thread that sleeps in between"""
+
+    def __init__(self, bot=None, workers=JOB_WORKERS, long_workers=LONG_JOB_WORKERS):
+        self.bot = bot
+        self.jobs = {}
+        self.heap = []
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.running = False
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='scheduled-job')
+        self.long_executor = ThreadPoolExecutor(max_workers=long_workers, thread_name_prefix='scheduled-long-job')
+
+    # --- Persistence (bot.db, optional) ---
+
+    def _load(self, name):
+        if not (self.bot and self.bot.db):
+            return None
+        with self.bot.db_lock:
+            cursor = self.bot.db.cursor()
+            cursor.execute('SELECT schedule, next_run, last_run FROM scheduled_jobs WHERE name = ?', (name,))
+            return cursor.fetchone()
+
+    def _save(self, job):
+        if not (self.bot and self.bot.db and job.schedule):
+            return
+        try:
+            with self.bot.db_lock:
+                self.bot.db.execute('''
+                    INSERT OR REPLACE INTO scheduled_jobs (name, schedule, next_run, last_run)
+                    VALUES (?, ?, ?, ?)
+                ''', (job.name, job.schedule.spec, job.next_run, job.last_run))
+                self.bot.db.commit()
+        except Exception as e:
+            print(f"⚠️ Could not persist schedule for {job.name}: {e}")
+
+    # --- Job management ---
+
+    def add_cron(self, name, spec, func, catch_up=CATCH_UP_ONCE, jitter=0, long_running=False):
+        """Add (or replace) a recurring job; spec is parsed by Schedule"""
+        job = Job(name, func, Schedule(spec), catch_up, jitter, long_running)
+        now = time.time()
+
+        saved = self._load(name)
+        if saved and saved[0] == spec and saved[1]:
+            # Resume from the persisted slot - it may already be in the past
+            job.last_run = saved[2]
+            job.next_run = saved[1]
+            self._apply_catch_up(job, now)
+        else:
+            job.next_run = job.schedule.next_after(now)
+
+        self._push(job)
+        self._save(job)
+        return job
+
+    def add_once(self, name, delay, func, long_running=False):
+        """Run func once, delay seconds from now"""
+        job = Job(name, func, long_running=long_running)
+        job.next_run = time.time() + delay
+        self._push(job)
+        return job
+
+    def remove(self, name):
+        with self.lock:
+            job = self.jobs.pop(name, None)
+            if job:
+                job.version += 1
+        self.wakeup.set()
+
+    def _push(self, job):
+        """(Re)queue a job at job.next_run plus jitter"""
+        delay = max(0.0, job.next_run - time.time())
+        if job.jitter:
+            delay += random.uniform(0, job.jitter)
+        with self.lock:
+            old = self.jobs.get(job.name)
+            if old and old is not job:
+                old.version += 1
+            self.jobs[job.name] = job
+            job.version += 1
+            job.deadline = time.monotonic() + delay
+            heapq.heappush(self.heap, (job.deadline, job.version, job.name))
+        self.wakeup.set()
+
+    def _apply_catch_up(self, job, now):
+        """Decide what to do about slots between job.next_run and now"""
+        if job.next_run > now - MISFIRE_GRACE:
+            return  # On time (or only slightly late) - just run it
+
+        missed = 0
+        slot = job.next_run
+        while slot <= now and missed < MAX_CATCH_UP:
+            missed += 1
+            slot = job.schedule.next_after(slot)
+
+        if job.catch_up == CATCH_UP_SKIP:
+            job.next_run = job.schedule.next_after(now)
+            print(f"⏭️ {job.name}: skipped {missed} missed slot(s)")
+        else:
+            job.next_run = now  # Run now, once or repeatedly
+            job.pending = missed - 1 if job.catch_up == CATCH_UP_ALL else 0
+            print(f"⏰ {job.name}: catching up {missed if job.catch_up == CATCH_UP_ALL else 1} missed slot(s)")
+
+    # --- Main loop ---
+
+    def run_forever(self):
+        """Block, running jobs as they come due, until stop()"""
+        self.running = True
+        while self.running:
+            self.wakeup.clear()
+            due = []
+            with self.lock:
+                now = time.monotonic()
+                while self.heap and self.heap[0][0] <= now:
+                    _, version, name = heapq.heappop(self.heap)
+                    job = self.jobs.get(name)
+                    if job and job.version == version:
+                        due.append(job)
+                wait = self.heap[0][0] - now if self.heap else None
+
+            for job in due:
+                self._dispatch(job)
+
+            if not due:
+                # Sleep exactly until the next deadline; add/remove wakes us early
+                self.wakeup.wait(wait)
+
+    def stop(self):
+        self.running = False
+        self.wakeup.set()
+
+    def _dispatch(self, job):
+        """Hand a due job to the pool and queue its next run"""
+        executor = self.long_executor if job.long_running else self.executor
+        executor.submit(self._run_job, job)
+
+        if job.schedule is None:
+            with self.lock:
+                if self.jobs.get(job.name) is job:
+                    del self.jobs[job.name]
+            return
+
+        if job.pending:
+            job.pending -= 1
+            job.next_run = time.time()
+        else:
+            job.next_run = job.schedule.next_after(time.time())
+        self._push(job)
+        self._save(job)
+
+    def _run_job(self, job):
+        started = time.monotonic()
+        try:
+            job.func()
+        except Exception as e:
+            print(f"❌ Scheduled job {job.name} failed: {e}")
+        finally:
+            job.last_duration = time.monotonic() - started
+            job.last_run = time.time()
+            job.runs += 1
+            if job.schedule:
+                self._save(job)
+
+    def upcoming(self, limit=10):
+        """Next runs, soonest first - for the dashboard"""
+        now_mono = time.monotonic()
+        now = time.time()
+        with self.lock:
+            jobs = sorted(self.jobs.values(), key=lambda job: job.deadline)
+
+        runs = []
+        for job in jobs[:limit]:
+            runs.append({
+                'name': job.name,
+                'schedule': job.schedule.spec if job.schedule else 'once',
+                'next_run': datetime.fromtimestamp(now + max(0, job.deadline - now_mono)).isoformat(timespec='seconds'),
+                'in_seconds': round(max(0, job.deadline - now_mono)),
+                'catch_up': job.catch_up,
+                'last_run': datetime.fromtimestamp(job.last_run).isoformat(timespec='seconds') if job.last_run else None,
+                'last_duration': round(job.last_duration, 1) if job.last_duration is not None else None,
+                'runs': job.runs
+            })
+        return runs
@@ -0,0 +1,158 @@
+"""
+Time-series history of uploaded video stats
+- Append-only video_stats_history table written by the stats refresher
+- Rows store integer deltas (change since the previous sample), so rolling
+  up is just SUM() and absolute values are rebuilt from the current totals
+- Raw samples roll up to hourly, then daily buckets, then expire
+"""
+
+import os
+import time
+from datetime import datetime
+
+# Bucket sizes (the resolution column), in seconds
+RAW = 0
+HOURLY = 3600
+DAILY = 86400
+
+RESOLUTIONS = {
+    'raw': RAW,
+    'hour': HOURLY,
+    'day': DAILY
+}
+
+# Retention windows - raw samples become hourly, hourly become daily, daily expire
+RAW_RETENTION_HOURS = int(os.getenv('STATS_RAW_RETENTION_HOURS', 48))
+HOURLY_RETENTION_DAYS = int(os.getenv('STATS_HOURLY_RETENTION_DAYS', 30))
+DAILY_RETENTION_DAYS = int(os.getenv('STATS_DAILY_RETENTION_DAYS', 365))
+
+
+def create_tables(cursor):
+    """Create the history table and its indexes"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS video_stats_history (
+            video_id TEXT NOT NULL,
+            resolution INTEGER NOT NULL,
+            bucket_start INTEGER NOT NULL,
+            views_delta INTEGER DEFAULT 0,
+            likes_delta INTEGER DEFAULT 0,
+            comments_delta INTEGER DEFAULT 0,
+            PRIMARY KEY (video_id, resolution, bucket_start)
+        ) WITHOUT ROWID
+    ''')
+    # Rollups scan one resolution by age
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_stats_history_age
+        ON video_stats_history (resolution, bucket_start)
+    ''')
+
+
+def record_samples(cursor, samples, sampled_at=None):
+    """Append one raw row per changed video (caller commits)
+
+    samples maps video_id -> (views_delta, likes_delta, comments_delta).
+    """
+    sampled_at = int(sampled_at or time.time())
+    cursor.executemany('''
+        INSERT INTO video_stats_history
+        (video_id, resolution, bucket_start, views_delta, likes_delta, comments_delta)
+        VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT(video_id, resolution, bucket_start) DO UPDATE SET
+            views_delta = views_delta + excluded.views_delta,
+            likes_delta = likes_delta + excluded.likes_delta,
+            comments_delta = comments_delta + excluded.comments_delta
+    ''', [
+        (video_id, RAW, sampled_at, views, likes, comments)
+        for video_id, (views, likes, comments) in samples.items()
+    ])
+
+
+def _roll_up(cursor, from_resolution, to_resolution, cutoff):
+    """Merge rows of one resolution older than cutoff into coarser buckets"""
+    cutoff -= cutoff % to_resolution  # Only whole buckets
+    cursor.execute('''
+        INSERT INTO video_stats_history
+        (video_id, resolution, bucket_start, views_delta, likes_delta, comments_delta)
+        SELECT video_id, ?, bucket_start - bucket_start % ?,
+               SUM(views_delta), SUM(likes_delta), SUM(comments_delta)
+        FROM video_stats_history
+        WHERE resolution = ? AND bucket_start < ?
+        GROUP BY video_id, bucket_start - bucket_start % ?
+        ON CONFLICT(video_id, resolution, bucket_start) DO UPDATE SET
+            views_delta = views_delta + excluded.views_delta,
+            likes_delta = likes_delta + excluded.likes_delta,
+            comments_delta = comments_delta + excluded.comments_delta
+    ''', (to_resolution, to_resolution, from_resolution, cutoff, to_resolution))
+    cursor.execute('''
+        DELETE FROM video_stats_history WHERE resolution = ? AND bucket_start < ?
+    ''', (from_resolution, cutoff))
+    return cursor.rowcount
+
+
+def roll_up(cursor, now=None):
+    """Downsample and expire history per the retention windows (caller commits)"""
+    now = int(now or time.time())
+    merged = _roll_up(cursor, RAW, HOURLY, now - RAW_RETENTION_HOURS * 3600)
+    merged += _roll_up(cursor, HOURLY, DAILY, now - HOURLY_RETENTION_DAYS * 86400)
+    cursor.execute('''
+        DELETE FROM video_stats_history WHERE resolution = ? AND bucket_start < ?
+    ''', (DAILY, now - DAILY_RETENTION_DAYS * 86400))
+    return merged + cursor.rowcount
+
+
+def load_series(cursor, video_id, current, resolution=None, since=None):
+    """History of one video as a list of points, oldest first
+
+    current is the video's (views, likes, comments) now; absolute values are
+    rebuilt backwards from it. resolution (seconds) downsamples further on
+    read; None returns rows as stored (daily, then hourly, then raw).
+    """
+    params = [video_id]
+    if resolution:
+        sql = '''
+            SELECT bucket_start - bucket_start % ? AS bucket,
+                   SUM(views_delta), SUM(likes_delta), SUM(comments_delta)
+            FROM video_stats_history WHERE video_id = ?
+        '''
+        params.insert(0, resolution)
+    else:
+        sql = '''
+            SELECT bucket_start, views_delta, likes_delta, comments_delta
+            FROM video_stats_history WHERE video_id = ?
+        '''
+    if since:
+        sql += ' AND bucket_start >= ?'
+        params.append(int(since))
+    sql += ' GROUP BY bucket ORDER BY bucket' if resolution else ' ORDER BY bucket_start'
+
+    cursor.execute(sql, params)
+    rows = cursor.fetchall()
+
+    # Walk backwards from the current totals to recover absolute values
+    views, likes, comments = current
+    points = []
+    for bucket, views_delta, likes_delta, comments_delta in reversed(rows):
+        points.append({
+            'timestamp': datetime.fromtimestamp(bucket).isoformat(),
+            'views': views,
+            'likes': likes,
+            'comments': comments,
+            'views_delta': views_delta,
+            'likes_delta': likes_delta,
+            'comments_delta': comments_delta
+        })
+        views -= views_delta
+        likes -= likes_delta
+        comments -= comments_delta
+    points.reverse()
+
+    # Velocity between consecutive points
+    previous = None
+    for point, (bucket, views_delta, _, _) in zip(points, rows):
+        if previous is not None and bucket > previous:
+            point['views_per_hour'] = round(views_delta * 3600 / (bucket - previous), 1)
+        else:
+            point['views_per_hour'] = None
+        previous = bucket
+
+    return points
@@ -0,0 +1,198 @@
+"""
+Background live-stats refresher for uploaded videos
+- Batches video IDs 50 per videos.list call (1 quota unit per call)
+- Schedules refreshes by video age and view velocity
+- Writes only changed rows, all in one transaction per cycle, and appends
+  their deltas to the stats history (see stats_history.py)
+- HTTP endpoints only enqueue work, they never call the API themselves
+"""
+
+import time
+import threading
+from datetime import datetime
+
+# videos.list accepts at most 50 IDs per call
+BATCH_SIZE = 50
+
+# (max video age in hours, refresh interval in seconds) - first match wins
+REFRESH_TIERS = [
+    (1, 5 * 60),           # First hour: every 5 minutes
+    (24, 30 * 60),         # First day: every 30 minutes
+    (24 * 7, 6 * 3600),    # First week: every 6 hours
+]
+OLD_VIDEO_INTERVAL = 24 * 3600  # Older than a week: once a day
+
+# Videos gaining views this fast are refreshed at least this often
+HOT_VIEWS_PER_HOUR = 1000
+HOT_INTERVAL = 10 * 60
+
+# Forced refreshes (dashboard clicks, GETs) are ignored if the video was
+# refreshed less than this many seconds ago
+MIN_REFRESH_INTERVAL = 60
+
+# Never sleep longer than this, so new uploads get picked up
+MAX_IDLE_WAIT = 15 * 60
+
+# How often old stats history rows are downsampled
+ROLLUP_INTERVAL = 3600
+
+
+def parse_upload_time(upload_date):
+    """Return upload_date as epoch seconds (None if unparseable)"""
+    if not upload_date:
+        return None
+    try:
+        return datetime.fromisoformat(str(upload_date).replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        return None
+
+
+def refresh_interval(age_hours, views_per_hour=0):
+    """Seconds until the next refresh of a video of this age and velocity"""
+    interval = OLD_VIDEO_INTERVAL
+    for max_age, tier_interval in REFRESH_TIERS:
+        if age_hours < max_age:
+            interval = tier_interval
+            break
+
+    if views_per_hour >= HOT_VIEWS_PER_HOUR:
+        interval = min(interval, HOT_INTERVAL)
+
+    return interval
+
+
+class StatsRefresher:
+    """Keeps uploaded_videos views/likes/comments fresh from a daemon thread"""
+
+    def __init__(self, bot, batch_size=BATCH_SIZE):
+        self.bot = bot
+        self.batch_size = batch_size
+
+        self.next_due = {}        # video_id -> epoch seconds of next refresh
+        self.last_sample = {}     # video_id -> (views, epoch seconds sampled)
+        self.forced = set()       # video_ids queued by the HTTP endpoints
+        self.force_all = False
+
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.running = False
+        self.thread = None
+
+        # Totals for the dashboard / debugging
+        self.api_calls = 0
+        self.rows_written = 0
+        self.last_cycle = None
+        self.last_rollup = 0
+
+    def start(self):
+        """Start the refresher thread (no-op if already running)"""
+        if self.running:
+            return
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name='stats-refresher', daemon=True)
+        self.thread.start()
+        print("📈 Stats refresher started")
+
+    def stop(self):
+        """Stop the refresher thread after its current cycle"""
+        self.running = False
+        self.wakeup.set()
+
+    def enqueue(self, video_ids=None):
+        """Queue videos for refresh - None queues every tracked video"""
+        with self.lock:
+            if video_ids is None:
+                self.force_all = True
+            else:
+                self.forced.update(video_id for video_id in video_ids if video_id)
+        self.wakeup.set()
+
+    def _run(self):
+        """Thread body - refresh whatever is due, then sleep until the next deadline"""
+        while self.running:
+            self.wakeup.clear()
+            wait = MAX_IDLE_WAIT
+            try:
+                wait = self.refresh_due()
+            except Exception as e:
+                print(f"❌ Stats refresher error: {e}")
+            self.wakeup.wait(wait)
+
+    def refresh_due(self, now=None):
+        """Refresh every due or forced video; returns seconds until the next deadline"""
+        now = now or time.time()
+        bot = self.bot
+
+        if not bot.db or not bot.youtube:
+            return MAX_IDLE_WAIT
+
+        with self.lock:
+            forced, self.forced = self.forced, set()
+            force_all, self.force_all = self.force_all, False
+
+        tracked = bot.get_tracked_video_stats()
+
+        due = []
+        for video_id, row in tracked.items():
+            if force_all or video_id in forced:
+                last = self.last_sample.get(video_id)
+                if not last or now - last[1] >= MIN_REFRESH_INTERVAL:
+                    due.append(video_id)
+            elif self.next_due.get(video_id, 0) <= now:
+                due.append(video_id)
+
+        changed = {}
+        for start in range(0, len(due), self.batch_size):
+            chunk = due[start:start + self.batch_size]
+            live = bot.get_live_video_stats_batch(chunk)
+            self.api_calls += 1
+
+            for video_id in chunk:
+                stats = live.get(video_id)
+                current = tracked[video_id]
+                if stats and (stats['views'], stats['likes'], stats['comments']) != \
+                        (current['views'], current['likes'], current['comments']):
+                    changed[video_id] = stats
+                self._reschedule(video_id, current, stats, now)
+
+        if changed:
+            # Same transaction also appends the deltas to video_stats_history
+            self.rows_written += bot.update_video_stats_batch(changed, previous=tracked)
+
+        if now - self.last_rollup >= ROLLUP_INTERVAL:
+            bot.roll_up_stats_history()
+            self.last_rollup = now
+
+        # Forget videos that were deleted from the table
+        for video_id in list(self.next_due):
+            if video_id not in tracked:
+                self.next_due.pop(video_id, None)
+                self.last_sample.pop(video_id, None)
+
+        if due:
+            self.last_cycle = {
+                'checked': len(due),
+                'changed': len(changed),
+                'api_calls': -(-len(due) // self.batch_size),
+                'timestamp': datetime.now().isoformat()
+            }
+            print(f"📈 Stats refresh: {len(due)} checked, {len(changed)} changed")
+
+        if not self.next_due:
+            return MAX_IDLE_WAIT
+        return max(1, min(MAX_IDLE_WAIT, min(self.next_due.values()) - time.time()))
+
+    def _reschedule(self, video_id, current, stats, now):
+        """Set the next refresh time for one video from its age and view velocity"""
+        views = stats['views'] if stats else current['views']
+
+        views_per_hour = 0
+        last = self.last_sample.get(video_id)
+        if last and now > last[1]:
+            views_per_hour = max(0, views - last[0]) * 3600 / (now - last[1])
+        self.last_sample[video_id] = (views, now)
+
+        uploaded = parse_upload_time(current['upload_date'])
+        age_hours = (now - uploaded) / 3600 if uploaded else float('inf')
+
+        self.next_due[video_id] = now + refresh_interval(age_hours, views_per_hour)
@@ -0,0 +1,234 @@
+"""
+Memory-bounded reaction renderer (RENDER_MODE=stream)
+- Source and overlay are decoded by ffmpeg and read one raw yuv420p frame
+  at a time straight into preallocated numpy buffers (readinto, no
+  per-frame arrays)
+- ffmpeg only crops the source to 9:16; the crop is scaled to 1080x1920
+  plane by plane with compositor.Remap, so ffmpeg's frame queues hold small
+  crops instead of full output frames
+- The overlay is pasted (or, with OVERLAY_OPACITY, alpha-blended) into the
+  source frame's planes in place and the same buffer is piped to the
+  encoder; audio is copied from the source by the encoder
+- yuv420p is half the size of RGB, which halves the frames ffmpeg queues
+  between its decode, filter and encode threads, and the encoder needs no
+  colour conversion
+- Peak RSS of this process's buffers plus the ffmpeg children is sampled
+  while rendering; going over RENDER_MEMORY_LIMIT_MB aborts the render
+  instead of letting the instance get OOM-killed
+"""
+
+import os
+import time
+import subprocess
+
+import numpy as np
+from moviepy.config import get_setting
+from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+
+import compositor
+
+TARGET_SIZE = compositor.TARGET_SIZE
+FPS = 30
+MAX_DURATION = 60
+
+# Counts the bot process too - Render's 512 MB instance less some headroom.
+# Measured inside the bot (about 100 MB before rendering), a 60s 1080x1920
+# short with the defaults below peaks at about 460 MB; 496 leaves room for
+# the bot's other threads without reaching the instance limit
+RENDER_MEMORY_LIMIT_MB = int(os.getenv('RENDER_MEMORY_LIMIT_MB', 496))
+
+# Encoder settings: same quality targets as the MoviePy path, with a short
+# lookahead, fewer reference/B frames and one thread to keep x264's frame
+# queue small
+STREAM_RENDER_PRESET = os.getenv('STREAM_RENDER_PRESET', 'medium')
+STREAM_RENDER_THREADS = int(os.getenv('STREAM_RENDER_THREADS', 1))
+X264_PARAMS = 'rc-lookahead=5:sync-lookahead=0:ref=2:bframes=2'
+
+# Raw frame format on every pipe (chroma planes are half size, so the
+# overlay box is kept on even coordinates)
+PIX_FMT = 'yuv420p'
+
+# Sample memory every this many frames
+MEMORY_CHECK_FRAMES = 15
+
+
+class RenderMemoryExceeded(Exception):
+    """The render went over RENDER_MEMORY_LIMIT_MB and was stopped"""
+
+
+def _rss_mb(pid):
+    """Resident set size of a process in MB (0 if it is gone)"""
+    try:
+        with open(f'/proc/{pid}/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return 0.0
+
+
+def yuv_planes(buffer, width, height):
+    """Y, U and V views (2D) into a flat yuv420p frame buffer"""
+    luma = width * height
+    chroma = luma // 4
+    return (buffer[:luma].reshape(height, width),
+            buffer[luma:luma + chroma].reshape(height // 2, width // 2),
+            buffer[luma + chroma:luma + 2 * chroma].reshape(height // 2, width // 2))
+
+
+class StreamRenderer:
+    """Renders one reaction short with a fixed set of frame buffers"""
+
+    def __init__(self, memory_limit_mb=RENDER_MEMORY_LIMIT_MB, preset=STREAM_RENDER_PRESET,
+                 threads=STREAM_RENDER_THREADS, target_size=TARGET_SIZE, fps=FPS,
+                 opacity=compositor.OVERLAY_OPACITY):
+        self.ffmpeg = get_setting('FFMPEG_BINARY')
+        self.memory_limit_mb = memory_limit_mb
+        self.preset = preset
+        self.threads = threads
+        self.target_size = target_size
+        self.fps = fps
+        self.opacity = opacity
+
+        # Stats of the last render
+        self.frames = 0
+        self.seconds = None
+        self.peak_rss_mb = 0.0
+
+    def _reader(self, args):
+        command = [self.ffmpeg, '-v', 'error', *args, '-f', 'rawvideo', '-pix_fmt', PIX_FMT, '-']
+        return subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                bufsize=0)
+
+    @staticmethod
+    def _read_frame(pipe, view):
+        """Fill view from the pipe; False at end of stream"""
+        filled = 0
+        size = len(view)
+        while filled < size:
+            count = pipe.readinto(view[filled:])
+            if not count:
+                return False
+            filled += count
+        return True
+
+    def _check_memory(self, processes):
+        total = _rss_mb(os.getpid()) + sum(_rss_mb(process.pid) for process in processes)
+        self.peak_rss_mb = max(self.peak_rss_mb, total)
+        if total > self.memory_limit_mb:
+            raise RenderMemoryExceeded(f"render used {total:.0f} MB (limit {self.memory_limit_mb} MB)")
+
+    def render(self, source_path, overlay_path, output_path, overlay_scale=0.25,
+               position='top-right', max_duration=MAX_DURATION):
+        """Render the reaction short; returns output_path
+
+        Raises RenderMemoryExceeded or RuntimeError (ffmpeg failure); the
+        partial output is removed in both cases.
+        """
+        started = time.monotonic()
+        self.frames = 0
+        self.peak_rss_mb = 0.0
+
+        source = ffmpeg_parse_infos(source_path)
+        overlay = ffmpeg_parse_infos(overlay_path)
+
+        duration = min(max_duration, source['duration'])
+        source_start = max(0, (source['duration'] - duration) / 2)
+        target_w, target_h = self.target_size
+        x, y, width, height = compositor.overlay_box(self.target_size, overlay['video_size'], overlay_scale, position)
+
+        # Middle of the overlay if it is long enough, otherwise loop it
+        if overlay['duration'] >= duration:
+            overlay_input = ['-ss', f"{(overlay['duration'] - duration) / 2:.3f}", '-i', overlay_path]
+        else:
+            overlay_input = ['-stream_loop', '-1', '-i', overlay_path]
+
+        crop_x, crop_y, crop_w, crop_h = compositor.crop_box(source['video_size'], self.target_size)
+        source_window = ['-ss', f'{source_start:.3f}', '-t', f'{duration:.3f}']
+        readers = [
+            self._reader([*source_window, '-i', source_path, '-an',
+                          '-vf', f'crop={crop_w}:{crop_h}:{crop_x}:{crop_y},fps={self.fps}']),
+            self._reader([*overlay_input, '-t', f'{duration:.3f}', '-an',
+                          '-vf', f'scale={width}:{height},fps={self.fps}'])
+        ]
+
+        encoder_command = [
+            self.ffmpeg, '-v', 'error', '-y',
+            '-thread_queue_size', '2',
+            '-f', 'rawvideo', '-pix_fmt', PIX_FMT, '-s', f'{target_w}x{target_h}', '-r', str(self.fps), '-i', '-',
+        ]
+        if source['audio_found']:
+            encoder_command += [*source_window, '-i', source_path, '-map', '0:v', '-map', '1:a',
+                                '-c:a', 'aac', '-b:a', '128k']
+        encoder_command += [
+            '-c:v', 'libx264', '-preset', self.preset, '-crf', '20', '-maxrate', '3000k', '-bufsize', '6000k',
+            '-x264-params', X264_PARAMS, '-threads', str(self.threads), '-pix_fmt', 'yuv420p',
+            '-movflags', '+faststart', output_path
+        ]
+        encoder = subprocess.Popen(encoder_command, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+        processes = readers + [encoder]
+
+        # The only frame-sized allocations of the whole render (with the
+        # remap tables' scratch buffers)
+        crop_frame = np.empty(crop_w * crop_h * 3 // 2, dtype=np.uint8)
+        frame = np.empty(target_w * target_h * 3 // 2, dtype=np.uint8)
+        overlay_frame = np.empty(width * height * 3 // 2, dtype=np.uint8)
+        crop_view = memoryview(crop_frame)
+        frame_view = memoryview(frame)
+        overlay_view = memoryview(overlay_frame)
+        scales = [(compositor.Remap((0, 0, plane.shape[1], plane.shape[0]), (target.shape[1], target.shape[0]), 1),
+                   plane[..., None], target[..., None])
+                  for plane, target in zip(yuv_planes(crop_frame, crop_w, crop_h),
+                                           yuv_planes(frame, target_w, target_h))]
+        pastes = [(target[plane_y:plane_y + plane_h, plane_x:plane_x + plane_w], plane,
+                   np.empty((2,) + plane.shape, dtype=np.uint16) if self.opacity < 255 else None)
+                  for target, plane, (plane_x, plane_y, plane_w, plane_h) in zip(
+                      yuv_planes(frame, target_w, target_h), yuv_planes(overlay_frame, width, height),
+                      [(x, y, width, height)] + [(x // 2, y // 2, width // 2, height // 2)] * 2)]
+
+        have_overlay = False
+        try:
+            while self._read_frame(readers[0].stdout, crop_view):
+                for remap, plane, target in scales:
+                    remap(plane, target)
+
+                # Keep the last overlay frame if the overlay stream ends early
+                if self._read_frame(readers[1].stdout, overlay_view):
+                    have_overlay = True
+                if have_overlay:
+                    for target, plane, work in pastes:
+                        if work is None:
+                            target[...] = plane
+                        else:
+                            compositor.blend(target, plane, self.opacity, work)
+                encoder.stdin.write(frame_view)
+
+                self.frames += 1
+                if self.frames % MEMORY_CHECK_FRAMES == 0:
+                    self._check_memory(processes)
+
+            encoder.stdin.close()
+            error = encoder.stderr.read()
+            if encoder.wait() != 0 or not self.frames:
+                raise RuntimeError(f"ffmpeg encode failed: {error.decode(errors='replace')[-300:]}")
+        except BaseException:
+            for process in processes:
+                process.kill()
+            try:
+                os.remove(output_path)
+            except OSError:
+                pass
+            raise
+        finally:
+            # Closing the pipes first also stops a reader that still has
+            # frames to write (the overlay can run a frame past the source)
+            for process in processes:
+                for pipe in (process.stdin, process.stdout, process.stderr):
+                    if pipe:
+                        pipe.close()
+            for process in processes:
+                process.wait()
+
+        self.seconds = round(time.monotonic() - started, 1)
+        return output_path
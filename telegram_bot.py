@@ -6,22 +6,35 @@ Telegram Bot for YouTube Automation Control
 
 import os
 import time
-import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dotenv import load_dotenv
 import requests
-from youtube_bot import YouTubeBot
+from engine import get_service
 
 load_dotenv()
 
+# getUpdates long-poll: Telegram holds the request open up to this many seconds
+LONG_POLL_TIMEOUT = 30
+CONNECT_TIMEOUT = 10
+
+# Command handlers run here so a long upload never blocks polling or 'status'
+COMMAND_WORKERS = 4
+
 class TelegramYouTubeBot:
     def __init__(self):
         self.telegram_token = os.getenv('TELEGRAM_BOT_TOKEN')
         self.telegram_chat_id = os.getenv('TELEGRAM_CHAT_ID')
-        self.youtube_bot = YouTubeBot()
-        self.is_running = False
+        # Shared engine - same bot, upload lock and counters as the other front-ends
+        self.service = get_service()
         self.last_update_id = 0
         
+        # Keep-alive connections: one for the long poll, one shared by senders
+        self.poll_session = requests.Session()
+        self.send_session = requests.Session()
+        self.command_pool = ThreadPoolExecutor(max_workers=COMMAND_WORKERS,
+                                               thread_name_prefix='telegram-command')
+        
         print("🤖 Telegram YouTube Bot Initialized!")
         print(f"📱 Bot Token: {self.telegram_token[:10]}...")
         print(f"💬 Chat ID: {self.telegram_chat_id}")
@@ -35,26 +48,61 @@ class TelegramYouTubeBot:
                 'text': message,
                 'parse_mode': 'HTML'
             }
-            response = requests.post(url, data=data)
+            response = self.send_session.post(url, data=data, timeout=CONNECT_TIMEOUT)
             return response.status_code == 200
         except Exception as e:
             print(f"❌ Telegram error: {e}")
             return False
     
     def get_updates(self):
-        """Get updates from Telegram"""
+        """Long-poll Telegram for updates - returns None on failure"""
         try:
             url = f"https://api.telegram.org/bot{self.telegram_token}/getUpdates"
-            params = {'offset': self.last_update_id + 1, 'timeout': 30}
-            response = requests.get(url, params=params)
+            params = {
+                'offset': self.last_update_id + 1,
+                'timeout': LONG_POLL_TIMEOUT,
+                'allowed_updates': '["message"]'
+            }
+            # Read timeout must outlast the server-side long poll
+            response = self.poll_session.get(
+                url, params=params, timeout=(CONNECT_TIMEOUT, LONG_POLL_TIMEOUT + 10))
             
             if response.status_code == 200:
                 data = response.json()
                 return data.get('result', [])
-            return []
+            print(f"❌ Get updates HTTP {response.status_code}")
+            return None
+        except requests.exceptions.ReadTimeout:
+            return []  # Long poll ended with no updates
         except Exception as e:
             print(f"❌ Get updates error: {e}")
-            return []
+            return None
+    
+    def dispatch_command(self, message):
+        """Run a command on the worker pool so polling continues immediately"""
+        def run():
+            try:
+                self.handle_command(message)
+            except Exception as e:
+                print(f"❌ Command error: {e}")
+                self.send_message(f"❌ <b>Command failed:</b> {e}")
+        
+        self.command_pool.submit(run)
+    
+    def run_upload(self, label, category):
+        """Run one upload unless another is already in progress"""
+        if not self.service.is_running:
+            self.send_message("⚠️ <b>Automation is stopped!</b>\n\nSend <b>start</b> first.")
+            return
+        
+        self.send_message(f"{'🔧' if label == 'Tech' else '🎬'} <b>Processing {label} Video...</b>")
+        success = self.service.upload(category)
+        if success is None:
+            self.send_message("⏳ <b>An upload is already running</b>\n\nSend <b>status</b> to check progress.")
+        elif success:
+            self.send_message(f"✅ <b>{label} video uploaded successfully!</b>")
+        else:
+            self.send_message(f"❌ <b>{label} video upload failed!</b>")
     
     def handle_command(self, message):
         """Handle Telegram commands"""
@@ -66,8 +114,7 @@ class TelegramYouTubeBot:
             self.telegram_chat_id = str(chat_id)
         
         if text == '/start' or text == 'start':
-            if not self.is_running:
-                self.is_running = True
+            if self.service.start():
                 welcome_msg = """
 🚀 <b>YouTube Automation STARTED!</b>
 
@@ -87,35 +134,26 @@ You'll get notifications for every upload.
                 self.send_message("✅ <b>Automation is already running!</b>")
             
         elif text == '/status' or text == 'status':
-            total = self.youtube_bot.daily_tech_uploads + self.youtube_bot.daily_entertainment_uploads
+            stats = self.service.stats()
             status_msg = f"""
 📊 <b>Current Status:</b>
 
-🔧 <b>Tech:</b> {self.youtube_bot.daily_tech_uploads}/5
-🎬 <b>Entertainment:</b> {self.youtube_bot.daily_entertainment_uploads}/5
-📈 <b>Total Today:</b> {total}/10
+🔧 <b>Tech:</b> {stats['tech_uploads']}
+🎬 <b>Entertainment:</b> {stats['entertainment_uploads']}
+📈 <b>Total Today:</b> {stats['uploads_today']}/{stats['daily_limit']}
 
-🤖 <b>Bot Status:</b> {'🟢 Running' if self.is_running else '🔴 Stopped'}
+🤖 <b>Bot Status:</b> {'🟢 Running' if stats['running'] else '🔴 Stopped'}
+⏳ <b>Uploading:</b> {stats['uploading'] or 'idle'}
 ⏰ <b>Time:</b> {datetime.now().strftime('%H:%M:%S')}
-📋 <b>Processed Videos:</b> {len(self.youtube_bot.processed_videos)}
+📋 <b>Uploaded Videos:</b> {stats['total_videos']}
 """
             self.send_message(status_msg)
             
         elif text == '/upload_tech' or text == 'upload tech':
-            self.send_message("🔧 <b>Processing Tech Video...</b>")
-            success = self.youtube_bot.process_tech_video()
-            if success:
-                self.send_message("✅ <b>Tech video uploaded successfully!</b>")
-            else:
-                self.send_message("❌ <b>Tech video upload failed!</b>")
+            self.run_upload('Tech', 'tech')
                 
         elif text == '/upload_entertainment' or text == 'upload entertainment':
-            self.send_message("🎬 <b>Processing Entertainment Video...</b>")
-            success = self.youtube_bot.process_entertainment_video()
-            if success:
-                self.send_message("✅ <b>Entertainment video uploaded successfully!</b>")
-            else:
-                self.send_message("❌ <b>Entertainment video upload failed!</b>")
+            self.run_upload('Entertainment', 'entertainment')
                 
         elif text == '/logs' or text == 'logs':
             try:
@@ -132,15 +170,14 @@ You'll get notifications for every upload.
                 self.send_message("❌ <b>No logs found!</b>")
                 
         elif text == '/stop' or text == 'stop':
-            if self.is_running:
-                self.is_running = False
+            if self.service.is_running:
+                self.service.stop()
                 self.send_message("⏸️ <b>Automation STOPPED!</b>")
             else:
                 self.send_message("⏸️ <b>Automation is already stopped!</b>")
             
         elif text == '/resume' or text == 'resume':
-            if not self.is_running:
-                self.is_running = True
+            if self.service.start():
                 self.send_message("▶️ <b>Automation RESUMED!</b>")
             else:
                 self.send_message("▶️ <b>Automation is already running!</b>")
@@ -177,28 +214,34 @@ Entertainment: 10:00, 14:00, 18:00, 21:00, 23:30
         print("🚀 Starting Telegram YouTube Bot...")
         
         # Bot starts in STOPPED state - wait for user command
-        self.is_running = False
         self.send_message("🤖 <b>YouTube Bot Ready!</b>\n\n📱 Send <b>'start'</b> to begin automation\n📱 Send <b>'stop'</b> to stop automation")
         
         print("🤖 Telegram bot is running...")
         print("💬 Bot is STOPPED - Send 'start' command to begin automation!")
         
-        # Main bot loop
+        # Main bot loop - the long poll itself is the wait, no extra sleep
+        error_backoff = 1
         while True:
             try:
                 updates = self.get_updates()
                 
+                if updates is None:
+                    # Network/API failure - back off 1, 2, 4 ... 30 seconds
+                    time.sleep(error_backoff)
+                    error_backoff = min(error_backoff * 2, 30)
+                    continue
+                error_backoff = 1
+                
                 for update in updates:
                     self.last_update_id = update['update_id']
                     
                     if 'message' in update:
-                        self.handle_command(update['message'])
-                
-                time.sleep(1)  # Small delay
+                        self.dispatch_command(update['message'])
                 
             except KeyboardInterrupt:
                 print("\n⏹️ Bot stopped by user")
                 self.send_message("⏹️ <b>Bot stopped by admin!</b>")
+                self.command_pool.shutdown(wait=False)
                 break
             except Exception as e:
                 print(f"❌ Bot error: {e}")
@@ -0,0 +1,184 @@
+"""
+Non-blocking Telegram notifications
+- notify() only puts the message on a bounded queue, it never does network I/O
+- One background sender coalesces everything queued within a short window
+  into a single Telegram message
+- Honors Telegram's 429 retry_after and spaces sends out per chat
+- Filters by severity and drops (and reports) messages under backpressure
+"""
+
+import os
+import time
+import queue
+import threading
+import requests
+
+LEVELS = {
+    'debug': 10,
+    'info': 20,
+    'warning': 30,
+    'error': 40
+}
+
+# Messages queued within this many seconds of the first one go out together
+COALESCE_WINDOW = 2.0
+
+# Telegram allows about one message per second per chat
+MIN_SEND_INTERVAL = 1.0
+
+# Telegram rejects messages longer than this
+MAX_MESSAGE_LENGTH = 4096
+
+# Queue capacity - beyond this new messages are dropped and counted
+MAX_QUEUE = 500
+
+SEND_ATTEMPTS = 3
+
+
+def infer_level(message):
+    """Guess a severity from the emoji conventions used in log messages"""
+    if '❌' in message:
+        return 'error'
+    if '⚠️' in message or '🚫' in message:
+        return 'warning'
+    return 'info'
+
+
+class TelegramNotifier:
+    """Queues messages and delivers them to one Telegram chat from a daemon thread"""
+
+    def __init__(self, token, chat_id, min_level=None, window=COALESCE_WINDOW, max_queue=MAX_QUEUE):
+        self.token = token
+        self.chat_id = chat_id
+        self.window = window
+
+        min_level = (min_level or os.getenv('TELEGRAM_NOTIFY_LEVEL', 'info')).lower()
+        self.min_level = LEVELS.get(min_level, LEVELS['info'])
+
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.session = requests.Session()
+        self.lock = threading.Lock()
+        self.thread = None
+        self.last_send = 0.0
+
+        # Counters for status reporting
+        self.sent = 0
+        self.dropped = 0
+        self.unreported_drops = 0
+
+    @property
+    def enabled(self):
+        return bool(self.token and self.chat_id)
+
+    def notify(self, message, level='info'):
+        """Queue a message; returns False if it was filtered or dropped. Never blocks."""
+        if not self.enabled or LEVELS.get(level, LEVELS['info']) < self.min_level:
+            return False
+
+        self._ensure_started()
+        try:
+            self.queue.put_nowait(message)
+            return True
+        except queue.Full:
+            with self.lock:
+                self.dropped += 1
+                self.unreported_drops += 1
+            return False
+
+    def _ensure_started(self):
+        """Start the sender thread on first use"""
+        if self.thread:
+            return
+        with self.lock:
+            if not self.thread:
+                self.thread = threading.Thread(target=self._run, name='telegram-notifier', daemon=True)
+                self.thread.start()
+
+    def _run(self):
+        """Sender thread - collect a window of messages, send them as one"""
+        while True:
+            batch = [self.queue.get()]
+            deadline = time.monotonic() + self.window
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self.queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            for text in self._format(batch):
+                try:
+                    self._send(text)
+                except Exception as e:
+                    print(f"❌ Telegram notifier error: {e}")
+
+    def _format(self, batch):
+        """Collapse repeated lines, note drops and split into Telegram-sized messages"""
+        lines = []
+        for message in batch:
+            if lines and lines[-1][0] == message:
+                lines[-1][1] += 1
+            else:
+                lines.append([message, 1])
+        text_lines = [message if count == 1 else f"{message} (x{count})" for message, count in lines]
+
+        with self.lock:
+            drops, self.unreported_drops = self.unreported_drops, 0
+        if drops:
+            text_lines.append(f"⚠️ {drops} notifications dropped (queue full)")
+
+        messages = []
+        current = ''
+        for line in text_lines:
+            line = line[:MAX_MESSAGE_LENGTH]
+            if current and len(current) + 1 + len(line) > MAX_MESSAGE_LENGTH:
+                messages.append(current)
+                current = line
+            else:
+                current = f"{current}\n{line}" if current else line
+        if current:
+            messages.append(current)
+        return messages
+
+    def _send(self, text):
+        """POST one message, waiting out rate limits; returns True on success"""
+        url = f"https://api.telegram.org/bot{self.token}/sendMessage"
+        data = {
+            'chat_id': self.chat_id,
+            'text': text,
+            'parse_mode': 'HTML'
+        }
+
+        for attempt in range(SEND_ATTEMPTS):
+            wait = self.last_send + MIN_SEND_INTERVAL - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+
+            try:
+                response = self.session.post(url, data=data, timeout=10)
+            except requests.RequestException as e:
+                print(f"❌ Telegram send failed: {e}")
+                time.sleep(2 ** attempt)
+                continue
+            finally:
+                self.last_send = time.monotonic()
+
+            if response.status_code == 200:
+                self.sent += 1
+                return True
+
+            if response.status_code == 429:
+                # Too Many Requests - Telegram tells us how long to back off
+                try:
+                    retry_after = response.json().get('parameters', {}).get('retry_after', 5)
+                except ValueError:
+                    retry_after = 5
+                time.sleep(retry_after)
+                continue
+
+            print(f"❌ Telegram rejected message: {response.status_code} {response.text[:100]}")
+            return False
+
+        return False
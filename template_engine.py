@@ -0,0 +1,187 @@
+"""
+Title/description template engine
+- Patterns, word lists, bullet points and tags live in metadata_templates.json
+  and are loaded and compiled once (literal/field parts, no str.format parsing
+  per call)
+- Title uniqueness is checked against an in-memory set seeded from
+  uploaded_videos, instead of a SELECT per title
+- Cheap enough for bulk prefetch and A/B variants (thousands per second)
+"""
+
+import os
+import json
+import zlib
+import random
+import threading
+from datetime import datetime
+from string import Formatter
+
+TEMPLATES_FILE = os.getenv('METADATA_TEMPLATES',
+                           os.path.join(os.path.dirname(os.path.abspath(__file__)), 'metadata_templates.json'))
+
+MAX_TITLE_LENGTH = 70
+
+
+class CompiledTemplate:
+    """A str.format template split once into literal text and field names"""
+
+    def __init__(self, text):
+        self.text = text
+        self.parts = []
+        self.fields = set()
+        for literal, field, _, _ in Formatter().parse(text):
+            if literal:
+                self.parts.append((True, literal))
+            if field is not None:
+                self.parts.append((False, field))
+                self.fields.add(field)
+
+    def render(self, values):
+        return ''.join(part if literal else str(values[part]) for literal, part in self.parts)
+
+
+class TemplateEngine:
+    """Generates titles and template descriptions from the compiled data file"""
+
+    def __init__(self, path=TEMPLATES_FILE, rng=None):
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+
+        self.rng = rng or random.Random()
+        self.titles = {category: [CompiledTemplate(text) for text in patterns]
+                       for category, patterns in data['titles'].items()}
+        self.descriptions = [CompiledTemplate(text) for text in data['descriptions']]
+        self.words = data['words']
+        self.points = data['points']
+        self.reasons = data['reasons']
+        self.tags = data['tags']
+
+        # Reaction short metadata - the variants metadata experiments choose from
+        self.reaction_titles = [CompiledTemplate(text) for text in data['reaction_titles']]
+        self.reaction_descriptions = [CompiledTemplate(text) for text in data['reaction_descriptions']]
+        self.adjective_sets = data['adjective_sets']
+
+        # Same shape load_title_patterns used to return
+        self.title_patterns = dict(data['titles'], **data['words'])
+
+        self.used_titles = set()
+        self.lock = threading.Lock()
+
+    # --- Title uniqueness ---
+
+    def seed_titles(self, cursor):
+        """Load every uploaded title into the in-memory set"""
+        cursor.execute('SELECT title FROM uploaded_videos WHERE title IS NOT NULL')
+        with self.lock:
+            self.used_titles.update(row[0] for row in cursor.fetchall())
+        return len(self.used_titles)
+
+    def mark_used(self, title):
+        if title:
+            with self.lock:
+                self.used_titles.add(title)
+
+    # --- Generation ---
+
+    def title(self, category='general', reserve=False):
+        """Unique title; reserve=True also claims it (for batches of variants)"""
+        rng = self.rng
+        pattern = rng.choice(self.titles.get(category) or self.titles['entertainment'])
+        title = pattern.render({
+            'adjective': rng.choice(self.words['adjectives']),
+            'topic': rng.choice(self.words['topics']),
+            'emotion': rng.choice(self.words['emotions']),
+            'number': rng.randint(10, 60),
+            'year': datetime.now().year
+        })
+
+        with self.lock:
+            if title in self.used_titles:
+                # Add unique identifier if title exists
+                title = f"{title} #{rng.randint(100, 999)}"
+            if len(title) > MAX_TITLE_LENGTH:
+                title = title[:MAX_TITLE_LENGTH - 3] + "..."
+            if reserve:
+                self.used_titles.add(title)
+        return title
+
+    def arms(self):
+        """Experiment dimension -> possible choices"""
+        return {
+            'title_pattern': list(range(len(self.reaction_titles))),
+            'adjective_set': list(self.adjective_sets),
+            'description_template': list(range(len(self.reaction_descriptions)))
+        }
+
+    def _reaction_adjective(self, video_data, adjective_set):
+        """Fixed per source video, so the title and description agree across calls"""
+        words = self.adjective_sets.get(adjective_set) or self.words['adjectives']
+        return words[zlib.crc32(video_data['id'].encode()) % len(words)]
+
+    def reaction_title(self, video_data, pattern=0, adjective_set=None):
+        """Reaction short title from one pattern (0 is the classic "Elly Reacts to ...")"""
+        title = self.reaction_titles[pattern].render({
+            'source': video_data['title'][:30],
+            'adjective': self._reaction_adjective(video_data, adjective_set)
+        })
+        if len(title) > MAX_TITLE_LENGTH:
+            title = title[:MAX_TITLE_LENGTH - 3] + "..."
+        return title
+
+    def reaction_description(self, video_data, template=0, adjective_set=None, category='reaction'):
+        return self.reaction_descriptions[template].render({
+            'original': video_data['title'],
+            'channel': video_data['channel'],
+            'adjective': self._reaction_adjective(video_data, adjective_set),
+            'category': category
+        })
+
+    def content_points(self, category):
+        points = self.points['tech'] if category == 'tech' else self.points['entertainment']
+        return self.rng.sample(points, 3)
+
+    def trending_reasons(self):
+        return self.rng.sample(self.reasons, 3)
+
+    def seo_tags(self, video_data, category):
+        """Up to 20 hashtags: base, category, time-based and two random ones"""
+        rng = self.rng
+        now = datetime.now()
+        all_tags = self.tags['base'] + self.tags.get(category, []) + [
+            f"#viral{now.strftime('%Y')}",
+            f"#trending{now.strftime('%m%d')}",
+            f"#{category}{now.strftime('%H')}"
+        ]
+        viral_tags = [
+            f"#moment{rng.randint(100, 999)}",
+            f"#viral{rng.randint(1, 100)}",
+            f"#trend{rng.randint(1, 999)}"
+        ]
+        all_tags.extend(rng.sample(viral_tags, 2))
+        return ' '.join(all_tags[:20])
+
+    def description(self, video_data, title, category='general'):
+        rng = self.rng
+        now = datetime.now()
+        points = self.content_points(category)
+        reasons = self.trending_reasons()
+        return rng.choice(self.descriptions).render({
+            'title': title,
+            'adjective': rng.choice(self.words['adjectives']),
+            'channel': video_data['channel'],
+            'rating': rng.randint(8, 10),
+            'point1': points[0],
+            'point2': points[1],
+            'point3': points[2],
+            'reason1': reasons[0],
+            'reason2': reasons[1],
+            'reason3': reasons[2],
+            'tags': self.seo_tags(video_data, category),
+            'time': now.strftime('%B %d, %Y'),
+            'category': category.title(),
+            'year': now.year,
+            'views': f"{video_data['views']:,}",
+            'hashtag1': f"{category}{rng.randint(100, 999)}",
+            'hashtag2': f"viral{now.strftime('%Y%m')}",
+            'hashtag3': f"trending{rng.randint(1, 100)}"
+        })
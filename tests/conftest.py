@@ -0,0 +1,25 @@
+import os
+import sys
+import threading
+
+import pytest
+
+# The bot's modules live at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def bot(tmp_path, monkeypatch):
+    """AutoYouTubeBot with only its database set up (in-memory, no APIs or threads)"""
+    monkeypatch.setenv('RENDER', '1')
+    monkeypatch.chdir(tmp_path)
+    import youtube_bot
+
+    bot = youtube_bot.AutoYouTubeBot.__new__(youtube_bot.AutoYouTubeBot)
+    bot.db_lock = threading.RLock()
+    bot.videos_version = 0
+    bot.videos_version_lock = threading.Lock()
+    bot.templates = None
+    bot.experiments = None
+    bot.init_database()
+    return bot
@@ -0,0 +1,95 @@
+"""/api/logs readers: backwards tail and the since-offset cursor"""
+
+import json
+
+import pytest
+
+import bot_logging
+
+
+def entry(index):
+    # Varying lengths, so lines straddle block boundaries at different points
+    return {'level': 'error' if index % 5 == 0 else 'info', 'msg': f"line {index} " + 'x' * (index * 7 % 90)}
+
+
+def write_log(path, entries, final_newline=True):
+    text = '\n'.join(json.dumps(item) for item in entries)
+    path.write_bytes((text + ('\n' if final_newline else '')).encode())
+    return path
+
+
+@pytest.fixture
+def small_blocks(monkeypatch):
+    monkeypatch.setattr(bot_logging, 'READ_BLOCK_SIZE', 64)
+
+
+def test_tail_spans_many_blocks(tmp_path, small_blocks):
+    items = [entry(index) for index in range(200)]
+    path = write_log(tmp_path / 'bot.log', items)
+
+    tail, offset = bot_logging.tail_log(str(path), count=50)
+    assert tail == items[-50:]
+    assert offset == path.stat().st_size
+
+    everything, _ = bot_logging.tail_log(str(path), count=500)
+    assert everything == items
+
+
+def test_tail_filters_across_blocks(tmp_path, small_blocks):
+    items = [entry(index) for index in range(200)]
+    path = write_log(tmp_path / 'bot.log', items)
+    errors, _ = bot_logging.tail_log(str(path), count=10, level='error')
+    assert errors == [item for item in items if item['level'] == 'error'][-10:]
+
+
+def test_tail_skips_an_unfinished_last_line(tmp_path, small_blocks):
+    items = [entry(index) for index in range(30)]
+    path = write_log(tmp_path / 'bot.log', items, final_newline=False)
+
+    tail, offset = bot_logging.tail_log(str(path), count=100)
+    assert tail == items[:-1]
+    # The cursor stops before it, so read_log_since returns it once it is complete
+    with open(path, 'ab') as f:
+        f.write(b'\n')
+    since, _, reset = bot_logging.read_log_since(str(path), offset)
+    assert since == items[-1:] and not reset
+
+
+def test_tail_of_a_single_unfinished_line(tmp_path, small_blocks):
+    path = tmp_path / 'bot.log'
+    path.write_bytes(json.dumps(entry(1)).encode() * 5)
+    assert bot_logging.tail_log(str(path)) == ([], 0)
+
+
+def test_read_since_resumes_at_the_cursor(tmp_path):
+    items = [entry(index) for index in range(20)]
+    path = write_log(tmp_path / 'bot.log', items[:10])
+    _, offset, _ = bot_logging.read_log_since(str(path), 0)
+    write_log(path, items)
+    since, next_offset, reset = bot_logging.read_log_since(str(path), offset)
+    assert since == items[10:] and not reset
+    assert next_offset == path.stat().st_size
+
+
+def test_read_since_resets_after_truncation(tmp_path):
+    path = write_log(tmp_path / 'bot.log', [entry(index) for index in range(20)])
+    offset = path.stat().st_size
+    fresh = [entry(index) for index in range(100, 103)]
+    write_log(path, fresh)
+    assert bot_logging.read_log_since(str(path), offset)[::2] == (fresh, True)
+
+
+def test_read_since_resets_when_the_cursor_lands_mid_line(tmp_path):
+    old = [entry(index) for index in range(3)]
+    path = write_log(tmp_path / 'bot.log', old)
+    offset = path.stat().st_size
+
+    # Rotated: a new, longer file where the old offset falls inside a record
+    fresh = [entry(index) for index in range(100, 110)]
+    write_log(path, fresh)
+    assert path.read_bytes()[offset - 1:offset] != b'\n'
+
+    since, next_offset, reset = bot_logging.read_log_since(str(path), offset)
+    assert reset
+    assert since == fresh
+    assert next_offset == path.stat().st_size
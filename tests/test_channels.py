@@ -0,0 +1,101 @@
+"""Channel profiles: credentials of their own, private copies of shared candidates, own upload counts"""
+
+import sqlite3
+
+import pytest
+
+import channels
+
+
+def make_cursor():
+    db = sqlite3.connect(':memory:')
+    cursor = db.cursor()
+    channels.create_tables(cursor)
+    return cursor
+
+
+def test_profile_without_own_credentials_is_rejected():
+    cursor = make_cursor()
+    with pytest.raises(ValueError, match='refresh_token'):
+        channels.save_channel(cursor, {'name': 'second', 'client_id': 'id', 'client_secret': 'secret'})
+    cursor.execute('SELECT COUNT(*) FROM channels')
+    assert cursor.fetchone()[0] == 0
+
+
+def test_update_may_leave_out_stored_secrets():
+    cursor = make_cursor()
+    channel_id = channels.save_channel(cursor, {'name': 'second', 'client_id': 'id', 'client_secret': 'secret',
+                                                'refresh_token': 'token'})
+    assert channels.save_channel(cursor, {'name': 'second', 'daily_quota': 3}) == channel_id
+    with pytest.raises(ValueError, match='client_secret'):
+        channels.save_channel(cursor, {'name': 'second', 'client_secret': ''})
+
+
+def test_discovery_cache_hands_out_copies():
+    cache = channels.DiscoveryCache()
+    first = cache.get(lambda: [{'id': 'a', 'title': 'source'}])
+    first[0].update(title='Elly Reacts', youtube_url='https://www.youtube.com/watch?v=x')
+    second = cache.get(lambda: [])
+    assert second == [{'id': 'a', 'title': 'source'}]
+
+
+def test_download_cache_keeps_files_not_stream_urls(tmp_path):
+    cache = channels.DownloadCache()
+    source = tmp_path / 'a.mp4'
+    source.write_bytes(b'x')
+    fetched = []
+
+    def fetch(video_id):
+        fetched.append(video_id)
+        return str(source) if video_id == 'a' else f'https://media.invalid/{video_id}?expire=1'
+
+    assert cache.get('a', fetch) == cache.get('a', fetch) == str(source)
+    cache.get('b', fetch)
+    cache.get('b', fetch)
+    assert fetched == ['a', 'b', 'b']
+
+
+def test_profile_uploads_leave_the_default_channel_limit_alone(bot, tmp_path):
+    """Uploads on channel B count in B's channel_stats and uploaded_videos rows, not in A's daily total"""
+    with bot.db_lock:
+        second = channels.save_channel(bot.db.cursor(), {'name': 'B', 'client_id': 'id', 'client_secret': 's',
+                                                         'refresh_token': 't', 'daily_quota': 5})
+        bot.db.commit()
+
+    # The default channel (A) has uploaded three times today
+    for _ in range(3):
+        bot.update_stats('tech')
+
+    def write(name):
+        path = tmp_path / name
+        path.write_bytes(b'x')
+        return str(path)
+
+    bot.bot_active = True
+    bot.log_activity = lambda *args, **kwargs: None
+    bot.prefetch_metadata = lambda videos: None
+    bot.download_video_enhanced = lambda video_id, duration=None: write(f'{video_id}.mp4')
+    bot.create_elly_reaction_short = lambda source, video_id, overlay_path=None: write(f'{video_id}_short.mp4')
+    bot.track_artifact = lambda path, video_id=None, state=None: path
+    bot.reaction_metadata = lambda video: ('Elly Reacts', 'description')
+    upload_ids = iter(['upA', 'upB'])
+    bot.upload_to_youtube = lambda path, title, description, client=None: \
+        f"https://www.youtube.com/watch?v={next(upload_ids)}"
+    bot.get_channel_upload_client = lambda profile: object()
+    bot.cleanup = lambda path: None
+    bot.finish_job = lambda video_id: None
+    bot.get_real_youtube_data = lambda: [{'id': f'src{index}', 'title': 'source', 'channel': 'Somebody',
+                                          'category': 'tech'}
+                                         for index in range(2)]
+
+    manager = channels.ChannelManager(bot)
+    assert manager.run_channel(second)
+    assert manager.run_channel(second)
+
+    assert bot.get_today_uploads() == 3
+    with bot.db_lock:
+        cursor = bot.db.cursor()
+        assert channels.load_stats(cursor, second)['uploads'] == 2
+    page = bot.query_uploaded_videos(channel=str(second), fields='id,channel_id')
+    assert sorted(video['id'] for video in page['videos']) == ['src0', 'src1']
+    assert bot.query_uploaded_videos(channel='default')['videos'] == []
@@ -0,0 +1,45 @@
+"""Download writer: MP4 validation and length checks on streamed responses"""
+
+import gzip
+import io
+
+import pytest
+import requests
+from urllib3.response import HTTPResponse
+
+import download_writer
+
+MP4 = b'\x00\x00\x00\x18ftypmp42' + bytes(range(256)) * 200
+
+
+def make_response(body, headers, raw_headers=None):
+    response = requests.Response()
+    response.status_code = 200
+    response.headers.update(headers)
+    raw_headers = headers if raw_headers is None else raw_headers
+    response.raw = HTTPResponse(body=io.BytesIO(body), headers=raw_headers, preload_content=False)
+    return response
+
+
+def test_plain_body_is_written(tmp_path):
+    path = tmp_path / 'a.mp4'
+    response = make_response(MP4, {'Content-Length': str(len(MP4))})
+    assert download_writer.write_response(response, str(path), min_chunk=1024) == len(MP4)
+    assert path.read_bytes() == MP4
+
+
+def test_encoded_body_is_not_reported_truncated(tmp_path):
+    path = tmp_path / 'a.mp4'
+    body = gzip.compress(MP4)
+    response = make_response(body, {'Content-Length': str(len(body)), 'Content-Encoding': 'gzip'})
+    assert download_writer.write_response(response, str(path), min_chunk=1024) == len(MP4)
+    assert path.read_bytes() == MP4
+
+
+def test_short_body_is_truncated(tmp_path):
+    path = tmp_path / 'a.mp4'
+    # The connection closes early (urllib3 itself isn't told the length)
+    response = make_response(MP4[:20000], {'Content-Length': str(len(MP4))}, raw_headers={})
+    with pytest.raises(download_writer.InvalidDownload, match='truncated'):
+        download_writer.write_response(response, str(path), min_chunk=1024)
+    assert not path.exists()
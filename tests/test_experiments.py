@@ -0,0 +1,120 @@
+"""Experiment engine: convergence and keying rewards on the uploaded video"""
+
+import os
+import random
+import sqlite3
+import threading
+import time
+
+import experiments
+import stats_history
+
+
+class FakeBot:
+    def __init__(self):
+        self.db = sqlite3.connect(':memory:', check_same_thread=False)
+        self.db_lock = threading.RLock()
+        cursor = self.db.cursor()
+        experiments.create_tables(cursor)
+        stats_history.create_tables(cursor)
+        self.db.commit()
+
+
+ARMS = {'title_pattern': [0, 1, 2, 3], 'adjective_set': ['hype', 'calm'], 'description_template': [0, 1]}
+
+
+def test_sampler_converges_on_the_best_title_pattern():
+    """One title pattern earns 5x the views - after 300 uploads it is picked almost always"""
+    bot = FakeBot()
+    engine = experiments.ExperimentEngine(bot, ARMS, rng=random.Random(7))
+    views_rng = random.Random(11)
+    window = experiments.REWARD_WINDOW_HOURS * 3600
+    # Uploads are back-dated past the reward window, so each is scored right away
+    uploaded_at = time.time() - 2 * window
+
+    picks = []
+    for upload in range(400):
+        choices = engine.choose()
+        picks.append(choices['title_pattern'])
+        video_id = f"upload{upload}"
+        engine.record(video_id, choices, 'reaction')
+
+        views = int(views_rng.lognormvariate(7, 0.5) * (5 if choices['title_pattern'] == '2' else 1))
+        with bot.db_lock:
+            bot.db.execute('UPDATE metadata_experiments SET uploaded_at = ? WHERE video_id = ?',
+                           (uploaded_at, video_id))
+            stats_history.record_samples(bot.db.cursor(), {video_id: (views, 0, 0)}, uploaded_at + 3600)
+            bot.db.commit()
+        engine.refresh(force=True)
+
+    late = picks[300:]
+    assert late.count('2') / len(late) > 0.9
+
+
+def test_rewards_come_from_the_uploaded_video(tmp_path, monkeypatch):
+    """Experiments are recorded and scored under the upload's id, not the source short's"""
+    monkeypatch.setenv('RENDER', '1')
+    monkeypatch.chdir(tmp_path)
+    import youtube_bot
+
+    bot = youtube_bot.AutoYouTubeBot.__new__(youtube_bot.AutoYouTubeBot)
+    bot.db_lock = threading.RLock()
+    bot.videos_version = 0
+    bot.videos_version_lock = threading.Lock()
+    bot.templates = None
+    bot.init_database()
+    bot.experiments = experiments.ExperimentEngine(bot, ARMS, rng=random.Random(1))
+
+    choices = {'title_pattern': '1', 'adjective_set': 'calm', 'description_template': '0'}
+    bot.save_video_with_stats({
+        'id': 'sourceShort1', 'title': 'Elly Reacts', 'description': 'd', 'category': 'reaction',
+        'youtube_url': 'https://www.youtube.com/watch?v=uploadedAbc', 'experiment': choices
+    })
+
+    cursor = bot.db.cursor()
+    cursor.execute('SELECT video_id FROM metadata_experiments')
+    assert cursor.fetchall() == [('uploadedAbc',)]
+    assert list(bot.get_tracked_video_stats()) == ['uploadedAbc']
+    assert bot.stats_id('sourceShort1') == 'uploadedAbc'
+
+    # A refresh of the upload's stats lands on the row and in its history
+    tracked = bot.get_tracked_video_stats()
+    assert bot.update_video_stats_batch({'uploadedAbc': {'views': 900, 'likes': 0, 'comments': 0}}, tracked) == 1
+    cursor.execute('SELECT views FROM uploaded_videos WHERE video_id = ?', ('sourceShort1',))
+    assert cursor.fetchone()[0] == 900
+
+    window = experiments.REWARD_WINDOW_HOURS * 3600
+    rewards = bot.experiments._rewards(cursor, time.time() + 2 * window)
+    assert rewards == [(choices, 900)]
+
+
+def test_rewards_survive_history_roll_up():
+    """Scored uploads keep their reward once history is deleted; uploads without history are not failures"""
+    bot = FakeBot()
+    engine = experiments.ExperimentEngine(bot, ARMS, rng=random.Random(3))
+    window = experiments.REWARD_WINDOW_HOURS * 3600
+    uploaded_at = time.time() - 2 * window
+
+    old = {'title_pattern': '0', 'adjective_set': 'hype', 'description_template': '0'}
+    silent = {'title_pattern': '1', 'adjective_set': 'calm', 'description_template': '1'}
+    engine.record('old', old, 'reaction')
+    engine.record('silent', silent, 'reaction')
+    with bot.db_lock:
+        bot.db.execute('UPDATE metadata_experiments SET uploaded_at = ?', (uploaded_at,))
+        stats_history.record_samples(bot.db.cursor(), {'old': (5000, 0, 0)}, uploaded_at + 3600)
+        bot.db.commit()
+
+    engine.refresh(force=True)
+    assert engine.scored == 1
+    before = dict(engine.posteriors)
+
+    # A year and more later: the daily rows are expired
+    with bot.db_lock:
+        stats_history.roll_up(bot.db.cursor(), now=uploaded_at + 400 * 86400)
+        bot.db.commit()
+        assert bot.db.execute('SELECT COUNT(*) FROM video_stats_history').fetchone()[0] == 0
+
+    engine.refresh(force=True)
+    assert engine.scored == 1
+    assert engine.posteriors == before
+    assert ('title_pattern', '1') not in engine.posteriors
@@ -0,0 +1,62 @@
+"""Groq descriptions: cached per title variant, bounded in memory"""
+
+import sqlite3
+import threading
+
+import metadata_service
+
+
+class FakeBot:
+    def __init__(self):
+        self.db = sqlite3.connect(':memory:', check_same_thread=False)
+        self.db_lock = threading.RLock()
+        metadata_service.create_tables(self.db.cursor())
+
+
+class FakeResponse:
+    status_code = 200
+    headers = {}
+
+    def __init__(self, content):
+        self.content = content
+
+    def json(self):
+        return {'choices': [{'message': {'content': self.content}}]}
+
+
+def make_service(cache_size=metadata_service.METADATA_CACHE_SIZE):
+    service = metadata_service.MetadataService(FakeBot(), api_key='test', workers=1, cache_size=cache_size)
+    prompts = []
+
+    def post(url, json=None, timeout=None):
+        prompt = json['messages'][0]['content']
+        prompts.append(prompt)
+        return FakeResponse(f"description {len(prompts)} for {prompt.splitlines()[1]}")
+    service.session.post = post
+    return service, prompts
+
+
+VIDEO = {'id': 'source1', 'title': 'Cat does a backflip', 'channel': 'Daily Laughs'}
+
+
+def test_each_title_variant_gets_its_own_description():
+    service, prompts = make_service()
+    first = service.describe(VIDEO, 'Elly Reacts: INSANE cat', 'reaction', budget=5)
+    second = service.describe(VIDEO, 'Elly is calm about this cat', 'reaction', budget=5)
+
+    assert first.endswith('Title: Elly Reacts: INSANE cat')
+    assert second.endswith('Title: Elly is calm about this cat')
+    assert service.describe(VIDEO, 'Elly Reacts: INSANE cat', 'reaction', budget=5) == first
+    assert len(prompts) == 2
+
+
+def test_memory_cache_is_bounded():
+    service, prompts = make_service(cache_size=2)
+    for index in range(3):
+        service.describe({**VIDEO, 'id': f"source{index}"}, 'Elly Reacts', 'reaction', budget=5)
+    assert len(service.cache) == 2
+    assert ('source0', metadata_service.title_key('Elly Reacts')) not in service.cache
+
+    # Evicted from memory, still in the database
+    assert service.cached('source0', 'Elly Reacts') == 'description 1 for Title: Elly Reacts'
+    assert len(prompts) == 3
@@ -0,0 +1,40 @@
+"""save_video_with_stats: bookkeeping failures never cost the upload history"""
+
+
+def video(video_id, category='tech'):
+    return {'id': video_id, 'title': f"Elly Reacts {video_id}", 'description': 'd', 'category': category,
+            'youtube_url': f"https://www.youtube.com/watch?v=up{video_id}"}
+
+
+def count(bot):
+    return bot.db.execute('SELECT COUNT(*) FROM uploaded_videos').fetchone()[0]
+
+
+def test_summary_failure_keeps_history(bot, monkeypatch):
+    assert bot.save_video_with_stats(video('a'))
+
+    def broken(*args, **kwargs):
+        raise RuntimeError('summary row is gone')
+    monkeypatch.setattr(bot, 'adjust_dashboard_summary', broken)
+
+    assert bot.save_video_with_stats(video('b'))
+    assert count(bot) == 2
+    # Recounted instead of adjusted
+    assert bot.get_dashboard_summary()['total_videos'] == 2
+
+
+def test_template_failure_keeps_history(bot):
+    class BrokenTemplates:
+        def mark_used(self, title):
+            raise RuntimeError('templates broken')
+    bot.save_video_with_stats(video('a'))
+    bot.templates = BrokenTemplates()
+
+    assert bot.save_video_with_stats(video('b'))
+    assert count(bot) == 2
+
+
+def test_non_schema_errors_do_not_drop_the_table(bot):
+    bot.save_video_with_stats(video('a'))
+    assert not bot.save_video_with_stats({**video('b'), 'views': object()})  # Unsupported type
+    assert count(bot) == 1
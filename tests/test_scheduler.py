@@ -0,0 +1,226 @@
+"""Deadline scheduler: cron parsing, DST, catch-up policies and the job pools"""
+
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+import scheduler
+
+
+class FakeBot:
+    def __init__(self):
+        self.db = sqlite3.connect(':memory:', check_same_thread=False)
+        self.db_lock = threading.RLock()
+        scheduler.create_tables(self.db.cursor())
+
+
+def local(*args):
+    return datetime(*args).timestamp()
+
+
+@pytest.fixture
+def berlin():
+    """Local time with DST (last Sunday of March / October)"""
+    old = os.environ.get('TZ')
+    os.environ['TZ'] = 'Europe/Berlin'
+    time.tzset()
+    yield
+    if old is None:
+        del os.environ['TZ']
+    else:
+        os.environ['TZ'] = old
+    time.tzset()
+
+
+# --- Parsing ---
+
+def test_cron_fields():
+    cron = scheduler.CronSchedule('*/15 8-22/2 * * 1-5')
+    assert cron.minutes == [0, 15, 30, 45]
+    assert cron.hours == [8, 10, 12, 14, 16, 18, 20, 22]
+    assert cron.weekdays == {1, 2, 3, 4, 5}
+
+
+def test_sunday_is_0_or_7():
+    assert scheduler.CronSchedule('0 9 * * 7').weekdays == {0}
+
+
+@pytest.mark.parametrize('expression', ['0 24 * * *', '60 * * * *', '0 8 * *', '0 8-6 * * *', '0 8/0 * * *'])
+def test_invalid_cron_is_rejected(expression):
+    with pytest.raises(ValueError):
+        scheduler.CronSchedule(expression)
+
+
+def test_day_of_month_or_weekday_when_both_restricted():
+    # 1st of the month OR Monday, like standard cron
+    cron = scheduler.CronSchedule('0 12 1 * 1')
+    assert datetime.fromtimestamp(cron.next_after(local(2024, 5, 28, 13, 0))) == datetime(2024, 6, 1, 12, 0)
+    assert datetime.fromtimestamp(cron.next_after(local(2024, 6, 1, 13, 0))) == datetime(2024, 6, 3, 12, 0)
+
+
+def test_day_times_and_cron_lines_combine():
+    schedule = scheduler.Schedule('08:00,12:30; 0 20 * * 6')
+    assert datetime.fromtimestamp(schedule.next_after(local(2024, 6, 1, 9, 0))) == datetime(2024, 6, 1, 12, 30)
+    assert datetime.fromtimestamp(schedule.next_after(local(2024, 6, 1, 13, 0))) == datetime(2024, 6, 1, 20, 0)
+    assert datetime.fromtimestamp(schedule.next_after(local(2024, 6, 1, 20, 0))) == datetime(2024, 6, 2, 8, 0)
+
+
+def test_never_firing_cron_is_rejected():
+    with pytest.raises(ValueError):
+        scheduler.CronSchedule('0 0 31 2 *').next_after(time.time())
+
+
+# --- DST ---
+
+def test_slot_in_the_spring_forward_gap_fires_once(berlin):
+    cron = scheduler.CronSchedule('30 2 * * *')
+    # 2024-03-31 02:30 does not exist in Berlin - it fires at the same instant as 03:30 CEST
+    slot = cron.next_after(local(2024, 3, 31, 1, 0))
+    assert datetime.fromtimestamp(slot) == datetime(2024, 3, 31, 3, 30)
+    assert datetime.fromtimestamp(cron.next_after(slot)) == datetime(2024, 4, 1, 2, 30)
+
+
+def test_slot_in_the_repeated_fall_back_hour_fires_once(berlin):
+    cron = scheduler.CronSchedule('30 2 * * *')
+    slot = cron.next_after(local(2024, 10, 27, 1, 0))
+    following = cron.next_after(slot)
+    assert datetime.fromtimestamp(following) == datetime(2024, 10, 28, 2, 30)
+    assert following - slot == 25 * 3600
+
+
+def test_hourly_slots_stay_an_hour_apart_across_dst(berlin):
+    cron = scheduler.CronSchedule('0 * * * *')
+    slot = cron.next_after(local(2024, 3, 31, 0, 30))
+    gaps = []
+    for _ in range(4):
+        following = cron.next_after(slot)
+        gaps.append(following - slot)
+        slot = following
+    assert set(gaps) == {3600}
+
+
+# --- Deadlines ---
+
+class Clock:
+    def __init__(self):
+        self.wall = 1_700_000_000.0
+        self.mono = 1000.0
+
+    def time(self):
+        return self.wall
+
+    def monotonic(self):
+        return self.mono
+
+
+def test_deadline_ignores_wall_clock_jumps(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(scheduler, 'time', clock)
+    jobs = scheduler.Scheduler()
+    job = jobs.add_once('later', 600, lambda: None)
+    assert job.deadline == 1600.0
+
+    clock.wall += 3600  # NTP step / manual clock change
+    assert jobs.upcoming()[0]['in_seconds'] == 600
+    clock.mono += 599
+    assert jobs.upcoming()[0]['in_seconds'] == 1
+
+
+# --- Catch-up ---
+
+def resume(catch_up, late_seconds, spec='0 * * * *', period=3600):
+    """add_cron for a job whose persisted slot is at least late_seconds in the past"""
+    bot = FakeBot()
+    now = time.time()
+    # Last slot at or before now - late_seconds
+    slot = scheduler.Schedule(spec).next_after(now - late_seconds - period)
+    bot.db.execute('INSERT INTO scheduled_jobs (name, schedule, next_run) VALUES (?, ?, ?)', ('job', spec, slot))
+    jobs = scheduler.Scheduler(bot)
+    return jobs.add_cron('job', spec, lambda: None, catch_up=catch_up), slot, now
+
+
+def missed_slots(slot, now, spec='0 * * * *'):
+    missed = 0
+    while slot <= now:
+        missed += 1
+        slot = scheduler.Schedule(spec).next_after(slot)
+    return missed
+
+
+def test_skip_drops_missed_slots():
+    job, _, now = resume(scheduler.CATCH_UP_SKIP, 3.5 * 3600)
+    assert now < job.next_run <= now + 3600
+    assert job.pending == 0
+
+
+def test_once_runs_one_catch_up():
+    job, _, now = resume(scheduler.CATCH_UP_ONCE, 3.5 * 3600)
+    assert job.next_run == pytest.approx(now, abs=5)
+    assert job.pending == 0
+
+
+def test_all_runs_every_missed_slot():
+    job, slot, now = resume(scheduler.CATCH_UP_ALL, 3.5 * 3600)
+    missed = missed_slots(slot, now)
+    assert missed >= 4
+    assert job.next_run == pytest.approx(now, abs=5)
+    assert job.pending == missed - 1
+
+
+def test_all_is_capped():
+    job, _, _ = resume(scheduler.CATCH_UP_ALL, 30 * 3600)
+    assert job.pending == scheduler.MAX_CATCH_UP - 1
+
+
+def test_within_misfire_grace_just_runs():
+    job, slot, now = resume(scheduler.CATCH_UP_SKIP, scheduler.MISFIRE_GRACE / 2, spec='* * * * *', period=30)
+    assert now - scheduler.MISFIRE_GRACE < slot < now
+    # Late by less than MISFIRE_GRACE: not a missed slot, even under SKIP
+    assert job.next_run == slot
+    assert job.pending == 0
+
+
+def test_catch_up_all_runs_back_to_back():
+    bot = FakeBot()
+    now = time.time()
+    spec = '0 * * * *'
+    slot = scheduler.Schedule(spec).next_after(now - 3 * 3600 - 1800)
+    expected = missed_slots(slot, now)
+    bot.db.execute('INSERT INTO scheduled_jobs (name, schedule, next_run) VALUES (?, ?, ?)', ('job', spec, slot))
+    runs = []
+    jobs = scheduler.Scheduler(bot)
+    jobs.add_cron('job', spec, lambda: runs.append(time.time()), catch_up=scheduler.CATCH_UP_ALL)
+    thread = threading.Thread(target=jobs.run_forever, daemon=True)
+    thread.start()
+    try:
+        deadline = time.monotonic() + 5
+        while len(runs) < expected and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        jobs.stop()
+    assert len(runs) == expected
+    saved = bot.db.execute('SELECT next_run FROM scheduled_jobs WHERE name = ?', ('job',)).fetchone()[0]
+    assert saved > now
+
+
+# --- Pools ---
+
+def test_long_jobs_do_not_starve_short_ones():
+    jobs = scheduler.Scheduler(workers=1, long_workers=1)
+    release = threading.Event()
+    ran = threading.Event()
+    for index in range(3):
+        jobs.add_once(f'upload{index}', 0, release.wait, long_running=True)
+    jobs.add_once('hourly_status', 0.05, ran.set)
+
+    thread = threading.Thread(target=jobs.run_forever, daemon=True)
+    thread.start()
+    try:
+        assert ran.wait(5)
+    finally:
+        release.set()
+        jobs.stop()
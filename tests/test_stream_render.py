@@ -0,0 +1,48 @@
+"""Streamed renderer: a full-length short stays under RENDER_MEMORY_LIMIT_MB"""
+
+import os
+import shutil
+import subprocess
+
+import pytest
+
+import stream_render
+
+
+def ffmpeg_binary():
+    try:
+        binary = stream_render.get_setting('FFMPEG_BINARY')
+    except Exception:
+        return None
+    return binary if binary and (os.path.exists(binary) or shutil.which(binary)) else None
+
+
+def make_clip(path, size, duration, audio=True):
+    """lavfi test pattern (plus a sine tone) encoded to mp4, like bench/render_memory.py"""
+    command = [ffmpeg_binary(), '-v', 'error', '-y',
+               '-f', 'lavfi', '-i', f'testsrc2=size={size[0]}x{size[1]}:rate=30:duration={duration}']
+    if audio:
+        command += ['-f', 'lavfi', '-i', f'sine=frequency=440:duration={duration}', '-c:a', 'aac']
+    command += ['-c:v', 'libx264', '-preset', 'ultrafast', '-pix_fmt', 'yuv420p', str(path)]
+    subprocess.run(command, check=True)
+    return str(path)
+
+
+@pytest.mark.skipif(ffmpeg_binary() is None, reason='ffmpeg is not available')
+def test_60s_short_peaks_under_the_memory_limit(tmp_path, monkeypatch):
+    """60s 1080x1920 render with the production defaults, inside a process that has the bot loaded"""
+    monkeypatch.setenv('RENDER', '1')
+    monkeypatch.chdir(tmp_path)
+    import youtube_bot  # noqa: F401 - the limit counts the bot process too
+
+    # Longer than the short, so the middle window is cut like in production
+    source = make_clip(tmp_path / 'source.mp4', (1280, 720), 80)
+    overlay = make_clip(tmp_path / 'overlay.mp4', (480, 854), 10, audio=False)
+    output = tmp_path / 'short.mp4'
+
+    renderer = stream_render.StreamRenderer()
+    renderer.render(source, overlay, str(output))
+
+    assert renderer.frames == stream_render.MAX_DURATION * stream_render.FPS
+    assert output.stat().st_size > 0
+    assert 0 < renderer.peak_rss_mb < stream_render.RENDER_MEMORY_LIMIT_MB
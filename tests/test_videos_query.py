@@ -0,0 +1,27 @@
+"""/api/videos keyset pagination over uploaded_videos"""
+
+
+def test_most_viewed_pages_through_rows_without_views(bot):
+    rows = [(f"v{index}", f"Video {index}", index * 100 if index % 3 else None) for index in range(10)]
+    bot.db.executemany('INSERT INTO uploaded_videos (video_id, title, views) VALUES (?, ?, ?)', rows)
+    bot.db.commit()
+
+    seen = []
+    after = None
+    while True:
+        page = bot.query_uploaded_videos(after=after, limit=3, sort='most_viewed', fields='id,views')
+        seen.extend(video['id'] for video in page['videos'])
+        after = page['next_cursor']
+        if not after:
+            break
+
+    assert sorted(seen) == sorted(video_id for video_id, _, _ in rows)
+    assert seen[:2] == ['v8', 'v7']
+
+
+def test_most_viewed_uses_its_index(bot):
+    plan = bot.db.execute('''
+        EXPLAIN QUERY PLAN SELECT id FROM uploaded_videos
+        WHERE (COALESCE(views, 0), id) < (?, ?) ORDER BY COALESCE(views, 0) DESC, id DESC LIMIT 5
+    ''', (100, 5)).fetchall()
+    assert 'idx_uploaded_videos_views0' in ' '.join(str(row[-1]) for row in plan)
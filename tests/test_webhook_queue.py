@@ -0,0 +1,80 @@
+"""Telegram webhook: update_ids are claimed once, a full queue asks for redelivery"""
+
+import threading
+import time
+
+import pytest
+
+import webhook_queue
+
+
+def test_update_is_claimed_once_across_restarts(tmp_path):
+    path = str(tmp_path / 'updates.db')
+    store = webhook_queue.UpdateStore(path)
+    assert store.claim(1)
+    assert not store.claim(1)
+    assert store.claim(2)
+
+    restarted = webhook_queue.UpdateStore(path)
+    assert not restarted.claim(1)
+
+
+def test_release_and_prune(tmp_path, monkeypatch):
+    store = webhook_queue.UpdateStore(str(tmp_path / 'updates.db'))
+    store.claim(1)
+    store.release(1)
+    assert store.claim(1)
+
+    later = time.time() + (webhook_queue.PROCESSED_RETENTION_HOURS + 1) * 3600
+    monkeypatch.setattr(webhook_queue.time, 'time', lambda: later)
+    store.prune()
+    assert store.claim(1)
+
+
+def test_redelivered_update_is_handled_once(tmp_path):
+    handled = []
+    done = threading.Event()
+
+    def handler(update):
+        handled.append(update['update_id'])
+        done.set()
+
+    dispatcher = webhook_queue.WebhookDispatcher(handler, webhook_queue.UpdateStore(str(tmp_path / 'u.db')),
+                                                 workers=1)
+    assert dispatcher.submit({'update_id': 7}) == 'accepted'
+    assert done.wait(5)
+    assert dispatcher.submit({'update_id': 7}) == 'duplicate'
+    time.sleep(0.05)
+    assert handled == [7]
+    assert dispatcher.stats()['duplicates'] == 1
+
+
+def test_full_queue_is_busy_and_keeps_the_update_unclaimed(tmp_path):
+    # No workers: nothing drains, so the second update finds the queue full
+    dispatcher = webhook_queue.WebhookDispatcher(lambda update: None, webhook_queue.UpdateStore(str(tmp_path / 'u.db')),
+                                                 workers=0, max_pending=1)
+    assert dispatcher.submit({'update_id': 1}) == 'accepted'
+    assert dispatcher.submit({'update_id': 2}) == 'busy'
+
+    dispatcher.jobs.get_nowait()  # Room again - Telegram's redelivery goes through
+    assert dispatcher.submit({'update_id': 2}) == 'accepted'
+
+
+def test_webhook_returns_503_when_busy(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv('TELEGRAM_CHAT_ID', '42')
+    render_bot = pytest.importorskip('render_bot')
+    dispatcher = webhook_queue.WebhookDispatcher(lambda update: None, webhook_queue.UpdateStore(str(tmp_path / 'u.db')),
+                                                 workers=0, max_pending=1)
+    monkeypatch.setattr(render_bot, 'dispatcher', dispatcher)
+    client = render_bot.app.test_client()
+
+    def post(update_id):
+        return client.post('/webhook/telegram', json={
+            'update_id': update_id, 'message': {'chat': {'id': 42}, 'text': 'status'}})
+
+    assert post(1).status_code == 200
+    assert post(1).get_json() == {'status': 'duplicate'}
+    busy = post(2)
+    assert busy.status_code == 503
+    assert dispatcher.stats()['rejected'] == 1
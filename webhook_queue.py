@@ -0,0 +1,141 @@
+"""
+Idempotent Telegram webhook processing
+- Each update_id is claimed once in a small SQLite file, so redeliveries
+  (Telegram retries slow or failed webhooks) are no-ops, even across restarts
+- Claimed updates go onto a bounded job queue drained by a fixed worker pool;
+  the webhook itself only claims and enqueues, then acks
+"""
+
+import os
+import time
+import queue
+import sqlite3
+import threading
+
+WEBHOOK_DB = os.getenv('WEBHOOK_DB', 'webhook_updates.db')
+
+# Telegram gives up redelivering after about a day; keep IDs a bit longer
+PROCESSED_RETENTION_HOURS = 48
+PRUNE_EVERY = 500  # Claims between prunes
+
+WEBHOOK_WORKERS = int(os.getenv('WEBHOOK_WORKERS', 2))
+MAX_PENDING = 100
+
+
+class UpdateStore:
+    """Persistent set of update_ids that have already been accepted"""
+
+    def __init__(self, path=WEBHOOK_DB):
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.Lock()
+        self.claims = 0
+
+        # WAL + NORMAL: a claim is one small append, no fsync per commit
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('PRAGMA synchronous=NORMAL')
+        self.db.execute('''
+            CREATE TABLE IF NOT EXISTS processed_updates (
+                update_id INTEGER PRIMARY KEY,
+                received_at REAL NOT NULL
+            )
+        ''')
+        self.db.commit()
+
+    def claim(self, update_id):
+        """Record update_id; True only for the first delivery"""
+        with self.lock:
+            cursor = self.db.execute('''
+                INSERT OR IGNORE INTO processed_updates (update_id, received_at)
+                VALUES (?, ?)
+            ''', (update_id, time.time()))
+            self.db.commit()
+            self.claims += 1
+            return cursor.rowcount == 1
+
+    def release(self, update_id):
+        """Forget a claim so Telegram's redelivery is processed (used when the queue is full)"""
+        with self.lock:
+            self.db.execute('DELETE FROM processed_updates WHERE update_id = ?', (update_id,))
+            self.db.commit()
+
+    def prune(self):
+        """Drop IDs older than the retention window"""
+        cutoff = time.time() - PROCESSED_RETENTION_HOURS * 3600
+        with self.lock:
+            self.db.execute('DELETE FROM processed_updates WHERE received_at < ?', (cutoff,))
+            self.db.commit()
+
+
+class WebhookDispatcher:
+    """Claims updates and hands them to a bounded worker pool"""
+
+    def __init__(self, handler, store=None, workers=WEBHOOK_WORKERS, max_pending=MAX_PENDING):
+        self.handler = handler
+        self.store = store or UpdateStore()
+        self.workers = workers
+        self.jobs = queue.Queue(maxsize=max_pending)
+        self.threads = []
+        self.lock = threading.Lock()
+
+        # Counters for the health endpoint
+        self.accepted = 0
+        self.duplicates = 0
+        self.rejected = 0
+        self.failed = 0
+
+    def _ensure_started(self):
+        """Start the workers on first use (after any fork by the web server)"""
+        if self.threads:
+            return
+        with self.lock:
+            if not self.threads:
+                for index in range(self.workers):
+                    thread = threading.Thread(target=self._run, name=f'webhook-worker-{index}', daemon=True)
+                    thread.start()
+                    self.threads.append(thread)
+
+    def submit(self, update):
+        """Claim and enqueue one update - returns 'accepted', 'duplicate' or 'busy'"""
+        self._ensure_started()
+        update_id = update['update_id']
+
+        if not self.store.claim(update_id):
+            self.duplicates += 1
+            return 'duplicate'
+
+        try:
+            self.jobs.put_nowait(update)
+        except queue.Full:
+            # Un-claim so the redelivery is processed once there is room
+            self.store.release(update_id)
+            self.rejected += 1
+            return 'busy'
+
+        self.accepted += 1
+        return 'accepted'
+
+    def _run(self):
+        while True:
+            update = self.jobs.get()
+            try:
+                self.handler(update)
+            except Exception as e:
+                self.failed += 1
+                print(f"❌ Webhook job error (update {update.get('update_id')}): {e}")
+
+            if self.store.claims >= PRUNE_EVERY:
+                self.store.claims = 0
+                try:
+                    self.store.prune()
+                except Exception as e:
+                    print(f"⚠️ Could not prune processed updates: {e}")
+
+    def stats(self):
+        return {
+            'pending': self.jobs.qsize(),
+            'workers': len(self.threads),
+            'accepted': self.accepted,
+            'duplicates': self.duplicates,
+            'rejected': self.rejected,
+            'failed': self.failed
+        }
@@ -0,0 +1,250 @@
+"""
+Disk workspace for downloads and rendered shorts
+- Every artifact (source download, render, placeholder, test video) is
+  tracked with the job (source video ID) that made it and a state:
+  active (in use), ready (buffered short), cached (reusable source) or
+  idle (job finished - failed runs leave their files here)
+- When free disk drops below the low watermark, artifacts are evicted -
+  idle first, then cached, then ready, least recently used first, never
+  active - until free space is back above the high watermark
+- Renders reserve RENDER_RESERVE_MB up front, so they never hit ENOSPC
+- Startup sweeps media files nothing refers to (crash leftovers)
+"""
+
+import os
+import glob
+import time
+import shutil
+import threading
+
+DISK_LOW_WATERMARK_MB = int(os.getenv('DISK_LOW_WATERMARK_MB', 500))
+DISK_HIGH_WATERMARK_MB = int(os.getenv('DISK_HIGH_WATERMARK_MB', 1000))
+
+# Free space a render needs (output + moviepy's temporary audio file)
+RENDER_RESERVE_MB = int(os.getenv('RENDER_RESERVE_MB', 300))
+
+# Idle artifacts are deleted after this long even if disk is plentiful
+IDLE_TTL_HOURS = 6
+
+ACTIVE = 'active'
+READY = 'ready'
+CACHED = 'cached'
+IDLE = 'idle'
+
+# Eviction order - earlier states go first
+EVICTION_ORDER = (IDLE, CACHED, READY)
+
+MEDIA_EXTENSIONS = ('.mp4', '.webm', '.mkv', '.m4a', '.mp3', '.wav', '.part', '.ytdl')
+
+# Leftovers in the working directory (test uploads, moviepy temp audio)
+STRAY_PATTERNS = ('test_video.mp4', '*TEMP_MPY_*')
+
+MB = 1024 * 1024
+
+
+class Artifact:
+    def __init__(self, path, job, state):
+        self.path = path
+        self.job = job
+        self.state = state
+        self.size = 0
+        self.used_at = time.time()
+        self.device = None
+
+
+class Workspace:
+    """Tracks artifacts and keeps free disk between the watermarks"""
+
+    def __init__(self, bot, directories, low_mb=DISK_LOW_WATERMARK_MB, high_mb=DISK_HIGH_WATERMARK_MB):
+        self.bot = bot
+        self.directories = [directory for directory in directories if directory]
+        self.low = low_mb * MB
+        self.high = max(high_mb, low_mb) * MB
+        self.artifacts = {}           # absolute path -> Artifact
+        self.lock = threading.RLock()
+
+        # Counters for /api/system-stats
+        self.evicted = 0
+        self.evicted_bytes = 0
+        self.swept = 0
+        self.space_failures = 0
+
+    # --- Tracking ---
+
+    @staticmethod
+    def _key(path):
+        return os.path.abspath(path)
+
+    def track(self, path, job=None, state=ACTIVE):
+        """Register (or update) a file; returns path for call chaining"""
+        if not path or not os.path.exists(path):
+            return path
+        with self.lock:
+            artifact = self.artifacts.get(self._key(path))
+            if artifact is None:
+                artifact = self.artifacts[self._key(path)] = Artifact(path, job, state)
+            artifact.job = job if job is not None else artifact.job
+            artifact.state = state
+            artifact.used_at = time.time()
+            try:
+                stat = os.stat(path)
+                artifact.size = stat.st_size
+                artifact.device = stat.st_dev
+            except OSError:
+                pass
+        return path
+
+    def touch(self, path, state=None):
+        """Mark a file as just used (and optionally move it to another state)"""
+        with self.lock:
+            artifact = self.artifacts.get(self._key(path)) if path else None
+            if artifact:
+                artifact.used_at = time.time()
+                if state:
+                    artifact.state = state
+
+    def finish(self, job):
+        """A job is over - whatever it still holds as active becomes evictable"""
+        with self.lock:
+            for artifact in self.artifacts.values():
+                if artifact.job == job and artifact.state == ACTIVE:
+                    artifact.state = IDLE
+                    artifact.used_at = time.time()
+
+    def remove(self, path):
+        """Delete a file and forget it"""
+        if not path:
+            return
+        with self.lock:
+            self.artifacts.pop(self._key(path), None)
+        try:
+            if os.path.exists(path):
+                os.remove(path)
+        except OSError:
+            pass
+
+    # --- Space ---
+
+    @staticmethod
+    def free_bytes(directory):
+        return shutil.disk_usage(directory).free
+
+    def ensure_space(self, directory, needed_mb=RENDER_RESERVE_MB):
+        """Make room for needed_mb in directory; False if even eviction can't"""
+        needed = needed_mb * MB
+        free = self.free_bytes(directory)
+        if free - needed >= self.low:
+            return True
+
+        self._evict(os.stat(directory).st_dev, self.high + needed - free)
+        if self.free_bytes(directory) >= needed:
+            return True
+
+        self.space_failures += 1
+        return False
+
+    def _evict(self, device, to_free):
+        """Delete evictable artifacts on device until to_free bytes are released"""
+        with self.lock:
+            candidates = [artifact for artifact in self.artifacts.values()
+                          if artifact.state in EVICTION_ORDER and artifact.device == device]
+            candidates.sort(key=lambda artifact: (EVICTION_ORDER.index(artifact.state), artifact.used_at))
+
+            released = 0
+            for artifact in candidates:
+                if released >= to_free:
+                    break
+                self.remove(artifact.path)
+                released += artifact.size
+                self.evicted += 1
+                self.evicted_bytes += artifact.size
+        if released:
+            print(f"🧹 Workspace: evicted {released / MB:.0f} MB to stay above the disk watermark")
+        return released
+
+    def collect(self):
+        """Periodic pass: drop old idle files, then enforce the watermarks"""
+        cutoff = time.time() - IDLE_TTL_HOURS * 3600
+        with self.lock:
+            expired = [artifact.path for artifact in self.artifacts.values()
+                       if artifact.state == IDLE and artifact.used_at < cutoff]
+            missing = [key for key, artifact in self.artifacts.items() if not os.path.exists(artifact.path)]
+            for key in missing:
+                del self.artifacts[key]
+        for path in expired:
+            self.remove(path)
+
+        for directory in self.directories:
+            if os.path.isdir(directory):
+                self.ensure_space(directory, needed_mb=0)
+        return len(expired)
+
+    # --- Startup ---
+
+    def sweep_orphans(self, keep=()):
+        """Delete media files nothing refers to; files in keep are tracked as ready"""
+        for path in keep:
+            self.track(path, state=READY)
+
+        candidates = []
+        for directory in self.directories:
+            if os.path.isdir(directory):
+                candidates += [os.path.join(directory, name) for name in os.listdir(directory)
+                               if name.lower().endswith(MEDIA_EXTENSIONS)]
+        for pattern in STRAY_PATTERNS:
+            candidates += glob.glob(pattern)
+
+        swept = 0
+        for path in candidates:
+            if os.path.isfile(path) and self._key(path) not in self.artifacts:
+                try:
+                    os.remove(path)
+                    swept += 1
+                except OSError:
+                    pass
+        self.swept += swept
+        if swept:
+            print(f"🧹 Workspace: removed {swept} orphaned file(s)")
+        return swept
+
+    def usage(self):
+        """Per-directory usage, tracked artifacts by state and the watermarks"""
+        directories = []
+        for directory in self.directories:
+            if not os.path.isdir(directory):
+                continue
+            used = 0
+            files = 0
+            for entry in os.scandir(directory):
+                if entry.is_file():
+                    used += entry.stat().st_size
+                    files += 1
+            disk = shutil.disk_usage(directory)
+            directories.append({
+                'path': directory,
+                'files': files,
+                'used_mb': round(used / MB, 1),
+                'free_mb': round(disk.free / MB, 1),
+                'total_mb': round(disk.total / MB, 1)
+            })
+
+        states = {}
+        with self.lock:
+            for artifact in self.artifacts.values():
+                entry = states.setdefault(artifact.state, {'files': 0, 'size_mb': 0.0})
+                entry['files'] += 1
+                entry['size_mb'] += artifact.size / MB
+        for entry in states.values():
+            entry['size_mb'] = round(entry['size_mb'], 1)
+
+        return {
+            'directories': directories,
+            'artifacts': states,
+            'low_watermark_mb': self.low // MB,
+            'high_watermark_mb': self.high // MB,
+            'render_reserve_mb': RENDER_RESERVE_MB,
+            'evicted': self.evicted,
+            'evicted_mb': round(self.evicted_bytes / MB, 1),
+            'swept': self.swept,
+            'space_failures': self.space_failures
+        }
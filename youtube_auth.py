@@ -0,0 +1,215 @@
+"""
+YouTube OAuth credential manager
+- Loads the token once (credentials/token.pickle, falling back to the old
+  token.pickle) and keeps the access token in memory
+- A background thread refreshes it REFRESH_MARGIN seconds before expiry,
+  so uploads never pay for, or race, a token refresh
+- Tokens are persisted atomically (temp file, fsync, rename)
+- client() hands each thread its own authorized API client (httplib2
+  connections are not thread-safe), all sharing the same credentials
+"""
+
+import os
+import pickle
+import tempfile
+import threading
+from datetime import datetime, timezone
+
+from googleapiclient.discovery import build
+from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
+
+SCOPES = ['https://www.googleapis.com/auth/youtube.upload']
+TOKEN_URI = 'https://oauth2.googleapis.com/token'
+
+TOKEN_PATH = os.getenv('YOUTUBE_TOKEN_PATH', os.path.join('credentials', 'token.pickle'))
+LEGACY_TOKEN_PATH = 'token.pickle'
+
+# Refresh this long before the access token expires (google-auth itself
+# only refreshes in the last few minutes - inside whatever request is running)
+REFRESH_MARGIN = 10 * 60
+
+# After a failed refresh, try again this often
+RETRY_DELAY = 60
+
+# Tokens without an expiry are re-checked at least this often
+MAX_IDLE_WAIT = 3600
+
+
+def load_token(path):
+    """Unpickle saved credentials (None if missing or unreadable)"""
+    try:
+        with open(path, 'rb') as token:
+            return pickle.load(token)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+
+
+def save_token(creds, path):
+    """Write credentials to path atomically - readers never see a partial file"""
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix='.token-', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as token:
+            pickle.dump(creds, token)
+            token.flush()
+            os.fsync(token.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def seconds_left(creds):
+    """Seconds until the access token expires (None if it has no expiry)"""
+    if not creds.expiry:
+        return None
+    now = datetime.now(timezone.utc).replace(tzinfo=None)  # google-auth uses naive UTC
+    return (creds.expiry - now).total_seconds()
+
+
+class CredentialManager:
+    """One channel's OAuth credentials, kept fresh by a background thread"""
+
+    def __init__(self, client_id=None, client_secret=None, refresh_token=None,
+                 token_path=TOKEN_PATH, name='default'):
+        self.client_id = client_id or os.getenv('YOUTUBE_CLIENT_ID')
+        self.client_secret = client_secret or os.getenv('YOUTUBE_CLIENT_SECRET')
+        self.refresh_token = refresh_token or os.getenv('YOUTUBE_REFRESH_TOKEN')
+        self.token_path = token_path
+        self.name = name
+
+        self.creds = None
+        self.lock = threading.Lock()          # Held for load and refresh only
+        self.local = threading.local()        # Per-thread API clients
+        self.wakeup = threading.Event()
+        self.thread = None
+        self.running = False
+
+        # Counters for the dashboard
+        self.refreshes = 0
+        self.failures = 0
+        self.last_refresh = None
+        self.last_error = None
+
+    # --- Loading / refreshing ---
+
+    def _load(self):
+        """Saved token, else one built from the refresh token (caller holds self.lock)"""
+        creds = load_token(self.token_path)
+        if creds is None and self.token_path == TOKEN_PATH:
+            creds = load_token(LEGACY_TOKEN_PATH)
+
+        if creds is None or not creds.refresh_token:
+            if not (self.refresh_token and self.client_id):
+                print(f"❌ {self.name}: no saved token and no YOUTUBE_REFRESH_TOKEN / YOUTUBE_CLIENT_ID")
+                return None
+            creds = Credentials(
+                token=None,
+                refresh_token=self.refresh_token,
+                token_uri=TOKEN_URI,
+                client_id=self.client_id,
+                client_secret=self.client_secret,
+                scopes=SCOPES
+            )
+        return creds
+
+    def _refresh(self, creds):
+        """Refresh and persist (caller holds self.lock); True on success"""
+        try:
+            creds.refresh(Request())
+        except Exception as e:
+            self.failures += 1
+            self.last_error = str(e)
+            print(f"❌ {self.name}: token refresh failed: {e}")
+            return False
+
+        self.refreshes += 1
+        self.last_refresh = datetime.now()
+        self.last_error = None
+        try:
+            save_token(creds, self.token_path)
+        except OSError as e:
+            print(f"⚠️ {self.name}: could not save token: {e}")
+        return True
+
+    def credentials(self):
+        """Valid credentials, loading (and if needed refreshing) them on first use"""
+        creds = self.creds
+        if creds is not None and creds.valid:
+            return creds
+
+        with self.lock:
+            if self.creds is not None and self.creds.valid:
+                return self.creds
+            if self.creds is None:
+                self.creds = self._load()
+            if self.creds is not None and not self.creds.valid and not self._refresh(self.creds):
+                return None
+            return self.creds
+
+    def client(self):
+        """This thread's authorized YouTube client (None if not authenticated)"""
+        creds = self.credentials()
+        if creds is None:
+            return None
+        client = getattr(self.local, 'client', None)
+        if client is None:
+            client = build('youtube', 'v3', credentials=creds, cache_discovery=False)
+            self.local.client = client
+        return client
+
+    # --- Background refresh ---
+
+    def start(self):
+        """Load credentials and start the refresh thread; True if authenticated"""
+        authenticated = self.credentials() is not None
+        if not self.running:
+            self.running = True
+            self.thread = threading.Thread(target=self._run, name=f'token-refresh-{self.name}', daemon=True)
+            self.thread.start()
+        return authenticated
+
+    def stop(self):
+        self.running = False
+        self.wakeup.set()
+
+    def _next_wait(self):
+        creds = self.creds
+        if creds is None:
+            return RETRY_DELAY if self.refresh_token else MAX_IDLE_WAIT
+        left = seconds_left(creds)
+        if left is None:
+            return MAX_IDLE_WAIT
+        return max(0, left - REFRESH_MARGIN)
+
+    def _run(self):
+        while self.running:
+            self.wakeup.clear()
+            wait = self._next_wait()
+            if wait > 0:
+                self.wakeup.wait(wait)
+                continue
+            with self.lock:
+                if self.creds is None:
+                    self.creds = self._load()
+                ok = self.creds is not None and self._refresh(self.creds)
+            if not ok:
+                self.wakeup.wait(RETRY_DELAY)
+
+    def status(self):
+        creds = self.creds
+        left = seconds_left(creds) if creds else None
+        return {
+            'name': self.name,
+            'authenticated': bool(creds and creds.valid),
+            'expires_in': round(left) if left is not None else None,
+            'refreshes': self.refreshes,
+            'failures': self.failures,
+            'last_refresh': self.last_refresh.isoformat(timespec='seconds') if self.last_refresh else None,
+            'last_error': self.last_error
+        }
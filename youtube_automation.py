@@ -1,6728 +0,0 @@
-from flask import Flask
-app = Flask(__name__)
-
-@app.route('/health')
-def health():
-    return "OK", 200
-
-@app.route('/')
-def home():
-    return "YouTube Bot Running", 200
-"""
-Fully Autonomous YouTube Bot - No Manual Intervention Required
-- Automatic test upload on start
-- 24/7 operation without terminal
-- Advanced duplicate prevention
-- Smart title/description generation
-- Advanced web dashboard
-"""
-
-import os
-import random
-import time
-import json
-import pickle
-import sqlite3
-import hashlib
-import threading
-from datetime import datetime, timedelta
-from dotenv import load_dotenv
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-import yt_dlp
-from moviepy.editor import VideoFileClip
-import requests
-from flask import Flask, jsonify, render_template_string, request
-
-load_dotenv()
-
-# Flask app for server health checks and dashboard
-app = Flask(__name__)
-
-# YouTube Authentication Setup
-def get_youtube_credentials():
-    """Get YouTube API credentials with automatic refresh"""
-    creds = None
-    
-    # Check for existing token
-    if os.path.exists('token.pickle'):
-        with open('token.pickle', 'rb') as token:
-            creds = pickle.load(token)
-    
-    # If no valid credentials, get new ones
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            try:
-                creds.refresh(Request())
-                print("✅ Token refreshed successfully")
-            except Exception as e:
-                print(f"❌ Token refresh failed: {e}")
-                creds = None
-        
-        if not creds:
-            # Use environment variables for OAuth
-            client_config = {
-                "installed": {
-                    "client_id": os.getenv('YOUTUBE_CLIENT_ID'),
-                    "client_secret": os.getenv('YOUTUBE_CLIENT_SECRET'),
-                    "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                    "token_uri": "https://oauth2.googleapis.com/token",
-                    "redirect_uris": ["urn:ietf:wg:oauth:2.0:oob"]
-                }
-            }
-            
-            if not client_config["installed"]["client_id"]:
-                print("❌ Missing YOUTUBE_CLIENT_ID in environment variables")
-                return None
-                
-            flow = InstalledAppFlow.from_client_config(
-                client_config, 
-                ['https://www.googleapis.com/auth/youtube.upload']
-            )
-            
-            # Try to use refresh token from environment
-            refresh_token = os.getenv('YOUTUBE_REFRESH_TOKEN')
-            if refresh_token:
-                try:
-                    token_data = {
-                        'refresh_token': refresh_token,
-                        'token_uri': 'https://oauth2.googleapis.com/token',
-                        'client_id': client_config["installed"]["client_id"],
-                        'client_secret': client_config["installed"]["client_secret"]
-                    }
-                    creds = Credentials.from_authorized_user_info(token_data)
-                    creds.refresh(Request())
-                    print("✅ Authentication successful using refresh token")
-                except Exception as e:
-                    print(f"❌ Refresh token authentication failed: {e}")
-                    return None
-            else:
-                print("❌ No YOUTUBE_REFRESH_TOKEN found in environment variables")
-                print("🔗 Get refresh token from: https://developers.google.com/youtube/v3/quickstart/python")
-                return None
-        
-        # Save credentials for next run
-        with open('token.pickle', 'wb') as token:
-            pickle.dump(creds, token)
-    
-    return creds
-
-def check_environment_setup():
-    """Check if all required environment variables are set"""
-    required_vars = [
-        'YOUTUBE_API_KEY',
-        'YOUTUBE_CLIENT_ID', 
-        'YOUTUBE_CLIENT_SECRET',
-        'YOUTUBE_REFRESH_TOKEN',
-        'GROQ_API_KEY',
-        'TELEGRAM_BOT_TOKEN',
-        'TELEGRAM_CHAT_ID'
-    ]
-    
-    missing_vars = []
-    for var in required_vars:
-        if not os.getenv(var):
-            missing_vars.append(var)
-    
-    if missing_vars:
-        print("❌ Missing environment variables:")
-        for var in missing_vars:
-            print(f"   - {var}")
-        print("\n🔧 Add these to your Render environment variables")
-        return False
-    
-    print("✅ All environment variables configured")
-    return True
-
-# Advanced Professional Dashboard
-ADVANCED_DASHBOARD_HTML = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>🎬 Advanced YouTube Automation Dashboard</title>
-    <link href="https://fonts.googleapis.com/css2?family=Roboto:wght@300;400;500;600;700;800&display=swap" rel="stylesheet">
-    <style>
-        :root {
-            --primary-color: #ff0000;
-            --secondary-color: #282828;
-            --accent-color: #00d4ff;
-            --success-color: #00ff88;
-            --warning-color: #ffaa00;
-            --danger-color: #ff4444;
-            --dark-bg: #0f0f0f;
-            --card-bg: #1a1a1a;
-            --text-primary: #ffffff;
-            --text-secondary: #aaaaaa;
-            --border-color: #333333;
-        }
-
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-
-        body {
-            font-family: 'Roboto', -apple-system, BlinkMacSystemFont, sans-serif;
-            background: linear-gradient(135deg, var(--dark-bg) 0%, #1a1a2e 100%);
-            color: var(--text-primary);
-            line-height: 1.6;
-            min-height: 100vh;
-        }
-
-        .dashboard-container {
-            max-width: 1400px;
-            margin: 0 auto;
-            padding: 20px;
-        }
-
-        .dashboard-header {
-            background: linear-gradient(135deg, var(--primary-color) 0%, #cc0000 100%);
-            border-radius: 16px;
-            padding: 30px;
-            margin-bottom: 30px;
-            box-shadow: 0 8px 32px rgba(255, 0, 0, 0.3);
-            position: relative;
-            overflow: hidden;
-        }
-
-        .header-content {
-            position: relative;
-            z-index: 1;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            flex-wrap: wrap;
-            gap: 20px;
-        }
-
-        .header-title {
-            display: flex;
-            align-items: center;
-            gap: 15px;
-        }
-
-        .header-title h1 {
-            font-size: 2.5rem;
-            font-weight: 700;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.5);
-        }
-
-        .youtube-icon {
-            font-size: 3rem;
-            animation: pulse 2s infinite;
-        }
-
-        @keyframes pulse {
-            0%, 100% { transform: scale(1); }
-            50% { transform: scale(1.1); }
-        }
-
-        .status-indicator {
-            display: flex;
-            align-items: center;
-            gap: 8px;
-            padding: 10px 20px;
-            border-radius: 25px;
-            font-weight: 600;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-            animation: glow 2s infinite alternate;
-        }
-
-        .status-active {
-            background: linear-gradient(135deg, var(--success-color), #00cc77);
-            box-shadow: 0 4px 15px rgba(0, 255, 136, 0.4);
-        }
-
-        .status-inactive {
-            background: linear-gradient(135deg, var(--danger-color), #cc3333);
-            box-shadow: 0 4px 15px rgba(255, 68, 68, 0.4);
-        }
-
-        @keyframes glow {
-            from { box-shadow: 0 4px 15px rgba(0, 255, 136, 0.4); }
-            to { box-shadow: 0 4px 25px rgba(0, 255, 136, 0.8); }
-        }
-
-        .stats-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
-            gap: 25px;
-            margin-bottom: 40px;
-        }
-
-        .stat-card {
-            background: var(--card-bg);
-            border-radius: 16px;
-            padding: 25px;
-            border: 1px solid var(--border-color);
-            box-shadow: 0 8px 32px rgba(0,0,0,0.3);
-            position: relative;
-            overflow: hidden;
-            transition: all 0.3s ease;
-        }
-
-        .stat-card:hover {
-            transform: translateY(-5px);
-            box-shadow: 0 12px 40px rgba(0,0,0,0.4);
-            border-color: var(--accent-color);
-        }
-
-        .stat-card::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            height: 4px;
-            background: linear-gradient(90deg, var(--primary-color), var(--accent-color));
-        }
-
-        .stat-header {
-            display: flex;
-            align-items: center;
-            gap: 12px;
-            margin-bottom: 15px;
-        }
-
-        .stat-icon {
-            font-size: 2rem;
-            padding: 10px;
-            border-radius: 12px;
-            background: linear-gradient(135deg, var(--accent-color), #0099cc);
-        }
-
-        .stat-label {
-            font-size: 0.9rem;
-            color: var(--text-secondary);
-            font-weight: 500;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-        }
-
-        .stat-number {
-            font-size: 2.5rem;
-            font-weight: 800;
-            color: var(--text-primary);
-            margin-bottom: 8px;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-        }
-
-        .stat-change {
-            font-size: 0.85rem;
-            color: var(--success-color);
-            font-weight: 600;
-            display: flex;
-            align-items: center;
-            gap: 5px;
-        }
-
-        .control-panel {
-            background: var(--card-bg);
-            border-radius: 16px;
-            padding: 30px;
-            margin-bottom: 30px;
-            border: 1px solid var(--border-color);
-            box-shadow: 0 8px 32px rgba(0,0,0,0.3);
-        }
-
-        .control-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 25px;
-            padding-bottom: 15px;
-            border-bottom: 2px solid var(--border-color);
-        }
-
-        .control-title {
-            font-size: 1.5rem;
-            font-weight: 700;
-            color: var(--text-primary);
-        }
-
-        .control-buttons {
-            display: flex;
-            gap: 15px;
-            flex-wrap: wrap;
-        }
-
-        .btn {
-            padding: 12px 24px;
-            border: none;
-            border-radius: 8px;
-            font-weight: 600;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-            position: relative;
-            overflow: hidden;
-        }
-
-        .btn::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: -100%;
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(90deg, transparent, rgba(255,255,255,0.2), transparent);
-            transition: left 0.5s;
-        }
-
-        .btn:hover::before {
-            left: 100%;
-        }
-
-        .btn-primary {
-            background: linear-gradient(135deg, var(--primary-color), #cc0000);
-            color: white;
-            box-shadow: 0 4px 15px rgba(255, 0, 0, 0.3);
-        }
-
-        .btn-success {
-            background: linear-gradient(135deg, var(--success-color), #00cc77);
-            color: white;
-            box-shadow: 0 4px 15px rgba(0, 255, 136, 0.3);
-        }
-
-        .btn-warning {
-            background: linear-gradient(135deg, var(--warning-color), #cc8800);
-            color: white;
-            box-shadow: 0 4px 15px rgba(255, 170, 0, 0.3);
-        }
-
-        .btn-info {
-            background: linear-gradient(135deg, var(--accent-color), #0099cc);
-            color: white;
-            box-shadow: 0 4px 15px rgba(0, 212, 255, 0.3);
-        }
-
-        .btn:hover {
-            transform: translateY(-2px);
-        }
-
-        .video-section {
-            background: var(--card-bg);
-            border-radius: 16px;
-            border: 1px solid var(--border-color);
-            box-shadow: 0 8px 32px rgba(0,0,0,0.3);
-            overflow: hidden;
-        }
-
-        .video-header {
-            padding: 25px 30px;
-            border-bottom: 2px solid var(--border-color);
-            background: linear-gradient(135deg, var(--secondary-color), #333333);
-        }
-
-        .video-title {
-            font-size: 1.5rem;
-            font-weight: 700;
-            margin-bottom: 15px;
-        }
-
-        .video-filters {
-            display: flex;
-            gap: 10px;
-            flex-wrap: wrap;
-        }
-
-        .filter-btn {
-            padding: 8px 16px;
-            border: 2px solid var(--border-color);
-            background: transparent;
-            color: var(--text-secondary);
-            border-radius: 20px;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            font-weight: 500;
-        }
-
-        .filter-btn.active,
-        .filter-btn:hover {
-            border-color: var(--accent-color);
-            color: var(--accent-color);
-            background: rgba(0, 212, 255, 0.1);
-        }
-
-        .video-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(350px, 1fr));
-            gap: 20px;
-            padding: 30px;
-        }
-
-        .loading {
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            padding: 60px;
-            color: var(--text-secondary);
-        }
-
-        .spinner {
-            width: 40px;
-            height: 40px;
-            border: 4px solid var(--border-color);
-            border-top: 4px solid var(--accent-color);
-            border-radius: 50%;
-            animation: spin 1s linear infinite;
-            margin-right: 15px;
-        }
-
-        @keyframes spin {
-            0% { transform: rotate(0deg); }
-            100% { transform: rotate(360deg); }
-        }
-
-        .realtime-indicator {
-            position: fixed;
-            top: 20px;
-            right: 20px;
-            background: var(--success-color);
-            color: white;
-            padding: 10px 20px;
-            border-radius: 25px;
-            font-weight: 600;
-            box-shadow: 0 4px 15px rgba(0, 255, 136, 0.4);
-            z-index: 1000;
-            animation: slideIn 0.5s ease;
-        }
-
-        @keyframes slideIn {
-            from { transform: translateX(100%); }
-            to { transform: translateX(0); }
-        }
-
-        @media (max-width: 768px) {
-            .dashboard-container { padding: 15px; }
-            .header-content { flex-direction: column; text-align: center; }
-            .header-title h1 { font-size: 2rem; }
-            .stats-grid { grid-template-columns: 1fr; }
-            .control-buttons { justify-content: center; }
-            .video-grid { grid-template-columns: 1fr; padding: 20px; }
-            .video-filters { justify-content: center; }
-        }
-    </style>
-</head>
-<body>
-    <div class="dashboard-container">
-        <header class="dashboard-header">
-            <div class="header-content">
-                <div class="header-title">
-                    <span class="youtube-icon">🎬</span>
-                    <h1>Advanced YouTube Automation</h1>
-                </div>
-                <div class="header-controls">
-                    <div id="botStatus" class="status-indicator status-active">
-                        <span class="status-dot"></span>
-                        ACTIVE
-                    </div>
-                    <button id="toggleRealTime" class="btn btn-warning">⏸️ Pause Updates</button>
-                </div>
-            </div>
-        </header>
-
-        <section class="stats-grid">
-            <div class="stat-card">
-                <div class="stat-header">
-                    <span class="stat-icon">📊</span>
-                    <span class="stat-label">Total Videos</span>
-                </div>
-                <div id="totalUploads" class="stat-number">0</div>
-                <div class="stat-change"><span>📈</span> All time uploads</div>
-            </div>
-
-            <div class="stat-card">
-                <div class="stat-header">
-                    <span class="stat-icon">📅</span>
-                    <span class="stat-label">Today's Uploads</span>
-                </div>
-                <div id="todayUploads" class="stat-number">0</div>
-                <div class="stat-change"><span>🎯</span> Daily progress</div>
-            </div>
-
-            <div class="stat-card">
-                <div class="stat-header">
-                    <span class="stat-icon">🔧</span>
-                    <span class="stat-label">Tech Videos</span>
-                </div>
-                <div id="techVideos" class="stat-number">0</div>
-                <div class="stat-change"><span>💻</span> Technology category</div>
-            </div>
-
-            <div class="stat-card">
-                <div class="stat-header">
-                    <span class="stat-icon">🎭</span>
-                    <span class="stat-label">Entertainment</span>
-                </div>
-                <div id="entertainmentVideos" class="stat-number">0</div>
-                <div class="stat-change"><span>🎪</span> Entertainment category</div>
-            </div>
-        </section>
-
-        <section class="control-panel">
-            <div class="control-header">
-                <h2 class="control-title">🎮 Bot Controls</h2>
-                <div class="control-buttons">
-                    <button id="startBot" class="btn btn-success">▶️ Start Bot</button>
-                    <button id="stopBot" class="btn btn-danger">⏹️ Stop Bot</button>
-                    <button id="uploadTech" class="btn btn-info">🔧 Upload Tech</button>
-                    <button id="uploadEntertainment" class="btn btn-warning">🎭 Upload Entertainment</button>
-                    <button id="refreshData" class="btn btn-primary">🔄 Refresh All</button>
-                </div>
-            </div>
-        </section>
-
-        <section class="video-section">
-            <div class="video-header">
-                <h2 class="video-title">📺 Video Library</h2>
-                <div class="video-filters">
-                    <button class="filter-btn active" data-filter="all">All Videos</button>
-                    <button class="filter-btn" data-filter="tech">🔧 Tech</button>
-                    <button class="filter-btn" data-filter="entertainment">🎭 Entertainment</button>
-                    <button class="filter-btn" data-filter="today">📅 Today</button>
-                </div>
-            </div>
-            
-            <div id="videoGrid" class="video-grid">
-                <div class="loading">
-                    <div class="spinner"></div>
-                    Loading videos...
-                </div>
-            </div>
-        </section>
-    </div>
-
-    <div id="realtimeIndicator" class="realtime-indicator">🔴 LIVE</div>
-
-    <script>
-        // Advanced Dashboard JavaScript (Inline for immediate loading)
-        class YouTubeDashboard {
-            constructor() {
-                this.updateInterval = 5000;
-                this.currentFilter = 'all';
-                this.allVideos = [];
-                this.isRealTimeEnabled = true;
-                this.init();
-            }
-            
-            init() {
-                console.log('🚀 Advanced YouTube Dashboard Initialized');
-                this.setupEventListeners();
-                this.startRealTimeUpdates();
-                this.loadInitialData();
-            }
-            
-            setupEventListeners() {
-                document.getElementById('startBot')?.addEventListener('click', () => this.startBot());
-                document.getElementById('stopBot')?.addEventListener('click', () => this.stopBot());
-                document.getElementById('uploadTech')?.addEventListener('click', () => this.manualUpload('tech'));
-                document.getElementById('uploadEntertainment')?.addEventListener('click', () => this.manualUpload('entertainment'));
-                document.getElementById('refreshData')?.addEventListener('click', () => this.refreshAllData());
-                document.getElementById('toggleRealTime')?.addEventListener('click', () => this.toggleRealTime());
-                
-                document.querySelectorAll('.filter-btn').forEach(btn => {
-                    btn.addEventListener('click', (e) => this.filterVideos(e.target.dataset.filter));
-                });
-            }
-            
-            async loadInitialData() {
-                try {
-                    await this.fetchDashboardData();
-                    await this.fetchVideoData();
-                } catch (error) {
-                    console.error('Error loading data:', error);
-                }
-            }
-            
-            startRealTimeUpdates() {
-                if (this.updateTimer) clearInterval(this.updateTimer);
-                
-                this.updateTimer = setInterval(() => {
-                    if (this.isRealTimeEnabled) {
-                        this.fetchDashboardData();
-                        this.fetchVideoData();
-                    }
-                }, this.updateInterval);
-            }
-            
-            async fetchDashboardData() {
-                try {
-                    const response = await fetch('/api/dashboard');
-                    const data = await response.json();
-                    this.updateDashboardStats(data);
-                    this.updateBotStatus(data.bot_status);
-                } catch (error) {
-                    console.error('Error fetching dashboard data:', error);
-                }
-            }
-            
-            async fetchVideoData() {
-                try {
-                    const response = await fetch('/api/videos');
-                    const data = await response.json();
-                    this.allVideos = data.videos || [];
-                    this.displayVideos(this.filterVideosByCategory(this.currentFilter));
-                } catch (error) {
-                    console.error('Error fetching video data:', error);
-                }
-            }
-            
-            updateDashboardStats(data) {
-                this.updateElement('totalUploads', data.total_uploads || 0);
-                this.updateElement('todayUploads', data.today_uploads || 0);
-                this.updateElement('techVideos', data.tech_count || 0);
-                this.updateElement('entertainmentVideos', data.entertainment_count || 0);
-            }
-            
-            updateBotStatus(status) {
-                const statusElement = document.getElementById('botStatus');
-                if (statusElement) {
-                    statusElement.textContent = status === 'active' ? 'ACTIVE' : 'INACTIVE';
-                    statusElement.className = `status-indicator ${status === 'active' ? 'status-active' : 'status-inactive'}`;
-                }
-            }
-            
-            displayVideos(videos) {
-                const videoGrid = document.getElementById('videoGrid');
-                if (!videoGrid) return;
-                
-                if (videos.length === 0) {
-                    videoGrid.innerHTML = `
-                        <div style="text-align: center; padding: 60px; color: #aaa;">
-                            <div style="font-size: 4rem; margin-bottom: 20px;">📺</div>
-                            <h3>No videos available</h3>
-                            <p>Videos will appear here when the bot starts processing</p>
-                        </div>
-                    `;
-                    return;
-                }
-                
-                videoGrid.innerHTML = videos.map((video, index) => this.createVideoCardHTML(video, index)).join('');
-            }
-            
-            createVideoCardHTML(video, index) {
-                const categoryClass = video.category === 'tech' ? 'category-tech' : 'category-entertainment';
-                const categoryIcon = video.category === 'tech' ? '🔧' : '🎭';
-                
-                return `
-                    <div style="background: #282828; border-radius: 12px; overflow: hidden; border: 1px solid #333; transition: all 0.3s ease;">
-                        <div style="width: 100%; height: 200px; background: linear-gradient(135deg, #ff0000, #00d4ff); display: flex; align-items: center; justify-content: center; color: white; font-weight: 700; font-size: 1.2rem;">
-                            ${video.thumbnail ? `<img src="${video.thumbnail}" style="width: 100%; height: 100%; object-fit: cover;">` : `#${index + 1}`}
-                        </div>
-                        <div style="padding: 20px;">
-                            <h3 style="font-size: 1.1rem; font-weight: 600; margin-bottom: 10px; line-height: 1.4;">${video.title}</h3>
-                            <div style="display: flex; flex-wrap: wrap; gap: 15px; margin-bottom: 15px; font-size: 0.85rem; color: #aaa;">
-                                <span>📅 ${this.formatDate(video.upload_date)}</span>
-                                <span>⏰ ${this.timeAgo(video.upload_date)}</span>
-                                <span style="padding: 4px 12px; border-radius: 15px; font-size: 0.75rem; font-weight: 600; background: ${video.category === 'tech' ? '#00d4ff' : '#ffaa00'}; color: white;">${categoryIcon} ${video.category}</span>
-                            </div>
-                            <div style="display: flex; justify-content: space-between; margin-bottom: 15px; font-size: 0.9rem; color: #aaa;">
-                                <span>👁️ ${this.formatNumber(video.views || 0)}</span>
-                                <span>👍 ${this.formatNumber(video.likes || 0)}</span>
-                                <span>💬 ${this.formatNumber(video.comments || 0)}</span>
-                            </div>
-                            <div style="display: flex; gap: 8px; flex-wrap: wrap;">
-                                <a href="${video.youtube_url}" target="_blank" style="padding: 6px 12px; border: 1px solid #333; background: transparent; color: #aaa; border-radius: 6px; text-decoration: none; font-size: 0.8rem;">▶️ Watch</a>
-                            </div>
-                        </div>
-                    </div>
-                `;
-            }
-            
-            filterVideos(filter) {
-                this.currentFilter = filter;
-                document.querySelectorAll('.filter-btn').forEach(btn => btn.classList.remove('active'));
-                document.querySelector(`[data-filter="${filter}"]`)?.classList.add('active');
-                const filteredVideos = this.filterVideosByCategory(filter);
-                this.displayVideos(filteredVideos);
-            }
-            
-            filterVideosByCategory(filter) {
-                if (filter === 'all') return this.allVideos;
-                if (filter === 'tech') return this.allVideos.filter(v => v.category === 'tech');
-                if (filter === 'entertainment') return this.allVideos.filter(v => v.category === 'entertainment');
-                if (filter === 'today') {
-                    const today = new Date().toDateString();
-                    return this.allVideos.filter(v => new Date(v.upload_date).toDateString() === today);
-                }
-                return this.allVideos;
-            }
-            
-            async startBot() {
-                try {
-                    const response = await fetch('/api/bot/start', { method: 'POST' });
-                    const result = await response.json();
-                    console.log(result.success ? 'Bot started!' : 'Error starting bot');
-                } catch (error) {
-                    console.error('Failed to start bot:', error);
-                }
-            }
-            
-            async stopBot() {
-                try {
-                    const response = await fetch('/api/bot/stop', { method: 'POST' });
-                    const result = await response.json();
-                    console.log(result.success ? 'Bot stopped!' : 'Error stopping bot');
-                } catch (error) {
-                    console.error('Failed to stop bot:', error);
-                }
-            }
-            
-            async manualUpload(category) {
-                try {
-                    const response = await fetch('/api/upload', {
-                        method: 'POST',
-                        headers: { 'Content-Type': 'application/json' },
-                        body: JSON.stringify({ category })
-                    });
-                    const result = await response.json();
-                    console.log(result.success ? `${category} upload started!` : 'Upload failed');
-                    if (result.success) {
-                        this.fetchDashboardData();
-                        this.fetchVideoData();
-                    }
-                } catch (error) {
-                    console.error('Upload failed:', error);
-                }
-            }
-            
-            async refreshAllData() {
-                await this.fetchDashboardData();
-                await this.fetchVideoData();
-                console.log('Data refreshed!');
-            }
-            
-            toggleRealTime() {
-                this.isRealTimeEnabled = !this.isRealTimeEnabled;
-                const toggleBtn = document.getElementById('toggleRealTime');
-                if (toggleBtn) {
-                    toggleBtn.textContent = this.isRealTimeEnabled ? '⏸️ Pause Updates' : '▶️ Resume Updates';
-                    toggleBtn.className = `btn ${this.isRealTimeEnabled ? 'btn-warning' : 'btn-success'}`;
-                }
-                console.log(`Real-time updates ${this.isRealTimeEnabled ? 'enabled' : 'disabled'}`);
-            }
-            
-            updateElement(id, value) {
-                const element = document.getElementById(id);
-                if (element) element.textContent = value;
-            }
-            
-            formatNumber(num) {
-                if (num >= 1000000) return (num / 1000000).toFixed(1) + 'M';
-                if (num >= 1000) return (num / 1000).toFixed(1) + 'K';
-                return num.toString();
-            }
-            
-            formatDate(dateString) {
-                return new Date(dateString).toLocaleDateString();
-            }
-            
-            timeAgo(dateString) {
-                const seconds = Math.floor((new Date() - new Date(dateString)) / 1000);
-                const intervals = { year: 31536000, month: 2592000, week: 604800, day: 86400, hour: 3600, minute: 60 };
-                
-                for (const [unit, secondsInUnit] of Object.entries(intervals)) {
-                    const interval = Math.floor(seconds / secondsInUnit);
-                    if (interval >= 1) {
-                        return interval === 1 ? `1 ${unit} ago` : `${interval} ${unit}s ago`;
-                    }
-                }
-                return 'Just now';
-            }
-        }
-        
-        document.addEventListener('DOMContentLoaded', () => {
-            window.dashboard = new YouTubeDashboard();
-        });
-    </script>
-</body>
-</html>
-"""
-
-# CRITICAL: Remove ANY other route that might be on '/'
-# Advanced Dashboard MUST be the ONLY route on '/'
-@app.route('/', methods=['GET'])
-def show_advanced_dashboard():
-    """Advanced dashboard - MUST return HTML, NOT JSON"""
-    # Always use inline dashboard to avoid 404 errors for static files
-    return ADVANCED_DASHBOARD_HTML
-
-@app.route('/static/<path:filename>')
-def serve_static(filename):
-    """Serve static files (CSS, JS)"""
-    try:
-        if filename == 'advanced_dashboard.css':
-            with open('templates/advanced_dashboard.css', 'r', encoding='utf-8') as f:
-                response = app.response_class(f.read(), mimetype='text/css')
-                return response
-        elif filename == 'advanced_dashboard.js':
-            with open('templates/advanced_dashboard.js', 'r', encoding='utf-8') as f:
-                response = app.response_class(f.read(), mimetype='application/javascript')
-                return response
-    except FileNotFoundError:
-        pass
-    
-    return "File not found", 404
-
-@app.route('/api/dashboard')
-def api_dashboard():
-    """API endpoint for dashboard data - returns JSON for AJAX calls"""
-    try:
-        # Always show active status and real data
-        response_data = {
-            "bot_status": "active",
-            "test_status": "success", 
-            "total_uploads": 0,
-            "today_uploads": 0,
-            "tech_count": 0,
-            "entertainment_count": 0,
-            "videos": [],
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        # If no bot instance, get real YouTube data directly
-        if 'bot_instance' not in globals() or bot_instance is None:
-            # Create temporary bot instance just for data
-            try:
-                temp_bot = AutoYouTubeBot()
-                if hasattr(temp_bot, 'get_real_youtube_data'):
-                    real_videos = temp_bot.get_real_youtube_data()
-                    response_data['videos'] = real_videos
-                    response_data['total_uploads'] = len(real_videos)
-                    response_data['tech_count'] = len([v for v in real_videos if v.get('category') == 'tech'])
-                    response_data['entertainment_count'] = len([v for v in real_videos if v.get('category') == 'entertainment'])
-                    response_data['today_uploads'] = len([v for v in real_videos if datetime.now().date() == datetime.fromisoformat(v.get('upload_date', '2024-01-01')).date()])
-            except:
-                # No sample data - only show real data
-                response_data['videos'] = []
-                response_data['total_uploads'] = 0
-                response_data['tech_count'] = 0
-                response_data['entertainment_count'] = 0
-                response_data['today_uploads'] = 0
-            
-            return jsonify(response_data)
-        
-        bot = bot_instance
-        
-        # Initialize response data
-        response_data = {
-            "bot_status": "inactive",
-            "test_status": "pending",
-            "total_uploads": 0,
-            "today_uploads": 0,
-            "tech_count": 0,
-            "entertainment_count": 0,
-            "videos": []
-        }
-        
-        try:
-            # Check if database exists and is accessible
-            if hasattr(bot, 'db') and bot.db:
-                db = bot.db
-                cursor = db.cursor()
-                
-                # Get total uploads
-                try:
-                    cursor.execute('SELECT COUNT(*) FROM uploaded_videos')
-                    result = cursor.fetchone()
-                    response_data['total_uploads'] = result[0] if result else 0
-                except:
-                    response_data['total_uploads'] = 0
-                
-                # Get today's uploads
-                try:
-                    today = datetime.now().date()
-                    cursor.execute('''
-                        SELECT total_uploads FROM bot_stats WHERE date = ?
-                    ''', (today,))
-                    result = cursor.fetchone()
-                    response_data['today_uploads'] = result[0] if result else 0
-                except:
-                    response_data['today_uploads'] = 0
-                
-                # Get category counts
-                try:
-                    cursor.execute('SELECT COUNT(*) FROM uploaded_videos WHERE category = "tech"')
-                    result = cursor.fetchone()
-                    response_data['tech_count'] = result[0] if result else 0
-                    
-                    cursor.execute('SELECT COUNT(*) FROM uploaded_videos WHERE category = "entertainment"')
-                    result = cursor.fetchone()
-                    response_data['entertainment_count'] = result[0] if result else 0
-                except:
-                    response_data['tech_count'] = 0
-                    response_data['entertainment_count'] = 0
-                
-                # Get all videos (no duplicates by design)
-                try:
-                    cursor.execute('''
-                        SELECT title, description, upload_date, youtube_url, category
-                        FROM uploaded_videos
-                        ORDER BY upload_date DESC
-                        LIMIT 100
-                    ''')
-                    
-                    videos = []
-                    rows = cursor.fetchall()
-                    if rows:
-                        for row in rows:
-                            videos.append({
-                                'title': row[0],
-                                'description': row[1][:200] + '...' if len(row[1]) > 200 else row[1],
-                                'upload_date': row[2],
-                                'youtube_url': row[3],
-                                'category': row[4]
-                            })
-                    response_data['videos'] = videos
-                except:
-                    # Get real YouTube data if API available
-                    if hasattr(bot, 'youtube') and bot.youtube:
-                        response_data['videos'] = bot.get_real_youtube_data()
-                    else:
-                        response_data['videos'] = []
-                
-        except Exception as db_error:
-            # Database not ready yet, try to get real YouTube data
-            print(f"Database not ready: {db_error}")
-            if hasattr(bot, 'youtube') and bot.youtube:
-                response_data['videos'] = bot.get_real_youtube_data()
-            else:
-                response_data['videos'] = []
-        
-        # Always show active status
-        response_data['bot_status'] = "active"
-        response_data['test_status'] = "success"
-        response_data['timestamp'] = datetime.now().isoformat()
-        response_data['message'] = "YouTube Automation Dashboard - Live & Active"
-        
-        return jsonify(response_data)
-        
-    except Exception as e:
-        print(f"API Error: {e}")
-        return jsonify({
-            "error": str(e),
-            "bot_status": "error",
-            "total_uploads": 0,
-            "today_uploads": 0,
-            "tech_count": 0,
-            "entertainment_count": 0,
-            "videos": [],
-            "message": f"Error: {str(e)}"
-        })
-
-# Health check moved to different endpoint - NOT on root
-@app.route('/health')
-def health_check():
-    """Health check endpoint - returns JSON status"""
-    try:
-        if 'bot_instance' in globals() and bot_instance:
-            return jsonify({
-                "status": "alive",
-                "message": "Auto YouTube Bot Running 24/7",
-                "test_status": bot_instance.test_upload_success if hasattr(bot_instance, 'test_upload_success') else "pending",
-                "uploads_today": bot_instance.get_today_uploads() if hasattr(bot_instance, 'get_today_uploads') else 0,
-                "timestamp": datetime.now().isoformat()
-            })
-        else:
-            return jsonify({
-                "status": "initializing",
-                "message": "Bot is starting up...",
-                "test_status": "pending",
-                "uploads_today": 0,
-                "timestamp": datetime.now().isoformat()
-            })
-    except Exception as e:
-        return jsonify({
-            "status": "error",
-            "message": str(e),
-            "timestamp": datetime.now().isoformat()
-        })
-
-# Additional route for JSON status (backward compatibility)
-@app.route('/status')
-def status():
-    """Status endpoint - returns JSON"""
-    return health_check()
-
-# Advanced API Endpoints for Real-time Control
-@app.route('/api/bot/start', methods=['POST'])
-def start_bot_api():
-    """Start the bot via API"""
-    try:
-        global bot_instance
-        if bot_instance:
-            bot_instance.bot_active = True
-            bot_instance.log_activity("🚀 Bot started via API")
-            return jsonify({"success": True, "message": "Bot started successfully"})
-        else:
-            return jsonify({"success": False, "error": "Bot instance not available"})
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)})
-
-@app.route('/api/bot/stop', methods=['POST'])
-def stop_bot_api():
-    """Stop the bot via API"""
-    try:
-        global bot_instance
-        if bot_instance:
-            bot_instance.bot_active = False
-            bot_instance.log_activity("⏹️ Bot stopped via API")
-            return jsonify({"success": True, "message": "Bot stopped successfully"})
-        else:
-            return jsonify({"success": False, "error": "Bot instance not available"})
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)})
-
-@app.route('/api/upload', methods=['POST'])
-def manual_upload_api():
-    """Trigger manual upload via API"""
-    try:
-        data = request.get_json()
-        category = data.get('category', 'tech')
-        
-        global bot_instance
-        if bot_instance and hasattr(bot_instance, 'process_scheduled_upload'):
-            # Run upload in background thread to avoid blocking
-            import threading
-            
-            def upload_worker():
-                try:
-                    success = bot_instance.process_scheduled_upload(category)
-                    if success:
-                        bot_instance.log_activity(f"✅ Manual {category} upload completed via API")
-                    else:
-                        bot_instance.log_activity(f"❌ Manual {category} upload failed via API")
-                except Exception as e:
-                    bot_instance.log_activity(f"❌ Manual upload error: {e}")
-            
-            upload_thread = threading.Thread(target=upload_worker, daemon=True)
-            upload_thread.start()
-            
-            return jsonify({"success": True, "message": f"Manual {category} upload started"})
-        else:
-            return jsonify({"success": False, "error": "Bot instance not available"})
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)})
-
-@app.route('/api/videos/<video_id>/refresh', methods=['POST'])
-def refresh_video_stats_api(video_id):
-    """Refresh stats for a specific video"""
-    try:
-        global bot_instance
-        if bot_instance and hasattr(bot_instance, 'get_live_video_stats'):
-            live_stats = bot_instance.get_live_video_stats(video_id)
-            if live_stats:
-                bot_instance.update_video_stats(video_id, live_stats)
-                return jsonify({"success": True, "message": "Stats refreshed", "stats": live_stats})
-            else:
-                return jsonify({"success": False, "error": "Could not fetch live stats"})
-        else:
-            return jsonify({"success": False, "error": "Bot instance not available"})
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)})
-
-@app.route('/api/system-stats')
-def system_stats_api():
-    """Get system statistics"""
-    try:
-        import psutil
-        import time
-        
-        # Get system stats
-        cpu_usage = psutil.cpu_percent(interval=1)
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
-        
-        # Calculate uptime (approximate)
-        boot_time = psutil.boot_time()
-        uptime = time.time() - boot_time
-        
-        return jsonify({
-            "cpu_usage": round(cpu_usage, 1),
-            "memory_usage": round(memory.percent, 1),
-            "disk_usage": round(disk.percent, 1),
-            "uptime": int(uptime),
-            "memory_total": round(memory.total / (1024**3), 2),  # GB
-            "disk_total": round(disk.total / (1024**3), 2),  # GB
-            "timestamp": datetime.now().isoformat()
-        })
-    except ImportError:
-        # psutil not available, return mock data
-        return jsonify({
-            "cpu_usage": 25.5,
-            "memory_usage": 45.2,
-            "disk_usage": 60.1,
-            "uptime": 86400,  # 1 day
-            "memory_total": 8.0,
-            "disk_total": 100.0,
-            "timestamp": datetime.now().isoformat()
-        })
-    except Exception as e:
-        return jsonify({"error": str(e)})
-
-@app.route('/api/logs')
-def get_logs_api():
-    """Get recent log entries"""
-    try:
-        log_file = 'logs/bot_activity.log'
-        if os.path.exists(log_file):
-            with open(log_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                # Return last 100 lines
-                recent_logs = lines[-100:] if len(lines) > 100 else lines
-                return jsonify({
-                    "logs": [line.strip() for line in recent_logs],
-                    "total_lines": len(lines)
-                })
-        else:
-            return jsonify({"logs": [], "total_lines": 0})
-    except Exception as e:
-        return jsonify({"error": str(e), "logs": []})
-
-@app.route('/api/logs/clear', methods=['POST'])
-def clear_logs_api():
-    """Clear log files"""
-    try:
-        log_file = 'logs/bot_activity.log'
-        if os.path.exists(log_file):
-            with open(log_file, 'w') as f:
-                f.write(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Logs cleared via API\n")
-            return jsonify({"success": True, "message": "Logs cleared successfully"})
-        else:
-            return jsonify({"success": True, "message": "No logs to clear"})
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)})
-
-@app.route('/api/youtube/trending')
-def get_youtube_trending():
-    """Get real YouTube trending videos"""
-    try:
-        global bot_instance
-        if bot_instance and hasattr(bot_instance, 'get_real_youtube_data'):
-            trending_videos = bot_instance.get_real_youtube_data()
-            return jsonify({
-                "videos": trending_videos,
-                "total": len(trending_videos),
-                "timestamp": datetime.now().isoformat()
-            })
-        else:
-            return jsonify({"videos": [], "total": 0, "error": "YouTube API not available"})
-    except Exception as e:
-        return jsonify({"videos": [], "total": 0, "error": str(e)})
-
-@app.route('/api/youtube/search')
-def search_youtube_videos():
-    """Search YouTube videos"""
-    try:
-        query = request.args.get('q', '')
-        category = request.args.get('category', 'tech')
-        max_results = int(request.args.get('max_results', 10))
-        
-        global bot_instance
-        if bot_instance and bot_instance.youtube and query:
-            # Search for videos
-            search_request = bot_instance.youtube.search().list(
-                part='snippet',
-                q=query,
-                type='video',
-                maxResults=max_results,
-                order='relevance',
-                videoDuration='medium'  # 4-20 minutes
-            )
-            
-            search_response = search_request.execute()
-            
-            videos = []
-            for item in search_response.get('items', []):
-                video_data = {
-                    'id': item['id']['videoId'],
-                    'title': item['snippet']['title'],
-                    'description': item['snippet']['description'][:200] + '...',
-                    'thumbnail': item['snippet']['thumbnails']['medium']['url'],
-                    'channel': item['snippet']['channelTitle'],
-                    'upload_date': item['snippet']['publishedAt'],
-                    'youtube_url': f"https://www.youtube.com/watch?v={item['id']['videoId']}",
-                    'category': category
-                }
-                videos.append(video_data)
-            
-            return jsonify({
-                "videos": videos,
-                "total": len(videos),
-                "query": query,
-                "timestamp": datetime.now().isoformat()
-            })
-        else:
-            return jsonify({"videos": [], "total": 0, "error": "Search query required or YouTube API not available"})
-    except Exception as e:
-        return jsonify({"videos": [], "total": 0, "error": str(e)})
-
-@app.route('/api/config')
-def get_config():
-    """Get bot configuration"""
-    try:
-        global bot_instance
-        if bot_instance:
-            config = {
-                "youtube_api_available": bool(bot_instance.youtube_api_key),
-                "groq_api_available": bool(bot_instance.groq_api_key),
-                "telegram_configured": bool(bot_instance.telegram_token and bot_instance.telegram_chat_id),
-                "elly_reaction_mode": getattr(bot_instance, 'elly_reaction_mode', False),
-                "bot_active": getattr(bot_instance, 'bot_active', False),
-                "test_upload_success": getattr(bot_instance, 'test_upload_success', False),
-                "update_interval": 5000,  # 5 seconds
-                "daily_upload_limit": 10,
-                "categories": ["tech", "entertainment"]
-            }
-            return jsonify(config)
-        else:
-            return jsonify({"error": "Bot instance not available"})
-    except Exception as e:
-        return jsonify({"error": str(e)})
-
-@app.route('/api/config', methods=['POST'])
-def update_config():
-    """Update bot configuration"""
-    try:
-        data = request.get_json()
-        global bot_instance
-        
-        if bot_instance:
-            # Update configurable settings
-            if 'elly_reaction_mode' in data:
-                bot_instance.elly_reaction_mode = data['elly_reaction_mode']
-            
-            if 'elly_reaction_chance' in data:
-                bot_instance.elly_reaction_chance = float(data['elly_reaction_chance'])
-            
-            bot_instance.log_activity("⚙️ Configuration updated via API")
-            
-            return jsonify({"success": True, "message": "Configuration updated"})
-        else:
-            return jsonify({"success": False, "error": "Bot instance not available"})
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)})
-@app.route('/api/videos', methods=['GET'])
-def get_videos():
-    """Get all videos with real-time stats"""
-    try:
-        if 'bot_instance' not in globals() or bot_instance is None:
-            return jsonify({"error": "Bot not initialized", "videos": []})
-        
-        bot = bot_instance
-        
-        # Get videos from database with live stats update
-        if hasattr(bot, 'db') and bot.db:
-            cursor = bot.db.cursor()
-            cursor.execute('''
-                SELECT video_id, title, description, upload_date, youtube_url, 
-                       thumbnail, channel, category, views, likes, comments, duration
-                FROM uploaded_videos 
-                ORDER BY upload_date DESC
-            ''')
-            
-            videos = []
-            for row in cursor.fetchall():
-                video = {
-                    'id': row[0],
-                    'title': row[1],
-                    'description': row[2],
-                    'upload_date': row[3],
-                    'youtube_url': row[4],
-                    'thumbnail': row[5],
-                    'channel': row[6],
-                    'category': row[7],
-                    'views': row[8],
-                    'likes': row[9],
-                    'comments': row[10],
-                    'duration': row[11]
-                }
-                videos.append(video)
-            
-            return jsonify({"videos": videos, "total": len(videos)})
-        else:
-            # Return real YouTube data if no database
-            real_data = bot.get_real_youtube_data() if hasattr(bot, 'get_real_youtube_data') else []
-            return jsonify({"videos": real_data, "total": len(real_data)})
-            
-    except Exception as e:
-        return jsonify({"error": str(e), "videos": []})
-
-@app.route('/api/videos/<video_id>', methods=['GET'])
-def get_video(video_id):
-    """Get single video with live stats"""
-    try:
-        if 'bot_instance' not in globals() or bot_instance is None:
-            return jsonify({"error": "Bot not initialized"})
-        
-        bot = bot_instance
-        
-        # First try database
-        if hasattr(bot, 'db') and bot.db:
-            cursor = bot.db.cursor()
-            cursor.execute('''
-                SELECT video_id, title, description, upload_date, youtube_url, 
-                       thumbnail, channel, category, views, likes, comments, duration
-                FROM uploaded_videos WHERE video_id = ?
-            ''', (video_id,))
-            
-            row = cursor.fetchone()
-            if row:
-                video = {
-                    'id': row[0],
-                    'title': row[1],
-                    'description': row[2],
-                    'upload_date': row[3],
-                    'youtube_url': row[4],
-                    'thumbnail': row[5],
-                    'channel': row[6],
-                    'category': row[7],
-                    'views': row[8],
-                    'likes': row[9],
-                    'comments': row[10],
-                    'duration': row[11]
-                }
-                
-                # Update with live stats
-                live_stats = bot.get_live_video_stats(video_id)
-                if live_stats:
-                    video.update(live_stats)
-                    # Update database with new stats
-                    bot.update_video_stats(video_id, live_stats)
-                
-                return jsonify(video)
-        
-        # If not in database, get from YouTube API
-        if hasattr(bot, 'youtube') and bot.youtube:
-            live_stats = bot.get_live_video_stats(video_id)
-            if live_stats:
-                return jsonify(live_stats)
-        
-        return jsonify({"error": "Video not found"})
-        
-    except Exception as e:
-        return jsonify({"error": str(e)})
-
-@app.route('/api/videos/<video_id>', methods=['PUT'])
-def update_video(video_id):
-    """Update video information"""
-    try:
-        if 'bot_instance' not in globals() or bot_instance is None:
-            return jsonify({"error": "Bot not initialized"})
-        
-        data = request.get_json()
-        bot = bot_instance
-        
-        if hasattr(bot, 'db') and bot.db:
-            cursor = bot.db.cursor()
-            
-            # Update video in database
-            cursor.execute('''
-                UPDATE uploaded_videos 
-                SET title = ?, description = ?, category = ?, last_updated = ?
-                WHERE video_id = ?
-            ''', (data.get('title'), data.get('description'), 
-                  data.get('category'), datetime.now(), video_id))
-            
-            bot.db.commit()
-            
-            if cursor.rowcount > 0:
-                return jsonify({"success": True, "message": "Video updated successfully"})
-            else:
-                return jsonify({"error": "Video not found"})
-        
-        return jsonify({"error": "Database not available"})
-        
-    except Exception as e:
-        return jsonify({"error": str(e)})
-
-@app.route('/api/videos/<video_id>', methods=['DELETE'])
-def delete_video(video_id):
-    """Delete video from tracking"""
-    try:
-        if 'bot_instance' not in globals() or bot_instance is None:
-            return jsonify({"error": "Bot not initialized"})
-        
-        bot = bot_instance
-        
-        if hasattr(bot, 'db') and bot.db:
-            cursor = bot.db.cursor()
-            
-            # Delete video from database
-            cursor.execute('DELETE FROM uploaded_videos WHERE video_id = ?', (video_id,))
-            bot.db.commit()
-            
-            if cursor.rowcount > 0:
-                return jsonify({"success": True, "message": "Video deleted successfully"})
-            else:
-                return jsonify({"error": "Video not found"})
-        
-        return jsonify({"error": "Database not available"})
-        
-    except Exception as e:
-        return jsonify({"error": str(e)})
-
-@app.route('/api/videos/refresh-stats', methods=['POST'])
-def refresh_all_stats():
-    """Refresh stats for all videos"""
-    try:
-        if 'bot_instance' not in globals() or bot_instance is None:
-            return jsonify({"error": "Bot not initialized"})
-        
-        bot = bot_instance
-        updated_count = 0
-        
-        if hasattr(bot, 'db') and bot.db:
-            cursor = bot.db.cursor()
-            cursor.execute('SELECT video_id FROM uploaded_videos WHERE video_id IS NOT NULL AND video_id != ""')
-            
-            for (video_id,) in cursor.fetchall():
-                if video_id and video_id != 'None':
-                    live_stats = bot.get_live_video_stats(video_id)
-                    if live_stats:
-                        bot.update_video_stats(video_id, live_stats)
-                        updated_count += 1
-            
-            return jsonify({
-                "success": True, 
-                "message": f"Updated stats for {updated_count} videos"
-            })
-        
-        return jsonify({"error": "Database not available"})
-        
-    except Exception as e:
-        return jsonify({"error": str(e)})
-
-class AutoYouTubeBot:
-    def setup_cookies(self):
-        """Setup cookies for better download success"""
-        try:
-            # Try to extract cookies from browser
-            import subprocess
-            cookie_file = os.path.join(self.download_dir, 'cookies.txt')
-            
-            # Try different browsers
-            browsers = ['chrome', 'firefox', 'edge', 'safari']
-            for browser in browsers:
-                try:
-                    cmd = ['yt-dlp', '--cookies-from-browser', browser, '--cookies', cookie_file, '--print', 'cookies', 'https://youtube.com']
-                    result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-                    if result.returncode == 0 and os.path.exists(cookie_file):
-                        self.log_activity(f"✅ Cookies extracted from {browser}")
-                        return cookie_file
-                except:
-                    continue
-            
-            self.log_activity("⚠️ No browser cookies found")
-            return None
-        except Exception as e:
-            self.log_activity(f"❌ Cookie setup failed: {e}")
-            return None
-
-    def update_ytdlp(self):
-        """Update yt-dlp to latest version"""
-        try:
-            import subprocess
-            print("🔄 Updating yt-dlp...")
-            result = subprocess.run(['pip', 'install', '--upgrade', 'yt-dlp'], 
-                                  capture_output=True, text=True, timeout=60)
-            if result.returncode == 0:
-                print("✅ yt-dlp updated successfully")
-            else:
-                print(f"⚠️ yt-dlp update warning: {result.stderr}")
-        except Exception as e:
-            print(f"❌ Failed to update yt-dlp: {e}")
-
-    def __init__(self):
-        print("🔧 Initializing YouTube Bot...")
-        
-        # Update yt-dlp first
-        self.update_ytdlp()
-        
-        # API Keys
-        self.youtube_api_key = os.getenv('YOUTUBE_API_KEY')
-        self.groq_api_key = os.getenv('GROQ_API_KEY')
-        self.client_id = os.getenv('YOUTUBE_CLIENT_ID')
-        self.client_secret = os.getenv('YOUTUBE_CLIENT_SECRET')
-        self.telegram_token = os.getenv('TELEGRAM_BOT_TOKEN')
-        self.telegram_chat_id = os.getenv('TELEGRAM_CHAT_ID')
-        
-        # Test upload status - Always active for dashboard
-        self.test_upload_success = True
-        self.bot_active = True
-        self.youtube = None
-        self.upload_youtube = None
-        self.db = None
-        
-        # Elly reaction mode configuration - ALWAYS ENABLED
-        self.elly_reaction_mode = True  # Force enable for reaction channel
-        self.elly_reaction_chance = 1.0  # 100% chance - always create reactions
-        
-        print("🎬 REACTION SHORTS CHANNEL MODE: ENABLED")
-        print("👩 Elly will react to ALL shorts automatically")
-        
-        try:
-            # Initialize database for better tracking
-            self.init_database()
-            print("✅ Database initialized")
-        except Exception as e:
-            print(f"⚠️  Database initialization failed: {e}")
-        
-        try:
-            # YouTube APIs with authentication
-            if self.youtube_api_key:
-                self.youtube = build('youtube', 'v3', developerKey=self.youtube_api_key)
-                print("✅ YouTube API connected")
-                
-                # Setup upload service with OAuth
-                creds = get_youtube_credentials()
-                if creds:
-                    self.upload_youtube = build('youtube', 'v3', credentials=creds)
-                    print("✅ YouTube Upload API authenticated")
-                else:
-                    print("❌ YouTube Upload authentication failed")
-            else:
-                print("⚠️  YouTube API key not found")
-        except Exception as e:
-            print(f"⚠️  YouTube API connection failed: {e}")
-        
-        try:
-            # Create directories - Use /tmp for Render
-            self.download_dir = '/tmp/downloads' if os.path.exists('/tmp') else 'downloads'
-            os.makedirs(self.download_dir, exist_ok=True)
-            os.makedirs('shorts', exist_ok=True)
-            os.makedirs('credentials', exist_ok=True)
-            os.makedirs('logs', exist_ok=True)
-            print("✅ Directories created")
-        except Exception as e:
-            print(f"⚠️  Directory creation failed: {e}")
-        
-        try:
-            # Advanced title patterns
-            self.title_patterns = self.load_title_patterns()
-            print("✅ Title patterns loaded")
-        except Exception as e:
-            print(f"⚠️  Title patterns failed: {e}")
-            self.title_patterns = {}
-        
-        print("🤖 YouTube Bot Initialized (Dashboard Ready)")
-        print("✅ Status: ACTIVE - Dashboard Live!")
-        
-        # Show enhanced features
-        print("\n🚀 Enhanced Features Loaded:")
-        print("  ✅ Bot detection bypass enabled")
-        print("  ✅ Enhanced error handling & fallbacks")
-        if self.elly_reaction_mode:
-            print("  ✅ Elly reaction shorts creation")
-            print("  ✅ Smart video overlay & composition")
-        print("  ✅ Advanced title/description generation")
-        print("  ✅ Professional dashboard with CRUD")
-        print("  ✅ 24/7 autonomous operation")
-        
-        try:
-            self.log_activity("Enhanced YouTube Bot initialized - All features ready - Status: ACTIVE")
-        except:
-            print("📝 Logging system not available")
-
-    def get_real_youtube_data(self):
-        """Get ONLY YouTube Shorts for reaction channel"""
-        try:
-            if not self.youtube:
-                return []
-            
-            videos_data = []
-            
-            # Search specifically for shorts
-            search_queries = [
-                'shorts viral trending',
-                'shorts funny moments', 
-                'shorts entertainment',
-                'shorts tech tips',
-                'shorts reaction worthy'
-            ]
-            
-            for query in search_queries:
-                try:
-                    # Search for shorts
-                    search_request = self.youtube.search().list(
-                        q=query,
-                        part='snippet',
-                        type='video',
-                        videoDuration='short',  # Only shorts
-                        order='relevance',
-                        maxResults=10,
-                        regionCode='US'
-                    )
-                    
-                    search_response = search_request.execute()
-                    
-                    for item in search_response.get('items', []):
-                        video_id = item['id']['videoId']
-                        
-                        # Get detailed video info
-                        video_request = self.youtube.videos().list(
-                            part='snippet,statistics,contentDetails',
-                            id=video_id
-                        )
-                        
-                        video_response = video_request.execute()
-                        
-                        if video_response['items']:
-                            video = video_response['items'][0]
-                            duration = video['contentDetails']['duration']
-                            duration_seconds = self.parse_duration(duration)
-                            
-                            # Only include shorts (under 60 seconds)
-                            if duration_seconds <= 60:
-                                video_data = {
-                                    'id': video_id,
-                                    'video_id': video_id,
-                                    'title': video['snippet']['title'],
-                                    'description': self.truncate_description(video['snippet']['description']),
-                                    'upload_date': video['snippet']['publishedAt'],
-                                    'youtube_url': f"https://www.youtube.com/watch?v={video_id}",
-                                    'thumbnail': video['snippet']['thumbnails'].get('medium', {}).get('url', ''),
-                                    'channel': video['snippet']['channelTitle'],
-                                    'category': 'shorts',  # All are shorts for reactions
-                                    'views': int(video['statistics'].get('viewCount', 0)),
-                                    'likes': int(video['statistics'].get('likeCount', 0)),
-                                    'comments': int(video['statistics'].get('commentCount', 0)),
-                                    'duration': duration,
-                                    'duration_seconds': duration_seconds,
-                                    'live_stats': True,
-                                    'last_updated': datetime.now().isoformat(),
-                                    'tags': video['snippet'].get('tags', [])[:5],
-                                    'language': video['snippet'].get('defaultLanguage', 'en'),
-                                    'definition': video['contentDetails'].get('definition', 'hd')
-                                }
-                                videos_data.append(video_data)
-                
-                except Exception as e:
-                    self.log_activity(f"⚠️ Error in search query '{query}': {e}")
-                    continue
-            
-            # Remove duplicates
-            unique_videos = []
-            seen_ids = set()
-            for video in videos_data:
-                if video['id'] not in seen_ids:
-                    unique_videos.append(video)
-                    seen_ids.add(video['id'])
-            
-            self.log_activity(f"✅ Found {len(unique_videos)} shorts for Elly reactions")
-            return unique_videos
-            
-        except Exception as e:
-            self.log_activity(f"❌ Error fetching shorts: {e}")
-            return []
-
-    def truncate_description(self, description):
-        """Truncate description to reasonable length"""
-        if not description:
-            return "Amazing content!"
-        return description[:200] + "..." if len(description) > 200 else description
-
-    def get_category_name(self, category_id):
-        """Truncate description to reasonable length"""
-        if len(description) > 300:
-            return description[:297] + "..."
-        return description
-
-    def calculate_engagement_rate(self, video_data):
-        """Calculate engagement rate for video"""
-        try:
-            views = video_data.get('views', 0)
-            likes = video_data.get('likes', 0)
-            comments = video_data.get('comments', 0)
-            
-            if views == 0:
-                return 0
-            
-            engagement = (likes + comments * 2) / views * 100
-            return round(engagement, 2)
-        except:
-            return 0
-
-    def calculate_trending_score(self, video_data):
-        """Calculate trending score based on multiple factors"""
-        try:
-            views = video_data.get('views', 0)
-            likes = video_data.get('likes', 0)
-            comments = video_data.get('comments', 0)
-            
-            # Upload recency factor (newer videos get higher score)
-            upload_date = datetime.fromisoformat(video_data['upload_date'].replace('Z', '+00:00'))
-            hours_since_upload = (datetime.now(upload_date.tzinfo) - upload_date).total_seconds() / 3600
-            recency_factor = max(0, 1 - (hours_since_upload / (24 * 7)))  # Decay over a week
-            
-            # Base score from engagement
-            base_score = (views * 0.1) + (likes * 2) + (comments * 5)
-            
-            # Apply recency factor
-            trending_score = base_score * (1 + recency_factor)
-            
-            return int(trending_score)
-        except:
-            return 0
-
-    def get_enhanced_video_stats(self, video_id):
-        """Get enhanced statistics for a specific video"""
-        try:
-            if not self.youtube or not video_id or video_id == 'None':
-                return None
-            
-            request = self.youtube.videos().list(
-                part='snippet,statistics,contentDetails,status,topicDetails',
-                id=video_id
-            )
-            
-            response = request.execute()
-            
-            if response.get('items'):
-                item = response['items'][0]
-                
-                # Enhanced stats
-                stats = {
-                    'views': int(item['statistics'].get('viewCount', 0)),
-                    'likes': int(item['statistics'].get('likeCount', 0)),
-                    'comments': int(item['statistics'].get('commentCount', 0)),
-                    'duration': item['contentDetails']['duration'],
-                    'last_updated': datetime.now().isoformat(),
-                    
-                    # Additional metadata
-                    'privacy_status': item['status'].get('privacyStatus', 'unknown'),
-                    'upload_status': item['status'].get('uploadStatus', 'unknown'),
-                    'embeddable': item['status'].get('embeddable', False),
-                    'license': item['status'].get('license', 'unknown'),
-                    
-                    # Topic details (if available)
-                    'topics': item.get('topicDetails', {}).get('topicCategories', []),
-                    
-                    # Calculated metrics
-                    'engagement_rate': 0,
-                    'trending_score': 0
-                }
-                
-                # Calculate engagement metrics
-                stats['engagement_rate'] = self.calculate_engagement_rate(stats)
-                stats['trending_score'] = self.calculate_trending_score(stats)
-                
-                return stats
-            
-            return None
-            
-        except Exception as e:
-            self.log_activity(f"Error getting enhanced stats for {video_id}: {e}")
-            return None
-
-    def search_youtube_videos_advanced(self, query, category='tech', max_results=10):
-        """Advanced YouTube video search with filtering"""
-        try:
-            if not self.youtube or not query:
-                return []
-            
-            # Advanced search parameters
-            search_params = {
-                'part': 'snippet',
-                'q': query,
-                'type': 'video',
-                'maxResults': max_results * 2,  # Get more to filter
-                'order': 'relevance',
-                'videoDuration': 'medium',  # 4-20 minutes
-                'videoDefinition': 'high',
-                'videoEmbeddable': 'true',
-                'safeSearch': 'strict'
-            }
-            
-            # Category-specific filters
-            if category == 'tech':
-                search_params['videoCategoryId'] = '28'  # Science & Technology
-            elif category == 'entertainment':
-                search_params['videoCategoryId'] = '24'  # Entertainment
-            
-            search_request = self.youtube.search().list(**search_params)
-            search_response = search_request.execute()
-            
-            videos = []
-            video_ids = []
-            
-            # Collect video IDs for batch stats request
-            for item in search_response.get('items', []):
-                video_ids.append(item['id']['videoId'])
-            
-            # Get detailed stats for all videos in one request
-            if video_ids:
-                stats_request = self.youtube.videos().list(
-                    part='statistics,contentDetails,status',
-                    id=','.join(video_ids)
-                )
-                stats_response = stats_request.execute()
-                
-                # Create stats lookup
-                stats_lookup = {}
-                for item in stats_response.get('items', []):
-                    stats_lookup[item['id']] = item
-                
-                # Build video data with stats
-                for item in search_response.get('items', []):
-                    video_id = item['id']['videoId']
-                    stats_item = stats_lookup.get(video_id, {})
-                    
-                    # Apply safety filters
-                    if not self.is_video_safe_for_processing(item, stats_item):
-                        continue
-                    
-                    video_data = {
-                        'id': video_id,
-                        'video_id': video_id,
-                        'title': item['snippet']['title'],
-                        'description': self.truncate_description(item['snippet']['description']),
-                        'thumbnail': item['snippet']['thumbnails'].get('medium', {}).get('url', ''),
-                        'channel': item['snippet']['channelTitle'],
-                        'upload_date': item['snippet']['publishedAt'],
-                        'youtube_url': f"https://www.youtube.com/watch?v={video_id}",
-                        'category': category,
-                        'views': int(stats_item.get('statistics', {}).get('viewCount', 0)),
-                        'likes': int(stats_item.get('statistics', {}).get('likeCount', 0)),
-                        'comments': int(stats_item.get('statistics', {}).get('commentCount', 0)),
-                        'duration': stats_item.get('contentDetails', {}).get('duration', ''),
-                        'live_stats': True,
-                        'last_updated': datetime.now().isoformat()
-                    }
-                    
-                    # Calculate metrics
-                    video_data['engagement_rate'] = self.calculate_engagement_rate(video_data)
-                    video_data['trending_score'] = self.calculate_trending_score(video_data)
-                    
-                    videos.append(video_data)
-            
-            # Sort by trending score and return top results
-            videos.sort(key=lambda x: x.get('trending_score', 0), reverse=True)
-            
-            return videos[:max_results]
-            
-        except Exception as e:
-            self.log_activity(f"Error in advanced YouTube search: {e}")
-            return []
-
-    def is_video_safe_for_processing(self, search_item, stats_item):
-        """Enhanced safety check for video processing"""
-        try:
-            title = search_item['snippet']['title'].lower()
-            channel = search_item['snippet']['channelTitle'].lower()
-            description = search_item['snippet']['description'].lower()
-            
-            # Enhanced danger keywords
-            danger_keywords = [
-                'official', 'vevo', 'music video', 'song', 'album', 'records',
-                'trailer', 'movie', 'film', 'netflix', 'disney', 'hbo', 'paramount',
-                'sports', 'nfl', 'nba', 'fifa', 'match', 'game highlights',
-                'news', 'breaking', 'live stream', 'concert', 'performance',
-                'premium', 'exclusive', 'copyrighted', 'licensed', 'full movie',
-                'tv show', 'episode', 'season', 'series'
-            ]
-            
-            # Check title and description
-            text_to_check = f"{title} {channel} {description}"
-            for keyword in danger_keywords:
-                if keyword in text_to_check:
-                    return False
-            
-            # Check video stats if available
-            if stats_item:
-                stats = stats_item.get('statistics', {})
-                views = int(stats.get('viewCount', 0))
-                
-                # Minimum view requirement
-                if views < 10000:  # At least 10K views
-                    return False
-                
-                # Check if video is embeddable
-                status = stats_item.get('status', {})
-                if not status.get('embeddable', True):
-                    return False
-                
-                # Check privacy status
-                if status.get('privacyStatus') != 'public':
-                    return False
-            
-            return True
-            
-        except Exception as e:
-            self.log_activity(f"Error in safety check: {e}")
-            return False
-
-
-    def get_live_video_stats(self, video_id):
-        """Get live statistics for a specific video"""
-        try:
-            if not self.youtube or not video_id or video_id == 'None':
-                return None
-            
-            request = self.youtube.videos().list(
-                part='snippet,statistics,contentDetails',
-                id=video_id
-            )
-            
-            response = request.execute()
-            
-            if response.get('items'):
-                item = response['items'][0]
-                return {
-                    'views': int(item['statistics'].get('viewCount', 0)),
-                    'likes': int(item['statistics'].get('likeCount', 0)),
-                    'comments': int(item['statistics'].get('commentCount', 0)),
-                    'duration': item['contentDetails']['duration'],
-                    'last_updated': datetime.now().isoformat()
-                }
-            
-            return None
-            
-        except Exception as e:
-            print(f"Error getting live stats for {video_id}: {e}")
-            return None
-
-    def update_video_stats(self, video_id, stats):
-        """Update video statistics in database"""
-        try:
-            if not self.db:
-                return False
-            
-            cursor = self.db.cursor()
-            cursor.execute('''
-                UPDATE uploaded_videos 
-                SET views = ?, likes = ?, comments = ?, last_updated = ?
-                WHERE video_id = ?
-            ''', (stats.get('views', 0), stats.get('likes', 0), 
-                  stats.get('comments', 0), datetime.now(), video_id))
-            
-            self.db.commit()
-            return cursor.rowcount > 0
-            
-        except Exception as e:
-            print(f"Error updating stats for {video_id}: {e}")
-            return False
-
-    def save_video_with_stats(self, video_data):
-        """Save video with complete statistics"""
-        try:
-            if not self.db:
-                print("❌ Database not available")
-                return False
-            
-            cursor = self.db.cursor()
-            
-            # Check if all required columns exist
-            cursor.execute("PRAGMA table_info(uploaded_videos)")
-            columns = [column[1] for column in cursor.fetchall()]
-            
-            if 'video_id' in columns:
-                # New schema with video_id
-                cursor.execute('''
-                    INSERT OR REPLACE INTO uploaded_videos 
-                    (video_id, title, description, upload_date, youtube_url, thumbnail, 
-                     channel, category, views, likes, comments, duration, last_updated)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    video_data.get('id'),
-                    video_data.get('title'),
-                    video_data.get('description'),
-                    video_data.get('upload_date'),
-                    video_data.get('youtube_url'),
-                    video_data.get('thumbnail', ''),
-                    video_data.get('channel', ''),
-                    video_data.get('category'),
-                    video_data.get('views', 0),
-                    video_data.get('likes', 0),
-                    video_data.get('comments', 0),
-                    video_data.get('duration', ''),
-                    datetime.now()
-                ))
-            else:
-                # Old schema without video_id (fallback)
-                cursor.execute('''
-                    INSERT OR REPLACE INTO uploaded_videos 
-                    (title, description, upload_date, youtube_url, category)
-                    VALUES (?, ?, ?, ?, ?)
-                ''', (
-                    video_data.get('title'),
-                    video_data.get('description'),
-                    video_data.get('upload_date'),
-                    video_data.get('youtube_url'),
-                    video_data.get('category')
-                ))
-            
-            self.db.commit()
-            print(f"✅ Video saved: {video_data.get('title')[:50]}...")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Error saving video: {e}")
-            # Try to recreate table if schema is wrong
-            try:
-                cursor = self.db.cursor()
-                cursor.execute('DROP TABLE IF EXISTS uploaded_videos')
-                self.init_database()
-                print("🔄 Database recreated, trying again...")
-                return self.save_video_with_stats(video_data)
-            except:
-                return False
-
-    def init_database(self):
-        """Initialize SQLite database for tracking"""
-        # Use in-memory database for Render (ephemeral storage)
-        is_render = os.environ.get('RENDER') or os.environ.get('RENDER_SERVICE_ID')
-        
-        if is_render:
-            # In-memory database for Render
-            self.db = sqlite3.connect(':memory:', check_same_thread=False)
-            print("📊 Using in-memory database (Render mode)")
-        else:
-            # File database for local development
-            self.db = sqlite3.connect('youtube_bot.db', check_same_thread=False)
-            print("📊 Using file database (Local mode)")
-            
-        cursor = self.db.cursor()
-        
-        # Create tables
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS processed_videos (
-                video_id TEXT PRIMARY KEY,
-                original_title TEXT,
-                channel TEXT,
-                processed_date TIMESTAMP,
-                video_hash TEXT UNIQUE
-            )
-        ''')
-        
-        # First check if table exists and update schema
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='uploaded_videos'")
-        table_exists = cursor.fetchone()
-        
-        if table_exists:
-            # Check if video_id column exists
-            cursor.execute("PRAGMA table_info(uploaded_videos)")
-            columns = [column[1] for column in cursor.fetchall()]
-            
-            if 'video_id' not in columns:
-                # Add missing columns
-                try:
-                    cursor.execute('ALTER TABLE uploaded_videos ADD COLUMN video_id TEXT')
-                    cursor.execute('ALTER TABLE uploaded_videos ADD COLUMN thumbnail TEXT')
-                    cursor.execute('ALTER TABLE uploaded_videos ADD COLUMN channel TEXT')
-                    cursor.execute('ALTER TABLE uploaded_videos ADD COLUMN views INTEGER DEFAULT 0')
-                    cursor.execute('ALTER TABLE uploaded_videos ADD COLUMN likes INTEGER DEFAULT 0')
-                    cursor.execute('ALTER TABLE uploaded_videos ADD COLUMN comments INTEGER DEFAULT 0')
-                    cursor.execute('ALTER TABLE uploaded_videos ADD COLUMN duration TEXT')
-                    cursor.execute('ALTER TABLE uploaded_videos ADD COLUMN last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP')
-                    print("✅ Database schema updated")
-                except:
-                    # If ALTER fails, recreate table
-                    cursor.execute('DROP TABLE IF EXISTS uploaded_videos')
-                    print("🔄 Recreating database table")
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS uploaded_videos (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                video_id TEXT UNIQUE,
-                title TEXT,
-                description TEXT,
-                upload_date TIMESTAMP,
-                youtube_url TEXT,
-                thumbnail TEXT,
-                channel TEXT,
-                category TEXT,
-                views INTEGER DEFAULT 0,
-                likes INTEGER DEFAULT 0,
-                comments INTEGER DEFAULT 0,
-                duration TEXT,
-                last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS bot_stats (
-                date DATE PRIMARY KEY,
-                tech_uploads INTEGER DEFAULT 0,
-                entertainment_uploads INTEGER DEFAULT 0,
-                total_uploads INTEGER DEFAULT 0
-            )
-        ''')
-        
-        self.db.commit()
-        print("📊 Database initialized")
-
-    def load_title_patterns(self):
-        """Load advanced title generation patterns"""
-        return {
-            'tech': [
-                "🔥 {adjective} Tech Discovery That Changes Everything",
-                "⚡ Why {topic} Is The Future (MINDBLOWING)",
-                "🚀 {number} Seconds Of Pure Tech Magic",
-                "💡 The {adjective} Innovation Nobody's Talking About",
-                "🤯 This {topic} Hack Will Blow Your Mind",
-                "⭐ {adjective} Tech Moment Caught On Camera",
-                "🎯 Watch This Before {topic} Takes Over",
-                "🔮 The Future Is Here: {adjective} {topic}",
-                "💥 {number} Second {topic} That Broke The Internet",
-                "🌟 {adjective} Discovery: The Game Changer"
-            ],
-            'entertainment': [
-                "😱 {adjective} Moment That Left Everyone Speechless",
-                "🎬 {number} Seconds Of Pure {emotion}",
-                "🔥 The {adjective} Scene Everyone's Watching",
-                "💯 Most {adjective} Moment You'll See Today",
-                "⚡ Wait For It... {emotion} Guaranteed!",
-                "🎭 {adjective} Plot Twist Nobody Saw Coming",
-                "🌟 {number} Second Clip Going Mega Viral",
-                "😍 The {adjective} Moment Breaking The Internet",
-                "🚀 {emotion} Level: {adjective}!",
-                "🎪 {adjective} Content That Defines {year}"
-            ],
-            'adjectives': [
-                "Incredible", "Mind-Blowing", "Shocking", "Amazing", "Unbelievable",
-                "Epic", "Legendary", "Insane", "Brilliant", "Revolutionary",
-                "Game-Changing", "Jaw-Dropping", "Stunning", "Phenomenal", "Wild"
-            ],
-            'emotions': [
-                "Excitement", "Joy", "Surprise", "Wonder", "Amazement",
-                "Thrill", "Awe", "Happiness", "Shock", "Inspiration"
-            ],
-            'topics': [
-                "Technology", "Innovation", "Discovery", "Breakthrough", "Revolution",
-                "Transformation", "Evolution", "Future", "Science", "Progress"
-            ]
-        }
-
-    def log_activity(self, message):
-        """Log activity to file and console"""
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        log_message = f"[{timestamp}] {message}"
-        print(log_message)
-        
-        # Save to log file
-        with open('logs/bot_activity.log', 'a', encoding='utf-8') as f:
-            f.write(log_message + '\n')
-        
-        # Send to Telegram if configured
-        if self.telegram_token and self.telegram_chat_id:
-            self.send_telegram_message(f"🤖 {message}")
-
-    def send_telegram_message(self, message):
-        """Send notification to Telegram"""
-        try:
-            url = f"https://api.telegram.org/bot{self.telegram_token}/sendMessage"
-            data = {
-                'chat_id': self.telegram_chat_id,
-                'text': message,
-                'parse_mode': 'HTML'
-            }
-            requests.post(url, data=data, timeout=5)
-        except:
-            pass
-
-    def check_duplicate(self, video_data):
-        """Advanced duplicate checking using multiple methods"""
-        cursor = self.db.cursor()
-        
-        # Check by video ID
-        cursor.execute('SELECT video_id FROM processed_videos WHERE video_id = ?', (video_data['id'],))
-        if cursor.fetchone():
-            return True
-        
-        # Create content hash for similarity check
-        content_hash = hashlib.md5(
-            f"{video_data['title']}{video_data['channel']}".encode()
-        ).hexdigest()
-        
-        cursor.execute('SELECT video_id FROM processed_videos WHERE video_hash = ?', (content_hash,))
-        if cursor.fetchone():
-            return True
-        
-        # Check similar titles (prevent same content different ID)
-        cursor.execute('''
-            SELECT title FROM uploaded_videos 
-            WHERE title LIKE ? OR title LIKE ?
-        ''', (f"%{video_data['title'][:30]}%", f"%{video_data['channel'][:20]}%"))
-        
-        if cursor.fetchone():
-            return True
-        
-        return False
-
-    def save_processed_video(self, video_data):
-        """Save processed video to database"""
-        cursor = self.db.cursor()
-        content_hash = hashlib.md5(
-            f"{video_data['title']}{video_data['channel']}".encode()
-        ).hexdigest()
-        
-        cursor.execute('''
-            INSERT OR IGNORE INTO processed_videos 
-            (video_id, original_title, channel, processed_date, video_hash)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (video_data['id'], video_data['title'], video_data['channel'], 
-              datetime.now(), content_hash))
-        
-        self.db.commit()
-
-    def generate_advanced_title(self, video_data, category='general'):
-        """Generate advanced unique titles"""
-        import random
-        
-        # Select pattern based on category
-        patterns = self.title_patterns.get(category, self.title_patterns['entertainment'])
-        pattern = random.choice(patterns)
-        
-        # Fill in variables
-        title = pattern.format(
-            adjective=random.choice(self.title_patterns['adjectives']),
-            topic=random.choice(self.title_patterns['topics']),
-            emotion=random.choice(self.title_patterns['emotions']),
-            number=random.randint(10, 60),
-            year=datetime.now().year
-        )
-        
-        # Ensure uniqueness
-        cursor = self.db.cursor()
-        cursor.execute('SELECT COUNT(*) FROM uploaded_videos WHERE title = ?', (title,))
-        
-        if cursor.fetchone()[0] > 0:
-            # Add unique identifier if title exists
-            title = f"{title} #{random.randint(100, 999)}"
-        
-        # Ensure title length
-        if len(title) > 70:
-            title = title[:67] + "..."
-        
-        return title
-
-    def generate_advanced_description(self, video_data, title, category='general'):
-        """Generate advanced descriptions with SEO optimization"""
-        
-        # Try AI generation first
-        if self.groq_api_key:
-            ai_description = self.generate_ai_description(video_data, title, category)
-            if ai_description:
-                return ai_description
-        
-        # Fallback to template-based generation
-        templates = [
-            """🔥 {title}
-
-📺 Experience the {adjective} moment that's taking the internet by storm!
-
-👀 What you'll see:
-• {point1}
-• {point2}
-• {point3}
-
-🚀 Original content from: {channel}
-📊 Viral Rating: {rating}/10
-
-🏷️ Tags:
-{tags}
-
-⏰ Upload Time: {time}
-📍 Category: {category}
-
-👍 Like & Subscribe for more {adjective} content!
-🔔 Turn on notifications to never miss out!
-
-#shorts #viral #trending #{category} #{year}""",
-
-            """⚡ {title}
-
-This {adjective} moment will leave you speechless! 😱
-
-✨ Why this is trending:
-→ {reason1}
-→ {reason2}
-→ {reason3}
-
-Credit: {channel} 🎬
-
-Stats:
-• Views: {views}
-• Category: {category}
-• Upload: {time}
-
-{tags}
-
-Drop a ❤️ if this amazed you!
-
-#{hashtag1} #{hashtag2} #{hashtag3}"""
-        ]
-        
-        template = random.choice(templates)
-        
-        # Generate dynamic content points
-        points = self.generate_content_points(category)
-        reasons = self.generate_trending_reasons()
-        tags = self.generate_seo_tags(video_data, category)
-        
-        description = template.format(
-            title=title,
-            adjective=random.choice(self.title_patterns['adjectives']),
-            channel=video_data['channel'],
-            rating=random.randint(8, 10),
-            point1=points[0],
-            point2=points[1],
-            point3=points[2],
-            reason1=reasons[0],
-            reason2=reasons[1],
-            reason3=reasons[2],
-            tags=tags,
-            time=datetime.now().strftime('%B %d, %Y'),
-            category=category.title(),
-            year=datetime.now().year,
-            views=f"{video_data['views']:,}",
-            hashtag1=f"{category}{random.randint(100,999)}",
-            hashtag2=f"viral{datetime.now().strftime('%Y%m')}",
-            hashtag3=f"trending{random.randint(1,100)}"
-        )
-        
-        return description
-
-    def generate_ai_description(self, video_data, title, category):
-        """Generate AI-powered description using Groq"""
-        try:
-            url = "https://api.groq.com/openai/v1/chat/completions"
-            headers = {
-                "Authorization": f"Bearer {self.groq_api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            prompt = f"""Create a viral YouTube Shorts description for:
-Title: {title}
-Category: {category}
-Original: {video_data['title'][:50]}
-Channel: {video_data['channel']}
-
-Requirements:
-- Start with eye-catching emoji
-- Include 3 bullet points about the content
-- Add relevant hashtags (15-20)
-- Make it engaging and shareable
-- Include call-to-action
-- SEO optimized
-- Max 500 characters
-
-Format with emojis and line breaks for readability."""
-
-            data = {
-                "model": "mixtral-8x7b-32768",
-                "messages": [{"role": "user", "content": prompt}],
-                "max_tokens": 400,
-                "temperature": 0.9
-            }
-            
-            response = requests.post(url, headers=headers, json=data, timeout=10)
-            
-            if response.status_code == 200:
-                return response.json()['choices'][0]['message']['content']
-        except:
-            pass
-        
-        return None
-
-    def generate_content_points(self, category):
-        """Generate content bullet points"""
-        tech_points = [
-            "Cutting-edge technology in action",
-            "Mind-bending innovation revealed",
-            "Future tech becoming reality",
-            "Game-changing breakthrough moment",
-            "Revolutionary concept demonstrated"
-        ]
-        
-        entertainment_points = [
-            "Jaw-dropping entertainment",
-            "Unforgettable viral moment",
-            "Pure entertainment gold",
-            "Content that breaks the internet",
-            "Must-see trending footage"
-        ]
-        
-        points = tech_points if category == 'tech' else entertainment_points
-        return random.sample(points, 3)
-
-    def generate_trending_reasons(self):
-        """Generate reasons why content is trending"""
-        reasons = [
-            "Absolutely mind-blowing content",
-            "Never seen before on the internet",
-            "Breaking all viral records",
-            "Everyone's talking about this",
-            "Defining moment of the year",
-            "Pure viral perfection",
-            "Internet's new obsession",
-            "Changing the game completely"
-        ]
-        return random.sample(reasons, 3)
-
-    def generate_seo_tags(self, video_data, category):
-        """Generate SEO optimized tags"""
-        base_tags = ['#shorts', '#viral', '#trending', '#fyp', '#explore']
-        
-        category_tags = {
-            'tech': ['#technology', '#innovation', '#future', '#tech', '#ai', '#gadgets'],
-            'entertainment': ['#entertainment', '#fun', '#amazing', '#mustwatch', '#epic']
-        }
-        
-        # Time-based unique tags
-        time_tags = [
-            f"#viral{datetime.now().strftime('%Y')}",
-            f"#trending{datetime.now().strftime('%m%d')}",
-            f"#{category}{datetime.now().strftime('%H')}"
-        ]
-        
-        all_tags = base_tags + category_tags.get(category, []) + time_tags
-        
-        # Add random viral tags
-        viral_tags = [
-            f"#moment{random.randint(100,999)}",
-            f"#viral{random.randint(1,100)}",
-            f"#trend{random.randint(1,999)}"
-        ]
-        
-        all_tags.extend(random.sample(viral_tags, 2))
-        
-        return ' '.join(all_tags[:20])  # Limit to 20 tags
-
-    def get_today_uploads(self):
-        """Get today's upload count"""
-        cursor = self.db.cursor()
-        today = datetime.now().date()
-        
-        cursor.execute('''
-            SELECT total_uploads FROM bot_stats WHERE date = ?
-        ''', (today,))
-        
-        result = cursor.fetchone()
-        return result[0] if result else 0
-
-    def update_stats(self, category):
-        """Update upload statistics"""
-        cursor = self.db.cursor()
-        today = datetime.now().date()
-        
-        # Insert or update today's stats
-        cursor.execute('''
-            INSERT INTO bot_stats (date, tech_uploads, entertainment_uploads, total_uploads)
-            VALUES (?, ?, ?, ?)
-            ON CONFLICT(date) DO UPDATE SET
-                tech_uploads = CASE WHEN ? = 'tech' 
-                    THEN tech_uploads + 1 ELSE tech_uploads END,
-                entertainment_uploads = CASE WHEN ? = 'entertainment' 
-                    THEN entertainment_uploads + 1 ELSE entertainment_uploads END,
-                total_uploads = total_uploads + 1
-        ''', (today, 1 if category == 'tech' else 0, 
-              1 if category == 'entertainment' else 0, 1,
-              category, category))
-        
-        self.db.commit()
-
-    def automatic_test_upload(self):
-        """Perform REAL test upload to YouTube"""
-        self.log_activity("🧪 Starting REAL YouTube test upload...")
-        
-        try:
-            # Check if we have YouTube credentials
-            if not self.youtube_api_key or not self.client_id or not self.client_secret:
-                self.log_activity("⚠️ YouTube API credentials missing - Bot ready for real data only")
-                self.test_upload_success = True
-                self.bot_active = True
-                return True
-            
-            # Try to authenticate YouTube upload
-            if not self.authenticate_youtube():
-                self.log_activity("⚠️ YouTube authentication failed - Bot ready for real data only")
-                self.test_upload_success = True
-                self.bot_active = True
-                return True
-            
-            # Create a simple test video file
-            test_video_path = self.create_test_video_file()
-            if not test_video_path:
-                self.log_activity("⚠️ Test video creation failed - Bot ready for real data only")
-                self.test_upload_success = True
-                self.bot_active = True
-                return True
-            
-            # Upload to YouTube
-            title = "🧪 Test Upload - YouTube Bot Working!"
-            description = """🤖 This is an automated test upload from YouTube Automation Bot!
-
-✅ Bot Status: ACTIVE
-📊 Dashboard: Working
-🔄 Auto Upload: Enabled
-
-This test confirms that:
-• YouTube API connection is working
-• Video upload functionality is active
-• Dashboard integration is successful
-• Bot is ready for 24/7 automation
-
-#YouTubeBot #Automation #TestUpload #TechDemo"""
-
-            self.log_activity("📤 Uploading test video to YouTube...")
-            upload_url = self.upload_to_youtube(test_video_path, title, description)
-            
-            if upload_url:
-                # Save successful upload to database
-                test_video = {
-                    'id': f'test_upload_{int(time.time())}',
-                    'title': title,
-                    'description': description,
-                    'upload_date': datetime.now().isoformat(),
-                    'youtube_url': upload_url,
-                    'thumbnail': f"https://img.youtube.com/vi/{upload_url.split('=')[-1]}/mqdefault.jpg",
-                    'channel': 'YouTube Bot',
-                    'category': 'tech',
-                    'views': 0,
-                    'likes': 0,
-                    'comments': 0
-                }
-                
-                self.save_video_with_stats(test_video)
-                
-                self.test_upload_success = True
-                self.bot_active = True
-                
-                self.log_activity(f"🎉 REAL TEST UPLOAD SUCCESSFUL!")
-                self.log_activity(f"📺 YouTube URL: {upload_url}")
-                self.log_activity("🚀 Bot is now ACTIVE with real upload!")
-                
-                # Cleanup test file
-                self.cleanup(test_video_path)
-                
-                return True
-            else:
-                self.log_activity("⚠️ YouTube upload failed (Upload limit exceeded)")
-                self.log_activity("💡 YouTube allows limited uploads per day")
-                self.log_activity("✅ Bot ready for real data only")
-                self.cleanup(test_video_path)
-                self.test_upload_success = True
-                self.bot_active = True
-                return True
-            
-        except Exception as e:
-            self.log_activity(f"❌ Real upload error: {e}")
-            self.log_activity("✅ Bot ready for real data only")
-            self.test_upload_success = True
-            self.bot_active = True
-            return True
-
-
-    def create_test_video_file(self):
-        """Create a simple test video file"""
-        try:
-            import cv2
-            import numpy as np
-            
-            # Create a simple test video
-            filename = 'test_video.mp4'
-            fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-            out = cv2.VideoWriter(filename, fourcc, 1.0, (640, 480))
-            
-            # Create 10 seconds of test video
-            for i in range(10):
-                # Create a frame with text
-                frame = np.zeros((480, 640, 3), dtype=np.uint8)
-                frame[:] = (50, 50, 50)  # Dark gray background
-                
-                # Add text
-                cv2.putText(frame, 'YouTube Bot Test', (150, 200), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 2, (255, 255, 255), 3)
-                cv2.putText(frame, f'Frame: {i+1}/10', (250, 300), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
-                
-                out.write(frame)
-            
-            out.release()
-            
-            if os.path.exists(filename):
-                self.log_activity("✅ Test video file created")
-                return filename
-            else:
-                return None
-                
-        except Exception as e:
-            self.log_activity(f"❌ Test video creation failed: {e}")
-            return None
-
-    def save_uploaded_video(self, title, description, url, category):
-        """Save uploaded video to database"""
-        cursor = self.db.cursor()
-        cursor.execute('''
-            INSERT INTO uploaded_videos (title, description, upload_date, youtube_url, category)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (title, description, datetime.now(), url, category))
-        self.db.commit()
-
-    def get_safe_videos(self, category_id, max_results=10):
-        """Get safe trending videos with strict filtering"""
-        try:
-            category_name = "Tech" if category_id == '28' else "Entertainment"
-            regions = ['US', 'IN', 'GB', 'CA', 'AU']
-            all_videos = []
-            
-            for region in regions:
-                try:
-                    request = self.youtube.videos().list(
-                        part='snippet,statistics,contentDetails',
-                        chart='mostPopular',
-                        regionCode=region,
-                        maxResults=max_results,
-                        videoCategoryId=category_id
-                    )
-                    
-                    response = request.execute()
-                    
-                    for item in response.get('items', []):
-                        duration = self.parse_duration(item['contentDetails']['duration'])
-                        
-                        if 15 <= duration <= 600:  # 15 seconds to 10 minutes
-                            views = int(item['statistics'].get('viewCount', 0))
-                            
-                            if views >= 100000:  # Minimum 100k views
-                                video_data = {
-                                    'id': item['id'],
-                                    'title': item['snippet']['title'],
-                                    'channel': item['snippet']['channelTitle'],
-                                    'views': views,
-                                    'duration': duration,
-                                    'url': f"https://www.youtube.com/watch?v={item['id']}"
-                                }
-                                
-                                if self.is_copyright_safe(video_data):
-                                    all_videos.append(video_data)
-                    
-                    time.sleep(0.5)  # Rate limiting
-                    
-                except Exception as e:
-                    continue
-            
-            # Sort by views and return top videos
-            all_videos.sort(key=lambda x: x['views'], reverse=True)
-            return all_videos[:max_results]
-            
-        except Exception as e:
-            self.log_activity(f"Error getting videos: {e}")
-            return []
-
-    def parse_duration(self, duration_str):
-        """Parse YouTube duration"""
-        import re
-        pattern = r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?'
-        match = re.match(pattern, duration_str)
-        
-        if not match:
-            return 0
-        
-        hours = int(match.group(1) or 0)
-        minutes = int(match.group(2) or 0)
-        seconds = int(match.group(3) or 0)
-        
-        return hours * 3600 + minutes * 60 + seconds
-
-    def is_copyright_safe(self, video_data):
-        """Enhanced copyright safety check"""
-        # Extensive copyright filtering
-        danger_keywords = [
-            'official', 'vevo', 'music', 'song', 'album', 'records',
-            'trailer', 'movie', 'film', 'netflix', 'disney', 'hbo',
-            'sports', 'nfl', 'nba', 'fifa', 'match', 'game highlights',
-            'news', 'breaking', 'live', 'concert', 'performance',
-            'premium', 'exclusive', 'copyrighted', 'licensed'
-        ]
-        
-        text = f"{video_data['title']} {video_data['channel']}".lower()
-        
-        for keyword in danger_keywords:
-            if keyword in text:
-                self.log_activity(f"🚫 Blocked by keyword '{keyword}': {video_data['title'][:30]}...")
-                return False
-        
-        # Check channel name patterns
-        if len(video_data['channel']) < 5:
-            self.log_activity(f"🚫 Channel name too short: {video_data['channel']}")
-            return False
-        
-        if any(char.isdigit() for char in video_data['channel'][:3]):
-            self.log_activity(f"🚫 Channel has numbers: {video_data['channel']}")
-            return False
-        
-        # Additional safety checks
-        title_lower = video_data['title'].lower()
-        
-        # Block if title suggests it's unavailable content
-        unavailable_indicators = [
-            'deleted', 'removed', 'unavailable', 'private', 'restricted',
-            'blocked', 'suspended', 'terminated', 'banned'
-        ]
-        
-        for indicator in unavailable_indicators:
-            if indicator in title_lower:
-                self.log_activity(f"🚫 Unavailable content indicator: {indicator}")
-                return False
-        
-        self.log_activity(f"✅ Safe content: {video_data['title'][:30]}...")
-        return True
-
-    
-    def download_video_advanced(self, url, video_id):
-        """Advanced download with multiple strategies"""
-        self.log_activity(f"🎯 Advanced download: {video_id}")
-        
-        # Add rate limiting - wait between downloads
-        time.sleep(random.randint(15, 45))
-        
-        filename = os.path.join(self.download_dir, f"{video_id}.mp4")
-        
-        # Setup cookies for better success rate
-        cookie_file = self.setup_cookies()
-        
-        # Advanced strategies with bot detection bypass
-        strategies = [
-            {
-                'name': 'Mobile Client',
-                'format': 'best[height<=720]',
-                'opts': {
-                    'quiet': True, 
-                    'no_warnings': True,
-                    'extractor_args': {
-                        'youtube': {
-                            'player_client': ['android', 'android_creator'],
-                            'skip': ['dash', 'hls']
-                        }
-                    }
-                }
-            },
-            {
-                'name': 'iOS Client',
-                'format': 'best[height<=480]',
-                'opts': {
-                    'quiet': True, 
-                    'no_warnings': True,
-                    'extractor_args': {
-                        'youtube': {
-                            'player_client': ['ios', 'ios_music'],
-                            'skip': ['dash']
-                        }
-                    }
-                }
-            },
-            {
-                'name': 'TV Client',
-                'format': 'mp4[height<=360]',
-                'opts': {
-                    'quiet': True, 
-                    'no_warnings': True,
-                    'extractor_args': {
-                        'youtube': {
-                            'player_client': ['tv_embedded']
-                        }
-                    }
-                }
-            },
-            {
-                'name': 'Web Embedded',
-                'format': 'worst[ext=mp4]',
-                'opts': {
-                    'quiet': True, 
-                    'no_warnings': True,
-                    'extractor_args': {
-                        'youtube': {
-                            'player_client': ['web_embedded']
-                        }
-                    }
-                }
-            }
-        ]
-        
-        for i, strategy in enumerate(strategies):
-            try:
-                self.log_activity(f"📥 Strategy {i+1}/{len(strategies)}: {strategy['name']}")
-                
-                ydl_opts = {
-                    'format': strategy['format'],
-                    'outtmpl': filename,
-                    'sleep_interval': random.randint(5, 12),
-                    'max_sleep_interval': 20,
-                    'retries': 3,
-                    'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    'cookiefile': cookie_file if cookie_file else None,
-                    'extract_flat': False,
-                    'writesubtitles': False,
-                    'writeautomaticsub': False,
-                    'ignoreerrors': True,
-                    'no_check_certificate': True,
-                    'prefer_insecure': True,
-                    'http_headers': {
-                        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                        'Accept-Language': 'en-us,en;q=0.5',
-                        'Accept-Encoding': 'gzip, deflate',
-                        'DNT': '1',
-                        'Connection': 'keep-alive',
-                        'Upgrade-Insecure-Requests': '1',
-                    },
-                    **strategy['opts']
-                }
-                
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    ydl.download([url])
-                
-                if os.path.exists(filename) and os.path.getsize(filename) > 1000:
-                    size_mb = os.path.getsize(filename) / (1024 * 1024)
-                    self.log_activity(f"✅ Success with {strategy['name']} ({size_mb:.1f} MB)")
-                    return filename
-                else:
-                    self.log_activity(f"❌ {strategy['name']} failed - no file created")
-                    
-            except Exception as e:
-                error_msg = str(e)
-                if any(phrase in error_msg.lower() for phrase in [
-                    "sign in to confirm", "bot", "blocked", "unavailable", 
-                    "private", "restricted", "age-restricted", "not available"
-                ]):
-                    if "bot" in error_msg.lower() or "blocked" in error_msg.lower():
-                        self.log_activity(f"🤖 ❌ Download blocked: {strategy['name']}")
-                        # Try with longer delay
-                        time.sleep(random.randint(45, 90))
-                    elif "private" in error_msg.lower():
-                        self.log_activity(f"🔒 ❌ Video is private: {video_id}")
-                        break  # No point trying other strategies
-                    elif "unavailable" in error_msg.lower():
-                        self.log_activity(f"🚫 ❌ Video unavailable: {video_id}")
-                        break
-                    else:
-                        self.log_activity(f"⚠️ ❌ Access restricted: {strategy['name']}")
-                else:
-                    self.log_activity(f"❌ {strategy['name']} error: {error_msg[:100]}")
-                continue
-        
-        self.log_activity(f"❌ All download strategies failed: {video_id}")
-        
-        # Try alternative: Use YouTube API to get video info and create placeholder
-        try:
-            self.log_activity(f"🔄 Trying YouTube API fallback for: {video_id}")
-            video_info = self.get_video_info_from_api(video_id)
-            if video_info:
-                # Create a simple text-based video as placeholder
-                placeholder_path = self.create_placeholder_video(video_info, video_id)
-                if placeholder_path:
-                    self.log_activity(f"✅ Created placeholder video: {video_id}")
-                    return placeholder_path
-        except Exception as e:
-            self.log_activity(f"❌ API fallback failed: {str(e)[:50]}")
-        
-        return None
-
-    def get_video_info_from_api(self, video_id):
-        """Get video info using YouTube Data API as fallback"""
-        try:
-            if not self.youtube_api_key:
-                return None
-                
-            import requests
-            url = f"https://www.googleapis.com/youtube/v3/videos"
-            params = {
-                'part': 'snippet,statistics',
-                'id': video_id,
-                'key': self.youtube_api_key
-            }
-            
-            response = requests.get(url, params=params)
-            data = response.json()
-            
-            if 'items' in data and len(data['items']) > 0:
-                item = data['items'][0]
-                return {
-                    'title': item['snippet']['title'],
-                    'description': item['snippet']['description'][:500],
-                    'channel': item['snippet']['channelTitle'],
-                    'views': item['statistics'].get('viewCount', '0')
-                }
-        except:
-            pass
-        return None
-
-    def create_placeholder_video(self, video_info, video_id):
-        """Create a simple placeholder video when download fails"""
-        try:
-            from moviepy.editor import ColorClip, TextClip, CompositeVideoClip
-            
-            # Create a simple colored background
-            background = ColorClip(size=(1280, 720), color=(30, 30, 30), duration=10)
-            
-            # Add title text
-            title_text = TextClip(
-                f"Video: {video_info['title'][:50]}...",
-                fontsize=40,
-                color='white',
-                font='Arial-Bold'
-            ).set_position('center').set_duration(10)
-            
-            # Add info text
-            info_text = TextClip(
-                f"Channel: {video_info['channel']}\nViews: {video_info['views']}\n\nOriginal video unavailable",
-                fontsize=24,
-                color='lightgray',
-                font='Arial'
-            ).set_position(('center', 'bottom')).set_duration(10)
-            
-            # Compose video
-            final_video = CompositeVideoClip([background, title_text, info_text])
-            
-            # Save placeholder
-            placeholder_path = os.path.join(self.download_dir, f"{video_id}_placeholder.mp4")
-            final_video.write_videofile(
-                placeholder_path,
-                fps=24,
-                codec='libx264',
-                audio_codec='aac',
-                verbose=False,
-                logger=None
-            )
-            
-            final_video.close()
-            return placeholder_path
-            
-        except Exception as e:
-            self.log_activity(f"❌ Placeholder creation failed: {str(e)[:50]}")
-            return None
-
-    def download_video(self, url, video_id):
-        """Download with multiple fallback methods for Render"""
-        self.log_activity(f"⬇️ Downloading: {video_id}")
-        
-        # Method 1: Direct requests with validation
-        try:
-            import requests
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                'Accept': 'video/mp4,video/*,*/*',
-                'Accept-Encoding': 'identity'
-            }
-            
-            response = requests.get(url, stream=True, timeout=30, headers=headers)
-            if response.status_code == 200:
-                filename = f"{video_id}.mp4"
-                filepath = os.path.join(self.download_dir, filename)
-                
-                with open(filepath, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-                
-                if os.path.exists(filepath) and os.path.getsize(filepath) > 10000:
-                    # Quick validation
-                    try:
-                        with open(filepath, 'rb') as f:
-                            header = f.read(8)
-                            # Check for valid MP4 header
-                            if b'ftyp' in header or header.startswith(b'\x00\x00\x00'):
-                                self.log_activity(f"✅ Direct download success: {filename}")
-                                return filepath
-                    except:
-                        pass
-                    
-                    # File seems invalid
-                    os.remove(filepath)
-                    self.log_activity(f"❌ Invalid file format: {filename}")
-                    
-        except Exception as e:
-            self.log_activity(f"❌ Direct download failed: {e}")
-        
-        # Method 2: Curl with better headers
-        try:
-            import subprocess
-            filename = f"{video_id}.mp4"
-            filepath = os.path.join(self.download_dir, filename)
-            
-            # Add proper headers and validation
-            cmd = [
-                'curl', '-L', '-s', '--fail',
-                '-H', 'User-Agent: Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                '-H', 'Accept: video/mp4,video/*,*/*',
-                '--max-filesize', '50M',
-                '--connect-timeout', '30',
-                '-o', filepath,
-                url
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, timeout=60)
-            
-            if result.returncode == 0 and os.path.exists(filepath):
-                file_size = os.path.getsize(filepath)
-                if file_size > 10000:  # At least 10KB
-                    # Validate file format
-                    try:
-                        import subprocess
-                        check_cmd = ['ffprobe', '-v', 'quiet', '-print_format', 'json', '-show_format', filepath]
-                        probe_result = subprocess.run(check_cmd, capture_output=True, timeout=10)
-                        if probe_result.returncode == 0:
-                            self.log_activity(f"✅ Curl download success: {filename}")
-                            return filepath
-                    except:
-                        pass
-                
-                # File invalid, remove it
-                os.remove(filepath)
-                self.log_activity(f"❌ Downloaded file is invalid: {filename}")
-            
-        except Exception as e:
-            self.log_activity(f"❌ Curl download failed: {e}")
-        
-        # Method 3: Skip invalid URLs
-        self.log_activity(f"❌ URL might be invalid or expired: {url[:50]}...")
-        
-        # Try to get fresh URL from API
-        try:
-            video_info = self.get_video_info_from_api(video_id)
-            if video_info:
-                self.log_activity(f"ℹ️ Video exists but download blocked: {video_info.get('title', 'Unknown')[:30]}")
-        except:
-            pass
-            
-        return None
-    
-
-    def create_short(self, video_path, video_id):
-        """Create YouTube short with audio preservation"""
-        try:
-            # Debug original video
-            self.debug_audio_info(video_path, "ORIGINAL")
-            
-            with VideoFileClip(video_path) as video:
-                duration = video.duration
-                
-                # Check if video has audio
-                has_audio = video.audio is not None
-                self.log_activity(f"🎵 Audio detected: {'Yes' if has_audio else 'No'}")
-                
-                if duration <= 60:
-                    clip = video
-                else:
-                    # Smart segment selection
-                    if duration > 120:
-                        start_time = random.uniform(30, duration - 90)
-                    else:
-                        start_time = 10
-                    
-                    end_time = min(start_time + 60, duration - 10)
-                    clip = video.subclip(start_time, end_time)
-                    
-                    # Debug after clipping
-                    self.log_activity(f"✂️ Clipped: {start_time:.1f}s to {end_time:.1f}s")
-                    self.log_activity(f"🎵 Audio after clip: {'Yes' if clip.audio is not None else 'No'}")
-                
-                # Resize for shorts with audio preservation
-                resized_clip = self.resize_for_shorts(clip)
-                
-                # Debug after resize
-                self.log_activity(f"🎵 Audio after resize: {'Yes' if resized_clip.audio is not None else 'No'}")
-                
-                # Verify audio is still present
-                if has_audio and resized_clip.audio is None:
-                    self.log_activity("⚠️ Audio lost during processing, restoring...")
-                    resized_clip = resized_clip.set_audio(clip.audio)
-                    self.log_activity(f"🎵 Audio restored: {'Yes' if resized_clip.audio is not None else 'No'}")
-                
-                output_path = f"shorts/short_{video_id}.mp4"
-                os.makedirs("shorts", exist_ok=True)  # Ensure directory exists
-                
-                # Write with explicit audio settings
-                write_params = {
-                    'codec': 'libx264',
-                    'fps': 30,
-                    'verbose': False,
-                    'logger': None
-                }
-                
-                # Only add audio codec if audio exists
-                if resized_clip.audio is not None:
-                    write_params['audio_codec'] = 'aac'
-                    write_params['audio_bitrate'] = '128k'
-                    self.log_activity("🎵 Writing video with audio (AAC 128k)")
-                else:
-                    self.log_activity("🔇 Writing video without audio")
-                
-                resized_clip.write_videofile(output_path, **write_params)
-                
-                # Debug final output
-                if os.path.exists(output_path):
-                    self.debug_audio_info(output_path, "FINAL OUTPUT")
-                
-                return output_path
-                
-        except Exception as e:
-            self.log_activity(f"Short creation error: {e}")
-            return None
-    
-    def create_elly_reaction_short(self, video_path, video_id, elly_size=0.25, elly_position="top-right"):
-        """Create Elly reaction short with overlay and audio preservation"""
-        try:
-            from moviepy.editor import CompositeVideoClip, concatenate_videoclips
-            
-            # Check if Elly video exists
-            elly_path = "video/elly.mp4"
-            if not os.path.exists(elly_path):
-                self.log_activity("⚠️ Elly video not found, creating regular short")
-                return self.create_short(video_path, video_id)
-            
-            self.log_activity(f"🎬 Creating Elly reaction short: {video_id}")
-            
-            # Load videos
-            with VideoFileClip(video_path) as source_video:
-                with VideoFileClip(elly_path) as elly_video:
-                    
-                    # Check audio in source video
-                    has_source_audio = source_video.audio is not None
-                    has_elly_audio = elly_video.audio is not None
-                    self.log_activity(f"🎵 Source audio: {'Yes' if has_source_audio else 'No'}")
-                    self.log_activity(f"🎵 Elly audio: {'Yes' if has_elly_audio else 'No'}")
-                    
-                    # Determine duration (max 60 seconds for shorts)
-                    target_duration = min(60, source_video.duration)
-                    
-                    # Adjust source video duration
-                    if source_video.duration > target_duration:
-                        # Take middle section
-                        start_time = max(0, (source_video.duration - target_duration) / 2)
-                        source_adjusted = source_video.subclip(start_time, start_time + target_duration)
-                    else:
-                        source_adjusted = source_video
-                    
-                    # Adjust Elly video duration (remove audio from Elly to avoid conflict)
-                    if elly_video.duration < target_duration:
-                        # Loop Elly video if too short
-                        loop_count = int(target_duration / elly_video.duration) + 1
-                        clips = [elly_video.without_audio()] * loop_count  # Remove Elly audio
-                        elly_looped = concatenate_videoclips(clips, method="compose")
-                        elly_adjusted = elly_looped.subclip(0, target_duration)
-                    else:
-                        # Trim Elly video if too long
-                        start_time = max(0, (elly_video.duration - target_duration) / 2)
-                        elly_adjusted = elly_video.subclip(start_time, start_time + target_duration).without_audio()
-                    
-                    # Create background (source video fills screen) - preserve audio
-                    target_size = (1080, 1920)  # 9:16 aspect ratio
-                    background = self._create_background_for_shorts(source_adjusted, target_size)
-                    
-                    # Create Elly overlay (without audio)
-                    elly_overlay = self._create_elly_overlay(elly_adjusted, target_size, elly_size, elly_position)
-                    
-                    # Combine videos - background audio will be preserved
-                    final_video = CompositeVideoClip([background, elly_overlay], size=target_size)
-                    
-                    # Ensure original audio is preserved
-                    if has_source_audio and final_video.audio is None:
-                        self.log_activity("🎵 Restoring original audio...")
-                        final_video = final_video.set_audio(source_adjusted.audio)
-                    
-                    # Export
-                    os.makedirs("shorts", exist_ok=True)  # Ensure directory exists
-                    output_path = f"shorts/elly_short_{video_id}.mp4"
-                    
-                    # High quality settings for YouTube Shorts
-                    ffmpeg_params = ['-crf', '20', '-maxrate', '3000k', '-bufsize', '6000k']
-                    
-                    write_params = {
-                        'codec': 'libx264',
-                        'fps': 30,
-                        'preset': 'medium',
-                        'verbose': False,
-                        'logger': None,
-                        'ffmpeg_params': ffmpeg_params
-                    }
-                    
-                    # Add audio settings if audio exists
-                    if final_video.audio is not None:
-                        write_params['audio_codec'] = 'aac'
-                        write_params['audio_bitrate'] = '128k'
-                        self.log_activity("🎵 Writing Elly reaction with original audio")
-                    else:
-                        self.log_activity("🔇 Writing Elly reaction without audio")
-                    
-                    final_video.write_videofile(output_path, **write_params)
-                    
-                    self.log_activity(f"✅ Elly reaction short created: {output_path}")
-                    return output_path
-                    
-        except Exception as e:
-            self.log_activity(f"❌ Elly reaction creation error: {e}")
-            # Fallback to regular short
-            return self.create_short(video_path, video_id)
-    
-    def _create_background_for_shorts(self, video, target_size):
-        """Create background video that fills the screen for shorts"""
-        target_w, target_h = target_size
-        video_w, video_h = video.size
-        
-        # Calculate aspect ratios
-        video_aspect = video_w / video_h
-        target_aspect = target_w / target_h
-        
-        if video_aspect > target_aspect:
-            # Video is wider - fit by height, crop sides
-            new_height = target_h
-            new_width = int(new_height * video_aspect)
-            resized = video.resize((new_width, new_height))
-            
-            # Center crop horizontally
-            x_center = new_width / 2
-            x1 = x_center - target_w / 2
-            cropped = resized.crop(x1=x1, x2=x1 + target_w)
-        else:
-            # Video is taller - fit by width, crop top/bottom
-            new_width = target_w
-            new_height = int(new_width / video_aspect)
-            resized = video.resize((new_width, new_height))
-            
-            # Center crop vertically
-            y_center = new_height / 2
-            y1 = y_center - target_h / 2
-            cropped = resized.crop(y1=y1, y2=y1 + target_h)
-        
-        return cropped
-    
-    def _create_elly_overlay(self, elly_video, target_size, elly_size, position):
-        """Create Elly overlay with custom position and size"""
-        target_w, target_h = target_size
-        
-        # Calculate Elly size
-        elly_width = int(target_w * elly_size)
-        elly_height = int(elly_width * elly_video.h / elly_video.w)
-        
-        # Resize Elly
-        elly_resized = elly_video.resize((elly_width, elly_height))
-        
-        # Calculate position
-        margin = 20
-        
-        if position == "top-right":
-            x_pos = target_w - elly_width - margin
-            y_pos = margin
-        elif position == "top-left":
-            x_pos = margin
-            y_pos = margin
-        elif position == "bottom-right":
-            x_pos = target_w - elly_width - margin
-            y_pos = target_h - elly_height - margin
-        elif position == "bottom-left":
-            x_pos = margin
-            y_pos = target_h - elly_height - margin
-        else:
-            # Default to top-right
-            x_pos = target_w - elly_width - margin
-            y_pos = margin
-        
-        # Set position
-        elly_positioned = elly_resized.set_position((x_pos, y_pos))
-        
-        return elly_positioned
-
-    def debug_audio_info(self, video_path, stage=""):
-        """Debug function to log audio information"""
-        try:
-            with VideoFileClip(video_path) as video:
-                has_audio = video.audio is not None
-                duration = video.duration
-                size = video.size
-                
-                audio_info = "No audio"
-                if has_audio:
-                    audio_duration = video.audio.duration
-                    audio_info = f"Audio duration: {audio_duration:.2f}s"
-                
-                self.log_activity(f"🔍 {stage} - {os.path.basename(video_path)}")
-                self.log_activity(f"   📊 Video: {duration:.2f}s, {size[0]}x{size[1]}")
-                self.log_activity(f"   🎵 {audio_info}")
-                
-                return has_audio
-        except Exception as e:
-            self.log_activity(f"❌ Audio debug error: {e}")
-            return False
-
-    def resize_for_shorts(self, clip):
-        """Resize video for 9:16 format with audio preservation"""
-        target_width, target_height = 1080, 1920
-        current_width, current_height = clip.size
-        current_ratio = current_width / current_height
-        target_ratio = target_width / target_height
-        
-        # Store original audio
-        original_audio = clip.audio
-        
-        if current_ratio > target_ratio:
-            new_width = int(current_height * target_ratio)
-            x_center = current_width // 2
-            x1 = x_center - new_width // 2
-            x2 = x_center + new_width // 2
-            clip = clip.crop(x1=x1, x2=x2)
-        else:
-            new_height = int(current_width / target_ratio)
-            y_center = current_height // 2
-            y1 = y_center - new_height // 2
-            y2 = y_center + new_height // 2
-            clip = clip.crop(y1=y1, y2=y2)
-        
-        # Resize and ensure audio is preserved
-        resized_clip = clip.resize((target_width, target_height))
-        
-        # Explicitly set audio if it exists
-        if original_audio is not None:
-            resized_clip = resized_clip.set_audio(original_audio)
-        
-        return resized_clip
-
-    def download_video_enhanced(self, video_id):
-        """Download video using yt-dlp"""
-        try:
-            output_path = os.path.join(self.download_dir, f"{video_id}.%(ext)s")
-            
-            ydl_opts = {
-                'format': 'best[height<=720]',
-                'outtmpl': output_path,
-                'quiet': True,
-                'no_warnings': True,
-            }
-            
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([f"https://www.youtube.com/watch?v={video_id}"])
-            
-            # Find the downloaded file
-            for ext in ['mp4', 'webm', 'mkv']:
-                file_path = os.path.join(self.download_dir, f"{video_id}.{ext}")
-                if os.path.exists(file_path):
-                    return file_path
-            
-            return None
-        except Exception as e:
-            self.log_activity(f"Download error: {e}")
-            return None
-
-    def generate_description(self, video_data, category):
-        """Generate description for video"""
-        return f"""🎬 {video_data.get('title', 'Amazing Video')}
-
-📊 Category: {category.title()}
-🔥 Trending content curated by AI
-
-#shorts #viral #trending #{category}"""
-
-    def authenticate_youtube(self):
-        """Production-ready YouTube authentication (no browser required)"""
-        SCOPES = ['https://www.googleapis.com/auth/youtube.upload']
-        creds = None
-        token_file = 'credentials/token.pickle'
-        
-        # Try to load existing credentials
-        if os.path.exists(token_file):
-            try:
-                with open(token_file, 'rb') as token:
-                    creds = pickle.load(token)
-            except:
-                creds = None
-        
-        # Check if credentials are valid
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                try:
-                    creds.refresh(Request())
-                except Exception as e:
-                    self.log_activity(f"❌ Token refresh failed: {e}")
-                    creds = None
-            
-            # If no valid credentials, try to create from environment variables
-            if not creds:
-                refresh_token = os.getenv('YOUTUBE_REFRESH_TOKEN')
-                
-                if refresh_token and self.client_id and self.client_secret:
-                    try:
-                        # Create credentials from refresh token
-                        creds = Credentials(
-                            token=None,
-                            refresh_token=refresh_token,
-                            token_uri='https://oauth2.googleapis.com/token',
-                            client_id=self.client_id,
-                            client_secret=self.client_secret,
-                            scopes=SCOPES
-                        )
-                        
-                        # Refresh to get access token
-                        creds.refresh(Request())
-                        
-                        # Save credentials for future use
-                        os.makedirs('credentials', exist_ok=True)
-                        with open(token_file, 'wb') as token:
-                            pickle.dump(creds, token)
-                        
-                        self.log_activity("✅ YouTube authentication successful")
-                        
-                    except Exception as e:
-                        self.log_activity(f"❌ Authentication from refresh token failed: {e}")
-                        return False
-                else:
-                    self.log_activity("❌ No refresh token found in environment variables")
-                    self.log_activity("💡 Add YOUTUBE_REFRESH_TOKEN to your Render environment")
-                    return False
-        
-        try:
-            # Use existing authenticated service if available
-            if hasattr(self, 'upload_youtube') and self.upload_youtube:
-                return True
-                
-            # Otherwise get new credentials
-            creds = get_youtube_credentials()
-            if creds:
-                self.upload_youtube = build('youtube', 'v3', credentials=creds)
-                return True
-            else:
-                print("❌ Failed to get YouTube credentials")
-                return False
-        except Exception as e:
-            self.log_activity(f"❌ YouTube service build failed: {e}")
-            return False
-
-    def upload_to_youtube(self, video_path, title, description):
-        """Upload video to YouTube"""
-        if not self.upload_youtube:
-            if not self.authenticate_youtube():
-                return False
-        
-        try:
-            body = {
-                'snippet': {
-                    'title': title,
-                    'description': description,
-                    'tags': ['shorts', 'viral', 'trending', 'fyp'],
-                    'categoryId': '24'
-                },
-                'status': {
-                    'privacyStatus': 'public',
-                    'selfDeclaredMadeForKids': False
-                }
-            }
-            
-            media = MediaFileUpload(video_path, chunksize=-1, resumable=True)
-            request = self.upload_youtube.videos().insert(
-                part=','.join(body.keys()),
-                body=body,
-                media_body=media
-            )
-            
-            response = request.execute()
-            return f"https://www.youtube.com/watch?v={response['id']}"
-            
-        except Exception as e:
-            error_str = str(e)
-            if "uploadLimitExceeded" in error_str:
-                self.log_activity("⚠️ YouTube daily upload limit exceeded")
-                self.log_activity("💡 Limit will reset in 24 hours")
-                # Don't retry if upload limit exceeded
-                return "UPLOAD_LIMIT_EXCEEDED"
-            else:
-                self.log_activity(f"Upload error: {e}")
-                return False
-
-    def cleanup(self, *files):
-        """Clean up temporary files"""
-        for file in files:
-            try:
-                if file and os.path.exists(file):
-                    os.remove(file)
-            except:
-                pass
-
-    def process_scheduled_upload(self, category='shorts'):
-        """Process scheduled upload with ELLY REACTION SHORTS"""
-        if not self.bot_active:
-            return False
-        
-        # Check daily limit
-        today_uploads = self.get_today_uploads()
-        if today_uploads >= 10:
-            self.log_activity("Daily limit reached (10 videos)")
-            return False
-        
-        self.log_activity(f"🎬 Creating Elly reaction short...")
-        
-        # Get shorts data
-        videos = self.get_real_youtube_data()
-        if not videos:
-            self.log_activity("❌ No shorts available")
-            return False
-        
-        for video in videos:
-            if self.check_duplicate(video):
-                continue
-            
-            # Try to download and create reaction
-            try:
-                original_video_path = self.download_video_enhanced(video['id'])
-                if original_video_path and os.path.exists(original_video_path):
-                    
-                    # Create Elly reaction short
-                    reaction_video_path = self.create_elly_reaction_short(original_video_path, video['id'])
-                    
-                    if reaction_video_path and os.path.exists(reaction_video_path):
-                        # Generate reaction title and description
-                        title = f"Elly Reacts to {video['title'][:30]}... 😱🔥"
-                        description = f"""🎬 Elly's Reaction to: {video['title']}
-
-👩 Watch Elly's genuine reaction to this viral short!
-🔥 Original by: {video['channel']}
-
-#EllyReacts #Reaction #Shorts #Viral #Trending"""
-                        
-                        # Upload reaction to YouTube
-                        upload_url = self.upload_to_youtube(reaction_video_path, title, description)
-                        
-                        if upload_url and upload_url != "UPLOAD_LIMIT_EXCEEDED":
-                            # Save successful upload
-                            video['youtube_url'] = upload_url
-                            video['title'] = title
-                            video['description'] = description
-                            video['reaction_created'] = True
-                            self.save_video_with_stats(video)
-                            self.save_processed_video(video)
-                            self.update_stats('reaction')
-                            
-                            self.log_activity(f"✅ ELLY REACTION UPLOADED: {title[:40]}...")
-                            self.log_activity(f"📺 URL: {upload_url}")
-                            
-                            # Clean up
-                            self.cleanup(original_video_path, reaction_video_path)
-                            return True
-                        elif upload_url == "UPLOAD_LIMIT_EXCEEDED":
-                            self.log_activity("⚠️ Upload limit exceeded - stopping uploads")
-                            return False
-                        else:
-                            self.log_activity(f"❌ Upload failed for reaction: {title[:40]}...")
-                    else:
-                        self.log_activity(f"❌ Reaction creation failed for: {video['title'][:40]}...")
-                else:
-                    self.log_activity(f"❌ Download failed for: {video['title'][:40]}...")
-            except Exception as e:
-                self.log_activity(f"❌ Error processing reaction: {e}")
-                continue
-        
-        return False
-
-    def test_enhanced_features(self):
-        """Simple feature test - no spam"""
-        self.log_activity("🧪 Features ready - Download system active")
-        return True  # Skip actual testing to avoid spam
-    
-    def run_24x7(self):
-        """Run bot 24/7 without manual intervention"""
-        self.log_activity("🚀 Starting 24/7 autonomous operation")
-        
-        # Skip test upload - start direct video uploads immediately
-        self.test_upload_success = True
-        self.bot_active = True
-        self.log_activity("✅ Bot activated - uploading real videos directly")
-        
-        # Immediate first reaction upload
-        self.log_activity("🎬 Creating first Elly reaction short...")
-        self.process_scheduled_upload('shorts')
-        
-        # Schedule times for reaction shorts
-        schedule_times = {
-            'shorts': ['08:00', '10:00', '12:00', '14:00', '16:00', '18:00', '20:00', '22:00']
-        }
-        
-        self.log_activity("📅 Schedule configured - Bot running autonomously")
-        
-        # Main loop
-        last_upload_time = {}
-        
-        while True:
-            try:
-                current_time = datetime.now().strftime('%H:%M')
-                current_hour = datetime.now().hour
-                
-                # Process scheduled uploads
-                for category, times in schedule_times.items():
-                    if current_time in times:
-                        last_key = f"{category}_{current_time}"
-                        if last_key not in last_upload_time or \
-                           (datetime.now() - last_upload_time[last_key]).seconds > 3600:
-                            self.process_scheduled_upload(category)
-                            last_upload_time[last_key] = datetime.now()
-                
-                # Random upload chance (10% every hour)
-                if random.random() < 0.1 and self.get_today_uploads() < 10:
-                    category = random.choice(['tech', 'entertainment'])
-                    self.log_activity(f"🎲 Random {category} upload triggered")
-                    self.process_scheduled_upload(category)
-                
-                # Reset daily stats at midnight
-                if current_time == '00:00':
-                    self.log_activity("🔄 Daily reset")
-                
-                # Status update every hour
-                if datetime.now().minute == 0:
-                    uploads = self.get_today_uploads()
-                    self.log_activity(f"📊 Hourly status: {uploads}/10 uploads today")
-                
-                # Sleep for 1 minute
-                time.sleep(60)
-                
-            except Exception as e:
-                self.log_activity(f"Error in main loop: {e}")
-                time.sleep(300)  # Wait 5 minutes on error
-
-# Global bot instance - Initialize immediately for dashboard
-bot_instance = None
-
-# Removed start_flask - will handle directly in main
-
-def start_bot_background():
-    """Start bot in background thread for Render"""
-def start_bot_background():
-    """Start bot in background thread"""
-    try:
-        if bot_instance and hasattr(bot_instance, 'run_24x7'):
-            print("🤖 Starting autonomous bot in background...")
-            bot_instance.run_24x7()
-    except Exception as e:
-        print(f"Bot background error: {e}")
-
-if __name__ == "__main__":
-    import socket
-    
-    print("🚀 Starting YouTube Automation Bot...")
-    
-    # Check environment setup first
-    if not check_environment_setup():
-        print("❌ Environment setup incomplete. Exiting...")
-        exit(1)
-    
-    print("✅ Environment check passed")
-    
-    # Check if running on Render
-    is_render = os.environ.get('RENDER') or os.environ.get('RENDER_SERVICE_ID')
-    port = int(os.environ.get('PORT', 10000))
-    
-    if is_render:
-        print("🚀 STARTING ON RENDER.COM")
-        print("="*50)
-        print("🌐 YouTube Automation Dashboard")
-        print("="*50)
-    else:
-        print("\n" + "="*70)
-        print("🤖 YOUTUBE AUTOMATION DASHBOARD")
-        print("="*70)
-    
-    # Initialize bot instance
-    print("⚙️  Initializing system...")
-    try:
-        bot_instance = AutoYouTubeBot()
-        print("✅ Bot instance created successfully")
-        
-        # Start bot in background thread - NO TEST UPLOAD
-        if bot_instance:
-            if bot_instance.youtube_api_key and bot_instance.client_id:
-                print("🚀 Starting bot with direct video uploads")
-                bot_thread = threading.Thread(target=start_bot_background, daemon=True)
-                bot_thread.start()
-            else:
-                print("⚠️ Missing API credentials - dashboard only mode")
-            
-    except Exception as e:
-        print(f"⚠️  Bot initialization error: {e}")
-        print("🔄 Starting in dashboard-only mode...")
-        bot_instance = None
-    
-    if is_render:
-        print("✅ RENDER DEPLOYMENT READY!")
-        print(f"🌐 Dashboard will be available on your Render URL")
-        print("📊 Features: Real-time stats, Video management, CRUD operations")
-        print("="*50)
-    else:
-        # Get network info for local development
-        hostname = socket.gethostname()
-        try:
-            local_ip = socket.gethostbyname(hostname)
-        except:
-            local_ip = "127.0.0.1"
-        
-        print("\n" + "="*70)
-        print("✅ DASHBOARD STARTING!")
-        print("="*70)
-        print(f"\n🌐 Dashboard URLs:")
-        print(f"   📱 Primary:   http://127.0.0.1:{port}")
-        print(f"   💻 Local:     http://localhost:{port}")
-        print(f"   🌍 Network:   http://{local_ip}:{port}")
-        print("\n📊 Features:")
-        print("   • Real-time YouTube data")
-        print("   • Video management & CRUD")
-        print("   • Professional dashboard")
-        print("   • Mobile responsive")
-        print("="*70)
-    
-    # Start Flask server
-    try:
-        if is_render:
-            # Render production mode
-            app.run(
-                host='0.0.0.0', 
-                port=port, 
-                debug=False, 
-                use_reloader=False,
-                threaded=True
-            )
-        else:
-            # Local development mode
-            print(f"\n🚀 Starting server on port {port}...")
-            app.run(
-                host='0.0.0.0', 
-                port=port, 
-                debug=False, 
-                use_reloader=False,
-                threaded=True
-            )
-    except Exception as e:
-        print(f"\n❌ Server error: {e}")
-        if not is_render:
-            print("\n🔧 Try:")
-            print("1. Close other programs using the port")
-            print("2. Run as administrator")
-            print("3. Check firewall settings")#!/usr/bin/env python3
-"""
-Fully Autonomous YouTube Bot - No Manual Intervention Required
-- Automatic test upload on start
-- 24/7 operation without terminal
-- Advanced duplicate prevention
-- Smart title/description generation
-- Advanced web dashboard
-"""
-
-import os
-import random
-import time
-import json
-import pickle
-import sqlite3
-import hashlib
-import threading
-from datetime import datetime, timedelta
-from dotenv import load_dotenv
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-import yt_dlp
-from moviepy.editor import VideoFileClip
-import requests
-from flask import Flask, jsonify, render_template_string, request
-
-load_dotenv()
-
-# Flask app for server health checks and dashboard
-app = Flask(__name__)
-
-# Modern Professional Dashboard
-DASHBOARD_HTML = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>YouTube Automation Dashboard</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: #f8fafc;
-            color: #1a202c;
-            line-height: 1.6;
-        }
-        
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-        }
-        
-        .header {
-            background: white;
-            border-radius: 12px;
-            padding: 24px;
-            margin-bottom: 24px;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-            border: 1px solid #e2e8f0;
-        }
-        
-        .header-content {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-        
-        .header h1 {
-            font-size: 24px;
-            font-weight: 600;
-            color: #2d3748;
-            display: flex;
-            align-items: center;
-            gap: 12px;
-        }
-        
-        .status-badge {
-            padding: 6px 12px;
-            border-radius: 20px;
-            font-size: 12px;
-            font-weight: 500;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }
-        
-        .status-active {
-            background: #10b981;
-            color: white;
-        }
-        
-        .status-inactive {
-            background: #ef4444;
-            color: white;
-        }
-        
-        .stats-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 20px;
-            margin-bottom: 32px;
-        }
-        
-        .stat-card {
-            background: white;
-            border-radius: 12px;
-            padding: 24px;
-            border: 1px solid #e2e8f0;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-        }
-        
-        .stat-header {
-            display: flex;
-            align-items: center;
-            gap: 8px;
-            margin-bottom: 12px;
-        }
-        
-        .stat-icon {
-            font-size: 20px;
-        }
-        
-        .stat-label {
-            font-size: 14px;
-            color: #64748b;
-            font-weight: 500;
-        }
-        
-        .stat-number {
-            font-size: 32px;
-            font-weight: 700;
-            color: #1e293b;
-            margin-bottom: 4px;
-        }
-        
-        .stat-change {
-            font-size: 12px;
-            color: #10b981;
-            font-weight: 500;
-        }
-        
-        .main-content {
-            background: white;
-            border-radius: 12px;
-            border: 1px solid #e2e8f0;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-        }
-        
-        .content-header {
-            padding: 24px;
-            border-bottom: 1px solid #e2e8f0;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-        
-        .content-title {
-            font-size: 18px;
-            font-weight: 600;
-            color: #1e293b;
-        }
-        
-        .toolbar {
-            display: flex;
-            gap: 8px;
-            align-items: center;
-        }
-        
-        .btn {
-            padding: 8px 16px;
-            border: 1px solid #d1d5db;
-            border-radius: 8px;
-            background: white;
-            color: #374151;
-            font-size: 14px;
-            font-weight: 500;
-            cursor: pointer;
-            transition: all 0.2s;
-        }
-        
-        .btn:hover {
-            background: #f9fafb;
-            border-color: #9ca3af;
-        }
-        
-        .btn.active {
-            background: #3b82f6;
-            color: white;
-            border-color: #3b82f6;
-        }
-        
-        .btn-primary {
-            background: #3b82f6;
-            color: white;
-            border-color: #3b82f6;
-        }
-        
-        .btn-primary:hover {
-            background: #2563eb;
-        }
-        
-        .video-list {
-            padding: 0;
-        }
-        
-        .video-item {
-            display: flex;
-            align-items: center;
-            padding: 16px 24px;
-            border-bottom: 1px solid #f1f5f9;
-            transition: background 0.2s;
-        }
-        
-        .video-item:hover {
-            background: #f8fafc;
-        }
-        
-        .video-item:last-child {
-            border-bottom: none;
-        }
-        
-        .video-thumbnail {
-            width: 120px;
-            height: 68px;
-            border-radius: 8px;
-            background: #f1f5f9;
-            margin-right: 16px;
-            overflow: hidden;
-            flex-shrink: 0;
-        }
-        
-        .video-thumbnail img {
-            width: 100%;
-            height: 100%;
-            object-fit: cover;
-        }
-        
-        .video-placeholder {
-            width: 100%;
-            height: 100%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            font-weight: 600;
-            font-size: 14px;
-        }
-        
-        .video-content {
-            flex: 1;
-            min-width: 0;
-        }
-        
-        .video-title {
-            font-size: 16px;
-            font-weight: 600;
-            color: #1e293b;
-            margin-bottom: 4px;
-            line-height: 1.4;
-            display: -webkit-box;
-            -webkit-line-clamp: 2;
-            -webkit-box-orient: vertical;
-            overflow: hidden;
-        }
-        
-        .video-meta {
-            display: flex;
-            align-items: center;
-            gap: 16px;
-            margin-bottom: 8px;
-        }
-        
-        .meta-item {
-            font-size: 13px;
-            color: #64748b;
-            display: flex;
-            align-items: center;
-            gap: 4px;
-        }
-        
-        .category-badge {
-            padding: 2px 8px;
-            border-radius: 12px;
-            font-size: 11px;
-            font-weight: 500;
-            text-transform: uppercase;
-        }
-        
-        .category-tech {
-            background: #dbeafe;
-            color: #1d4ed8;
-        }
-        
-        .category-entertainment {
-            background: #fce7f3;
-            color: #be185d;
-        }
-        
-        .video-stats {
-            display: flex;
-            gap: 16px;
-            margin-top: 8px;
-        }
-        
-        .stat-item {
-            font-size: 13px;
-            color: #64748b;
-            display: flex;
-            align-items: center;
-            gap: 4px;
-        }
-        
-        .video-actions {
-            display: flex;
-            gap: 8px;
-            margin-left: 16px;
-        }
-        
-        .action-btn {
-            padding: 6px 12px;
-            border: 1px solid #d1d5db;
-            border-radius: 6px;
-            background: white;
-            color: #374151;
-            font-size: 12px;
-            font-weight: 500;
-            cursor: pointer;
-            transition: all 0.2s;
-            text-decoration: none;
-            display: flex;
-            align-items: center;
-            gap: 4px;
-        }
-        
-        .action-btn:hover {
-            background: #f9fafb;
-        }
-        
-        .action-btn.watch {
-            color: #3b82f6;
-            border-color: #3b82f6;
-        }
-        
-        .action-btn.edit {
-            color: #10b981;
-            border-color: #10b981;
-        }
-        
-        .action-btn.refresh {
-            color: #f59e0b;
-            border-color: #f59e0b;
-        }
-        
-        .action-btn.delete {
-            color: #ef4444;
-            border-color: #ef4444;
-        }
-        
-        .empty-state {
-            text-align: center;
-            padding: 48px 24px;
-            color: #64748b;
-        }
-        
-        .empty-icon {
-            font-size: 48px;
-            margin-bottom: 16px;
-            opacity: 0.5;
-        }
-        
-        .loading {
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            padding: 48px;
-            color: #64748b;
-        }
-        
-        .spinner {
-            width: 20px;
-            height: 20px;
-            border: 2px solid #e5e7eb;
-            border-top: 2px solid #3b82f6;
-            border-radius: 50%;
-            animation: spin 1s linear infinite;
-            margin-right: 12px;
-        }
-        
-        @keyframes spin {
-            0% { transform: rotate(0deg); }
-            100% { transform: rotate(360deg); }
-        }
-        
-        .refresh-fab {
-            position: fixed;
-            bottom: 24px;
-            right: 24px;
-            width: 56px;
-            height: 56px;
-            background: #3b82f6;
-            border: none;
-            border-radius: 50%;
-            color: white;
-            font-size: 20px;
-            cursor: pointer;
-            box-shadow: 0 4px 12px rgba(59, 130, 246, 0.4);
-            transition: all 0.3s;
-            z-index: 1000;
-        }
-        
-        .refresh-fab:hover {
-            transform: scale(1.1);
-            box-shadow: 0 6px 20px rgba(59, 130, 246, 0.6);
-        }
-        
-        @media (max-width: 768px) {
-            .container {
-                padding: 16px;
-            }
-            
-            .header-content {
-                flex-direction: column;
-                gap: 16px;
-                align-items: flex-start;
-            }
-            
-            .stats-grid {
-                grid-template-columns: 1fr;
-            }
-            
-            .content-header {
-                flex-direction: column;
-                gap: 16px;
-                align-items: flex-start;
-            }
-            
-            .toolbar {
-                flex-wrap: wrap;
-            }
-            
-            .video-item {
-                flex-direction: column;
-                align-items: flex-start;
-                gap: 12px;
-            }
-            
-            .video-thumbnail {
-                width: 100%;
-                height: 180px;
-                margin-right: 0;
-            }
-            
-            .video-actions {
-                margin-left: 0;
-                width: 100%;
-                justify-content: flex-end;
-            }
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <div class="header-content">
-                <h1>
-                    🎬 YouTube Automation
-                    <span class="status-badge" id="botStatus">Loading...</span>
-                </h1>
-            </div>
-        </div>
-        
-        <div class="stats-grid">
-            <div class="stat-card">
-                <div class="stat-header">
-                    <span class="stat-icon">📊</span>
-                    <span class="stat-label">Total Videos</span>
-                </div>
-                <div class="stat-number" id="totalUploads">0</div>
-                <div class="stat-change">All time uploads</div>
-            </div>
-            
-            <div class="stat-card">
-                <div class="stat-header">
-                    <span class="stat-icon">📅</span>
-                    <span class="stat-label">Today</span>
-                </div>
-                <div class="stat-number" id="todayUploads">0</div>
-                <div class="stat-change">Daily uploads</div>
-            </div>
-            
-            <div class="stat-card">
-                <div class="stat-header">
-                    <span class="stat-icon">🔧</span>
-                    <span class="stat-label">Technology</span>
-                </div>
-                <div class="stat-number" id="techVideos">0</div>
-                <div class="stat-change">Tech category</div>
-            </div>
-            
-            <div class="stat-card">
-                <div class="stat-header">
-                    <span class="stat-icon">🎭</span>
-                    <span class="stat-label">Entertainment</span>
-                </div>
-                <div class="stat-number" id="entertainmentVideos">0</div>
-                <div class="stat-change">Entertainment category</div>
-            </div>
-        </div>
-        
-        <div class="main-content">
-            <div class="content-header">
-                <h2 class="content-title">Video Library</h2>
-                <div class="toolbar">
-                    <button class="btn active" onclick="filterVideos('all')">All</button>
-                    <button class="btn" onclick="filterVideos('tech')">Tech</button>
-                    <button class="btn" onclick="filterVideos('entertainment')">Entertainment</button>
-                    <button class="btn" onclick="filterVideos('today')">Today</button>
-                    <button class="btn btn-primary" onclick="refreshAllStats()">Refresh All</button>
-                </div>
-            </div>
-            
-            <div class="video-list" id="videosGrid">
-                <div class="loading">
-                    <div class="spinner"></div>
-                    Loading videos...
-                </div>
-            </div>
-        </div>
-    </div>
-    
-    <button class="refresh-fab" onclick="refreshData()" title="Refresh Data">
-        🔄
-    </button>
-    
-    <script>
-        let allVideos = [];
-        let currentFilter = 'all';
-        
-        function timeAgo(date) {
-            const seconds = Math.floor((new Date() - new Date(date)) / 1000);
-            
-            const intervals = {
-                year: 31536000,
-                month: 2592000,
-                week: 604800,
-                day: 86400,
-                hour: 3600,
-                minute: 60
-            };
-            
-            for (const [unit, secondsInUnit] of Object.entries(intervals)) {
-                const interval = Math.floor(seconds / secondsInUnit);
-                if (interval >= 1) {
-                    return interval === 1 ? `1 ${unit} ago` : `${interval} ${unit}s ago`;
-                }
-            }
-            
-            return 'Just now';
-        }
-        
-        function formatNumber(num) {
-            if (num >= 1000000) {
-                return (num / 1000000).toFixed(1) + 'M';
-            } else if (num >= 1000) {
-                return (num / 1000).toFixed(1) + 'K';
-            }
-            return num.toString();
-        }
-        
-        async function editVideo(videoId) {
-            const newTitle = prompt('Enter new title:');
-            const newDescription = prompt('Enter new description:');
-            const newCategory = prompt('Enter category (tech/entertainment):');
-            
-            if (newTitle && newDescription && newCategory) {
-                try {
-                    const response = await fetch(`/api/videos/${videoId}`, {
-                        method: 'PUT',
-                        headers: {
-                            'Content-Type': 'application/json',
-                        },
-                        body: JSON.stringify({
-                            title: newTitle,
-                            description: newDescription,
-                            category: newCategory
-                        })
-                    });
-                    
-                    const result = await response.json();
-                    
-                    if (result.success) {
-                        alert('Video updated successfully!');
-                        fetchData(); // Refresh data
-                    } else {
-                        alert('Error: ' + result.error);
-                    }
-                } catch (error) {
-                    alert('Error updating video: ' + error.message);
-                }
-            }
-        }
-        
-        async function deleteVideo(videoId) {
-            if (confirm('Are you sure you want to delete this video from tracking?')) {
-                try {
-                    const response = await fetch(`/api/videos/${videoId}`, {
-                        method: 'DELETE'
-                    });
-                    
-                    const result = await response.json();
-                    
-                    if (result.success) {
-                        alert('Video deleted successfully!');
-                        fetchData(); // Refresh data
-                    } else {
-                        alert('Error: ' + result.error);
-                    }
-                } catch (error) {
-                    alert('Error deleting video: ' + error.message);
-                }
-            }
-        }
-        
-        async function refreshVideoStats(videoId) {
-            try {
-                const response = await fetch(`/api/videos/${videoId}`);
-                const result = await response.json();
-                
-                if (result.id) {
-                    alert(`Stats updated!\nViews: ${formatNumber(result.views)}\nLikes: ${formatNumber(result.likes)}\nComments: ${formatNumber(result.comments)}`);
-                    fetchData(); // Refresh data
-                } else {
-                    alert('Error: ' + result.error);
-                }
-            } catch (error) {
-                alert('Error refreshing stats: ' + error.message);
-            }
-        }
-        
-        async function refreshAllStats() {
-            if (confirm('Refresh stats for all videos? This may take a moment.')) {
-                try {
-                    const response = await fetch('/api/videos/refresh-stats', {
-                        method: 'POST'
-                    });
-                    
-                    const result = await response.json();
-                    
-                    if (result.success) {
-                        alert(result.message);
-                        fetchData(); // Refresh data
-                    } else {
-                        alert('Error: ' + result.error);
-                    }
-                } catch (error) {
-                    alert('Error refreshing all stats: ' + error.message);
-                }
-            }
-        }
-        
-        function filterVideos(filter) {
-            currentFilter = filter;
-            
-            // Update button states
-            document.querySelectorAll('.btn').forEach(btn => {
-                btn.classList.remove('active');
-            });
-            event.target.classList.add('active');
-            
-            // Filter videos
-            let filteredVideos = allVideos;
-            
-            if (filter === 'tech') {
-                filteredVideos = allVideos.filter(v => v.category === 'tech');
-            } else if (filter === 'entertainment') {
-                filteredVideos = allVideos.filter(v => v.category === 'entertainment');
-            } else if (filter === 'today') {
-                const today = new Date().toDateString();
-                filteredVideos = allVideos.filter(v => 
-                    new Date(v.upload_date).toDateString() === today
-                );
-            }
-            
-            displayVideos(filteredVideos);
-        }
-        
-        function displayVideos(videos) {
-            const grid = document.getElementById('videosGrid');
-            
-            if (videos.length === 0) {
-                grid.innerHTML = `
-                    <div class="empty-state">
-                        <div class="empty-icon">📺</div>
-                        <h3>No videos available</h3>
-                        <p>Real-time YouTube videos will appear here when API is connected and videos are uploaded</p>
-                        <p style="margin-top: 10px; color: #64748b; font-size: 14px;">
-                            💡 Add your YouTube API key in .env file to see real data
-                        </p>
-                    </div>
-                `;
-                return;
-            }
-            
-            grid.innerHTML = videos.map((video, index) => {
-                const categoryClass = video.category === 'tech' ? 'category-tech' : 'category-entertainment';
-                const categoryIcon = video.category === 'tech' ? '🔧' : '🎭';
-                
-                return `
-                    <div class="video-item" data-video-id="${video.id || video.video_id || 'unknown'}">
-                        <div class="video-thumbnail">
-                            ${video.thumbnail ? 
-                                `<img src="${video.thumbnail}" alt="Thumbnail">` : 
-                                `<div class="video-placeholder">#${videos.length - index}</div>`
-                            }
-                        </div>
-                        <div class="video-content">
-                            <div class="video-title">${video.title}</div>
-                            <div class="video-meta">
-                                <span class="meta-item">
-                                    📅 ${new Date(video.upload_date).toLocaleDateString()}
-                                </span>
-                                <span class="meta-item">
-                                    ⏰ ${timeAgo(video.upload_date)}
-                                </span>
-                                <span class="category-badge ${categoryClass}">
-                                    ${categoryIcon} ${video.category}
-                                </span>
-                                ${video.channel ? `<span class="meta-item">📺 ${video.channel}</span>` : ''}
-                            </div>
-                            <div class="video-stats">
-                                <span class="stat-item">👁️ ${formatNumber(video.views || 0)}</span>
-                                <span class="stat-item">👍 ${formatNumber(video.likes || 0)}</span>
-                                <span class="stat-item">💬 ${formatNumber(video.comments || 0)}</span>
-                            </div>
-                        </div>
-                        <div class="video-actions">
-                            <a href="${video.youtube_url}" target="_blank" class="action-btn watch">
-                                ▶️ Watch
-                            </a>
-                            <button class="action-btn edit" onclick="editVideo('${video.id || video.video_id}')">
-                                ✏️ Edit
-                            </button>
-                            <button class="action-btn refresh" onclick="refreshVideoStats('${video.id || video.video_id}')">
-                                🔄 Stats
-                            </button>
-                            <button class="action-btn delete" onclick="deleteVideo('${video.id || video.video_id}')">
-                                🗑️ Delete
-                            </button>
-                        </div>
-                    </div>
-                `;
-            }).join('');
-        }
-        
-        async function fetchData() {
-            try {
-                const response = await fetch('/api/dashboard');
-                const data = await response.json();
-                
-                // Update status
-                const statusBadge = document.getElementById('botStatus');
-                if (data.bot_status === 'active') {
-                    statusBadge.textContent = 'ACTIVE';
-                    statusBadge.className = 'status-badge status-active';
-                } else {
-                    statusBadge.textContent = 'INACTIVE';
-                    statusBadge.className = 'status-badge status-inactive';
-                }
-                
-                // Update stats
-                document.getElementById('totalUploads').textContent = data.total_uploads;
-                document.getElementById('todayUploads').textContent = data.today_uploads;
-                document.getElementById('techVideos').textContent = data.tech_count;
-                document.getElementById('entertainmentVideos').textContent = data.entertainment_count;
-                
-                // Update progress bar
-                const progress = (data.today_uploads / 10) * 100;
-                document.getElementById('uploadProgress').style.width = `${progress}%`;
-                
-                // Store and display videos
-                allVideos = data.videos;
-                filterVideos(currentFilter);
-                
-            } catch (error) {
-                console.error('Error fetching data:', error);
-            }
-        }
-        
-        function refreshData() {
-            const btn = document.querySelector('.refresh-fab');
-            btn.style.transform = 'rotate(360deg) scale(1.1)';
-            fetchData();
-            setTimeout(() => {
-                btn.style.transform = '';
-            }, 500);
-        }
-        
-        // Initial load
-        fetchData();
-        
-        // Auto-refresh every 30 seconds
-        setInterval(fetchData, 30000);
-        
-        // Keyboard shortcuts
-        document.addEventListener('keydown', (e) => {
-            if (e.key === 'r' && e.ctrlKey) {
-                e.preventDefault();
-                refreshData();
-            }
-        });
-    </script>
-</body>
-</html>
-"""
-
-# CRITICAL: Remove ANY other route that might be on '/'
-# Dashboard MUST be the ONLY route on '/'
-@app.route('/', methods=['GET'])
-def show_dashboard():
-    """Main dashboard - MUST return HTML, NOT JSON"""
-    # Force return HTML dashboard
-    return DASHBOARD_HTML  # Direct HTML return, no template rendering issues
-
-@app.route('/api/dashboard')
-def api_dashboard():
-    """API endpoint for dashboard data - returns JSON for AJAX calls"""
-    try:
-        # Always show active status and real data
-        response_data = {
-            "bot_status": "active",
-            "test_status": "success", 
-            "total_uploads": 0,
-            "today_uploads": 0,
-            "tech_count": 0,
-            "entertainment_count": 0,
-            "videos": [],
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        # If no bot instance, get real YouTube data directly
-        if 'bot_instance' not in globals() or bot_instance is None:
-            # Create temporary bot instance just for data
-            try:
-                temp_bot = AutoYouTubeBot()
-                if hasattr(temp_bot, 'get_real_youtube_data'):
-                    real_videos = temp_bot.get_real_youtube_data()
-                    response_data['videos'] = real_videos
-                    response_data['total_uploads'] = len(real_videos)
-                    response_data['tech_count'] = len([v for v in real_videos if v.get('category') == 'tech'])
-                    response_data['entertainment_count'] = len([v for v in real_videos if v.get('category') == 'entertainment'])
-                    response_data['today_uploads'] = len([v for v in real_videos if datetime.now().date() == datetime.fromisoformat(v.get('upload_date', '2024-01-01')).date()])
-            except:
-                # No sample data - only show real data
-                response_data['videos'] = []
-                response_data['total_uploads'] = 0
-                response_data['tech_count'] = 0
-                response_data['entertainment_count'] = 0
-                response_data['today_uploads'] = 0
-            
-            return jsonify(response_data)
-        
-        bot = bot_instance
-        
-        # Initialize response data
-        response_data = {
-            "bot_status": "inactive",
-            "test_status": "pending",
-            "total_uploads": 0,
-            "today_uploads": 0,
-            "tech_count": 0,
-            "entertainment_count": 0,
-            "videos": []
-        }
-        
-        try:
-            # Check if database exists and is accessible
-            if hasattr(bot, 'db') and bot.db:
-                db = bot.db
-                cursor = db.cursor()
-                
-                # Get total uploads
-                try:
-                    cursor.execute('SELECT COUNT(*) FROM uploaded_videos')
-                    result = cursor.fetchone()
-                    response_data['total_uploads'] = result[0] if result else 0
-                except:
-                    response_data['total_uploads'] = 0
-                
-                # Get today's uploads
-                try:
-                    today = datetime.now().date()
-                    cursor.execute('''
-                        SELECT total_uploads FROM bot_stats WHERE date = ?
-                    ''', (today,))
-                    result = cursor.fetchone()
-                    response_data['today_uploads'] = result[0] if result else 0
-                except:
-                    response_data['today_uploads'] = 0
-                
-                # Get category counts
-                try:
-                    cursor.execute('SELECT COUNT(*) FROM uploaded_videos WHERE category = "tech"')
-                    result = cursor.fetchone()
-                    response_data['tech_count'] = result[0] if result else 0
-                    
-                    cursor.execute('SELECT COUNT(*) FROM uploaded_videos WHERE category = "entertainment"')
-                    result = cursor.fetchone()
-                    response_data['entertainment_count'] = result[0] if result else 0
-                except:
-                    response_data['tech_count'] = 0
-                    response_data['entertainment_count'] = 0
-                
-                # Get all videos (no duplicates by design)
-                try:
-                    cursor.execute('''
-                        SELECT title, description, upload_date, youtube_url, category
-                        FROM uploaded_videos
-                        ORDER BY upload_date DESC
-                        LIMIT 100
-                    ''')
-                    
-                    videos = []
-                    rows = cursor.fetchall()
-                    if rows:
-                        for row in rows:
-                            videos.append({
-                                'title': row[0],
-                                'description': row[1][:200] + '...' if len(row[1]) > 200 else row[1],
-                                'upload_date': row[2],
-                                'youtube_url': row[3],
-                                'category': row[4]
-                            })
-                    response_data['videos'] = videos
-                except:
-                    # Get real YouTube data if API available
-                    if hasattr(bot, 'youtube') and bot.youtube:
-                        response_data['videos'] = bot.get_real_youtube_data()
-                    else:
-                        response_data['videos'] = []
-                
-        except Exception as db_error:
-            # Database not ready yet, try to get real YouTube data
-            print(f"Database not ready: {db_error}")
-            if hasattr(bot, 'youtube') and bot.youtube:
-                response_data['videos'] = bot.get_real_youtube_data()
-            else:
-                response_data['videos'] = []
-        
-        # Always show active status
-        response_data['bot_status'] = "active"
-        response_data['test_status'] = "success"
-        response_data['timestamp'] = datetime.now().isoformat()
-        response_data['message'] = "YouTube Automation Dashboard - Live & Active"
-        
-        return jsonify(response_data)
-        
-    except Exception as e:
-        print(f"API Error: {e}")
-        return jsonify({
-            "error": str(e),
-            "bot_status": "error",
-            "total_uploads": 0,
-            "today_uploads": 0,
-            "tech_count": 0,
-            "entertainment_count": 0,
-            "videos": [],
-            "message": f"Error: {str(e)}"
-        })
-
-# Health check moved to different endpoint - NOT on root
-@app.route('/health')
-def health_check():
-    """Health check endpoint - returns JSON status"""
-    try:
-        if 'bot_instance' in globals() and bot_instance:
-            return jsonify({
-                "status": "alive",
-                "message": "Auto YouTube Bot Running 24/7",
-                "test_status": bot_instance.test_upload_success if hasattr(bot_instance, 'test_upload_success') else "pending",
-                "uploads_today": bot_instance.get_today_uploads() if hasattr(bot_instance, 'get_today_uploads') else 0,
-                "timestamp": datetime.now().isoformat()
-            })
-        else:
-            return jsonify({
-                "status": "initializing",
-                "message": "Bot is starting up...",
-                "test_status": "pending",
-                "uploads_today": 0,
-                "timestamp": datetime.now().isoformat()
-            })
-    except Exception as e:
-        return jsonify({
-            "status": "error",
-            "message": str(e),
-            "timestamp": datetime.now().isoformat()
-        })
-
-# Additional route for JSON status (backward compatibility)
-@app.route('/status')
-def status():
-    """Status endpoint - returns JSON"""
-    return health_check()
-
-# CRUD Operations for Videos
-@app.route('/api/videos', methods=['GET'])
-def get_videos():
-    """Get all videos with real-time stats"""
-    try:
-        if 'bot_instance' not in globals() or bot_instance is None:
-            return jsonify({"error": "Bot not initialized", "videos": []})
-        
-        bot = bot_instance
-        
-        # Get videos from database with live stats update
-        if hasattr(bot, 'db') and bot.db:
-            cursor = bot.db.cursor()
-            cursor.execute('''
-                SELECT video_id, title, description, upload_date, youtube_url, 
-                       thumbnail, channel, category, views, likes, comments, duration
-                FROM uploaded_videos 
-                ORDER BY upload_date DESC
-            ''')
-            
-            videos = []
-            for row in cursor.fetchall():
-                video = {
-                    'id': row[0],
-                    'title': row[1],
-                    'description': row[2],
-                    'upload_date': row[3],
-                    'youtube_url': row[4],
-                    'thumbnail': row[5],
-                    'channel': row[6],
-                    'category': row[7],
-                    'views': row[8],
-                    'likes': row[9],
-                    'comments': row[10],
-                    'duration': row[11]
-                }
-                videos.append(video)
-            
-            return jsonify({"videos": videos, "total": len(videos)})
-        else:
-            # Return real YouTube data if no database
-            real_data = bot.get_real_youtube_data() if hasattr(bot, 'get_real_youtube_data') else []
-            return jsonify({"videos": real_data, "total": len(real_data)})
-            
-    except Exception as e:
-        return jsonify({"error": str(e), "videos": []})
-
-@app.route('/api/videos/<video_id>', methods=['GET'])
-def get_video(video_id):
-    """Get single video with live stats"""
-    try:
-        if 'bot_instance' not in globals() or bot_instance is None:
-            return jsonify({"error": "Bot not initialized"})
-        
-        bot = bot_instance
-        
-        # First try database
-        if hasattr(bot, 'db') and bot.db:
-            cursor = bot.db.cursor()
-            cursor.execute('''
-                SELECT video_id, title, description, upload_date, youtube_url, 
-                       thumbnail, channel, category, views, likes, comments, duration
-                FROM uploaded_videos WHERE video_id = ?
-            ''', (video_id,))
-            
-            row = cursor.fetchone()
-            if row:
-                video = {
-                    'id': row[0],
-                    'title': row[1],
-                    'description': row[2],
-                    'upload_date': row[3],
-                    'youtube_url': row[4],
-                    'thumbnail': row[5],
-                    'channel': row[6],
-                    'category': row[7],
-                    'views': row[8],
-                    'likes': row[9],
-                    'comments': row[10],
-                    'duration': row[11]
-                }
-                
-                # Update with live stats
-                live_stats = bot.get_live_video_stats(video_id)
-                if live_stats:
-                    video.update(live_stats)
-                    # Update database with new stats
-                    bot.update_video_stats(video_id, live_stats)
-                
-                return jsonify(video)
-        
-        # If not in database, get from YouTube API
-        if hasattr(bot, 'youtube') and bot.youtube:
-            live_stats = bot.get_live_video_stats(video_id)
-            if live_stats:
-                return jsonify(live_stats)
-        
-        return jsonify({"error": "Video not found"})
-        
-    except Exception as e:
-        return jsonify({"error": str(e)})
-
-@app.route('/api/videos/<video_id>', methods=['PUT'])
-def update_video(video_id):
-    """Update video information"""
-    try:
-        if 'bot_instance' not in globals() or bot_instance is None:
-            return jsonify({"error": "Bot not initialized"})
-        
-        data = request.get_json()
-        bot = bot_instance
-        
-        if hasattr(bot, 'db') and bot.db:
-            cursor = bot.db.cursor()
-            
-            # Update video in database
-            cursor.execute('''
-                UPDATE uploaded_videos 
-                SET title = ?, description = ?, category = ?, last_updated = ?
-                WHERE video_id = ?
-            ''', (data.get('title'), data.get('description'), 
-                  data.get('category'), datetime.now(), video_id))
-            
-            bot.db.commit()
-            
-            if cursor.rowcount > 0:
-                return jsonify({"success": True, "message": "Video updated successfully"})
-            else:
-                return jsonify({"error": "Video not found"})
-        
-        return jsonify({"error": "Database not available"})
-        
-    except Exception as e:
-        return jsonify({"error": str(e)})
-
-@app.route('/api/videos/<video_id>', methods=['DELETE'])
-def delete_video(video_id):
-    """Delete video from tracking"""
-    try:
-        if 'bot_instance' not in globals() or bot_instance is None:
-            return jsonify({"error": "Bot not initialized"})
-        
-        bot = bot_instance
-        
-        if hasattr(bot, 'db') and bot.db:
-            cursor = bot.db.cursor()
-            
-            # Delete video from database
-            cursor.execute('DELETE FROM uploaded_videos WHERE video_id = ?', (video_id,))
-            bot.db.commit()
-            
-            if cursor.rowcount > 0:
-                return jsonify({"success": True, "message": "Video deleted successfully"})
-            else:
-                return jsonify({"error": "Video not found"})
-        
-        return jsonify({"error": "Database not available"})
-        
-    except Exception as e:
-        return jsonify({"error": str(e)})
-
-@app.route('/api/videos/refresh-stats', methods=['POST'])
-def refresh_all_stats():
-    """Refresh stats for all videos"""
-    try:
-        if 'bot_instance' not in globals() or bot_instance is None:
-            return jsonify({"error": "Bot not initialized"})
-        
-        bot = bot_instance
-        updated_count = 0
-        
-        if hasattr(bot, 'db') and bot.db:
-            cursor = bot.db.cursor()
-            cursor.execute('SELECT video_id FROM uploaded_videos WHERE video_id IS NOT NULL AND video_id != ""')
-            
-            for (video_id,) in cursor.fetchall():
-                if video_id and video_id != 'None':
-                    live_stats = bot.get_live_video_stats(video_id)
-                    if live_stats:
-                        bot.update_video_stats(video_id, live_stats)
-                        updated_count += 1
-            
-            return jsonify({
-                "success": True, 
-                "message": f"Updated stats for {updated_count} videos"
-            })
-        
-        return jsonify({"error": "Database not available"})
-        
-    except Exception as e:
-        return jsonify({"error": str(e)})
-
-class AutoYouTubeBot:
-    def __init__(self):
-        print("🔧 Initializing YouTube Bot...")
-        
-        # API Keys
-        self.youtube_api_key = os.getenv('YOUTUBE_API_KEY')
-        self.groq_api_key = os.getenv('GROQ_API_KEY')
-        self.client_id = os.getenv('YOUTUBE_CLIENT_ID')
-        self.client_secret = os.getenv('YOUTUBE_CLIENT_SECRET')
-        self.telegram_token = os.getenv('TELEGRAM_BOT_TOKEN')
-        self.telegram_chat_id = os.getenv('TELEGRAM_CHAT_ID')
-        
-        # Test upload status - Always active for dashboard
-        self.test_upload_success = True
-        self.bot_active = True
-        self.youtube = None
-        self.upload_youtube = None
-        self.db = None
-        
-        # Elly reaction mode configuration
-        self.elly_reaction_mode = os.path.exists("video/elly.mp4")
-        self.elly_reaction_chance = 0.7  # 70% chance to create Elly reaction
-        
-        if self.elly_reaction_mode:
-            print("🎬 Elly Reaction Mode: ENABLED")
-        else:
-            print("📹 Regular Shorts Mode: ENABLED")
-        
-        try:
-            # Initialize database for better tracking
-            self.init_database()
-            print("✅ Database initialized")
-        except Exception as e:
-            print(f"⚠️  Database initialization failed: {e}")
-        
-        try:
-            # YouTube APIs - only if API key exists
-            if self.youtube_api_key:
-                self.youtube = build('youtube', 'v3', developerKey=self.youtube_api_key)
-                print("✅ YouTube API connected")
-            else:
-                print("⚠️  YouTube API key not found")
-        except Exception as e:
-            print(f"⚠️  YouTube API connection failed: {e}")
-        
-        try:
-            # Create directories
-            os.makedirs('downloads', exist_ok=True)
-            os.makedirs('shorts', exist_ok=True)
-            os.makedirs('credentials', exist_ok=True)
-            os.makedirs('logs', exist_ok=True)
-            print("✅ Directories created")
-        except Exception as e:
-            print(f"⚠️  Directory creation failed: {e}")
-        
-        try:
-            # Advanced title patterns
-            self.title_patterns = self.load_title_patterns()
-            print("✅ Title patterns loaded")
-        except Exception as e:
-            print(f"⚠️  Title patterns failed: {e}")
-            self.title_patterns = {}
-        
-        print("🤖 YouTube Bot Initialized (Dashboard Ready)")
-        print("✅ Status: ACTIVE - Dashboard Live!")
-        
-        # Show enhanced features
-        print("\n🚀 Enhanced Features Loaded:")
-        print("  ✅ Multiple download methods (yt-dlp + pytube)")
-        print("  ✅ Enhanced error handling & fallbacks")
-        if self.elly_reaction_mode:
-            print("  ✅ Elly reaction shorts creation")
-            print("  ✅ Smart video overlay & composition")
-        print("  ✅ Advanced title/description generation")
-        print("  ✅ Professional dashboard with CRUD")
-        print("  ✅ 24/7 autonomous operation")
-        
-        try:
-            self.log_activity("Enhanced YouTube Bot initialized - All features ready - Status: ACTIVE")
-        except:
-            print("📝 Logging system not available")
-
-    def get_real_youtube_data(self):
-        """Get real YouTube trending videos with live stats"""
-        try:
-            if not self.youtube:
-                # Return empty data if no API - no dummy data
-                return []
-            
-            videos_data = []
-            categories = ['28', '24']  # Tech and Entertainment
-            
-            for category_id in categories:
-                try:
-                    request = self.youtube.videos().list(
-                        part='snippet,statistics,contentDetails',
-                        chart='mostPopular',
-                        regionCode='US',
-                        maxResults=5,
-                        videoCategoryId=category_id
-                    )
-                    
-                    response = request.execute()
-                    
-                    for item in response.get('items', []):
-                        video_data = {
-                            'id': item['id'],
-                            'title': item['snippet']['title'],
-                            'description': item['snippet']['description'][:200] + '...',
-                            'upload_date': item['snippet']['publishedAt'],
-                            'youtube_url': f"https://www.youtube.com/watch?v={item['id']}",
-                            'thumbnail': item['snippet']['thumbnails']['medium']['url'],
-                            'channel': item['snippet']['channelTitle'],
-                            'category': 'tech' if category_id == '28' else 'entertainment',
-                            'views': int(item['statistics'].get('viewCount', 0)),
-                            'likes': int(item['statistics'].get('likeCount', 0)),
-                            'comments': int(item['statistics'].get('commentCount', 0)),
-                            'duration': item['contentDetails']['duration'],
-                            'live_stats': True
-                        }
-                        videos_data.append(video_data)
-                        
-                except Exception as e:
-                    print(f"Error fetching category {category_id}: {e}")
-                    continue
-            
-            # If no real data, return empty list - no dummy data
-            if not videos_data:
-                return []
-                
-            return videos_data[:10]  # Return top 10
-            
-        except Exception as e:
-            print(f"Error getting real YouTube data: {e}")
-            return []
-
-
-    def get_live_video_stats(self, video_id):
-        """Get live statistics for a specific video"""
-        try:
-            if not self.youtube or not video_id or video_id == 'None':
-                return None
-            
-            request = self.youtube.videos().list(
-                part='snippet,statistics,contentDetails',
-                id=video_id
-            )
-            
-            response = request.execute()
-            
-            if response.get('items'):
-                item = response['items'][0]
-                return {
-                    'views': int(item['statistics'].get('viewCount', 0)),
-                    'likes': int(item['statistics'].get('likeCount', 0)),
-                    'comments': int(item['statistics'].get('commentCount', 0)),
-                    'duration': item['contentDetails']['duration'],
-                    'last_updated': datetime.now().isoformat()
-                }
-            
-            return None
-            
-        except Exception as e:
-            print(f"Error getting live stats for {video_id}: {e}")
-            return None
-
-    def update_video_stats(self, video_id, stats):
-        """Update video statistics in database"""
-        try:
-            if not self.db:
-                return False
-            
-            cursor = self.db.cursor()
-            cursor.execute('''
-                UPDATE uploaded_videos 
-                SET views = ?, likes = ?, comments = ?, last_updated = ?
-                WHERE video_id = ?
-            ''', (stats.get('views', 0), stats.get('likes', 0), 
-                  stats.get('comments', 0), datetime.now(), video_id))
-            
-            self.db.commit()
-            return cursor.rowcount > 0
-            
-        except Exception as e:
-            print(f"Error updating stats for {video_id}: {e}")
-            return False
-
-    def save_video_with_stats(self, video_data):
-        """Save video with complete statistics"""
-        try:
-            if not self.db:
-                print("❌ Database not available")
-                return False
-            
-            cursor = self.db.cursor()
-            
-            # Check if all required columns exist
-            cursor.execute("PRAGMA table_info(uploaded_videos)")
-            columns = [column[1] for column in cursor.fetchall()]
-            
-            if 'video_id' in columns:
-                # New schema with video_id
-                cursor.execute('''
-                    INSERT OR REPLACE INTO uploaded_videos 
-                    (video_id, title, description, upload_date, youtube_url, thumbnail, 
-                     channel, category, views, likes, comments, duration, last_updated)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    video_data.get('id'),
-                    video_data.get('title'),
-                    video_data.get('description'),
-                    video_data.get('upload_date'),
-                    video_data.get('youtube_url'),
-                    video_data.get('thumbnail', ''),
-                    video_data.get('channel', ''),
-                    video_data.get('category'),
-                    video_data.get('views', 0),
-                    video_data.get('likes', 0),
-                    video_data.get('comments', 0),
-                    video_data.get('duration', ''),
-                    datetime.now()
-                ))
-            else:
-                # Old schema without video_id (fallback)
-                cursor.execute('''
-                    INSERT OR REPLACE INTO uploaded_videos 
-                    (title, description, upload_date, youtube_url, category)
-                    VALUES (?, ?, ?, ?, ?)
-                ''', (
-                    video_data.get('title'),
-                    video_data.get('description'),
-                    video_data.get('upload_date'),
-                    video_data.get('youtube_url'),
-                    video_data.get('category')
-                ))
-            
-            self.db.commit()
-            print(f"✅ Video saved: {video_data.get('title')[:50]}...")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Error saving video: {e}")
-            # Try to recreate table if schema is wrong
-            try:
-                cursor = self.db.cursor()
-                cursor.execute('DROP TABLE IF EXISTS uploaded_videos')
-                self.init_database()
-                print("🔄 Database recreated, trying again...")
-                return self.save_video_with_stats(video_data)
-            except:
-                return False
-
-    def init_database(self):
-        """Initialize SQLite database for tracking"""
-        # Use in-memory database for Render (ephemeral storage)
-        is_render = os.environ.get('RENDER') or os.environ.get('RENDER_SERVICE_ID')
-        
-        if is_render:
-            # In-memory database for Render
-            self.db = sqlite3.connect(':memory:', check_same_thread=False)
-            print("📊 Using in-memory database (Render mode)")
-        else:
-            # File database for local development
-            self.db = sqlite3.connect('youtube_bot.db', check_same_thread=False)
-            print("📊 Using file database (Local mode)")
-            
-        cursor = self.db.cursor()
-        
-        # Create tables
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS processed_videos (
-                video_id TEXT PRIMARY KEY,
-                original_title TEXT,
-                channel TEXT,
-                processed_date TIMESTAMP,
-                video_hash TEXT UNIQUE
-            )
-        ''')
-        
-        # First check if table exists and update schema
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='uploaded_videos'")
-        table_exists = cursor.fetchone()
-        
-        if table_exists:
-            # Check if video_id column exists
-            cursor.execute("PRAGMA table_info(uploaded_videos)")
-            columns = [column[1] for column in cursor.fetchall()]
-            
-            if 'video_id' not in columns:
-                # Add missing columns
-                try:
-                    cursor.execute('ALTER TABLE uploaded_videos ADD COLUMN video_id TEXT')
-                    cursor.execute('ALTER TABLE uploaded_videos ADD COLUMN thumbnail TEXT')
-                    cursor.execute('ALTER TABLE uploaded_videos ADD COLUMN channel TEXT')
-                    cursor.execute('ALTER TABLE uploaded_videos ADD COLUMN views INTEGER DEFAULT 0')
-                    cursor.execute('ALTER TABLE uploaded_videos ADD COLUMN likes INTEGER DEFAULT 0')
-                    cursor.execute('ALTER TABLE uploaded_videos ADD COLUMN comments INTEGER DEFAULT 0')
-                    cursor.execute('ALTER TABLE uploaded_videos ADD COLUMN duration TEXT')
-                    cursor.execute('ALTER TABLE uploaded_videos ADD COLUMN last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP')
-                    print("✅ Database schema updated")
-                except:
-                    # If ALTER fails, recreate table
-                    cursor.execute('DROP TABLE IF EXISTS uploaded_videos')
-                    print("🔄 Recreating database table")
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS uploaded_videos (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                video_id TEXT UNIQUE,
-                title TEXT,
-                description TEXT,
-                upload_date TIMESTAMP,
-                youtube_url TEXT,
-                thumbnail TEXT,
-                channel TEXT,
-                category TEXT,
-                views INTEGER DEFAULT 0,
-                likes INTEGER DEFAULT 0,
-                comments INTEGER DEFAULT 0,
-                duration TEXT,
-                last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS bot_stats (
-                date DATE PRIMARY KEY,
-                tech_uploads INTEGER DEFAULT 0,
-                entertainment_uploads INTEGER DEFAULT 0,
-                total_uploads INTEGER DEFAULT 0
-            )
-        ''')
-        
-        self.db.commit()
-        print("📊 Database initialized")
-
-    def load_title_patterns(self):
-        """Load advanced title generation patterns"""
-        return {
-            'tech': [
-                "🔥 {adjective} Tech Discovery That Changes Everything",
-                "⚡ Why {topic} Is The Future (MINDBLOWING)",
-                "🚀 {number} Seconds Of Pure Tech Magic",
-                "💡 The {adjective} Innovation Nobody's Talking About",
-                "🤯 This {topic} Hack Will Blow Your Mind",
-                "⭐ {adjective} Tech Moment Caught On Camera",
-                "🎯 Watch This Before {topic} Takes Over",
-                "🔮 The Future Is Here: {adjective} {topic}",
-                "💥 {number} Second {topic} That Broke The Internet",
-                "🌟 {adjective} Discovery: The Game Changer"
-            ],
-            'entertainment': [
-                "😱 {adjective} Moment That Left Everyone Speechless",
-                "🎬 {number} Seconds Of Pure {emotion}",
-                "🔥 The {adjective} Scene Everyone's Watching",
-                "💯 Most {adjective} Moment You'll See Today",
-                "⚡ Wait For It... {emotion} Guaranteed!",
-                "🎭 {adjective} Plot Twist Nobody Saw Coming",
-                "🌟 {number} Second Clip Going Mega Viral",
-                "😍 The {adjective} Moment Breaking The Internet",
-                "🚀 {emotion} Level: {adjective}!",
-                "🎪 {adjective} Content That Defines {year}"
-            ],
-            'adjectives': [
-                "Incredible", "Mind-Blowing", "Shocking", "Amazing", "Unbelievable",
-                "Epic", "Legendary", "Insane", "Brilliant", "Revolutionary",
-                "Game-Changing", "Jaw-Dropping", "Stunning", "Phenomenal", "Wild"
-            ],
-            'emotions': [
-                "Excitement", "Joy", "Surprise", "Wonder", "Amazement",
-                "Thrill", "Awe", "Happiness", "Shock", "Inspiration"
-            ],
-            'topics': [
-                "Technology", "Innovation", "Discovery", "Breakthrough", "Revolution",
-                "Transformation", "Evolution", "Future", "Science", "Progress"
-            ]
-        }
-
-    def log_activity(self, message):
-        """Log activity to file and console"""
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        log_message = f"[{timestamp}] {message}"
-        print(log_message)
-        
-        # Save to log file
-        with open('logs/bot_activity.log', 'a', encoding='utf-8') as f:
-            f.write(log_message + '\n')
-        
-        # Send to Telegram if configured
-        if self.telegram_token and self.telegram_chat_id:
-            self.send_telegram_message(f"🤖 {message}")
-
-    def send_telegram_message(self, message):
-        """Send notification to Telegram"""
-        try:
-            url = f"https://api.telegram.org/bot{self.telegram_token}/sendMessage"
-            data = {
-                'chat_id': self.telegram_chat_id,
-                'text': message,
-                'parse_mode': 'HTML'
-            }
-            requests.post(url, data=data, timeout=5)
-        except:
-            pass
-
-    def check_duplicate(self, video_data):
-        """Advanced duplicate checking using multiple methods"""
-        cursor = self.db.cursor()
-        
-        # Check by video ID
-        cursor.execute('SELECT video_id FROM processed_videos WHERE video_id = ?', (video_data['id'],))
-        if cursor.fetchone():
-            return True
-        
-        # Create content hash for similarity check
-        content_hash = hashlib.md5(
-            f"{video_data['title']}{video_data['channel']}".encode()
-        ).hexdigest()
-        
-        cursor.execute('SELECT video_id FROM processed_videos WHERE video_hash = ?', (content_hash,))
-        if cursor.fetchone():
-            return True
-        
-        # Check similar titles (prevent same content different ID)
-        cursor.execute('''
-            SELECT title FROM uploaded_videos 
-            WHERE title LIKE ? OR title LIKE ?
-        ''', (f"%{video_data['title'][:30]}%", f"%{video_data['channel'][:20]}%"))
-        
-        if cursor.fetchone():
-            return True
-        
-        return False
-
-    def save_processed_video(self, video_data):
-        """Save processed video to database"""
-        cursor = self.db.cursor()
-        content_hash = hashlib.md5(
-            f"{video_data['title']}{video_data['channel']}".encode()
-        ).hexdigest()
-        
-        cursor.execute('''
-            INSERT OR IGNORE INTO processed_videos 
-            (video_id, original_title, channel, processed_date, video_hash)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (video_data['id'], video_data['title'], video_data['channel'], 
-              datetime.now(), content_hash))
-        
-        self.db.commit()
-
-    def generate_advanced_title(self, video_data, category='general'):
-        """Generate advanced unique titles"""
-        import random
-        
-        # Select pattern based on category
-        patterns = self.title_patterns.get(category, self.title_patterns['entertainment'])
-        pattern = random.choice(patterns)
-        
-        # Fill in variables
-        title = pattern.format(
-            adjective=random.choice(self.title_patterns['adjectives']),
-            topic=random.choice(self.title_patterns['topics']),
-            emotion=random.choice(self.title_patterns['emotions']),
-            number=random.randint(10, 60),
-            year=datetime.now().year
-        )
-        
-        # Ensure uniqueness
-        cursor = self.db.cursor()
-        cursor.execute('SELECT COUNT(*) FROM uploaded_videos WHERE title = ?', (title,))
-        
-        if cursor.fetchone()[0] > 0:
-            # Add unique identifier if title exists
-            title = f"{title} #{random.randint(100, 999)}"
-        
-        # Ensure title length
-        if len(title) > 70:
-            title = title[:67] + "..."
-        
-        return title
-
-    def generate_advanced_description(self, video_data, title, category='general'):
-        """Generate advanced descriptions with SEO optimization"""
-        
-        # Try AI generation first
-        if self.groq_api_key:
-            ai_description = self.generate_ai_description(video_data, title, category)
-            if ai_description:
-                return ai_description
-        
-        # Fallback to template-based generation
-        templates = [
-            """🔥 {title}
-
-📺 Experience the {adjective} moment that's taking the internet by storm!
-
-👀 What you'll see:
-• {point1}
-• {point2}
-• {point3}
-
-🚀 Original content from: {channel}
-📊 Viral Rating: {rating}/10
-
-🏷️ Tags:
-{tags}
-
-⏰ Upload Time: {time}
-📍 Category: {category}
-
-👍 Like & Subscribe for more {adjective} content!
-🔔 Turn on notifications to never miss out!
-
-#shorts #viral #trending #{category} #{year}""",
-
-            """⚡ {title}
-
-This {adjective} moment will leave you speechless! 😱
-
-✨ Why this is trending:
-→ {reason1}
-→ {reason2}
-→ {reason3}
-
-Credit: {channel} 🎬
-
-Stats:
-• Views: {views}
-• Category: {category}
-• Upload: {time}
-
-{tags}
-
-Drop a ❤️ if this amazed you!
-
-#{hashtag1} #{hashtag2} #{hashtag3}"""
-        ]
-        
-        template = random.choice(templates)
-        
-        # Generate dynamic content points
-        points = self.generate_content_points(category)
-        reasons = self.generate_trending_reasons()
-        tags = self.generate_seo_tags(video_data, category)
-        
-        description = template.format(
-            title=title,
-            adjective=random.choice(self.title_patterns['adjectives']),
-            channel=video_data['channel'],
-            rating=random.randint(8, 10),
-            point1=points[0],
-            point2=points[1],
-            point3=points[2],
-            reason1=reasons[0],
-            reason2=reasons[1],
-            reason3=reasons[2],
-            tags=tags,
-            time=datetime.now().strftime('%B %d, %Y'),
-            category=category.title(),
-            year=datetime.now().year,
-            views=f"{video_data['views']:,}",
-            hashtag1=f"{category}{random.randint(100,999)}",
-            hashtag2=f"viral{datetime.now().strftime('%Y%m')}",
-            hashtag3=f"trending{random.randint(1,100)}"
-        )
-        
-        return description
-
-    def generate_ai_description(self, video_data, title, category):
-        """Generate AI-powered description using Groq"""
-        try:
-            url = "https://api.groq.com/openai/v1/chat/completions"
-            headers = {
-                "Authorization": f"Bearer {self.groq_api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            prompt = f"""Create a viral YouTube Shorts description for:
-Title: {title}
-Category: {category}
-Original: {video_data['title'][:50]}
-Channel: {video_data['channel']}
-
-Requirements:
-- Start with eye-catching emoji
-- Include 3 bullet points about the content
-- Add relevant hashtags (15-20)
-- Make it engaging and shareable
-- Include call-to-action
-- SEO optimized
-- Max 500 characters
-
-Format with emojis and line breaks for readability."""
-
-            data = {
-                "model": "mixtral-8x7b-32768",
-                "messages": [{"role": "user", "content": prompt}],
-                "max_tokens": 400,
-                "temperature": 0.9
-            }
-            
-            response = requests.post(url, headers=headers, json=data, timeout=10)
-            
-            if response.status_code == 200:
-                return response.json()['choices'][0]['message']['content']
-        except:
-            pass
-        
-        return None
-
-    def generate_content_points(self, category):
-        """Generate content bullet points"""
-        tech_points = [
-            "Cutting-edge technology in action",
-            "Mind-bending innovation revealed",
-            "Future tech becoming reality",
-            "Game-changing breakthrough moment",
-            "Revolutionary concept demonstrated"
-        ]
-        
-        entertainment_points = [
-            "Jaw-dropping entertainment",
-            "Unforgettable viral moment",
-            "Pure entertainment gold",
-            "Content that breaks the internet",
-            "Must-see trending footage"
-        ]
-        
-        points = tech_points if category == 'tech' else entertainment_points
-        return random.sample(points, 3)
-
-    def generate_trending_reasons(self):
-        """Generate reasons why content is trending"""
-        reasons = [
-            "Absolutely mind-blowing content",
-            "Never seen before on the internet",
-            "Breaking all viral records",
-            "Everyone's talking about this",
-            "Defining moment of the year",
-            "Pure viral perfection",
-            "Internet's new obsession",
-            "Changing the game completely"
-        ]
-        return random.sample(reasons, 3)
-
-    def generate_seo_tags(self, video_data, category):
-        """Generate SEO optimized tags"""
-        base_tags = ['#shorts', '#viral', '#trending', '#fyp', '#explore']
-        
-        category_tags = {
-            'tech': ['#technology', '#innovation', '#future', '#tech', '#ai', '#gadgets'],
-            'entertainment': ['#entertainment', '#fun', '#amazing', '#mustwatch', '#epic']
-        }
-        
-        # Time-based unique tags
-        time_tags = [
-            f"#viral{datetime.now().strftime('%Y')}",
-            f"#trending{datetime.now().strftime('%m%d')}",
-            f"#{category}{datetime.now().strftime('%H')}"
-        ]
-        
-        all_tags = base_tags + category_tags.get(category, []) + time_tags
-        
-        # Add random viral tags
-        viral_tags = [
-            f"#moment{random.randint(100,999)}",
-            f"#viral{random.randint(1,100)}",
-            f"#trend{random.randint(1,999)}"
-        ]
-        
-        all_tags.extend(random.sample(viral_tags, 2))
-        
-        return ' '.join(all_tags[:20])  # Limit to 20 tags
-
-    def get_today_uploads(self):
-        """Get today's upload count"""
-        cursor = self.db.cursor()
-        today = datetime.now().date()
-        
-        cursor.execute('''
-            SELECT total_uploads FROM bot_stats WHERE date = ?
-        ''', (today,))
-        
-        result = cursor.fetchone()
-        return result[0] if result else 0
-
-    def update_stats(self, category):
-        """Update upload statistics"""
-        cursor = self.db.cursor()
-        today = datetime.now().date()
-        
-        # Insert or update today's stats
-        cursor.execute('''
-            INSERT INTO bot_stats (date, tech_uploads, entertainment_uploads, total_uploads)
-            VALUES (?, ?, ?, ?)
-            ON CONFLICT(date) DO UPDATE SET
-                tech_uploads = CASE WHEN ? = 'tech' 
-                    THEN tech_uploads + 1 ELSE tech_uploads END,
-                entertainment_uploads = CASE WHEN ? = 'entertainment' 
-                    THEN entertainment_uploads + 1 ELSE entertainment_uploads END,
-                total_uploads = total_uploads + 1
-        ''', (today, 1 if category == 'tech' else 0, 
-              1 if category == 'entertainment' else 0, 1,
-              category, category))
-        
-        self.db.commit()
-
-    def automatic_test_upload(self):
-        """Perform REAL test upload to YouTube"""
-        self.log_activity("🧪 Starting REAL YouTube test upload...")
-        
-        try:
-            # Check if we have YouTube credentials
-            if not self.youtube_api_key or not self.client_id or not self.client_secret:
-                self.log_activity("⚠️ YouTube API credentials missing - Bot ready for real data only")
-                self.test_upload_success = True
-                self.bot_active = True
-                return True
-            
-            # Try to authenticate YouTube upload
-            if not self.authenticate_youtube():
-                self.log_activity("⚠️ YouTube authentication failed - Bot ready for real data only")
-                self.test_upload_success = True
-                self.bot_active = True
-                return True
-            
-            # Create a simple test video file
-            test_video_path = self.create_test_video_file()
-            if not test_video_path:
-                self.log_activity("⚠️ Test video creation failed - Bot ready for real data only")
-                self.test_upload_success = True
-                self.bot_active = True
-                return True
-            
-            # Upload to YouTube
-            title = "🧪 Test Upload - YouTube Bot Working!"
-            description = """🤖 This is an automated test upload from YouTube Automation Bot!
-
-✅ Bot Status: ACTIVE
-📊 Dashboard: Working
-🔄 Auto Upload: Enabled
-
-This test confirms that:
-• YouTube API connection is working
-• Video upload functionality is active
-• Dashboard integration is successful
-• Bot is ready for 24/7 automation
-
-#YouTubeBot #Automation #TestUpload #TechDemo"""
-
-            self.log_activity("📤 Uploading test video to YouTube...")
-            upload_url = self.upload_to_youtube(test_video_path, title, description)
-            
-            if upload_url:
-                # Save successful upload to database
-                test_video = {
-                    'id': f'test_upload_{int(time.time())}',
-                    'title': title,
-                    'description': description,
-                    'upload_date': datetime.now().isoformat(),
-                    'youtube_url': upload_url,
-                    'thumbnail': f"https://img.youtube.com/vi/{upload_url.split('=')[-1]}/mqdefault.jpg",
-                    'channel': 'YouTube Bot',
-                    'category': 'tech',
-                    'views': 0,
-                    'likes': 0,
-                    'comments': 0
-                }
-                
-                self.save_video_with_stats(test_video)
-                
-                self.test_upload_success = True
-                self.bot_active = True
-                
-                self.log_activity(f"🎉 REAL TEST UPLOAD SUCCESSFUL!")
-                self.log_activity(f"📺 YouTube URL: {upload_url}")
-                self.log_activity("🚀 Bot is now ACTIVE with real upload!")
-                
-                # Cleanup test file
-                self.cleanup(test_video_path)
-                
-                return True
-            else:
-                self.log_activity("⚠️ YouTube upload failed (Upload limit exceeded)")
-                self.log_activity("💡 YouTube allows limited uploads per day")
-                self.log_activity("✅ Bot ready for real data only")
-                self.cleanup(test_video_path)
-                self.test_upload_success = True
-                self.bot_active = True
-                return True
-            
-        except Exception as e:
-            self.log_activity(f"❌ Real upload error: {e}")
-            self.log_activity("✅ Bot ready for real data only")
-            self.test_upload_success = True
-            self.bot_active = True
-            return True
-
-
-    def create_test_video_file(self):
-        """Create a simple test video file"""
-        try:
-            import cv2
-            import numpy as np
-            
-            # Create a simple test video
-            filename = 'test_video.mp4'
-            fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-            out = cv2.VideoWriter(filename, fourcc, 1.0, (640, 480))
-            
-            # Create 10 seconds of test video
-            for i in range(10):
-                # Create a frame with text
-                frame = np.zeros((480, 640, 3), dtype=np.uint8)
-                frame[:] = (50, 50, 50)  # Dark gray background
-                
-                # Add text
-                cv2.putText(frame, 'YouTube Bot Test', (150, 200), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 2, (255, 255, 255), 3)
-                cv2.putText(frame, f'Frame: {i+1}/10', (250, 300), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
-                
-                out.write(frame)
-            
-            out.release()
-            
-            if os.path.exists(filename):
-                self.log_activity("✅ Test video file created")
-                return filename
-            else:
-                return None
-                
-        except Exception as e:
-            self.log_activity(f"❌ Test video creation failed: {e}")
-            return None
-
-    def save_uploaded_video(self, title, description, url, category):
-        """Save uploaded video to database"""
-        cursor = self.db.cursor()
-        cursor.execute('''
-            INSERT INTO uploaded_videos (title, description, upload_date, youtube_url, category)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (title, description, datetime.now(), url, category))
-        self.db.commit()
-
-    def get_safe_videos(self, category_id, max_results=10):
-        """Get safe trending videos with strict filtering"""
-        try:
-            category_name = "Tech" if category_id == '28' else "Entertainment"
-            regions = ['US', 'IN', 'GB', 'CA', 'AU']
-            all_videos = []
-            
-            for region in regions:
-                try:
-                    request = self.youtube.videos().list(
-                        part='snippet,statistics,contentDetails',
-                        chart='mostPopular',
-                        regionCode=region,
-                        maxResults=max_results,
-                        videoCategoryId=category_id
-                    )
-                    
-                    response = request.execute()
-                    
-                    for item in response.get('items', []):
-                        duration = self.parse_duration(item['contentDetails']['duration'])
-                        
-                        if 15 <= duration <= 600:  # 15 seconds to 10 minutes
-                            views = int(item['statistics'].get('viewCount', 0))
-                            
-                            if views >= 100000:  # Minimum 100k views
-                                video_data = {
-                                    'id': item['id'],
-                                    'title': item['snippet']['title'],
-                                    'channel': item['snippet']['channelTitle'],
-                                    'views': views,
-                                    'duration': duration,
-                                    'url': f"https://www.youtube.com/watch?v={item['id']}"
-                                }
-                                
-                                if self.is_copyright_safe(video_data):
-                                    all_videos.append(video_data)
-                    
-                    time.sleep(0.5)  # Rate limiting
-                    
-                except Exception as e:
-                    continue
-            
-            # Sort by views and return top videos
-            all_videos.sort(key=lambda x: x['views'], reverse=True)
-            return all_videos[:max_results]
-            
-        except Exception as e:
-            self.log_activity(f"Error getting videos: {e}")
-            return []
-
-    def parse_duration(self, duration_str):
-        """Parse YouTube duration"""
-        import re
-        pattern = r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?'
-        match = re.match(pattern, duration_str)
-        
-        if not match:
-            return 0
-        
-        hours = int(match.group(1) or 0)
-        minutes = int(match.group(2) or 0)
-        seconds = int(match.group(3) or 0)
-        
-        return hours * 3600 + minutes * 60 + seconds
-
-    def is_copyright_safe(self, video_data):
-        """Enhanced copyright safety check"""
-        # Extensive copyright filtering
-        danger_keywords = [
-            'official', 'vevo', 'music', 'song', 'album', 'records',
-            'trailer', 'movie', 'film', 'netflix', 'disney', 'hbo',
-            'sports', 'nfl', 'nba', 'fifa', 'match', 'game highlights',
-            'news', 'breaking', 'live', 'concert', 'performance',
-            'premium', 'exclusive', 'copyrighted', 'licensed'
-        ]
-        
-        text = f"{video_data['title']} {video_data['channel']}".lower()
-        
-        for keyword in danger_keywords:
-            if keyword in text:
-                self.log_activity(f"🚫 Blocked by keyword '{keyword}': {video_data['title'][:30]}...")
-                return False
-        
-        # Check channel name patterns
-        if len(video_data['channel']) < 5:
-            self.log_activity(f"🚫 Channel name too short: {video_data['channel']}")
-            return False
-        
-        if any(char.isdigit() for char in video_data['channel'][:3]):
-            self.log_activity(f"🚫 Channel has numbers: {video_data['channel']}")
-            return False
-        
-        # Additional safety checks
-        title_lower = video_data['title'].lower()
-        
-        # Block if title suggests it's unavailable content
-        unavailable_indicators = [
-            'deleted', 'removed', 'unavailable', 'private', 'restricted',
-            'blocked', 'suspended', 'terminated', 'banned'
-        ]
-        
-        for indicator in unavailable_indicators:
-            if indicator in title_lower:
-                self.log_activity(f"🚫 Unavailable content indicator: {indicator}")
-                return False
-        
-        self.log_activity(f"✅ Safe content: {video_data['title'][:30]}...")
-        return True
-
-    
-    def download_video_advanced(self, url, video_id):
-        """Advanced download with multiple strategies"""
-        self.log_activity(f"🎯 Advanced download: {video_id}")
-        
-        filename = f"downloads/{video_id}.mp4"
-        
-        # Strategy 1: High quality MP4
-        strategies = [
-            {
-                'name': 'High Quality MP4',
-                'format': 'best[height<=720][ext=mp4]',
-                'opts': {'quiet': True, 'no_warnings': True}
-            },
-            {
-                'name': 'Any MP4',
-                'format': 'best[ext=mp4]',
-                'opts': {'quiet': True, 'no_warnings': True}
-            },
-            {
-                'name': 'Medium Quality',
-                'format': 'best[height<=480]',
-                'opts': {'quiet': True, 'no_warnings': True}
-            },
-            {
-                'name': 'Any MP4 Format',
-                'format': 'mp4',
-                'opts': {'quiet': True, 'no_warnings': True}
-            },
-            {
-                'name': 'Best Available',
-                'format': 'best',
-                'opts': {'quiet': True, 'no_warnings': True}
-            },
-            {
-                'name': 'Worst Quality (Last Resort)',
-                'format': 'worst',
-                'opts': {'quiet': True, 'no_warnings': True}
-            }
-        ]
-        
-        for i, strategy in enumerate(strategies):
-            try:
-                self.log_activity(f"📥 Strategy {i+1}/{len(strategies)}: {strategy['name']}")
-                
-                ydl_opts = {
-                    'format': strategy['format'],
-                    'outtmpl': filename,
-                    'retries': 2,
-                    'fragment_retries': 2,
-                    'http_headers': {
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-                    },
-                    **strategy['opts']
-                }
-                
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    ydl.download([url])
-                
-                if os.path.exists(filename) and os.path.getsize(filename) > 1000:
-                    size_mb = os.path.getsize(filename) / (1024 * 1024)
-                    self.log_activity(f"✅ Success with {strategy['name']} ({size_mb:.1f} MB)")
-                    return filename
-                else:
-                    self.log_activity(f"❌ {strategy['name']} failed - no file created")
-                    
-            except Exception as e:
-                self.log_activity(f"❌ {strategy['name']} error: {str(e)[:100]}")
-                continue
-        
-        self.log_activity(f"❌ All download strategies failed: {video_id}")
-        return None
-
-    def download_video(self, url, video_id):
-        """Simple and reliable download method"""
-        self.log_activity(f"⬇️ Downloading video: {video_id}")
-        
-        try:
-            filename = f"downloads/{video_id}.mp4"
-            
-            # Simple yt-dlp configuration that works
-            ydl_opts = {
-                'format': 'best[height<=720][ext=mp4]/best[ext=mp4]/best[height<=480]/mp4/best',  # Multiple fallbacks
-                'outtmpl': filename,
-                'quiet': True,
-                'no_warnings': True,
-                'ignoreerrors': True,
-                'retries': 1,  # Only 1 retry
-                'http_headers': {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                }
-            }
-            
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([url])
-            
-            if os.path.exists(filename) and os.path.getsize(filename) > 1000:
-                self.log_activity(f"✅ Download successful: {video_id}")
-                return filename
-            else:
-                self.log_activity(f"❌ Primary download failed, trying advanced method...")
-                return self.download_video_advanced(url, video_id)
-                
-        except Exception as e:
-            self.log_activity(f"❌ Download error: {e}, trying advanced method...")
-            return self.download_video_advanced(url, video_id)
-    
-
-    def create_short(self, video_path, video_id):
-        """Create YouTube short with audio preservation"""
-        try:
-            # Debug original video
-            self.debug_audio_info(video_path, "ORIGINAL")
-            
-            with VideoFileClip(video_path) as video:
-                duration = video.duration
-                
-                # Check if video has audio
-                has_audio = video.audio is not None
-                self.log_activity(f"🎵 Audio detected: {'Yes' if has_audio else 'No'}")
-                
-                if duration <= 60:
-                    clip = video
-                else:
-                    # Smart segment selection
-                    if duration > 120:
-                        start_time = random.uniform(30, duration - 90)
-                    else:
-                        start_time = 10
-                    
-                    end_time = min(start_time + 60, duration - 10)
-                    clip = video.subclip(start_time, end_time)
-                    
-                    # Debug after clipping
-                    self.log_activity(f"✂️ Clipped: {start_time:.1f}s to {end_time:.1f}s")
-                    self.log_activity(f"🎵 Audio after clip: {'Yes' if clip.audio is not None else 'No'}")
-                
-                # Resize for shorts with audio preservation
-                resized_clip = self.resize_for_shorts(clip)
-                
-                # Debug after resize
-                self.log_activity(f"🎵 Audio after resize: {'Yes' if resized_clip.audio is not None else 'No'}")
-                
-                # Verify audio is still present
-                if has_audio and resized_clip.audio is None:
-                    self.log_activity("⚠️ Audio lost during processing, restoring...")
-                    resized_clip = resized_clip.set_audio(clip.audio)
-                    self.log_activity(f"🎵 Audio restored: {'Yes' if resized_clip.audio is not None else 'No'}")
-                
-                output_path = f"shorts/short_{video_id}.mp4"
-                
-                # Write with explicit audio settings
-                write_params = {
-                    'codec': 'libx264',
-                    'fps': 30,
-                    'verbose': False,
-                    'logger': None
-                }
-                
-                # Only add audio codec if audio exists
-                if resized_clip.audio is not None:
-                    write_params['audio_codec'] = 'aac'
-                    write_params['audio_bitrate'] = '128k'
-                    self.log_activity("🎵 Writing video with audio (AAC 128k)")
-                else:
-                    self.log_activity("🔇 Writing video without audio")
-                
-                resized_clip.write_videofile(output_path, **write_params)
-                
-                # Debug final output
-                if os.path.exists(output_path):
-                    self.debug_audio_info(output_path, "FINAL OUTPUT")
-                
-                return output_path
-                
-        except Exception as e:
-            self.log_activity(f"Short creation error: {e}")
-            return None
-    
-    def create_elly_reaction_short(self, video_path, video_id, elly_size=0.25, elly_position="top-right"):
-        """Create Elly reaction short with overlay and audio preservation"""
-        try:
-            from moviepy.editor import CompositeVideoClip, concatenate_videoclips
-            
-            # Check if Elly video exists
-            elly_path = "video/elly.mp4"
-            if not os.path.exists(elly_path):
-                self.log_activity("⚠️ Elly video not found, creating regular short")
-                return self.create_short(video_path, video_id)
-            
-            self.log_activity(f"🎬 Creating Elly reaction short: {video_id}")
-            
-            # Load videos
-            with VideoFileClip(video_path) as source_video:
-                with VideoFileClip(elly_path) as elly_video:
-                    
-                    # Check audio in source video
-                    has_source_audio = source_video.audio is not None
-                    has_elly_audio = elly_video.audio is not None
-                    self.log_activity(f"🎵 Source audio: {'Yes' if has_source_audio else 'No'}")
-                    self.log_activity(f"🎵 Elly audio: {'Yes' if has_elly_audio else 'No'}")
-                    
-                    # Determine duration (max 60 seconds for shorts)
-                    target_duration = min(60, source_video.duration)
-                    
-                    # Adjust source video duration
-                    if source_video.duration > target_duration:
-                        # Take middle section
-                        start_time = max(0, (source_video.duration - target_duration) / 2)
-                        source_adjusted = source_video.subclip(start_time, start_time + target_duration)
-                    else:
-                        source_adjusted = source_video
-                    
-                    # Adjust Elly video duration (remove audio from Elly to avoid conflict)
-                    if elly_video.duration < target_duration:
-                        # Loop Elly video if too short
-                        loop_count = int(target_duration / elly_video.duration) + 1
-                        clips = [elly_video.without_audio()] * loop_count  # Remove Elly audio
-                        elly_looped = concatenate_videoclips(clips, method="compose")
-                        elly_adjusted = elly_looped.subclip(0, target_duration)
-                    else:
-                        # Trim Elly video if too long
-                        start_time = max(0, (elly_video.duration - target_duration) / 2)
-                        elly_adjusted = elly_video.subclip(start_time, start_time + target_duration).without_audio()
-                    
-                    # Create background (source video fills screen) - preserve audio
-                    target_size = (1080, 1920)  # 9:16 aspect ratio
-                    background = self._create_background_for_shorts(source_adjusted, target_size)
-                    
-                    # Create Elly overlay (without audio)
-                    elly_overlay = self._create_elly_overlay(elly_adjusted, target_size, elly_size, elly_position)
-                    
-                    # Combine videos - background audio will be preserved
-                    final_video = CompositeVideoClip([background, elly_overlay], size=target_size)
-                    
-                    # Ensure original audio is preserved
-                    if has_source_audio and final_video.audio is None:
-                        self.log_activity("🎵 Restoring original audio...")
-                        final_video = final_video.set_audio(source_adjusted.audio)
-                    
-                    # Export
-                    output_path = f"shorts/elly_short_{video_id}.mp4"
-                    
-                    # High quality settings for YouTube Shorts
-                    ffmpeg_params = ['-crf', '20', '-maxrate', '3000k', '-bufsize', '6000k']
-                    
-                    write_params = {
-                        'codec': 'libx264',
-                        'fps': 30,
-                        'preset': 'medium',
-                        'verbose': False,
-                        'logger': None,
-                        'ffmpeg_params': ffmpeg_params
-                    }
-                    
-                    # Add audio settings if audio exists
-                    if final_video.audio is not None:
-                        write_params['audio_codec'] = 'aac'
-                        write_params['audio_bitrate'] = '128k'
-                        self.log_activity("🎵 Writing Elly reaction with original audio")
-                    else:
-                        self.log_activity("🔇 Writing Elly reaction without audio")
-                    
-                    final_video.write_videofile(output_path, **write_params)
-                    
-                    self.log_activity(f"✅ Elly reaction short created: {output_path}")
-                    return output_path
-                    
-        except Exception as e:
-            self.log_activity(f"❌ Elly reaction creation error: {e}")
-            # Fallback to regular short
-            return self.create_short(video_path, video_id)
-    
-    def _create_background_for_shorts(self, video, target_size):
-        """Create background video that fills the screen for shorts"""
-        target_w, target_h = target_size
-        video_w, video_h = video.size
-        
-        # Calculate aspect ratios
-        video_aspect = video_w / video_h
-        target_aspect = target_w / target_h
-        
-        if video_aspect > target_aspect:
-            # Video is wider - fit by height, crop sides
-            new_height = target_h
-            new_width = int(new_height * video_aspect)
-            resized = video.resize((new_width, new_height))
-            
-            # Center crop horizontally
-            x_center = new_width / 2
-            x1 = x_center - target_w / 2
-            cropped = resized.crop(x1=x1, x2=x1 + target_w)
-        else:
-            # Video is taller - fit by width, crop top/bottom
-            new_width = target_w
-            new_height = int(new_width / video_aspect)
-            resized = video.resize((new_width, new_height))
-            
-            # Center crop vertically
-            y_center = new_height / 2
-            y1 = y_center - target_h / 2
-            cropped = resized.crop(y1=y1, y2=y1 + target_h)
-        
-        return cropped
-    
-    def _create_elly_overlay(self, elly_video, target_size, elly_size, position):
-        """Create Elly overlay with custom position and size"""
-        target_w, target_h = target_size
-        
-        # Calculate Elly size
-        elly_width = int(target_w * elly_size)
-        elly_height = int(elly_width * elly_video.h / elly_video.w)
-        
-        # Resize Elly
-        elly_resized = elly_video.resize((elly_width, elly_height))
-        
-        # Calculate position
-        margin = 20
-        
-        if position == "top-right":
-            x_pos = target_w - elly_width - margin
-            y_pos = margin
-        elif position == "top-left":
-            x_pos = margin
-            y_pos = margin
-        elif position == "bottom-right":
-            x_pos = target_w - elly_width - margin
-            y_pos = target_h - elly_height - margin
-        elif position == "bottom-left":
-            x_pos = margin
-            y_pos = target_h - elly_height - margin
-        else:
-            # Default to top-right
-            x_pos = target_w - elly_width - margin
-            y_pos = margin
-        
-        # Set position
-        elly_positioned = elly_resized.set_position((x_pos, y_pos))
-        
-        return elly_positioned
-
-    def debug_audio_info(self, video_path, stage=""):
-        """Debug function to log audio information"""
-        try:
-            with VideoFileClip(video_path) as video:
-                has_audio = video.audio is not None
-                duration = video.duration
-                size = video.size
-                
-                audio_info = "No audio"
-                if has_audio:
-                    audio_duration = video.audio.duration
-                    audio_info = f"Audio duration: {audio_duration:.2f}s"
-                
-                self.log_activity(f"🔍 {stage} - {os.path.basename(video_path)}")
-                self.log_activity(f"   📊 Video: {duration:.2f}s, {size[0]}x{size[1]}")
-                self.log_activity(f"   🎵 {audio_info}")
-                
-                return has_audio
-        except Exception as e:
-            self.log_activity(f"❌ Audio debug error: {e}")
-            return False
-
-    def resize_for_shorts(self, clip):
-        """Resize video for 9:16 format with audio preservation"""
-        target_width, target_height = 1080, 1920
-        current_width, current_height = clip.size
-        current_ratio = current_width / current_height
-        target_ratio = target_width / target_height
-        
-        # Store original audio
-        original_audio = clip.audio
-        
-        if current_ratio > target_ratio:
-            new_width = int(current_height * target_ratio)
-            x_center = current_width // 2
-            x1 = x_center - new_width // 2
-            x2 = x_center + new_width // 2
-            clip = clip.crop(x1=x1, x2=x2)
-        else:
-            new_height = int(current_width / target_ratio)
-            y_center = current_height // 2
-            y1 = y_center - new_height // 2
-            y2 = y_center + new_height // 2
-            clip = clip.crop(y1=y1, y2=y2)
-        
-        # Resize and ensure audio is preserved
-        resized_clip = clip.resize((target_width, target_height))
-        
-        # Explicitly set audio if it exists
-        if original_audio is not None:
-            resized_clip = resized_clip.set_audio(original_audio)
-        
-        return resized_clip
-
-    def authenticate_youtube(self):
-        """Authenticate YouTube upload"""
-        SCOPES = ['https://www.googleapis.com/auth/youtube.upload']
-        creds = None
-        token_file = 'credentials/token.pickle'
-        
-        if os.path.exists(token_file):
-            with open(token_file, 'rb') as token:
-                creds = pickle.load(token)
-        
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                try:
-                    creds.refresh(Request())
-                except:
-                    creds = None
-            
-            if not creds:
-                credentials_info = {
-                    "installed": {
-                        "client_id": self.client_id,
-                        "client_secret": self.client_secret,
-                        "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                        "token_uri": "https://oauth2.googleapis.com/token",
-                        "redirect_uris": ["http://localhost", "urn:ietf:wg:oauth:2.0:oob"]
-                    }
-                }
-                
-                with open('credentials/credentials.json', 'w') as f:
-                    json.dump(credentials_info, f)
-                
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    'credentials/credentials.json', SCOPES)
-                creds = flow.run_local_server(port=0)
-            
-            with open(token_file, 'wb') as token:
-                pickle.dump(creds, token)
-        
-        self.upload_youtube = build('youtube', 'v3', credentials=creds)
-        return True
-
-    def upload_to_youtube(self, video_path, title, description):
-        """Upload video to YouTube"""
-        if not self.upload_youtube:
-            if not self.authenticate_youtube():
-                return False
-        
-        try:
-            body = {
-                'snippet': {
-                    'title': title,
-                    'description': description,
-                    'tags': ['shorts', 'viral', 'trending', 'fyp'],
-                    'categoryId': '24'
-                },
-                'status': {
-                    'privacyStatus': 'public',
-                    'selfDeclaredMadeForKids': False
-                }
-            }
-            
-            media = MediaFileUpload(video_path, chunksize=-1, resumable=True)
-            request = self.upload_youtube.videos().insert(
-                part=','.join(body.keys()),
-                body=body,
-                media_body=media
-            )
-            
-            response = request.execute()
-            return f"https://www.youtube.com/watch?v={response['id']}"
-            
-        except Exception as e:
-            error_str = str(e)
-            if "uploadLimitExceeded" in error_str:
-                self.log_activity("⚠️ YouTube daily upload limit exceeded")
-                self.log_activity("💡 Limit will reset in 24 hours")
-                # Don't retry if upload limit exceeded
-                return "UPLOAD_LIMIT_EXCEEDED"
-            else:
-                self.log_activity(f"Upload error: {e}")
-                return False
-
-    def cleanup(self, *files):
-        """Clean up temporary files"""
-        for file in files:
-            try:
-                if file and os.path.exists(file):
-                    os.remove(file)
-            except:
-                pass
-
-    def process_scheduled_upload(self, category='tech'):
-        """Process scheduled upload"""
-        if not self.bot_active:
-            return False
-        
-        # Check daily limit
-        today_uploads = self.get_today_uploads()
-        if today_uploads >= 10:
-            self.log_activity("Daily limit reached (10 videos)")
-            return False
-        
-        self.log_activity(f"Processing scheduled {category} upload...")
-        
-        category_id = '28' if category == 'tech' else '24'
-        videos = self.get_safe_videos(category_id, max_results=10)
-        
-        successful_uploads = 0
-        attempted_videos = 0
-        max_attempts = min(len(videos), 10)  # Try maximum 10 videos
-        
-        for video in videos:
-            if attempted_videos >= max_attempts:
-                break
-                
-            attempted_videos += 1
-            self.log_activity(f"🎯 Attempting video {attempted_videos}/{max_attempts}: {video['title'][:40]}...")
-            
-            if self.check_duplicate(video):
-                self.log_activity(f"⏭️ Skipping duplicate: {video['id']}")
-                continue
-                
-            # Download with retry mechanism
-            video_path = None
-            download_attempts = 0
-            max_download_attempts = 3  # Increased attempts
-            
-            while download_attempts < max_download_attempts and not video_path:
-                download_attempts += 1
-                self.log_activity(f"📥 Download attempt {download_attempts}/{max_download_attempts}")
-                video_path = self.download_video(video['url'], video['id'])
-                
-                if not video_path and download_attempts < max_download_attempts:
-                    wait_time = 5 * download_attempts  # Progressive wait
-                    self.log_activity(f"⏳ Retrying download in {wait_time} seconds...")
-                    time.sleep(wait_time)
-            
-            if not video_path:
-                self.log_activity(f"❌ Download failed after {max_download_attempts} attempts, skipping...")
-                continue
-                
-            # Create short (with Elly reaction if enabled)
-            if self.elly_reaction_mode and random.random() < self.elly_reaction_chance:
-                self.log_activity(f"🎬 Creating Elly reaction short...")
-                short_path = self.create_elly_reaction_short(
-                    video_path, 
-                    video['id'],
-                    elly_size=random.uniform(0.20, 0.30),  # Random size between 20-30%
-                    elly_position=random.choice(["top-right", "top-left", "bottom-right"])
-                )
-            else:
-                self.log_activity(f"📹 Creating regular short...")
-                short_path = self.create_short(video_path, video['id'])
-            
-            if not short_path:
-                self.log_activity(f"❌ Short creation failed, skipping...")
-                self.cleanup(video_path)
-                continue
-                
-            # Generate content
-            title = self.generate_advanced_title(video, category)
-            description = self.generate_advanced_description(video, title, category)
-            
-            # Upload
-            self.log_activity(f"📤 Uploading: {title[:40]}...")
-            upload_url = self.upload_to_youtube(short_path, title, description)
-            
-            if upload_url and upload_url != "UPLOAD_LIMIT_EXCEEDED":
-                # Save and update stats
-                self.save_processed_video(video)
-                self.save_uploaded_video(title, description, upload_url, category)
-                self.update_stats(category)
-                
-                successful_uploads += 1
-                self.log_activity(f"🎉 {category.upper()} uploaded successfully!")
-                self.log_activity(f"📺 URL: {upload_url}")
-                
-                # Cleanup
-                self.cleanup(video_path, short_path)
-                return True
-            elif upload_url == "UPLOAD_LIMIT_EXCEEDED":
-                self.log_activity(f"⚠️ Upload limit exceeded, stopping attempts")
-                self.cleanup(video_path, short_path)
-                break
-            else:
-                self.log_activity(f"❌ Upload failed, trying next video...")
-                self.cleanup(video_path, short_path)
-        
-        if successful_uploads == 0:
-            self.log_activity(f"❌ No successful uploads from {attempted_videos} attempts")
-        
-        return successful_uploads > 0
-        
-        return False
-
-    def test_enhanced_features(self):
-        """Simple feature test - no spam"""
-        self.log_activity("🧪 Features ready - Download system active")
-        return True  # Skip actual testing to avoid spam
-    
-    def run_24x7(self):
-        """Run bot 24/7 without manual intervention"""
-        self.log_activity("🚀 Starting 24/7 autonomous operation")
-        
-        # Test enhanced features first
-        self.test_enhanced_features()
-        
-        # Perform test upload first
-        if not self.test_upload_success:
-            success = self.automatic_test_upload()
-            if not success:
-                # Retry every 30 minutes until successful
-                while not self.test_upload_success:
-                    self.log_activity("Retrying test upload in 30 minutes...")
-                    time.sleep(1800)  # 30 minutes
-                    self.automatic_test_upload()
-        
-        # Schedule times (IST)
-        schedule_times = {
-            'tech': ['08:00', '12:00', '16:00', '20:00', '23:00'],
-            'entertainment': ['10:00', '14:00', '18:00', '21:00', '23:30']
-        }
-        
-        self.log_activity("📅 Schedule configured - Bot running autonomously")
-        
-        # Main loop
-        last_upload_time = {}
-        
-        while True:
-            try:
-                current_time = datetime.now().strftime('%H:%M')
-                current_hour = datetime.now().hour
-                
-                # Process scheduled uploads
-                for category, times in schedule_times.items():
-                    if current_time in times:
-                        last_key = f"{category}_{current_time}"
-                        if last_key not in last_upload_time or \
-                           (datetime.now() - last_upload_time[last_key]).seconds > 3600:
-                            self.process_scheduled_upload(category)
-                            last_upload_time[last_key] = datetime.now()
-                
-                # Random upload chance (10% every hour)
-                if random.random() < 0.1 and self.get_today_uploads() < 10:
-                    category = random.choice(['tech', 'entertainment'])
-                    self.log_activity(f"🎲 Random {category} upload triggered")
-                    self.process_scheduled_upload(category)
-                
-                # Reset daily stats at midnight
-                if current_time == '00:00':
-                    self.log_activity("🔄 Daily reset")
-                
-                # Status update every hour
-                if datetime.now().minute == 0:
-                    uploads = self.get_today_uploads()
-                    self.log_activity(f"📊 Hourly status: {uploads}/10 uploads today")
-                
-                # Sleep for 1 minute
-                time.sleep(60)
-                
-            except Exception as e:
-                self.log_activity(f"Error in main loop: {e}")
-                time.sleep(300)  # Wait 5 minutes on error
-
-# Global bot instance - Initialize immediately for dashboard
-bot_instance = None
-
-# Removed start_flask - will handle directly in main
-
-def start_bot_background():
-    """Start bot in background thread for Render"""
-    try:
-        if bot_instance and hasattr(bot_instance, 'run_24x7'):
-            print("🤖 Starting autonomous bot in background...")
-            bot_instance.run_24x7()
-    except Exception as e:
-        print(f"Bot background error: {e}")
-
-if __name__ == "__main__":
-    import socket
-    
-    # Check if running on Render
-    is_render = os.environ.get('RENDER') or os.environ.get('RENDER_SERVICE_ID')
-    port = int(os.environ.get('PORT', 10000))
-    
-    if is_render:
-        print("🚀 STARTING ON RENDER.COM")
-        print("="*50)
-        print("🌐 YouTube Automation Dashboard")
-        print("="*50)
-    else:
-        print("\n" + "="*70)
-        print("🤖 YOUTUBE AUTOMATION DASHBOARD")
-        print("="*70)
-    
-    # Initialize bot instance
-    print("⚙️  Initializing system...")
-    try:
-        bot_instance = AutoYouTubeBot()
-        print("✅ Bot instance created successfully")
-        
-        # Start bot in background thread and run test upload
-        if bot_instance:
-            # Run test upload immediately
-            print("🧪 Running test upload...")
-            bot_instance.automatic_test_upload()
-            
-            # Start background thread if API keys available
-            if not is_render or bot_instance.youtube_api_key:
-                bot_thread = threading.Thread(target=start_bot_background, daemon=True)
-                bot_thread.start()
-            
-    except Exception as e:
-        print(f"⚠️  Bot initialization error: {e}")
-        print("🔄 Starting in dashboard-only mode...")
-        bot_instance = None
-    
-    if is_render:
-        print("✅ RENDER DEPLOYMENT READY!")
-        print(f"🌐 Dashboard will be available on your Render URL")
-        print("📊 Features: Real-time stats, Video management, CRUD operations")
-        print("="*50)
-    else:
-        # Get network info for local development
-        hostname = socket.gethostname()
-        try:
-            local_ip = socket.gethostbyname(hostname)
-        except:
-            local_ip = "127.0.0.1"
-        
-        print("\n" + "="*70)
-        print("✅ DASHBOARD STARTING!")
-        print("="*70)
-        print(f"\n🌐 Dashboard URLs:")
-        print(f"   📱 Primary:   http://127.0.0.1:{port}")
-        print(f"   💻 Local:     http://localhost:{port}")
-        print(f"   🌍 Network:   http://{local_ip}:{port}")
-        print("\n📊 Features:")
-        print("   • Real-time YouTube data")
-        print("   • Video management & CRUD")
-        print("   • Professional dashboard")
-        print("   • Mobile responsive")
-        print("="*70)
-    
-    # Start Flask server
-    try:
-        if is_render:
-            # Render production mode
-            app.run(
-                host='0.0.0.0', 
-                port=port, 
-                debug=False, 
-                use_reloader=False,
-                threaded=True
-            )
-        else:
-            # Local development mode
-            print(f"\n🚀 Starting server on port {port}...")
-            app.run(
-                host='0.0.0.0', 
-                port=port, 
-                debug=False, 
-                use_reloader=False,
-                threaded=True
-            )
-    except Exception as e:
-        print(f"\n❌ Server error: {e}")
-        if not is_render:
-            print("\n🔧 Try:")
-            print("1. Close other programs using the port")
-            print("2. Run as administrator")
-            print("3. Check firewall settings")
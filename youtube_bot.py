@@ -18,10 +18,10 @@ Fully Autonomous YouTube Bot - No Manual Intervention Required
 """
 
 import os
+import html
 import random
 import time
 import json
-import pickle
 import sqlite3
 import hashlib
 import threading
@@ -29,13 +29,29 @@ from datetime import datetime, timedelta
 from dotenv import load_dotenv
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaFileUpload
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
 import yt_dlp
+from yt_dlp.utils import download_range_func
 from moviepy.editor import VideoFileClip
 import requests
-from flask import Flask, jsonify, render_template_string, request
+from flask import Flask, Response, jsonify, render_template_string, request
+from stats_refresher import StatsRefresher, BATCH_SIZE
+import stats_history
+import scheduler
+import channels
+import render_buffer
+import download_writer
+import metadata_service
+import template_engine
+import experiments
+import youtube_auth
+import workspace
+import compositor
+import stream_render
+import metrics
+import profiler
+from telegram_notifier import TelegramNotifier, infer_level
+import bot_logging
+from engine import get_service
 
 load_dotenv()
 
@@ -43,72 +59,21 @@ load_dotenv()
 app = Flask(__name__)
 
 # YouTube Authentication Setup
-def get_youtube_credentials():
-    """Get YouTube API credentials with automatic refresh"""
-    creds = None
-    
-    # Check for existing token
-    if os.path.exists('token.pickle'):
-        with open('token.pickle', 'rb') as token:
-            creds = pickle.load(token)
-    
-    # If no valid credentials, get new ones
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            try:
-                creds.refresh(Request())
-                print("✅ Token refreshed successfully")
-            except Exception as e:
-                print(f"❌ Token refresh failed: {e}")
-                creds = None
-        
-        if not creds:
-            # Use environment variables for OAuth
-            client_config = {
-                "installed": {
-                    "client_id": os.getenv('YOUTUBE_CLIENT_ID'),
-                    "client_secret": os.getenv('YOUTUBE_CLIENT_SECRET'),
-                    "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                    "token_uri": "https://oauth2.googleapis.com/token",
-                    "redirect_uris": ["urn:ietf:wg:oauth:2.0:oob"]
-                }
-            }
-            
-            if not client_config["installed"]["client_id"]:
-                print("❌ Missing YOUTUBE_CLIENT_ID in environment variables")
-                return None
-                
-            flow = InstalledAppFlow.from_client_config(
-                client_config, 
-                ['https://www.googleapis.com/auth/youtube.upload']
-            )
-            
-            # Try to use refresh token from environment
-            refresh_token = os.getenv('YOUTUBE_REFRESH_TOKEN')
-            if refresh_token:
-                try:
-                    token_data = {
-                        'refresh_token': refresh_token,
-                        'token_uri': 'https://oauth2.googleapis.com/token',
-                        'client_id': client_config["installed"]["client_id"],
-                        'client_secret': client_config["installed"]["client_secret"]
-                    }
-                    creds = Credentials.from_authorized_user_info(token_data)
-                    creds.refresh(Request())
-                    print("✅ Authentication successful using refresh token")
-                except Exception as e:
-                    print(f"❌ Refresh token authentication failed: {e}")
-                    return None
-            else:
-                print("❌ No YOUTUBE_REFRESH_TOKEN found in environment variables")
-                print("🔗 Get refresh token from: https://developers.google.com/youtube/v3/quickstart/python")
-                return None
-        
-        # Save credentials for next run
-        with open('token.pickle', 'wb') as token:
-            pickle.dump(creds, token)
-    
-    return creds
+def get_youtube_credentials(client_id=None, client_secret=None, refresh_token=None,
+                            token_path=youtube_auth.TOKEN_PATH):
+    """Get YouTube API credentials (one-off load/refresh)
+
+    Defaults to the YOUTUBE_* environment variables; channel profiles pass
+    their own credentials and token file. The bot itself keeps a
+    youtube_auth.CredentialManager, which refreshes in the background.
+    """
+    return youtube_auth.CredentialManager(client_id, client_secret, refresh_token, token_path).credentials()
+
+def youtube_id_from_url(url):
+    """Video ID of a youtube.com/watch?v= URL as returned by upload_to_youtube (None otherwise)"""
+    if not url or 'watch?v=' not in url:
+        return None
+    return url.split('watch?v=', 1)[1].split('&', 1)[0] or None
 
 def check_environment_setup():
     """Check if all required environment variables are set"""
@@ -137,6 +102,64 @@ def check_environment_setup():
     print("✅ All environment variables configured")
     return True
 
+# /api/videos paging limits
+VIDEOS_PAGE_DEFAULT = 50
+VIDEOS_PAGE_MAX = 200
+
+# /api/videos field name -> uploaded_videos column
+VIDEO_API_FIELDS = {
+    'id': 'video_id',
+    'title': 'title',
+    'description': 'description',
+    'upload_date': 'upload_date',
+    'youtube_url': 'youtube_url',
+    'thumbnail': 'thumbnail',
+    'channel': 'channel',
+    'category': 'category',
+    'views': 'views',
+    'likes': 'likes',
+    'comments': 'comments',
+    'duration': 'duration',
+    'channel_id': 'channel_id'
+}
+
+# /api/videos sort name -> (column expression, direction); every sort has a matching index.
+# Views not fetched yet (NULL) sort as 0, so the keyset cursor never skips them
+VIDEO_SORTS = {
+    'newest': ('upload_date', 'DESC'),
+    'oldest': ('upload_date', 'ASC'),
+    'most_viewed': ('COALESCE(views, 0)', 'DESC')
+}
+
+# Upload slots for the 24/7 scheduler - "HH:MM" times or cron lines separated by ';'
+UPLOAD_SCHEDULE = os.getenv('UPLOAD_SCHEDULE', '08:00,10:00,12:00,14:00,16:00,18:00,20:00,22:00')
+UPLOAD_JITTER_SECONDS = int(os.getenv('UPLOAD_JITTER_SECONDS', 0))
+UPLOAD_CATCH_UP = os.getenv('UPLOAD_CATCH_UP', scheduler.CATCH_UP_ONCE)
+
+# Shorts use at most this much of the source
+SHORT_MAX_SECONDS = 60
+
+# Longest source discovery accepts - longer ones are cut to their middle
+# SHORT_MAX_SECONDS (videoDuration='short' searches return up to 4 minutes)
+SOURCE_MAX_SECONDS = int(os.getenv('SOURCE_MAX_SECONDS', 180))
+
+# How sources are fetched for rendering:
+#   range  - only the middle SHORT_MAX_SECONDS window (yt-dlp download_ranges)
+#   stream - no download; the renderer reads the remote media URL, seeking
+#            with -ss so only the window is transferred
+#   full   - the whole file
+DOWNLOAD_MODE = os.getenv('DOWNLOAD_MODE', 'range')
+
+# Single-file (audio + video) HTTP formats ffmpeg can seek into remotely
+STREAM_FORMAT = 'best[height<=720][vcodec!=none][acodec!=none][protocol^=http]'
+
+# How reaction shorts are rendered:
+#   moviepy - VideoFileClip readers + compositor, encoded by MoviePy
+#   stream  - stream_render: frame-at-a-time through ffmpeg pipes with a
+#             peak-RSS ceiling (RENDER_MEMORY_LIMIT_MB); falls back to moviepy
+#             on ffmpeg errors, but not when the memory limit was hit
+RENDER_MODE = os.getenv('RENDER_MODE', 'moviepy')
+
 # Advanced Professional Dashboard
 ADVANCED_DASHBOARD_HTML = """
 <!DOCTYPE html>
@@ -576,6 +599,7 @@ ADVANCED_DASHBOARD_HTML = """
                     <button id="refreshData" class="btn btn-primary">🔄 Refresh All</button>
                 </div>
             </div>
+            <div id="upcomingRuns" class="stat-change"></div>
         </section>
 
         <section class="video-section">
@@ -664,10 +688,11 @@ ADVANCED_DASHBOARD_HTML = """
             
             async fetchVideoData() {
                 try {
-                    const response = await fetch('/api/videos');
+                    // Filtering is done server-side; unchanged pages come back as 304 via ETag
+                    const response = await fetch(`/api/videos?${this.videoQuery(this.currentFilter)}`);
                     const data = await response.json();
                     this.allVideos = data.videos || [];
-                    this.displayVideos(this.filterVideosByCategory(this.currentFilter));
+                    this.displayVideos(this.allVideos);
                 } catch (error) {
                     console.error('Error fetching video data:', error);
                 }
@@ -678,6 +703,15 @@ ADVANCED_DASHBOARD_HTML = """
                 this.updateElement('todayUploads', data.today_uploads || 0);
                 this.updateElement('techVideos', data.tech_count || 0);
                 this.updateElement('entertainmentVideos', data.entertainment_count || 0);
+                this.updateUpcomingRuns(data.upcoming_runs || []);
+            }
+            
+            updateUpcomingRuns(runs) {
+                const element = document.getElementById('upcomingRuns');
+                if (!element) return;
+                element.textContent = runs.length
+                    ? '⏰ Next: ' + runs.map(run => `${run.name} at ${run.next_run.slice(11, 16)}`).join(' • ')
+                    : '';
             }
             
             updateBotStatus(status) {
@@ -739,19 +773,18 @@ ADVANCED_DASHBOARD_HTML = """
                 this.currentFilter = filter;
                 document.querySelectorAll('.filter-btn').forEach(btn => btn.classList.remove('active'));
                 document.querySelector(`[data-filter="${filter}"]`)?.classList.add('active');
-                const filteredVideos = this.filterVideosByCategory(filter);
-                this.displayVideos(filteredVideos);
+                this.fetchVideoData();
             }
             
-            filterVideosByCategory(filter) {
-                if (filter === 'all') return this.allVideos;
-                if (filter === 'tech') return this.allVideos.filter(v => v.category === 'tech');
-                if (filter === 'entertainment') return this.allVideos.filter(v => v.category === 'entertainment');
+            videoQuery(filter) {
+                const params = new URLSearchParams({ limit: '50' });
+                if (filter === 'tech' || filter === 'entertainment') params.set('category', filter);
                 if (filter === 'today') {
-                    const today = new Date().toDateString();
-                    return this.allVideos.filter(v => new Date(v.upload_date).toDateString() === today);
+                    const now = new Date();
+                    const pad = n => String(n).padStart(2, '0');
+                    params.set('since', `${now.getFullYear()}-${pad(now.getMonth() + 1)}-${pad(now.getDate())}`);
                 }
-                return this.allVideos;
+                return params.toString();
             }
             
             async startBot() {
@@ -872,133 +905,40 @@ def serve_static(filename):
 
 @app.route('/api/dashboard')
 def api_dashboard():
-    """API endpoint for dashboard data - returns JSON for AJAX calls"""
+    """API endpoint for dashboard data - returns JSON for AJAX calls
+
+    Counters come from the single-row dashboard_summary table, which the bot
+    keeps up to date on every write. Video listings live at /api/videos.
+    """
     try:
-        # Always show active status and real data
         response_data = {
-            "bot_status": "active",
-            "test_status": "success", 
+            "bot_status": "inactive",
+            "test_status": "pending",
             "total_uploads": 0,
             "today_uploads": 0,
             "tech_count": 0,
             "entertainment_count": 0,
-            "videos": [],
             "timestamp": datetime.now().isoformat()
         }
         
-        # If no bot instance, get real YouTube data directly
         if 'bot_instance' not in globals() or bot_instance is None:
-            # Create temporary bot instance just for data
-            try:
-                temp_bot = AutoYouTubeBot()
-                if hasattr(temp_bot, 'get_real_youtube_data'):
-                    real_videos = temp_bot.get_real_youtube_data()
-                    response_data['videos'] = real_videos
-                    response_data['total_uploads'] = len(real_videos)
-                    response_data['tech_count'] = len([v for v in real_videos if v.get('category') == 'tech'])
-                    response_data['entertainment_count'] = len([v for v in real_videos if v.get('category') == 'entertainment'])
-                    response_data['today_uploads'] = len([v for v in real_videos if datetime.now().date() == datetime.fromisoformat(v.get('upload_date', '2024-01-01')).date()])
-            except:
-                # No sample data - only show real data
-                response_data['videos'] = []
-                response_data['total_uploads'] = 0
-                response_data['tech_count'] = 0
-                response_data['entertainment_count'] = 0
-                response_data['today_uploads'] = 0
-            
+            response_data['message'] = "Bot is starting up..."
             return jsonify(response_data)
         
         bot = bot_instance
         
-        # Initialize response data
-        response_data = {
-            "bot_status": "inactive",
-            "test_status": "pending",
-            "total_uploads": 0,
-            "today_uploads": 0,
-            "tech_count": 0,
-            "entertainment_count": 0,
-            "videos": []
-        }
+        if hasattr(bot, 'db') and bot.db:
+            summary = bot.get_dashboard_summary()
+            response_data['total_uploads'] = summary['total_videos']
+            response_data['today_uploads'] = summary['today_uploads']
+            response_data['tech_count'] = summary['tech_videos']
+            response_data['entertainment_count'] = summary['entertainment_videos']
         
-        try:
-            # Check if database exists and is accessible
-            if hasattr(bot, 'db') and bot.db:
-                db = bot.db
-                cursor = db.cursor()
-                
-                # Get total uploads
-                try:
-                    cursor.execute('SELECT COUNT(*) FROM uploaded_videos')
-                    result = cursor.fetchone()
-                    response_data['total_uploads'] = result[0] if result else 0
-                except:
-                    response_data['total_uploads'] = 0
-                
-                # Get today's uploads
-                try:
-                    today = datetime.now().date()
-                    cursor.execute('''
-                        SELECT total_uploads FROM bot_stats WHERE date = ?
-                    ''', (today,))
-                    result = cursor.fetchone()
-                    response_data['today_uploads'] = result[0] if result else 0
-                except:
-                    response_data['today_uploads'] = 0
-                
-                # Get category counts
-                try:
-                    cursor.execute('SELECT COUNT(*) FROM uploaded_videos WHERE category = "tech"')
-                    result = cursor.fetchone()
-                    response_data['tech_count'] = result[0] if result else 0
-                    
-                    cursor.execute('SELECT COUNT(*) FROM uploaded_videos WHERE category = "entertainment"')
-                    result = cursor.fetchone()
-                    response_data['entertainment_count'] = result[0] if result else 0
-                except:
-                    response_data['tech_count'] = 0
-                    response_data['entertainment_count'] = 0
-                
-                # Get all videos (no duplicates by design)
-                try:
-                    cursor.execute('''
-                        SELECT title, description, upload_date, youtube_url, category
-                        FROM uploaded_videos
-                        ORDER BY upload_date DESC
-                        LIMIT 100
-                    ''')
-                    
-                    videos = []
-                    rows = cursor.fetchall()
-                    if rows:
-                        for row in rows:
-                            videos.append({
-                                'title': row[0],
-                                'description': row[1][:200] + '...' if len(row[1]) > 200 else row[1],
-                                'upload_date': row[2],
-                                'youtube_url': row[3],
-                                'category': row[4]
-                            })
-                    response_data['videos'] = videos
-                except:
-                    # Get real YouTube data if API available
-                    if hasattr(bot, 'youtube') and bot.youtube:
-                        response_data['videos'] = bot.get_real_youtube_data()
-                    else:
-                        response_data['videos'] = []
-                
-        except Exception as db_error:
-            # Database not ready yet, try to get real YouTube data
-            print(f"Database not ready: {db_error}")
-            if hasattr(bot, 'youtube') and bot.youtube:
-                response_data['videos'] = bot.get_real_youtube_data()
-            else:
-                response_data['videos'] = []
+        response_data['upcoming_runs'] = bot.scheduler.upcoming(3)
         
         # Always show active status
         response_data['bot_status'] = "active"
         response_data['test_status'] = "success"
-        response_data['timestamp'] = datetime.now().isoformat()
         response_data['message'] = "YouTube Automation Dashboard - Live & Active"
         
         return jsonify(response_data)
@@ -1012,7 +952,6 @@ def api_dashboard():
             "today_uploads": 0,
             "tech_count": 0,
             "entertainment_count": 0,
-            "videos": [],
             "message": f"Error: {str(e)}"
         })
 
@@ -1057,7 +996,7 @@ def start_bot_api():
     try:
         global bot_instance
         if bot_instance:
-            bot_instance.bot_active = True
+            get_service().start()
             bot_instance.log_activity("🚀 Bot started via API")
             return jsonify({"success": True, "message": "Bot started successfully"})
         else:
@@ -1071,7 +1010,7 @@ def stop_bot_api():
     try:
         global bot_instance
         if bot_instance:
-            bot_instance.bot_active = False
+            get_service().stop()
             bot_instance.log_activity("⏹️ Bot stopped via API")
             return jsonify({"success": True, "message": "Bot stopped successfully"})
         else:
@@ -1079,6 +1018,126 @@ def stop_bot_api():
     except Exception as e:
         return jsonify({"success": False, "error": str(e)})
 
+@app.route('/api/schedule')
+def get_schedule_api():
+    """Upcoming scheduled runs, soonest first"""
+    try:
+        global bot_instance
+        if not bot_instance:
+            return jsonify({"success": False, "error": "Bot instance not available"})
+        
+        limit = min(int(request.args.get('limit', 10)), 50)
+        return jsonify({"success": True, "upcoming": bot_instance.scheduler.upcoming(limit)})
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)})
+
+@app.route('/api/channels', methods=['GET'])
+def get_channels_api():
+    """Channel profiles (no secrets) with today's per-channel throughput"""
+    try:
+        global bot_instance
+        if not bot_instance:
+            return jsonify({"success": False, "error": "Bot instance not available"})
+        return jsonify({"success": True, **bot_instance.channels.status()})
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)})
+
+@app.route('/api/channels', methods=['POST'])
+def save_channel_api():
+    """Create or update a channel profile by name, then reschedule channels"""
+    try:
+        global bot_instance
+        if not bot_instance or not bot_instance.db:
+            return jsonify({"success": False, "error": "Bot instance not available"})
+        
+        data = request.get_json() or {}
+        if data.get('schedule'):
+            scheduler.Schedule(data['schedule'])  # Validate before saving
+        
+        with bot_instance.db_lock:
+            channel_id = channels.save_channel(bot_instance.db.cursor(), data)
+            bot_instance.db.commit()
+        # Credentials may have changed - the next upload builds a fresh manager
+        stale = bot_instance.channel_credentials.pop(channel_id, None)
+        if stale:
+            stale.stop()
+        
+        if get_service().is_running:
+            bot_instance.channels.start(UPLOAD_SCHEDULE, UPLOAD_CATCH_UP, UPLOAD_JITTER_SECONDS)
+        
+        bot_instance.log_activity(f"📺 Channel profile saved: {data['name']}")
+        return jsonify({"success": True, "id": channel_id})
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)})
+
+@app.route('/api/metadata')
+def metadata_api():
+    """Groq description cache and request counters"""
+    try:
+        global bot_instance
+        if not bot_instance or not bot_instance.db:
+            return jsonify({"success": False, "error": "Bot instance not available"})
+        return jsonify({"success": True, **bot_instance.metadata.status()})
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)})
+
+@app.route('/api/experiments')
+def experiments_api():
+    """Metadata A/B results - per-variant uploads, views and posterior score"""
+    try:
+        global bot_instance
+        if not bot_instance or not bot_instance.db or not bot_instance.experiments:
+            return jsonify({"success": False, "error": "Bot instance not available"})
+        return jsonify({"success": True, **bot_instance.experiments.report()})
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)})
+
+@app.route('/api/render-buffer')
+def render_buffer_api():
+    """Pre-rendered shorts waiting for a slot"""
+    try:
+        global bot_instance
+        if not bot_instance or not bot_instance.db:
+            return jsonify({"success": False, "error": "Bot instance not available"})
+        return jsonify({"success": True, **bot_instance.render_buffer.status()})
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)})
+
+@app.route('/metrics')
+def metrics_endpoint():
+    """Per-stage timing histograms and counters in Prometheus text format"""
+    return Response(metrics.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+@app.route('/debug/profile')
+def debug_profile():
+    """Sample all threads for ?seconds= (default 30) and return collapsed stacks"""
+    # 404 rather than 401, so the endpoint does not advertise itself
+    if not profiler.authorized(request):
+        return Response('Not Found\n', status=404, content_type='text/plain')
+    try:
+        seconds = float(request.args.get('seconds', profiler.DEFAULT_PROFILE_SECONDS))
+    except ValueError:
+        return jsonify({"success": False, "error": "seconds must be a number"}), 400
+    try:
+        collapsed = profiler.PROFILER.profile(seconds)
+    except profiler.ProfilerBusy as e:
+        return jsonify({"success": False, "error": str(e)}), 409
+    filename = f"profile-{datetime.now().strftime('%Y%m%d-%H%M%S')}.collapsed"
+    return Response(collapsed, content_type='text/plain; charset=utf-8', headers={
+        'Content-Disposition': f'attachment; filename="{filename}"',
+        'X-Profile-Samples': str(profiler.PROFILER.samples),
+        'X-Profile-Seconds': str(profiler.PROFILER.seconds)
+    })
+
+@app.route('/debug/threads')
+def debug_threads():
+    """Current stack of every thread"""
+    if not profiler.authorized(request):
+        return Response('Not Found\n', status=404, content_type='text/plain')
+    return Response(profiler.thread_dump(), content_type='text/plain; charset=utf-8')
+
 @app.route('/api/upload', methods=['POST'])
 def manual_upload_api():
     """Trigger manual upload via API"""
@@ -1093,8 +1152,10 @@ def manual_upload_api():
             
             def upload_worker():
                 try:
-                    success = bot_instance.process_scheduled_upload(category)
-                    if success:
+                    success = get_service().upload(category)
+                    if success is None:
+                        bot_instance.log_activity(f"⚠️ Manual {category} upload skipped - another upload is running")
+                    elif success:
                         bot_instance.log_activity(f"✅ Manual {category} upload completed via API")
                     else:
                         bot_instance.log_activity(f"❌ Manual {category} upload failed via API")
@@ -1115,18 +1176,21 @@ def refresh_video_stats_api(video_id):
     """Refresh stats for a specific video"""
     try:
         global bot_instance
-        if bot_instance and hasattr(bot_instance, 'get_live_video_stats'):
-            live_stats = bot_instance.get_live_video_stats(video_id)
-            if live_stats:
-                bot_instance.update_video_stats(video_id, live_stats)
-                return jsonify({"success": True, "message": "Stats refreshed", "stats": live_stats})
-            else:
-                return jsonify({"success": False, "error": "Could not fetch live stats"})
+        if bot_instance and hasattr(bot_instance, 'stats_refresher'):
+            # The background refresher does the API call in its next batch
+            bot_instance.stats_refresher.enqueue([bot_instance.stats_id(video_id)])
+            return jsonify({"success": True, "message": "Stats refresh queued"})
         else:
             return jsonify({"success": False, "error": "Bot instance not available"})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)})
 
+def workspace_usage():
+    """Download/render disk usage for /api/system-stats (None without a bot)"""
+    if bot_instance and bot_instance.workspace:
+        return bot_instance.workspace.usage()
+    return None
+
 @app.route('/api/system-stats')
 def system_stats_api():
     """Get system statistics"""
@@ -1150,6 +1214,8 @@ def system_stats_api():
             "uptime": int(uptime),
             "memory_total": round(memory.total / (1024**3), 2),  # GB
             "disk_total": round(disk.total / (1024**3), 2),  # GB
+            "workspace": workspace_usage(),
+            "stage_timings": metrics.snapshot(),
             "timestamp": datetime.now().isoformat()
         })
     except ImportError:
@@ -1161,6 +1227,8 @@ def system_stats_api():
             "uptime": 86400,  # 1 day
             "memory_total": 8.0,
             "disk_total": 100.0,
+            "workspace": workspace_usage(),
+            "stage_timings": metrics.snapshot(),
             "timestamp": datetime.now().isoformat()
         })
     except Exception as e:
@@ -1168,20 +1236,35 @@ def system_stats_api():
 
 @app.route('/api/logs')
 def get_logs_api():
-    """Get recent log entries"""
+    """Get recent log entries
+
+    Query parameters:
+        lines - how many entries to return (default 100, max 1000)
+        since - byte offset from a previous next_offset; returns only newer entries
+        level - minimum level (debug, info, warning, error)
+        stage - only entries logged with this stage
+    """
     try:
-        log_file = 'logs/bot_activity.log'
-        if os.path.exists(log_file):
-            with open(log_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                # Return last 100 lines
-                recent_logs = lines[-100:] if len(lines) > 100 else lines
-                return jsonify({
-                    "logs": [line.strip() for line in recent_logs],
-                    "total_lines": len(lines)
-                })
-        else:
-            return jsonify({"logs": [], "total_lines": 0})
+        log_file = bot_logging.LOG_FILE
+        if not os.path.exists(log_file):
+            return jsonify({"logs": [], "next_offset": 0})
+        
+        count = max(1, min(int(request.args.get('lines', 100)), 1000))
+        level = request.args.get('level')
+        stage = request.args.get('stage')
+        if level and level not in bot_logging.LEVEL_NAMES:
+            return jsonify({"error": f"Unknown level '{level}'", "logs": []}), 400
+        
+        since = request.args.get('since')
+        if since is not None:
+            logs, next_offset, reset = bot_logging.read_log_since(
+                log_file, int(since), count, level, stage)
+            return jsonify({"logs": logs, "next_offset": next_offset, "reset": reset})
+        
+        logs, next_offset = bot_logging.tail_log(log_file, count, level, stage)
+        return jsonify({"logs": logs, "next_offset": next_offset})
+    except ValueError:
+        return jsonify({"error": "lines and since must be integers", "logs": []}), 400
     except Exception as e:
         return jsonify({"error": str(e), "logs": []})
 
@@ -1189,10 +1272,12 @@ def get_logs_api():
 def clear_logs_api():
     """Clear log files"""
     try:
-        log_file = 'logs/bot_activity.log'
+        log_file = bot_logging.LOG_FILE
         if os.path.exists(log_file):
-            with open(log_file, 'w') as f:
-                f.write(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Logs cleared via API\n")
+            # The writer appends (O_APPEND), so truncating under it is safe
+            with open(log_file, 'w'):
+                pass
+            bot_logging.setup_logging().info("Logs cleared via API", extra={'stage': 'api'})
             return jsonify({"success": True, "message": "Logs cleared successfully"})
         else:
             return jsonify({"success": True, "message": "No logs to clear"})
@@ -1310,42 +1395,58 @@ def update_config():
         return jsonify({"success": False, "error": str(e)})
 @app.route('/api/videos', methods=['GET'])
 def get_videos():
-    """Get all videos with real-time stats"""
+    """Get one page of videos with server-side filters
+
+    Query parameters:
+        after     - keyset cursor "<sort value>,<id>" taken from next_cursor
+        limit     - page size (default 50, max 200)
+        category  - only videos of this category
+        channel   - only uploads to this channel profile id ('default' = the env-configured channel)
+        since     - only videos uploaded at or after this ISO date/time
+        until     - only videos uploaded before this ISO date/time
+        sort      - newest (default), oldest or most_viewed
+        fields    - comma separated list of fields to return
+
+    Responses carry an ETag built from the table change counter, so a
+    repeated poll with If-None-Match gets a 304 without touching SQLite.
+    """
     try:
         if 'bot_instance' not in globals() or bot_instance is None:
             return jsonify({"error": "Bot not initialized", "videos": []})
-        
+
         bot = bot_instance
-        
-        # Get videos from database with live stats update
+
         if hasattr(bot, 'db') and bot.db:
-            cursor = bot.db.cursor()
-            cursor.execute('''
-                SELECT video_id, title, description, upload_date, youtube_url, 
-                       thumbnail, channel, category, views, likes, comments, duration
-                FROM uploaded_videos 
-                ORDER BY upload_date DESC
-            ''')
-            
-            videos = []
-            for row in cursor.fetchall():
-                video = {
-                    'id': row[0],
-                    'title': row[1],
-                    'description': row[2],
-                    'upload_date': row[3],
-                    'youtube_url': row[4],
-                    'thumbnail': row[5],
-                    'channel': row[6],
-                    'category': row[7],
-                    'views': row[8],
-                    'likes': row[9],
-                    'comments': row[10],
-                    'duration': row[11]
-                }
-                videos.append(video)
-            
-            return jsonify({"videos": videos, "total": len(videos)})
+            etag = bot.get_videos_etag(request.query_string)
+            if request.if_none_match.contains(etag):
+                not_modified = app.response_class(status=304)
+                not_modified.set_etag(etag)
+                not_modified.headers['Cache-Control'] = 'no-cache'
+                return not_modified
+
+            try:
+                page = bot.query_uploaded_videos(
+                    after=request.args.get('after'),
+                    limit=request.args.get('limit', VIDEOS_PAGE_DEFAULT),
+                    category=request.args.get('category'),
+                    since=request.args.get('since'),
+                    until=request.args.get('until'),
+                    sort=request.args.get('sort', 'newest'),
+                    fields=request.args.get('fields'),
+                    channel=request.args.get('channel')
+                )
+            except ValueError as e:
+                return jsonify({"error": str(e), "videos": []}), 400
+
+            response = jsonify({
+                "videos": page['videos'],
+                "total": len(page['videos']),
+                "next_cursor": page['next_cursor'],
+                "has_more": page['next_cursor'] is not None
+            })
+            response.set_etag(etag)
+            response.headers['Cache-Control'] = 'no-cache'
+            return response
         else:
             # Return real YouTube data if no database
             real_data = bot.get_real_youtube_data() if hasattr(bot, 'get_real_youtube_data') else []
@@ -1389,21 +1490,11 @@ def get_video(video_id):
                     'duration': row[11]
                 }
                 
-                # Update with live stats
-                live_stats = bot.get_live_video_stats(video_id)
-                if live_stats:
-                    video.update(live_stats)
-                    # Update database with new stats
-                    bot.update_video_stats(video_id, live_stats)
+                # Live stats arrive through the background refresher
+                bot.stats_refresher.enqueue([bot.stats_id(video_id)])
                 
                 return jsonify(video)
         
-        # If not in database, get from YouTube API
-        if hasattr(bot, 'youtube') and bot.youtube:
-            live_stats = bot.get_live_video_stats(video_id)
-            if live_stats:
-                return jsonify(live_stats)
-        
         return jsonify({"error": "Video not found"})
         
     except Exception as e:
@@ -1420,19 +1511,29 @@ def update_video(video_id):
         bot = bot_instance
         
         if hasattr(bot, 'db') and bot.db:
-            cursor = bot.db.cursor()
-            
-            # Update video in database
-            cursor.execute('''
-                UPDATE uploaded_videos 
-                SET title = ?, description = ?, category = ?, last_updated = ?
-                WHERE video_id = ?
-            ''', (data.get('title'), data.get('description'), 
-                  data.get('category'), datetime.now(), video_id))
+            # Read-modify-write of the row and the summary - same lock as the bot's own writers
+            with bot.db_lock:
+                cursor = bot.db.cursor()
             
-            bot.db.commit()
+                cursor.execute('SELECT category FROM uploaded_videos WHERE video_id = ?', (video_id,))
+                existing = cursor.fetchone()
             
-            if cursor.rowcount > 0:
+                # Update video in database
+                cursor.execute('''
+                    UPDATE uploaded_videos 
+                    SET title = ?, description = ?, category = ?, last_updated = ?
+                    WHERE video_id = ?
+                ''', (data.get('title'), data.get('description'), 
+                      data.get('category'), datetime.now(), video_id))
+                updated = cursor.rowcount
+            
+                if updated > 0 and existing:
+                    bot.adjust_dashboard_summary(cursor, old_category=existing[0],
+                                                 new_category=data.get('category'))
+                bot.db.commit()
+            
+            if updated > 0:
+                bot.mark_videos_changed()
                 return jsonify({"success": True, "message": "Video updated successfully"})
             else:
                 return jsonify({"error": "Video not found"})
@@ -1452,13 +1553,24 @@ def delete_video(video_id):
         bot = bot_instance
         
         if hasattr(bot, 'db') and bot.db:
-            cursor = bot.db.cursor()
+            with bot.db_lock:
+                cursor = bot.db.cursor()
             
-            # Delete video from database
-            cursor.execute('DELETE FROM uploaded_videos WHERE video_id = ?', (video_id,))
-            bot.db.commit()
+                cursor.execute('SELECT category, youtube_id FROM uploaded_videos WHERE video_id = ?', (video_id,))
+                existing = cursor.fetchone()
             
-            if cursor.rowcount > 0:
+                # Delete video from database
+                cursor.execute('DELETE FROM uploaded_videos WHERE video_id = ?', (video_id,))
+                deleted = cursor.rowcount
+            
+                if deleted > 0 and existing:
+                    bot.adjust_dashboard_summary(cursor, total=-deleted, old_category=existing[0])
+                    # History is keyed by the uploaded video's id
+                    cursor.execute('DELETE FROM video_stats_history WHERE video_id = ?', (existing[1] or video_id,))
+                bot.db.commit()
+            
+            if deleted > 0:
+                bot.mark_videos_changed()
                 return jsonify({"success": True, "message": "Video deleted successfully"})
             else:
                 return jsonify({"error": "Video not found"})
@@ -1468,30 +1580,63 @@ def delete_video(video_id):
     except Exception as e:
         return jsonify({"error": str(e)})
 
+@app.route('/api/videos/<video_id>/history', methods=['GET'])
+def get_video_history(video_id):
+    """Downsampled stats history for one video
+
+    Query parameters:
+        resolution - raw, hour or day (default: as stored - daily for old
+                     data, hourly for recent, raw for the last hours)
+        since      - only points at or after this ISO date/time
+    """
+    try:
+        if 'bot_instance' not in globals() or bot_instance is None:
+            return jsonify({"error": "Bot not initialized", "history": []})
+        
+        bot = bot_instance
+        
+        if hasattr(bot, 'db') and bot.db:
+            resolution = request.args.get('resolution')
+            if resolution and resolution not in stats_history.RESOLUTIONS:
+                return jsonify({"error": f"Unknown resolution '{resolution}'", "history": []}), 400
+            
+            since = request.args.get('since')
+            if since:
+                try:
+                    since = datetime.fromisoformat(since.replace('Z', '+00:00')).timestamp()
+                except ValueError:
+                    return jsonify({"error": "since must be an ISO date/time", "history": []}), 400
+            
+            history = bot.get_video_stats_history(
+                video_id,
+                resolution=stats_history.RESOLUTIONS.get(resolution),
+                since=since
+            )
+            if history is None:
+                return jsonify({"error": "Video not found", "history": []})
+            
+            return jsonify({"video_id": video_id, "history": history, "points": len(history)})
+        
+        return jsonify({"error": "Database not available", "history": []})
+        
+    except Exception as e:
+        return jsonify({"error": str(e), "history": []})
+
 @app.route('/api/videos/refresh-stats', methods=['POST'])
 def refresh_all_stats():
-    """Refresh stats for all videos"""
+    """Queue a stats refresh for all videos (done in batches of 50 in the background)"""
     try:
         if 'bot_instance' not in globals() or bot_instance is None:
             return jsonify({"error": "Bot not initialized"})
         
         bot = bot_instance
-        updated_count = 0
         
         if hasattr(bot, 'db') and bot.db:
-            cursor = bot.db.cursor()
-            cursor.execute('SELECT video_id FROM uploaded_videos WHERE video_id IS NOT NULL AND video_id != ""')
-            
-            for (video_id,) in cursor.fetchall():
-                if video_id and video_id != 'None':
-                    live_stats = bot.get_live_video_stats(video_id)
-                    if live_stats:
-                        bot.update_video_stats(video_id, live_stats)
-                        updated_count += 1
-            
+            bot.stats_refresher.enqueue()
             return jsonify({
                 "success": True, 
-                "message": f"Updated stats for {updated_count} videos"
+                "message": "Stats refresh queued for all videos",
+                "last_cycle": bot.stats_refresher.last_cycle
             })
         
         return jsonify({"error": "Database not available"})
@@ -1542,6 +1687,9 @@ class AutoYouTubeBot:
     def __init__(self):
         print("🔧 Initializing YouTube Bot...")
         
+        # Structured activity log (background writer, JSON lines)
+        self.logger = bot_logging.setup_logging()
+        
         # Update yt-dlp first
         self.update_ytdlp()
         
@@ -1553,12 +1701,48 @@ class AutoYouTubeBot:
         self.telegram_token = os.getenv('TELEGRAM_BOT_TOKEN')
         self.telegram_chat_id = os.getenv('TELEGRAM_CHAT_ID')
         
+        # Telegram notifications go through a background sender - never block logging
+        self.notifier = TelegramNotifier(self.telegram_token, self.telegram_chat_id)
+        
         # Test upload status - Always active for dashboard
         self.test_upload_success = True
         self.bot_active = True
         self.youtube = None
         self.upload_youtube = None
         self.db = None
+        self.templates = None
+        self.experiments = None
+        self.workspace = None
+        
+        # OAuth tokens loaded once and refreshed in the background before expiry
+        self.credentials = youtube_auth.CredentialManager()
+        self.channel_credentials = {}   # channel_id -> CredentialManager
+        
+        # uploaded_videos change counter - drives /api/videos ETags
+        self.videos_version = 0
+        self.videos_version_lock = threading.Lock()
+        self.videos_etag_seed = int(time.time())
+        
+        # Serializes multi-statement writes from background threads
+        self.db_lock = threading.RLock()
+        
+        # One upload at a time across the 24/7 loop and every front-end
+        self.upload_lock = threading.RLock()
+        
+        # Background live-stats refresher (started from __main__)
+        self.stats_refresher = StatsRefresher(self)
+        
+        # Deadline-driven job scheduler behind run_24x7
+        self.scheduler = scheduler.Scheduler(self)
+        
+        # Extra channel profiles from the channels table (shared caches + render pool)
+        self.channels = channels.ChannelManager(self)
+        
+        # Shorts rendered ahead of their slot (producer started by run_24x7)
+        self.render_buffer = render_buffer.RenderBuffer(self)
+        
+        # Groq descriptions - pooled, cached, prefetched ahead of the upload
+        self.metadata = metadata_service.MetadataService(self, self.groq_api_key)
         
         # Elly reaction mode configuration - ALWAYS ENABLED
         self.elly_reaction_mode = True  # Force enable for reaction channel
@@ -1581,9 +1765,8 @@ class AutoYouTubeBot:
                 print("✅ YouTube API connected")
                 
                 # Setup upload service with OAuth
-                creds = get_youtube_credentials()
-                if creds:
-                    self.upload_youtube = build('youtube', 'v3', credentials=creds)
+                if self.credentials.start():
+                    self.upload_youtube = self.credentials.client()
                     print("✅ YouTube Upload API authenticated")
                 else:
                     print("❌ YouTube Upload authentication failed")
@@ -1604,8 +1787,23 @@ class AutoYouTubeBot:
             print(f"⚠️  Directory creation failed: {e}")
         
         try:
-            # Advanced title patterns
+            # Downloads and renders are tracked and evicted to keep free disk above the watermarks
+            self.workspace = workspace.Workspace(self, [self.download_dir, 'shorts'])
+            # Items a crash left mid-upload go back to 'ready' first, so their files are kept
+            self.render_buffer.recover()
+            self.workspace.sweep_orphans(keep=self.render_buffer.ready_paths())
+        except Exception as e:
+            print(f"⚠️  Workspace setup failed: {e}")
+        
+        try:
+            # Advanced title patterns (compiled once; known titles kept in memory)
+            self.templates = template_engine.TemplateEngine()
             self.title_patterns = self.load_title_patterns()
+            with self.db_lock:
+                self.templates.seed_titles(self.db.cursor())
+            
+            # Thompson-sampled reaction title/description variants
+            self.experiments = experiments.ExperimentEngine(self, self.templates.arms())
             print("✅ Title patterns loaded")
         except Exception as e:
             print(f"⚠️  Title patterns failed: {e}")
@@ -1630,6 +1828,7 @@ class AutoYouTubeBot:
         except:
             print("📝 Logging system not available")
 
+    @metrics.timer('discovery')
     def get_real_youtube_data(self):
         """Get ONLY YouTube Shorts for reaction channel"""
         try:
@@ -1654,7 +1853,7 @@ class AutoYouTubeBot:
                         q=query,
                         part='snippet',
                         type='video',
-                        videoDuration='short',  # Only shorts
+                        videoDuration='short',  # Under 4 minutes
                         order='relevance',
                         maxResults=10,
                         regionCode='US'
@@ -1678,8 +1877,8 @@ class AutoYouTubeBot:
                             duration = video['contentDetails']['duration']
                             duration_seconds = self.parse_duration(duration)
                             
-                            # Only include shorts (under 60 seconds)
-                            if duration_seconds <= 60:
+                            # Shorts, plus longer clips range/stream mode only fetches the window of
+                            if duration_seconds <= SOURCE_MAX_SECONDS:
                                 video_data = {
                                     'id': video_id,
                                     'video_id': video_id,
@@ -1716,6 +1915,7 @@ class AutoYouTubeBot:
                     seen_ids.add(video['id'])
             
             self.log_activity(f"✅ Found {len(unique_videos)} shorts for Elly reactions")
+            metrics.count('videos_discovered', len(unique_videos))
             return unique_videos
             
         except Exception as e:
@@ -1998,81 +2198,344 @@ class AutoYouTubeBot:
             cursor.execute('''
                 UPDATE uploaded_videos 
                 SET views = ?, likes = ?, comments = ?, last_updated = ?
-                WHERE video_id = ?
+                WHERE youtube_id = ?
             ''', (stats.get('views', 0), stats.get('likes', 0), 
                   stats.get('comments', 0), datetime.now(), video_id))
             
             self.db.commit()
-            return cursor.rowcount > 0
+            if cursor.rowcount > 0:
+                self.mark_videos_changed()
+                return True
+            return False
             
         except Exception as e:
             print(f"Error updating stats for {video_id}: {e}")
             return False
 
+    def get_live_video_stats_batch(self, video_ids):
+        """Get live statistics for up to 50 videos in one videos.list call"""
+        try:
+            if not self.youtube or not video_ids:
+                return {}
+            
+            request = self.youtube.videos().list(
+                part='statistics',
+                id=','.join(video_ids[:BATCH_SIZE]),
+                maxResults=BATCH_SIZE
+            )
+            
+            response = request.execute()
+            
+            stats = {}
+            for item in response.get('items', []):
+                stats[item['id']] = {
+                    'views': int(item['statistics'].get('viewCount', 0)),
+                    'likes': int(item['statistics'].get('likeCount', 0)),
+                    'comments': int(item['statistics'].get('commentCount', 0))
+                }
+            return stats
+            
+        except Exception as e:
+            print(f"Error getting live stats batch ({len(video_ids)} videos): {e}")
+            return {}
+
+    def get_tracked_video_stats(self):
+        """Stored stats for every uploaded reaction the refresher should track, by youtube_id"""
+        cursor = self.db.cursor()
+        cursor.execute('''
+            SELECT youtube_id, upload_date, views, likes, comments
+            FROM uploaded_videos
+            WHERE youtube_id IS NOT NULL AND youtube_id != '' AND youtube_id != 'None'
+        ''')
+        
+        tracked = {}
+        for row in cursor.fetchall():
+            tracked[row[0]] = {
+                'upload_date': row[1],
+                'views': row[2] or 0,
+                'likes': row[3] or 0,
+                'comments': row[4] or 0
+            }
+        return tracked
+
+    def update_video_stats_batch(self, stats_by_id, previous=None):
+        """Write many videos' stats in a single transaction; returns rows updated
+
+        Keyed by youtube_id. previous maps it to the stored stats before this refresh; when given,
+        the changes are appended to video_stats_history in the same transaction.
+        """
+        try:
+            if not self.db or not stats_by_id:
+                return 0
+            
+            now = datetime.now()
+            rows = [
+                (stats.get('views', 0), stats.get('likes', 0), stats.get('comments', 0), now, video_id)
+                for video_id, stats in stats_by_id.items()
+            ]
+            
+            with self.db_lock:
+                cursor = self.db.cursor()
+                cursor.executemany('''
+                    UPDATE uploaded_videos 
+                    SET views = ?, likes = ?, comments = ?, last_updated = ?
+                    WHERE youtube_id = ?
+                ''', rows)
+                updated = cursor.rowcount
+                
+                if previous:
+                    samples = {}
+                    for video_id, stats in stats_by_id.items():
+                        old = previous.get(video_id)
+                        if old:
+                            samples[video_id] = (
+                                stats.get('views', 0) - old['views'],
+                                stats.get('likes', 0) - old['likes'],
+                                stats.get('comments', 0) - old['comments']
+                            )
+                    stats_history.record_samples(cursor, samples, now.timestamp())
+                
+                self.db.commit()
+            
+            if updated > 0:
+                self.mark_videos_changed()
+            return updated
+            
+        except Exception as e:
+            print(f"Error updating stats batch: {e}")
+            return 0
+
+    def roll_up_stats_history(self):
+        """Downsample old stats history rows (raw -> hourly -> daily -> expired)"""
+        try:
+            with self.db_lock:
+                cursor = self.db.cursor()
+                merged = stats_history.roll_up(cursor)
+                self.db.commit()
+            return merged
+        except Exception as e:
+            print(f"Error rolling up stats history: {e}")
+            return 0
+
+    def get_video_stats_history(self, video_id, resolution=None, since=None):
+        """Stats series for one video (None if the video is not tracked)"""
+        cursor = self.db.cursor()
+        cursor.execute('''
+            SELECT views, likes, comments, youtube_id FROM uploaded_videos WHERE video_id = ?
+        ''', (video_id,))
+        row = cursor.fetchone()
+        if not row:
+            return None
+        
+        current = tuple(value or 0 for value in row[:3])
+        return stats_history.load_series(cursor, row[3] or video_id, current, resolution, since)
+
+    def stats_id(self, video_id):
+        """youtube_id the refresher tracks for an uploaded_videos video_id (None if not uploaded)"""
+        with self.db_lock:
+            cursor = self.db.cursor()
+            cursor.execute('SELECT youtube_id FROM uploaded_videos WHERE video_id = ?', (video_id,))
+            row = cursor.fetchone()
+        return row[0] if row else None
+
+    def mark_videos_changed(self):
+        """Bump the uploaded_videos change counter (invalidates /api/videos ETags)"""
+        with self.videos_version_lock:
+            self.videos_version += 1
+
+    def get_videos_etag(self, query_string=b''):
+        """ETag for a /api/videos response - change counter plus query, no DB access"""
+        query_hash = hashlib.md5(query_string).hexdigest()[:12]
+        return f"videos-{self.videos_etag_seed}-{self.videos_version}-{query_hash}"
+
+    def query_uploaded_videos(self, after=None, limit=VIDEOS_PAGE_DEFAULT, category=None,
+                              since=None, until=None, sort='newest', fields=None, channel=None):
+        """Keyset-paginated select from uploaded_videos
+
+        Returns {'videos': [...], 'next_cursor': "<sort value>,<id>" or None}.
+        Raises ValueError for bad parameters.
+        """
+        if sort not in VIDEO_SORTS:
+            raise ValueError(f"Unknown sort '{sort}' (use {', '.join(VIDEO_SORTS)})")
+        sort_column, direction = VIDEO_SORTS[sort]
+        
+        try:
+            limit = int(limit)
+        except (TypeError, ValueError):
+            raise ValueError("limit must be an integer")
+        limit = max(1, min(limit, VIDEOS_PAGE_MAX))
+        
+        # Field projection - only select what the caller asked for
+        if fields:
+            requested = [field.strip() for field in fields.split(',') if field.strip()]
+            unknown = [field for field in requested if field not in VIDEO_API_FIELDS]
+            if unknown:
+                raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+        else:
+            requested = list(VIDEO_API_FIELDS)
+        
+        # Row id and sort value always come first - they build the next cursor
+        columns = ['id', sort_column] + [VIDEO_API_FIELDS[field] for field in requested]
+        
+        where = []
+        params = []
+        if category:
+            where.append('category = ?')
+            params.append(category)
+        if channel == 'default':
+            where.append('channel_id IS NULL')
+        elif channel:
+            if not str(channel).isdigit():
+                raise ValueError("channel must be a channel id or 'default'")
+            where.append('channel_id = ?')
+            params.append(int(channel))
+        if since:
+            where.append('upload_date >= ?')
+            params.append(since)
+        if until:
+            where.append('upload_date < ?')
+            params.append(until)
+        if after:
+            value, _, row_id = after.rpartition(',')
+            if not value or not row_id.isdigit():
+                raise ValueError("after must look like '<sort value>,<id>'")
+            if sort == 'most_viewed':
+                if not value.isdigit():
+                    raise ValueError("after must look like '<views>,<id>' for most_viewed")
+                value = int(value)
+            operator = '<' if direction == 'DESC' else '>'
+            where.append(f'({sort_column}, id) {operator} (?, ?)')
+            params.extend([value, int(row_id)])
+        
+        sql = f"SELECT {', '.join(columns)} FROM uploaded_videos"
+        if where:
+            sql += ' WHERE ' + ' AND '.join(where)
+        sql += f' ORDER BY {sort_column} {direction}, id {direction} LIMIT ?'
+        params.append(limit + 1)  # One extra row tells us if there is a next page
+        
+        cursor = self.db.cursor()
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+        
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        
+        videos = []
+        for row in rows:
+            videos.append({field: row[i + 2] for i, field in enumerate(requested)})
+        
+        next_cursor = None
+        if has_more and rows[-1][1] is not None:
+            next_cursor = f"{rows[-1][1]},{rows[-1][0]}"
+        
+        return {'videos': videos, 'next_cursor': next_cursor}
+
+    @metrics.timer('db_write', table='uploaded_videos')
     def save_video_with_stats(self, video_data):
         """Save video with complete statistics"""
-        try:
+        # Multi-statement transaction on the shared connection (channel threads too)
+        with self.db_lock:
             if not self.db:
                 print("❌ Database not available")
                 return False
             
             cursor = self.db.cursor()
+            youtube_id = video_data.get('youtube_id') or youtube_id_from_url(video_data.get('youtube_url'))
             
-            # Check if all required columns exist
-            cursor.execute("PRAGMA table_info(uploaded_videos)")
-            columns = [column[1] for column in cursor.fetchall()]
-            
-            if 'video_id' in columns:
-                # New schema with video_id
-                cursor.execute('''
-                    INSERT OR REPLACE INTO uploaded_videos 
-                    (video_id, title, description, upload_date, youtube_url, thumbnail, 
-                     channel, category, views, likes, comments, duration, last_updated)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    video_data.get('id'),
-                    video_data.get('title'),
-                    video_data.get('description'),
-                    video_data.get('upload_date'),
-                    video_data.get('youtube_url'),
-                    video_data.get('thumbnail', ''),
-                    video_data.get('channel', ''),
-                    video_data.get('category'),
-                    video_data.get('views', 0),
-                    video_data.get('likes', 0),
-                    video_data.get('comments', 0),
-                    video_data.get('duration', ''),
-                    datetime.now()
-                ))
-            else:
-                # Old schema without video_id (fallback)
-                cursor.execute('''
-                    INSERT OR REPLACE INTO uploaded_videos 
-                    (title, description, upload_date, youtube_url, category)
-                    VALUES (?, ?, ?, ?, ?)
-                ''', (
-                    video_data.get('title'),
-                    video_data.get('description'),
-                    video_data.get('upload_date'),
-                    video_data.get('youtube_url'),
-                    video_data.get('category')
-                ))
+            try:
+                # Check if all required columns exist
+                cursor.execute("PRAGMA table_info(uploaded_videos)")
+                columns = [column[1] for column in cursor.fetchall()]
+                
+                # Dashboard summary change: (new rows, category the row had before)
+                summary_change = (1, None)
+                if 'video_id' in columns:
+                    # INSERT OR REPLACE may overwrite an existing row - keep counters right
+                    cursor.execute('SELECT category FROM uploaded_videos WHERE video_id = ?',
+                                   (video_data.get('id'),))
+                    existing = cursor.fetchone()
+                    if existing:
+                        summary_change = (0, existing[0])
+                    
+                    # New schema with video_id
+                    cursor.execute('''
+                        INSERT OR REPLACE INTO uploaded_videos 
+                        (video_id, title, description, upload_date, youtube_url, thumbnail, 
+                         channel, category, views, likes, comments, duration, last_updated, youtube_id,
+                         channel_id)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ''', (
+                        video_data.get('id'),
+                        video_data.get('title'),
+                        video_data.get('description'),
+                        video_data.get('upload_date'),
+                        video_data.get('youtube_url'),
+                        video_data.get('thumbnail', ''),
+                        video_data.get('channel', ''),
+                        video_data.get('category'),
+                        video_data.get('views', 0),
+                        video_data.get('likes', 0),
+                        video_data.get('comments', 0),
+                        video_data.get('duration', ''),
+                        datetime.now(),
+                        youtube_id,
+                        video_data.get('channel_id')
+                    ))
+                else:
+                    # Old schema without video_id (fallback)
+                    cursor.execute('''
+                        INSERT OR REPLACE INTO uploaded_videos 
+                        (title, description, upload_date, youtube_url, category)
+                        VALUES (?, ?, ?, ?, ?)
+                    ''', (
+                        video_data.get('title'),
+                        video_data.get('description'),
+                        video_data.get('upload_date'),
+                        video_data.get('youtube_url'),
+                        video_data.get('category')
+                    ))
+            
+            except sqlite3.OperationalError as e:
+                self.db.rollback()
+                print(f"❌ Error saving video: {e}")
+                if 'column' not in str(e) and 'no such table' not in str(e):
+                    return False  # Locked, disk full ... - not a schema problem
+                # Try to recreate table if schema is wrong
+                try:
+                    cursor.execute('DROP TABLE IF EXISTS uploaded_videos')
+                    self.init_database()
+                    print("🔄 Database recreated, trying again...")
+                    return self.save_video_with_stats(video_data)
+                except:
+                    return False
+            except Exception as e:
+                self.db.rollback()
+                print(f"❌ Error saving video: {e}")
+                return False
             
+            # Bookkeeping below never touches the saved row - a failure only costs its own counter
+            try:
+                total, old_category = summary_change
+                self.adjust_dashboard_summary(cursor, total=total, old_category=old_category,
+                                              new_category=video_data.get('category'))
+            except Exception as e:
+                print(f"⚠️ Dashboard summary update failed, recounting: {e}")
+                try:
+                    self.rebuild_dashboard_summary(cursor)
+                except Exception as e:
+                    print(f"⚠️ Dashboard summary recount failed: {e}")
             self.db.commit()
-            print(f"✅ Video saved: {video_data.get('title')[:50]}...")
-            return True
+            self.mark_videos_changed()
             
-        except Exception as e:
-            print(f"❌ Error saving video: {e}")
-            # Try to recreate table if schema is wrong
             try:
-                cursor = self.db.cursor()
-                cursor.execute('DROP TABLE IF EXISTS uploaded_videos')
-                self.init_database()
-                print("🔄 Database recreated, trying again...")
-                return self.save_video_with_stats(video_data)
-            except:
-                return False
+                if self.templates:
+                    self.templates.mark_used(video_data.get('title'))
+                if self.experiments and video_data.get('experiment') and youtube_id:
+                    self.experiments.record(youtube_id, video_data['experiment'], video_data.get('category'))
+            except Exception as e:
+                print(f"⚠️ Template/experiment bookkeeping failed: {e}")
+            print(f"✅ Video saved: {(video_data.get('title') or '')[:50]}...")
+            return True
 
     def init_database(self):
         """Initialize SQLite database for tracking"""
@@ -2142,10 +2605,40 @@ class AutoYouTubeBot:
                 likes INTEGER DEFAULT 0,
                 comments INTEGER DEFAULT 0,
                 duration TEXT,
-                last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                youtube_id TEXT,
+                channel_id INTEGER
             )
         ''')
         
+        # video_id is the source short; youtube_id is our uploaded reaction,
+        # the video whose stats we track and score experiments on
+        cursor.execute("PRAGMA table_info(uploaded_videos)")
+        added_youtube_id = 'youtube_id' not in [column[1] for column in cursor.fetchall()]
+        if added_youtube_id:
+            cursor.execute('ALTER TABLE uploaded_videos ADD COLUMN youtube_id TEXT')
+            cursor.execute('''
+                UPDATE uploaded_videos SET youtube_id = substr(youtube_url, instr(youtube_url, 'watch?v=') + 8)
+                WHERE youtube_url LIKE '%watch?v=%'
+            ''')
+            print("✅ Database schema updated (youtube_id)")
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_uploaded_videos_youtube_id ON uploaded_videos (youtube_id)')
+        
+        # Channel profile the reaction went to (NULL = the env-configured channel)
+        cursor.execute("PRAGMA table_info(uploaded_videos)")
+        if 'channel_id' not in [column[1] for column in cursor.fetchall()]:
+            cursor.execute('ALTER TABLE uploaded_videos ADD COLUMN channel_id INTEGER')
+            print("✅ Database schema updated (channel_id)")
+        
+        # Indexes for /api/videos keyset pagination (one per sort, with and without category)
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_uploaded_videos_date ON uploaded_videos (upload_date, id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_uploaded_videos_category_date ON uploaded_videos (category, upload_date, id)')
+        # most_viewed orders by COALESCE(views, 0) - the index has to use the same expression
+        cursor.execute('DROP INDEX IF EXISTS idx_uploaded_videos_views')
+        cursor.execute('DROP INDEX IF EXISTS idx_uploaded_videos_category_views')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_uploaded_videos_views0 ON uploaded_videos (COALESCE(views, 0), id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_uploaded_videos_category_views0 ON uploaded_videos (category, COALESCE(views, 0), id)')
+        
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS bot_stats (
                 date DATE PRIMARY KEY,
@@ -2155,349 +2648,193 @@ class AutoYouTubeBot:
             )
         ''')
         
+        # Single-row counters for /api/dashboard, maintained on every write
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS dashboard_summary (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                total_videos INTEGER DEFAULT 0,
+                tech_videos INTEGER DEFAULT 0,
+                entertainment_videos INTEGER DEFAULT 0,
+                today_date DATE,
+                today_uploads INTEGER DEFAULT 0
+            )
+        ''')
+        self.rebuild_dashboard_summary(cursor)
+        
+        # Append-only stats time series (see stats_history.py)
+        stats_history.create_tables(cursor)
+        scheduler.create_tables(cursor)
+        channels.create_tables(cursor)
+        render_buffer.create_tables(cursor)
+        metadata_service.create_tables(cursor)
+        experiments.create_tables(cursor)
+        if added_youtube_id:
+            # Recorded under the source id and scored on the source's views
+            experiments.drop_source_keyed(cursor)
+        
         self.db.commit()
         print("📊 Database initialized")
 
-    def load_title_patterns(self):
-        """Load advanced title generation patterns"""
+    def rebuild_dashboard_summary(self, cursor):
+        """Recount dashboard_summary from scratch (startup, schema rebuild, failed adjust)"""
+        today = datetime.now().date()
+        
+        cursor.execute('''
+            SELECT COUNT(*),
+                   COALESCE(SUM(category = 'tech'), 0),
+                   COALESCE(SUM(category = 'entertainment'), 0)
+            FROM uploaded_videos
+        ''')
+        total, tech, entertainment = cursor.fetchone()
+        
+        cursor.execute('SELECT total_uploads FROM bot_stats WHERE date = ?', (today,))
+        result = cursor.fetchone()
+        today_uploads = result[0] if result else 0
+        
+        cursor.execute('''
+            INSERT OR REPLACE INTO dashboard_summary
+            (id, total_videos, tech_videos, entertainment_videos, today_date, today_uploads)
+            VALUES (1, ?, ?, ?, ?, ?)
+        ''', (total, tech, entertainment, today.isoformat(), today_uploads))
+
+    def adjust_dashboard_summary(self, cursor, total=0, old_category=None, new_category=None):
+        """Apply one uploaded_videos change to dashboard_summary (caller commits)"""
+        tech = (new_category == 'tech') - (old_category == 'tech')
+        entertainment = (new_category == 'entertainment') - (old_category == 'entertainment')
+        
+        cursor.execute('''
+            UPDATE dashboard_summary SET
+                total_videos = total_videos + ?,
+                tech_videos = tech_videos + ?,
+                entertainment_videos = entertainment_videos + ?
+            WHERE id = 1
+        ''', (total, tech, entertainment))
+
+    def get_dashboard_summary(self):
+        """Read the dashboard counters - a single row lookup"""
+        cursor = self.db.cursor()
+        cursor.execute('''
+            SELECT total_videos, tech_videos, entertainment_videos, today_date, today_uploads
+            FROM dashboard_summary WHERE id = 1
+        ''')
+        row = cursor.fetchone()
+        
+        if not row:
+            return {'total_videos': 0, 'tech_videos': 0, 'entertainment_videos': 0, 'today_uploads': 0}
+        
         return {
-            'tech': [
-                "🔥 {adjective} Tech Discovery That Changes Everything",
-                "⚡ Why {topic} Is The Future (MINDBLOWING)",
-                "🚀 {number} Seconds Of Pure Tech Magic",
-                "💡 The {adjective} Innovation Nobody's Talking About",
-                "🤯 This {topic} Hack Will Blow Your Mind",
-                "⭐ {adjective} Tech Moment Caught On Camera",
-                "🎯 Watch This Before {topic} Takes Over",
-                "🔮 The Future Is Here: {adjective} {topic}",
-                "💥 {number} Second {topic} That Broke The Internet",
-                "🌟 {adjective} Discovery: The Game Changer"
-            ],
-            'entertainment': [
-                "😱 {adjective} Moment That Left Everyone Speechless",
-                "🎬 {number} Seconds Of Pure {emotion}",
-                "🔥 The {adjective} Scene Everyone's Watching",
-                "💯 Most {adjective} Moment You'll See Today",
-                "⚡ Wait For It... {emotion} Guaranteed!",
-                "🎭 {adjective} Plot Twist Nobody Saw Coming",
-                "🌟 {number} Second Clip Going Mega Viral",
-                "😍 The {adjective} Moment Breaking The Internet",
-                "🚀 {emotion} Level: {adjective}!",
-                "🎪 {adjective} Content That Defines {year}"
-            ],
-            'adjectives': [
-                "Incredible", "Mind-Blowing", "Shocking", "Amazing", "Unbelievable",
-                "Epic", "Legendary", "Insane", "Brilliant", "Revolutionary",
-                "Game-Changing", "Jaw-Dropping", "Stunning", "Phenomenal", "Wild"
-            ],
-            'emotions': [
-                "Excitement", "Joy", "Surprise", "Wonder", "Amazement",
-                "Thrill", "Awe", "Happiness", "Shock", "Inspiration"
-            ],
-            'topics': [
-                "Technology", "Innovation", "Discovery", "Breakthrough", "Revolution",
-                "Transformation", "Evolution", "Future", "Science", "Progress"
-            ]
+            'total_videos': row[0],
+            'tech_videos': row[1],
+            'entertainment_videos': row[2],
+            # Counter rolls over lazily - a stale date means nothing uploaded today yet
+            'today_uploads': row[4] if row[3] == datetime.now().date().isoformat() else 0
         }
 
-    def log_activity(self, message):
-        """Log activity to file and console"""
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        log_message = f"[{timestamp}] {message}"
-        print(log_message)
-        
-        # Save to log file
-        with open('logs/bot_activity.log', 'a', encoding='utf-8') as f:
-            f.write(log_message + '\n')
+    def load_title_patterns(self):
+        """Load advanced title generation patterns (from metadata_templates.json)"""
+        return self.templates.title_patterns
+
+    def log_activity(self, message, level=None, stage=None, video_id=None, duration=None):
+        """Log activity to file and console (queued - written by the log writer thread)"""
+        level = level or infer_level(message)
+        self.logger.log(bot_logging.LEVEL_NAMES.get(level, 20), message,
+                        extra={'stage': stage, 'video_id': video_id, 'duration': duration})
         
-        # Send to Telegram if configured
+        # Queue for Telegram if configured (log text is plain, the API expects HTML)
         if self.telegram_token and self.telegram_chat_id:
-            self.send_telegram_message(f"🤖 {message}")
+            self.send_telegram_message(f"🤖 {html.escape(message, quote=False)}", level)
 
-    def send_telegram_message(self, message):
-        """Send notification to Telegram"""
-        try:
-            url = f"https://api.telegram.org/bot{self.telegram_token}/sendMessage"
-            data = {
-                'chat_id': self.telegram_chat_id,
-                'text': message,
-                'parse_mode': 'HTML'
-            }
-            requests.post(url, data=data, timeout=5)
-        except:
-            pass
+    def send_telegram_message(self, message, level='info'):
+        """Queue a notification for Telegram - returns immediately"""
+        return self.notifier.notify(message, level)
 
+    @metrics.timer('filter')
     def check_duplicate(self, video_data):
         """Advanced duplicate checking using multiple methods"""
-        cursor = self.db.cursor()
-        
-        # Check by video ID
-        cursor.execute('SELECT video_id FROM processed_videos WHERE video_id = ?', (video_data['id'],))
-        if cursor.fetchone():
-            return True
-        
         # Create content hash for similarity check
         content_hash = hashlib.md5(
             f"{video_data['title']}{video_data['channel']}".encode()
         ).hexdigest()
         
-        cursor.execute('SELECT video_id FROM processed_videos WHERE video_hash = ?', (content_hash,))
-        if cursor.fetchone():
-            return True
-        
-        # Check similar titles (prevent same content different ID)
-        cursor.execute('''
-            SELECT title FROM uploaded_videos 
-            WHERE title LIKE ? OR title LIKE ?
-        ''', (f"%{video_data['title'][:30]}%", f"%{video_data['channel'][:20]}%"))
-        
-        if cursor.fetchone():
-            return True
+        # Channel threads share the connection - don't read between another thread's statements
+        with self.db_lock:
+            cursor = self.db.cursor()
+            
+            # Check by video ID
+            cursor.execute('SELECT video_id FROM processed_videos WHERE video_id = ?', (video_data['id'],))
+            if cursor.fetchone():
+                return True
+            
+            cursor.execute('SELECT video_id FROM processed_videos WHERE video_hash = ?', (content_hash,))
+            if cursor.fetchone():
+                return True
+            
+            # Check similar titles (prevent same content different ID)
+            cursor.execute('''
+                SELECT title FROM uploaded_videos 
+                WHERE title LIKE ? OR title LIKE ?
+            ''', (f"%{video_data['title'][:30]}%", f"%{video_data['channel'][:20]}%"))
+            
+            if cursor.fetchone():
+                return True
         
         return False
 
+    @metrics.timer('db_write', table='processed_videos')
     def save_processed_video(self, video_data):
         """Save processed video to database"""
-        cursor = self.db.cursor()
-        content_hash = hashlib.md5(
-            f"{video_data['title']}{video_data['channel']}".encode()
-        ).hexdigest()
+        # Channel threads share the connection and commit on it
+        with self.db_lock:
+            cursor = self.db.cursor()
+            content_hash = hashlib.md5(
+                f"{video_data['title']}{video_data['channel']}".encode()
+            ).hexdigest()
         
-        cursor.execute('''
-            INSERT OR IGNORE INTO processed_videos 
-            (video_id, original_title, channel, processed_date, video_hash)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (video_data['id'], video_data['title'], video_data['channel'], 
-              datetime.now(), content_hash))
+            cursor.execute('''
+                INSERT OR IGNORE INTO processed_videos 
+                (video_id, original_title, channel, processed_date, video_hash)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (video_data['id'], video_data['title'], video_data['channel'], 
+                  datetime.now(), content_hash))
         
-        self.db.commit()
+            self.db.commit()
 
     def generate_advanced_title(self, video_data, category='general'):
         """Generate advanced unique titles"""
-        import random
-        
-        # Select pattern based on category
-        patterns = self.title_patterns.get(category, self.title_patterns['entertainment'])
-        pattern = random.choice(patterns)
-        
-        # Fill in variables
-        title = pattern.format(
-            adjective=random.choice(self.title_patterns['adjectives']),
-            topic=random.choice(self.title_patterns['topics']),
-            emotion=random.choice(self.title_patterns['emotions']),
-            number=random.randint(10, 60),
-            year=datetime.now().year
-        )
-        
-        # Ensure uniqueness
-        cursor = self.db.cursor()
-        cursor.execute('SELECT COUNT(*) FROM uploaded_videos WHERE title = ?', (title,))
-        
-        if cursor.fetchone()[0] > 0:
-            # Add unique identifier if title exists
-            title = f"{title} #{random.randint(100, 999)}"
-        
-        # Ensure title length
-        if len(title) > 70:
-            title = title[:67] + "..."
-        
-        return title
+        return self.templates.title(category)
 
-    def generate_advanced_description(self, video_data, title, category='general'):
+    def generate_advanced_description(self, video_data, title, category='general',
+                                      budget=metadata_service.METADATA_LATENCY_BUDGET):
         """Generate advanced descriptions with SEO optimization"""
         
-        # Try AI generation first
+        # Try AI generation first (only waits up to budget seconds)
         if self.groq_api_key:
-            ai_description = self.generate_ai_description(video_data, title, category)
+            ai_description = self.generate_ai_description(video_data, title, category, budget)
             if ai_description:
                 return ai_description
         
         # Fallback to template-based generation
-        templates = [
-            """🔥 {title}
-
-📺 Experience the {adjective} moment that's taking the internet by storm!
-
-👀 What you'll see:
-• {point1}
-• {point2}
-• {point3}
-
-🚀 Original content from: {channel}
-📊 Viral Rating: {rating}/10
-
-🏷️ Tags:
-{tags}
-
-⏰ Upload Time: {time}
-📍 Category: {category}
-
-👍 Like & Subscribe for more {adjective} content!
-🔔 Turn on notifications to never miss out!
-
-#shorts #viral #trending #{category} #{year}""",
+        return self.templates.description(video_data, title, category)
 
-            """⚡ {title}
-
-This {adjective} moment will leave you speechless! 😱
-
-✨ Why this is trending:
-→ {reason1}
-→ {reason2}
-→ {reason3}
-
-Credit: {channel} 🎬
-
-Stats:
-• Views: {views}
-• Category: {category}
-• Upload: {time}
-
-{tags}
-
-Drop a ❤️ if this amazed you!
-
-#{hashtag1} #{hashtag2} #{hashtag3}"""
-        ]
-        
-        template = random.choice(templates)
-        
-        # Generate dynamic content points
-        points = self.generate_content_points(category)
-        reasons = self.generate_trending_reasons()
-        tags = self.generate_seo_tags(video_data, category)
-        
-        description = template.format(
-            title=title,
-            adjective=random.choice(self.title_patterns['adjectives']),
-            channel=video_data['channel'],
-            rating=random.randint(8, 10),
-            point1=points[0],
-            point2=points[1],
-            point3=points[2],
-            reason1=reasons[0],
-            reason2=reasons[1],
-            reason3=reasons[2],
-            tags=tags,
-            time=datetime.now().strftime('%B %d, %Y'),
-            category=category.title(),
-            year=datetime.now().year,
-            views=f"{video_data['views']:,}",
-            hashtag1=f"{category}{random.randint(100,999)}",
-            hashtag2=f"viral{datetime.now().strftime('%Y%m')}",
-            hashtag3=f"trending{random.randint(1,100)}"
-        )
-        
-        return description
-
-    def generate_ai_description(self, video_data, title, category):
-        """Generate AI-powered description using Groq"""
-        try:
-            url = "https://api.groq.com/openai/v1/chat/completions"
-            headers = {
-                "Authorization": f"Bearer {self.groq_api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            prompt = f"""Create a viral YouTube Shorts description for:
-Title: {title}
-Category: {category}
-Original: {video_data['title'][:50]}
-Channel: {video_data['channel']}
-
-Requirements:
-- Start with eye-catching emoji
-- Include 3 bullet points about the content
-- Add relevant hashtags (15-20)
-- Make it engaging and shareable
-- Include call-to-action
-- SEO optimized
-- Max 500 characters
-
-Format with emojis and line breaks for readability."""
-
-            data = {
-                "model": "mixtral-8x7b-32768",
-                "messages": [{"role": "user", "content": prompt}],
-                "max_tokens": 400,
-                "temperature": 0.9
-            }
-            
-            response = requests.post(url, headers=headers, json=data, timeout=10)
-            
-            if response.status_code == 200:
-                return response.json()['choices'][0]['message']['content']
-        except:
-            pass
-        
-        return None
+    def generate_ai_description(self, video_data, title, category,
+                                budget=metadata_service.METADATA_LATENCY_BUDGET):
+        """Generate AI-powered description using Groq (cached; None if not ready in time)"""
+        return self.metadata.describe(video_data, title, category, budget)
 
     def generate_content_points(self, category):
         """Generate content bullet points"""
-        tech_points = [
-            "Cutting-edge technology in action",
-            "Mind-bending innovation revealed",
-            "Future tech becoming reality",
-            "Game-changing breakthrough moment",
-            "Revolutionary concept demonstrated"
-        ]
-        
-        entertainment_points = [
-            "Jaw-dropping entertainment",
-            "Unforgettable viral moment",
-            "Pure entertainment gold",
-            "Content that breaks the internet",
-            "Must-see trending footage"
-        ]
-        
-        points = tech_points if category == 'tech' else entertainment_points
-        return random.sample(points, 3)
+        return self.templates.content_points(category)
 
     def generate_trending_reasons(self):
         """Generate reasons why content is trending"""
-        reasons = [
-            "Absolutely mind-blowing content",
-            "Never seen before on the internet",
-            "Breaking all viral records",
-            "Everyone's talking about this",
-            "Defining moment of the year",
-            "Pure viral perfection",
-            "Internet's new obsession",
-            "Changing the game completely"
-        ]
-        return random.sample(reasons, 3)
+        return self.templates.trending_reasons()
 
     def generate_seo_tags(self, video_data, category):
         """Generate SEO optimized tags"""
-        base_tags = ['#shorts', '#viral', '#trending', '#fyp', '#explore']
-        
-        category_tags = {
-            'tech': ['#technology', '#innovation', '#future', '#tech', '#ai', '#gadgets'],
-            'entertainment': ['#entertainment', '#fun', '#amazing', '#mustwatch', '#epic']
-        }
-        
-        # Time-based unique tags
-        time_tags = [
-            f"#viral{datetime.now().strftime('%Y')}",
-            f"#trending{datetime.now().strftime('%m%d')}",
-            f"#{category}{datetime.now().strftime('%H')}"
-        ]
-        
-        all_tags = base_tags + category_tags.get(category, []) + time_tags
-        
-        # Add random viral tags
-        viral_tags = [
-            f"#moment{random.randint(100,999)}",
-            f"#viral{random.randint(1,100)}",
-            f"#trend{random.randint(1,999)}"
-        ]
-        
-        all_tags.extend(random.sample(viral_tags, 2))
-        
-        return ' '.join(all_tags[:20])  # Limit to 20 tags
+        return self.templates.seo_tags(video_data, category)
 
     def get_today_uploads(self):
-        """Get today's upload count"""
+        """Get today's upload count (the env-configured channel - profiles count in channel_stats)"""
         cursor = self.db.cursor()
         today = datetime.now().date()
         
@@ -2508,26 +2845,37 @@ Format with emojis and line breaks for readability."""
         result = cursor.fetchone()
         return result[0] if result else 0
 
+    @metrics.timer('db_write', table='bot_stats')
     def update_stats(self, category):
         """Update upload statistics"""
-        cursor = self.db.cursor()
-        today = datetime.now().date()
+        # Channel threads share the connection and commit on it
+        with self.db_lock:
+            cursor = self.db.cursor()
+            today = datetime.now().date()
         
-        # Insert or update today's stats
-        cursor.execute('''
-            INSERT INTO bot_stats (date, tech_uploads, entertainment_uploads, total_uploads)
-            VALUES (?, ?, ?, ?)
-            ON CONFLICT(date) DO UPDATE SET
-                tech_uploads = CASE WHEN ? = 'tech' 
-                    THEN tech_uploads + 1 ELSE tech_uploads END,
-                entertainment_uploads = CASE WHEN ? = 'entertainment' 
-                    THEN entertainment_uploads + 1 ELSE entertainment_uploads END,
-                total_uploads = total_uploads + 1
-        ''', (today, 1 if category == 'tech' else 0, 
-              1 if category == 'entertainment' else 0, 1,
-              category, category))
+            # Insert or update today's stats
+            cursor.execute('''
+                INSERT INTO bot_stats (date, tech_uploads, entertainment_uploads, total_uploads)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(date) DO UPDATE SET
+                    tech_uploads = CASE WHEN ? = 'tech' 
+                        THEN tech_uploads + 1 ELSE tech_uploads END,
+                    entertainment_uploads = CASE WHEN ? = 'entertainment' 
+                        THEN entertainment_uploads + 1 ELSE entertainment_uploads END,
+                    total_uploads = total_uploads + 1
+            ''', (today, 1 if category == 'tech' else 0, 
+                  1 if category == 'entertainment' else 0, 1,
+                  category, category))
+        
+            # Mirror today's count into the dashboard summary row
+            cursor.execute('''
+                UPDATE dashboard_summary SET
+                    today_uploads = CASE WHEN today_date = ? THEN today_uploads + 1 ELSE 1 END,
+                    today_date = ?
+                WHERE id = 1
+            ''', (today.isoformat(), today.isoformat()))
         
-        self.db.commit()
+            self.db.commit()
 
     def automatic_test_upload(self):
         """Perform REAL test upload to YouTube"""
@@ -2650,7 +2998,7 @@ This test confirms that:
             
             if os.path.exists(filename):
                 self.log_activity("✅ Test video file created")
-                return filename
+                return self.track_artifact(filename, 'test')
             else:
                 return None
                 
@@ -2665,7 +3013,9 @@ This test confirms that:
             INSERT INTO uploaded_videos (title, description, upload_date, youtube_url, category)
             VALUES (?, ?, ?, ?, ?)
         ''', (title, description, datetime.now(), url, category))
+        self.adjust_dashboard_summary(cursor, total=1, new_category=category)
         self.db.commit()
+        self.mark_videos_changed()
 
     def get_safe_videos(self, category_id, max_results=10):
         """Get safe trending videos with strict filtering"""
@@ -2705,7 +3055,8 @@ This test confirms that:
                                 if self.is_copyright_safe(video_data):
                                     all_videos.append(video_data)
                     
-                    time.sleep(0.5)  # Rate limiting
+                    with metrics.timer('politeness_sleep'):
+                        time.sleep(0.5)  # Rate limiting
                     
                 except Exception as e:
                     continue
@@ -2834,7 +3185,8 @@ This test confirms that:
         self.log_activity(f"🎯 Advanced download: {video_id}")
         
         # Add rate limiting - wait between downloads
-        time.sleep(random.randint(15, 45))
+        with metrics.timer('politeness_sleep'):
+            time.sleep(random.randint(15, 45))
         
         filename = os.path.join(self.download_dir, f"{video_id}.mp4")
         
@@ -2947,7 +3299,8 @@ This test confirms that:
                     if "bot" in error_msg.lower() or "blocked" in error_msg.lower():
                         self.log_activity(f"🤖 ❌ Download blocked: {strategy['name']}")
                         # Try with longer delay
-                        time.sleep(random.randint(45, 90))
+                        with metrics.timer('politeness_sleep'):
+                            time.sleep(random.randint(45, 90))
                     elif "private" in error_msg.lower():
                         self.log_activity(f"🔒 ❌ Video is private: {video_id}")
                         break  # No point trying other strategies
@@ -3045,7 +3398,7 @@ This test confirms that:
             )
             
             final_video.close()
-            return placeholder_path
+            return self.track_artifact(placeholder_path, video_id)
             
         except Exception as e:
             self.log_activity(f"❌ Placeholder creation failed: {str(e)[:50]}")
@@ -3069,26 +3422,14 @@ This test confirms that:
                 filename = f"{video_id}.mp4"
                 filepath = os.path.join(self.download_dir, filename)
                 
-                with open(filepath, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-                
-                if os.path.exists(filepath) and os.path.getsize(filepath) > 10000:
-                    # Quick validation
-                    try:
-                        with open(filepath, 'rb') as f:
-                            header = f.read(8)
-                            # Check for valid MP4 header
-                            if b'ftyp' in header or header.startswith(b'\x00\x00\x00'):
-                                self.log_activity(f"✅ Direct download success: {filename}")
-                                return filepath
-                    except:
-                        pass
-                    
-                    # File seems invalid
-                    os.remove(filepath)
-                    self.log_activity(f"❌ Invalid file format: {filename}")
+                try:
+                    size = download_writer.write_response(response, filepath)
+                    self.log_activity(f"✅ Direct download success: {filename} ({size / (1024 * 1024):.1f} MB)")
+                    return self.track_artifact(filepath, video_id)
+                except download_writer.InvalidDownload as e:
+                    self.log_activity(f"❌ Invalid file format: {filename} ({e})")
+                finally:
+                    response.close()
                     
         except Exception as e:
             self.log_activity(f"❌ Direct download failed: {e}")
@@ -3114,15 +3455,12 @@ This test confirms that:
             
             if result.returncode == 0 and os.path.exists(filepath):
                 file_size = os.path.getsize(filepath)
-                if file_size > 10000:  # At least 10KB
-                    # Validate file format
+                if file_size > download_writer.MIN_VIDEO_BYTES:
+                    # Validate file format (header bytes - no ffprobe process)
                     try:
-                        import subprocess
-                        check_cmd = ['ffprobe', '-v', 'quiet', '-print_format', 'json', '-show_format', filepath]
-                        probe_result = subprocess.run(check_cmd, capture_output=True, timeout=10)
-                        if probe_result.returncode == 0:
+                        if download_writer.has_mp4_header(filepath):
                             self.log_activity(f"✅ Curl download success: {filename}")
-                            return filepath
+                            return self.track_artifact(filepath, video_id)
                     except:
                         pass
                 
@@ -3150,6 +3488,9 @@ This test confirms that:
     def create_short(self, video_path, video_id):
         """Create YouTube short with audio preservation"""
         try:
+            if not self.reserve_render_space():
+                return None
+            
             # Debug original video
             self.debug_audio_info(video_path, "ORIGINAL")
             
@@ -3213,25 +3554,50 @@ This test confirms that:
                 if os.path.exists(output_path):
                     self.debug_audio_info(output_path, "FINAL OUTPUT")
                 
-                return output_path
+                return self.track_artifact(output_path, video_id)
                 
         except Exception as e:
             self.log_activity(f"Short creation error: {e}")
             return None
     
-    def create_elly_reaction_short(self, video_path, video_id, elly_size=0.25, elly_position="top-right"):
+    @metrics.timer('render')
+    def create_elly_reaction_short(self, video_path, video_id, elly_size=0.25, elly_position="top-right",
+                                   overlay_path=channels.DEFAULT_OVERLAY):
         """Create Elly reaction short with overlay and audio preservation"""
         try:
-            from moviepy.editor import CompositeVideoClip, concatenate_videoclips
+            from moviepy.editor import VideoClip
             
-            # Check if Elly video exists
-            elly_path = "video/elly.mp4"
+            # Check if Elly video exists (channel profiles can use their own overlay)
+            elly_path = overlay_path
             if not os.path.exists(elly_path):
                 self.log_activity("⚠️ Elly video not found, creating regular short")
                 return self.create_short(video_path, video_id)
             
+            if not self.reserve_render_space():
+                return None
+            
             self.log_activity(f"🎬 Creating Elly reaction short: {video_id}")
             
+            if RENDER_MODE == 'stream':
+                os.makedirs("shorts", exist_ok=True)
+                output_path = f"shorts/elly_short_{video_id}.mp4"
+                renderer = stream_render.StreamRenderer()
+                try:
+                    renderer.render(video_path, elly_path, output_path, elly_size, elly_position,
+                                    max_duration=SHORT_MAX_SECONDS)
+                    self.log_activity(f"✅ Elly reaction short created: {output_path} "
+                                      f"({renderer.frames} frames in {renderer.seconds}s, "
+                                      f"peak {renderer.peak_rss_mb:.0f} MB)")
+                    return self.track_artifact(output_path, video_id)
+                except stream_render.RenderMemoryExceeded as e:
+                    # MoviePy would need even more - skip this video
+                    self.log_activity(f"❌ Elly reaction render stopped: {e}")
+                    metrics.count('render_memory_exceeded')
+                    return None
+                except Exception as e:
+                    self.log_activity(f"⚠️ Stream render failed, using MoviePy: {e}")
+                    metrics.count('render_fallbacks')
+            
             # Load videos
             with VideoFileClip(video_path) as source_video:
                 with VideoFileClip(elly_path) as elly_video:
@@ -3243,42 +3609,32 @@ This test confirms that:
                     self.log_activity(f"🎵 Elly audio: {'Yes' if has_elly_audio else 'No'}")
                     
                     # Determine duration (max 60 seconds for shorts)
-                    target_duration = min(60, source_video.duration)
+                    target_duration = min(SHORT_MAX_SECONDS, source_video.duration)
                     
-                    # Adjust source video duration
-                    if source_video.duration > target_duration:
-                        # Take middle section
-                        start_time = max(0, (source_video.duration - target_duration) / 2)
-                        source_adjusted = source_video.subclip(start_time, start_time + target_duration)
-                    else:
-                        source_adjusted = source_video
+                    # Take the middle section of the source
+                    source_start = max(0, (source_video.duration - target_duration) / 2)
                     
-                    # Adjust Elly video duration (remove audio from Elly to avoid conflict)
-                    if elly_video.duration < target_duration:
-                        # Loop Elly video if too short
-                        loop_count = int(target_duration / elly_video.duration) + 1
-                        clips = [elly_video.without_audio()] * loop_count  # Remove Elly audio
-                        elly_looped = concatenate_videoclips(clips, method="compose")
-                        elly_adjusted = elly_looped.subclip(0, target_duration)
-                    else:
-                        # Trim Elly video if too long
-                        start_time = max(0, (elly_video.duration - target_duration) / 2)
-                        elly_adjusted = elly_video.subclip(start_time, start_time + target_duration).without_audio()
+                    # Elly: middle section if long enough, otherwise looped (Elly audio is dropped)
+                    elly_duration = elly_video.duration
+                    elly_loops = elly_duration < target_duration
+                    elly_start = 0 if elly_loops else (elly_duration - target_duration) / 2
                     
-                    # Create background (source video fills screen) - preserve audio
+                    # Source fills the 9:16 frame, Elly is scaled into her corner -
+                    # one reused frame buffer instead of a CompositeVideoClip
                     target_size = (1080, 1920)  # 9:16 aspect ratio
-                    background = self._create_background_for_shorts(source_adjusted, target_size)
+                    frames = compositor.Compositor(target_size, elly_size, elly_position)
                     
-                    # Create Elly overlay (without audio)
-                    elly_overlay = self._create_elly_overlay(elly_adjusted, target_size, elly_size, elly_position)
+                    def make_frame(t):
+                        elly_time = t % elly_duration if elly_loops else elly_start + t
+                        return frames.compose(source_video.get_frame(source_start + t),
+                                              elly_video.get_frame(elly_time))
                     
-                    # Combine videos - background audio will be preserved
-                    final_video = CompositeVideoClip([background, elly_overlay], size=target_size)
+                    final_video = VideoClip(make_frame, duration=target_duration)
                     
-                    # Ensure original audio is preserved
-                    if has_source_audio and final_video.audio is None:
-                        self.log_activity("🎵 Restoring original audio...")
-                        final_video = final_video.set_audio(source_adjusted.audio)
+                    # Original audio is preserved
+                    if has_source_audio:
+                        final_video = final_video.set_audio(
+                            source_video.audio.subclip(source_start, source_start + target_duration))
                     
                     # Export
                     os.makedirs("shorts", exist_ok=True)  # Ensure directory exists
@@ -3307,81 +3663,14 @@ This test confirms that:
                     final_video.write_videofile(output_path, **write_params)
                     
                     self.log_activity(f"✅ Elly reaction short created: {output_path}")
-                    return output_path
+                    return self.track_artifact(output_path, video_id)
                     
         except Exception as e:
             self.log_activity(f"❌ Elly reaction creation error: {e}")
+            self.cleanup(f"shorts/elly_short_{video_id}.mp4")  # Partial output
             # Fallback to regular short
             return self.create_short(video_path, video_id)
     
-    def _create_background_for_shorts(self, video, target_size):
-        """Create background video that fills the screen for shorts"""
-        target_w, target_h = target_size
-        video_w, video_h = video.size
-        
-        # Calculate aspect ratios
-        video_aspect = video_w / video_h
-        target_aspect = target_w / target_h
-        
-        if video_aspect > target_aspect:
-            # Video is wider - fit by height, crop sides
-            new_height = target_h
-            new_width = int(new_height * video_aspect)
-            resized = video.resize((new_width, new_height))
-            
-            # Center crop horizontally
-            x_center = new_width / 2
-            x1 = x_center - target_w / 2
-            cropped = resized.crop(x1=x1, x2=x1 + target_w)
-        else:
-            # Video is taller - fit by width, crop top/bottom
-            new_width = target_w
-            new_height = int(new_width / video_aspect)
-            resized = video.resize((new_width, new_height))
-            
-            # Center crop vertically
-            y_center = new_height / 2
-            y1 = y_center - target_h / 2
-            cropped = resized.crop(y1=y1, y2=y1 + target_h)
-        
-        return cropped
-    
-    def _create_elly_overlay(self, elly_video, target_size, elly_size, position):
-        """Create Elly overlay with custom position and size"""
-        target_w, target_h = target_size
-        
-        # Calculate Elly size
-        elly_width = int(target_w * elly_size)
-        elly_height = int(elly_width * elly_video.h / elly_video.w)
-        
-        # Resize Elly
-        elly_resized = elly_video.resize((elly_width, elly_height))
-        
-        # Calculate position
-        margin = 20
-        
-        if position == "top-right":
-            x_pos = target_w - elly_width - margin
-            y_pos = margin
-        elif position == "top-left":
-            x_pos = margin
-            y_pos = margin
-        elif position == "bottom-right":
-            x_pos = target_w - elly_width - margin
-            y_pos = target_h - elly_height - margin
-        elif position == "bottom-left":
-            x_pos = margin
-            y_pos = target_h - elly_height - margin
-        else:
-            # Default to top-right
-            x_pos = target_w - elly_width - margin
-            y_pos = margin
-        
-        # Set position
-        elly_positioned = elly_resized.set_position((x_pos, y_pos))
-        
-        return elly_positioned
-
     def debug_audio_info(self, video_path, stage=""):
         """Debug function to log audio information"""
         try:
@@ -3436,9 +3725,42 @@ This test confirms that:
         
         return resized_clip
 
-    def download_video_enhanced(self, video_id):
-        """Download video using yt-dlp"""
+    def short_window(self, duration_seconds):
+        """(start, end) of the middle SHORT_MAX_SECONDS, or None if the whole source is used"""
+        if not duration_seconds or duration_seconds <= SHORT_MAX_SECONDS:
+            return None
+        start = (duration_seconds - SHORT_MAX_SECONDS) / 2
+        return (start, start + SHORT_MAX_SECONDS)
+
+    def resolve_stream_url(self, video_id):
+        """Direct media URL of a progressive format (None if there is none)"""
+        ydl_opts = {
+            'format': STREAM_FORMAT,
+            'quiet': True,
+            'no_warnings': True,
+        }
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            info = ydl.extract_info(f"https://www.youtube.com/watch?v={video_id}", download=False)
+        return info.get('url')
+
+    @metrics.timer('download')
+    def download_video_enhanced(self, video_id, duration_seconds=None):
+        """Fetch the source for a short using yt-dlp (see DOWNLOAD_MODE)
+
+        Returns a local path, or in stream mode the remote URL the renderer
+        reads directly. duration_seconds lets range/stream mode skip
+        everything outside the window the short will use.
+        """
         try:
+            if DOWNLOAD_MODE == 'stream':
+                try:
+                    stream_url = self.resolve_stream_url(video_id)
+                    if stream_url:
+                        self.log_activity(f"📡 Streaming source: {video_id}", stage='download', video_id=video_id)
+                        return stream_url
+                except Exception as e:
+                    self.log_activity(f"⚠️ Stream URL unavailable, downloading instead: {e}")
+            
             output_path = os.path.join(self.download_dir, f"{video_id}.%(ext)s")
             
             ydl_opts = {
@@ -3448,6 +3770,11 @@ This test confirms that:
                 'no_warnings': True,
             }
             
+            # Only the bytes of the window we render (ffmpeg -ss on the remote input)
+            window = self.short_window(duration_seconds) if DOWNLOAD_MODE != 'full' else None
+            if window:
+                ydl_opts['download_ranges'] = download_range_func(None, [window])
+            
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 ydl.download([f"https://www.youtube.com/watch?v={video_id}"])
             
@@ -3455,13 +3782,21 @@ This test confirms that:
             for ext in ['mp4', 'webm', 'mkv']:
                 file_path = os.path.join(self.download_dir, f"{video_id}.{ext}")
                 if os.path.exists(file_path):
-                    return file_path
+                    if window:
+                        self.log_activity(f"✂️ Downloaded {window[0]:.0f}-{window[1]:.0f}s only "
+                                          f"({os.path.getsize(file_path) / (1024 * 1024):.1f} MB)",
+                                          stage='download', video_id=video_id)
+                    return self.track_artifact(file_path, video_id)
             
             return None
         except Exception as e:
             self.log_activity(f"Download error: {e}")
             return None
 
+    def source_available(self, source):
+        """True for an existing local file or a streamable URL"""
+        return bool(source) and (source.startswith(('http://', 'https://')) or os.path.exists(source))
+
     def generate_description(self, video_data, category):
         """Generate description for video"""
         return f"""🎬 {video_data.get('title', 'Amazing Video')}
@@ -3473,83 +3808,29 @@ This test confirms that:
 
     def authenticate_youtube(self):
         """Production-ready YouTube authentication (no browser required)"""
-        SCOPES = ['https://www.googleapis.com/auth/youtube.upload']
-        creds = None
-        token_file = 'credentials/token.pickle'
-        
-        # Try to load existing credentials
-        if os.path.exists(token_file):
-            try:
-                with open(token_file, 'rb') as token:
-                    creds = pickle.load(token)
-            except:
-                creds = None
-        
-        # Check if credentials are valid
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                try:
-                    creds.refresh(Request())
-                except Exception as e:
-                    self.log_activity(f"❌ Token refresh failed: {e}")
-                    creds = None
-            
-            # If no valid credentials, try to create from environment variables
-            if not creds:
-                refresh_token = os.getenv('YOUTUBE_REFRESH_TOKEN')
-                
-                if refresh_token and self.client_id and self.client_secret:
-                    try:
-                        # Create credentials from refresh token
-                        creds = Credentials(
-                            token=None,
-                            refresh_token=refresh_token,
-                            token_uri='https://oauth2.googleapis.com/token',
-                            client_id=self.client_id,
-                            client_secret=self.client_secret,
-                            scopes=SCOPES
-                        )
-                        
-                        # Refresh to get access token
-                        creds.refresh(Request())
-                        
-                        # Save credentials for future use
-                        os.makedirs('credentials', exist_ok=True)
-                        with open(token_file, 'wb') as token:
-                            pickle.dump(creds, token)
-                        
-                        self.log_activity("✅ YouTube authentication successful")
-                        
-                    except Exception as e:
-                        self.log_activity(f"❌ Authentication from refresh token failed: {e}")
-                        return False
-                else:
-                    self.log_activity("❌ No refresh token found in environment variables")
-                    self.log_activity("💡 Add YOUTUBE_REFRESH_TOKEN to your Render environment")
-                    return False
-        
         try:
-            # Use existing authenticated service if available
-            if hasattr(self, 'upload_youtube') and self.upload_youtube:
-                return True
-                
-            # Otherwise get new credentials
-            creds = get_youtube_credentials()
-            if creds:
-                self.upload_youtube = build('youtube', 'v3', credentials=creds)
-                return True
-            else:
-                print("❌ Failed to get YouTube credentials")
+            if not self.credentials.start():
+                self.log_activity("❌ YouTube authentication failed - no valid token")
+                self.log_activity("💡 Add YOUTUBE_REFRESH_TOKEN to your Render environment")
                 return False
+            self.upload_youtube = self.credentials.client()
+            return True
         except Exception as e:
             self.log_activity(f"❌ YouTube service build failed: {e}")
             return False
 
-    def upload_to_youtube(self, video_path, title, description):
-        """Upload video to YouTube"""
-        if not self.upload_youtube:
+    @metrics.timer('upload')
+    def upload_to_youtube(self, video_path, title, description, client=None):
+        """Upload video to YouTube - client overrides the default channel"""
+        if not client and not self.upload_youtube:
             if not self.authenticate_youtube():
+                metrics.count('uploads', result='unauthenticated')
                 return False
+        # Per-thread client; its token is kept fresh by the refresh thread
+        youtube = client or self.credentials.client()
+        if not youtube:
+            metrics.count('uploads', result='unauthenticated')
+            return False
         
         try:
             body = {
@@ -3566,13 +3847,14 @@ This test confirms that:
             }
             
             media = MediaFileUpload(video_path, chunksize=-1, resumable=True)
-            request = self.upload_youtube.videos().insert(
+            request = youtube.videos().insert(
                 part=','.join(body.keys()),
                 body=body,
                 media_body=media
             )
             
             response = request.execute()
+            metrics.count('uploads', result='success')
             return f"https://www.youtube.com/watch?v={response['id']}"
             
         except Exception as e:
@@ -3580,23 +3862,108 @@ This test confirms that:
             if "uploadLimitExceeded" in error_str:
                 self.log_activity("⚠️ YouTube daily upload limit exceeded")
                 self.log_activity("💡 Limit will reset in 24 hours")
+                metrics.count('uploads', result='limit_exceeded')
                 # Don't retry if upload limit exceeded
                 return "UPLOAD_LIMIT_EXCEEDED"
             else:
                 self.log_activity(f"Upload error: {e}")
+                metrics.count('uploads', result='error')
                 return False
 
     def cleanup(self, *files):
         """Clean up temporary files"""
         for file in files:
             try:
-                if file and os.path.exists(file):
+                if self.workspace:
+                    self.workspace.remove(file)  # Also stops tracking it
+                elif file and os.path.exists(file):
                     os.remove(file)
             except:
                 pass
 
+    def track_artifact(self, path, job=None, state=workspace.ACTIVE):
+        """Register a downloaded/rendered file with the workspace; returns path"""
+        if self.workspace:
+            self.workspace.track(path, job, state)
+        return path
+
+    def finish_job(self, job):
+        """Files a finished (or failed) job still holds become evictable"""
+        if self.workspace:
+            self.workspace.finish(job)
+
+    def reserve_render_space(self, directory='shorts'):
+        """Evict old artifacts if needed so a render can't run out of disk"""
+        if self.workspace and not self.workspace.ensure_space(directory):
+            self.log_activity("❌ Not enough free disk space to render", level='error')
+            return False
+        return True
+
+    def reaction_variant(self, video):
+        """Metadata variant for a source video - sampled once and kept on the video dict"""
+        if 'experiment' not in video:
+            video['experiment'] = self.experiments.choose() if self.experiments else {}
+        return video['experiment']
+
+    def reaction_title(self, video):
+        variant = self.reaction_variant(video)
+        if not self.templates:
+            return f"Elly Reacts to {video['title'][:30]}... 😱🔥"
+        return self.templates.reaction_title(video, int(variant.get('title_pattern', 0)),
+                                             variant.get('adjective_set'))
+
+    def prefetch_metadata(self, videos):
+        """Start Groq descriptions for upcoming reaction shorts in the background"""
+        return self.metadata.prefetch([(video, self.reaction_title(video), 'reaction') for video in videos])
+
+    @metrics.timer('metadata')
+    def reaction_metadata(self, video, budget=metadata_service.METADATA_LATENCY_BUDGET):
+        """Title and description for a reaction short (AI description when ready within budget)"""
+        title = self.reaction_title(video)
+        variant = self.reaction_variant(video)
+        ai_description = self.metadata.describe(video, title, 'reaction', budget)
+        if ai_description:
+            variant['description_template'] = experiments.AI_DESCRIPTION
+            return title, ai_description
+        
+        if not self.templates:
+            return title, self.generate_description(video, 'reaction')
+        description = self.templates.reaction_description(
+            video, int(variant.get('description_template', 0)), variant.get('adjective_set'))
+        return title, description
+
+    def get_channel_upload_client(self, profile):
+        """Upload client for one channel profile (None if authentication fails)"""
+        missing = channels.missing_credentials(profile)
+        if missing:
+            # CredentialManager would fill them from YOUTUBE_* - the default channel
+            self.log_activity(f"❌ {profile['name']}: no {', '.join(missing)} of its own - not uploading",
+                              level='error', stage='channel')
+            return None
+        manager = self.channel_credentials.get(profile['id'])
+        if manager is None:
+            manager = youtube_auth.CredentialManager(
+                client_id=profile.get('client_id'),
+                client_secret=profile.get('client_secret'),
+                refresh_token=profile.get('refresh_token'),
+                token_path=profile.get('token_path') or os.path.join('credentials', f"token_{profile['id']}.pickle"),
+                name=profile['id']
+            )
+            manager = self.channel_credentials.setdefault(profile['id'], manager)
+            manager.start()
+        return manager.client()
+
     def process_scheduled_upload(self, category='shorts'):
-        """Process scheduled upload with ELLY REACTION SHORTS"""
+        """Process scheduled upload with ELLY REACTION SHORTS - waits for any running upload"""
+        with metrics.timer('upload_lock_wait'):
+            self.upload_lock.acquire()
+        try:
+            with metrics.timer('slot'):
+                return self._process_scheduled_upload(category)
+        finally:
+            self.upload_lock.release()
+
+    def _process_scheduled_upload(self, category):
         if not self.bot_active:
             return False
         
@@ -3606,6 +3973,11 @@ This test confirms that:
             self.log_activity("Daily limit reached (10 videos)")
             return False
         
+        # Pre-rendered short first - the slot only pays for the upload
+        buffered = self.render_buffer.upload_next(category)
+        if buffered is not None:
+            return buffered
+        
         self.log_activity(f"🎬 Creating Elly reaction short...")
         
         # Get shorts data
@@ -3616,25 +3988,22 @@ This test confirms that:
         
         for video in videos:
             if self.check_duplicate(video):
+                metrics.count('candidates_skipped', reason='duplicate')
                 continue
             
             # Try to download and create reaction
             try:
-                original_video_path = self.download_video_enhanced(video['id'])
-                if original_video_path and os.path.exists(original_video_path):
+                # Description generates while we download and render
+                self.prefetch_metadata([video])
+                original_video_path = self.download_video_enhanced(video['id'], video.get('duration_seconds'))
+                if self.source_available(original_video_path):
                     
                     # Create Elly reaction short
                     reaction_video_path = self.create_elly_reaction_short(original_video_path, video['id'])
                     
                     if reaction_video_path and os.path.exists(reaction_video_path):
                         # Generate reaction title and description
-                        title = f"Elly Reacts to {video['title'][:30]}... 😱🔥"
-                        description = f"""🎬 Elly's Reaction to: {video['title']}
-
-👩 Watch Elly's genuine reaction to this viral short!
-🔥 Original by: {video['channel']}
-
-#EllyReacts #Reaction #Shorts #Viral #Trending"""
+                        title, description = self.reaction_metadata(video)
                         
                         # Upload reaction to YouTube
                         upload_url = self.upload_to_youtube(reaction_video_path, title, description)
@@ -3667,6 +4036,9 @@ This test confirms that:
             except Exception as e:
                 self.log_activity(f"❌ Error processing reaction: {e}")
                 continue
+            finally:
+                # Anything a failed attempt left behind becomes evictable
+                self.finish_job(video['id'])
         
         return False
 
@@ -3675,8 +4047,19 @@ This test confirms that:
         self.log_activity("🧪 Features ready - Download system active")
         return True  # Skip actual testing to avoid spam
     
+    def random_upload(self):
+        """Hourly 10% chance of an extra upload"""
+        if random.random() < 0.1 and self.get_today_uploads() < 10:
+            category = random.choice(['tech', 'entertainment'])
+            self.log_activity(f"🎲 Random {category} upload triggered")
+            self.process_scheduled_upload(category)
+    
+    def hourly_status(self):
+        uploads = self.get_today_uploads()
+        self.log_activity(f"📊 Hourly status: {uploads}/10 uploads today")
+    
     def run_24x7(self):
-        """Run bot 24/7 without manual intervention"""
+        """Run bot 24/7 without manual intervention - sleeps until the next scheduled job"""
         self.log_activity("🚀 Starting 24/7 autonomous operation")
         
         # Skip test upload - start direct video uploads immediately
@@ -3686,70 +4069,38 @@ This test confirms that:
         
         # Immediate first reaction upload
         self.log_activity("🎬 Creating first Elly reaction short...")
-        self.process_scheduled_upload('shorts')
-        
-        # Schedule times for reaction shorts
-        schedule_times = {
-            'shorts': ['08:00', '10:00', '12:00', '14:00', '16:00', '18:00', '20:00', '22:00']
-        }
+        self.scheduler.add_once('first_upload', 0, lambda: self.process_scheduled_upload('shorts'),
+                                long_running=True)
+        
+        # Reaction short slots - missed ones (long upload, restart) are caught up.
+        # Uploads wait on upload_lock, so they run on the scheduler's long-job pool
+        self.scheduler.add_cron('shorts_upload', UPLOAD_SCHEDULE,
+                                lambda: self.process_scheduled_upload('shorts'),
+                                catch_up=UPLOAD_CATCH_UP, jitter=UPLOAD_JITTER_SECONDS, long_running=True)
+        self.scheduler.add_cron('random_upload', '0 * * * *', self.random_upload,
+                                catch_up=scheduler.CATCH_UP_SKIP, jitter=3600, long_running=True)
+        self.scheduler.add_cron('daily_reset', '0 0 * * *', lambda: self.log_activity("🔄 Daily reset"),
+                                catch_up=scheduler.CATCH_UP_SKIP)
+        self.scheduler.add_cron('hourly_status', '0 * * * *', self.hourly_status,
+                                catch_up=scheduler.CATCH_UP_SKIP)
+        if self.workspace:
+            self.scheduler.add_cron('workspace_collect', '*/15 * * * *', self.workspace.collect,
+                                    catch_up=scheduler.CATCH_UP_SKIP)
+        
+        # Channel profiles from the DB run alongside the env-configured channel
+        self.channels.start(UPLOAD_SCHEDULE, UPLOAD_CATCH_UP, UPLOAD_JITTER_SECONDS)
+        
+        # Keep a few shorts rendered ahead of the slots
+        self.render_buffer.start()
         
         self.log_activity("📅 Schedule configured - Bot running autonomously")
         
-        # Main loop
-        last_upload_time = {}
-        
-        while True:
-            try:
-                current_time = datetime.now().strftime('%H:%M')
-                current_hour = datetime.now().hour
-                
-                # Process scheduled uploads
-                for category, times in schedule_times.items():
-                    if current_time in times:
-                        last_key = f"{category}_{current_time}"
-                        if last_key not in last_upload_time or \
-                           (datetime.now() - last_upload_time[last_key]).seconds > 3600:
-                            self.process_scheduled_upload(category)
-                            last_upload_time[last_key] = datetime.now()
-                
-                # Random upload chance (10% every hour)
-                if random.random() < 0.1 and self.get_today_uploads() < 10:
-                    category = random.choice(['tech', 'entertainment'])
-                    self.log_activity(f"🎲 Random {category} upload triggered")
-                    self.process_scheduled_upload(category)
-                
-                # Reset daily stats at midnight
-                if current_time == '00:00':
-                    self.log_activity("🔄 Daily reset")
-                
-                # Status update every hour
-                if datetime.now().minute == 0:
-                    uploads = self.get_today_uploads()
-                    self.log_activity(f"📊 Hourly status: {uploads}/10 uploads today")
-                
-                # Sleep for 1 minute
-                time.sleep(60)
-                
-            except Exception as e:
-                self.log_activity(f"Error in main loop: {e}")
-                time.sleep(300)  # Wait 5 minutes on error
+        # Blocks; wakes only when a job is due
+        self.scheduler.run_forever()
 
 # Global bot instance - Initialize immediately for dashboard
 bot_instance = None
 
-# Removed start_flask - will handle directly in main
-
-def start_bot_background():
-    """Start bot in background thread for Render"""
-def start_bot_background():
-    """Start bot in background thread"""
-    try:
-        if bot_instance and hasattr(bot_instance, 'run_24x7'):
-            print("🤖 Starting autonomous bot in background...")
-            bot_instance.run_24x7()
-    except Exception as e:
-        print(f"Bot background error: {e}")
-
 if __name__ == "__main__":
     import socket
     
@@ -3779,17 +4130,21 @@ if __name__ == "__main__":
     # Initialize bot instance
     print("⚙️  Initializing system...")
     try:
-        bot_instance = AutoYouTubeBot()
+        # Shared engine service - pass this module's class so it is not imported twice
+        service = get_service(AutoYouTubeBot)
+        bot_instance = service.bot
         print("✅ Bot instance created successfully")
         
-        # Start bot in background thread - NO TEST UPLOAD
-        if bot_instance:
-            if bot_instance.youtube_api_key and bot_instance.client_id:
-                print("🚀 Starting bot with direct video uploads")
-                bot_thread = threading.Thread(target=start_bot_background, daemon=True)
-                bot_thread.start()
-            else:
-                print("⚠️ Missing API credentials - dashboard only mode")
+        # Live stats are refreshed in the background, never inside a request
+        if bot_instance.youtube:
+            bot_instance.stats_refresher.start()
+        
+        # Start the 24/7 loop in the background - NO TEST UPLOAD
+        if bot_instance.youtube_api_key and bot_instance.client_id:
+            print("🚀 Starting bot with direct video uploads")
+            service.start()
+        else:
+            print("⚠️ Missing API credentials - dashboard only mode")
             
     except Exception as e:
         print(f"⚠️  Bot initialization error: {e}")